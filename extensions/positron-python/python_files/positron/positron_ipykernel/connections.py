@@ -21,8 +21,9 @@ from .connections_comm import (
     ObjectSchema,
     PreviewObjectRequest,
 )
+from .data_explorer import SQLTable
 from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
-from .third_party import pd_, sqlalchemy_
+from .third_party import sqlalchemy_
 from .utils import JsonData, JsonRecord, safe_isinstance
 
 if TYPE_CHECKING:
@@ -570,9 +571,6 @@ class SQLite3Connection(Connection):
         self.conn.close()
 
     def preview_object(self, path: List[ObjectSchema]):
-        if pd_ is None:
-            raise ModuleNotFoundError("Pandas is required for previewing SQLite tables.")
-
         if len(path) != 2:
             raise ValueError(f"Path length must be 2, but got {len(path)}. Path: {path}")
 
@@ -582,9 +580,17 @@ class SQLite3Connection(Connection):
                 "Path must include a schema and a table/view in this order.", f"Path: {path}"
             )
 
-        return pd_.read_sql(
-            f"SELECT * FROM {schema.name}.{table.name} LIMIT 1000;",
-            self.conn,
+        # Queries of the data explorer run in the database, so that
+        # only the rows on screen are read into Python
+        return SQLTable(
+            f"{_sqlite_quote(schema.name)}.{_sqlite_quote(table.name)}",
+            [(field["name"], field["dtype"]) for field in self.list_fields(path)],
+            lambda sql, params: self.conn.execute(sql, params).fetchall(),
+            _sqlite_quote,
+            "sqlite",
+            # sqlite3 connections can only be used by the thread that
+            # created them
+            thread_safe=False,
         )
 
     def list_object_types(self):
@@ -672,19 +678,26 @@ class SQLAlchemyConnection(Connection):
                 "SQLAlchemy is required for previewing objects in SQLAlchemy connections."
             )
 
-        if pd_ is None:
-            raise ModuleNotFoundError("Pandas is required for previewing SQLAlchemy tables.")
-
         self._check_table_path(path)
         schema, table = path
 
-        table = sqlalchemy_.Table(
-            table.name, sqlalchemy_.MetaData(), autoload_with=self.conn, schema=schema.name
+        def execute(sql: str, params: Dict[str, Any]):
+            with self.conn.connect() as conn:
+                return conn.execute(sqlalchemy_.text(sql), params).fetchall()
+
+        quote = self.conn.dialect.identifier_preparer.quote
+        dialect = self.conn.dialect.name
+        # Queries of the data explorer run in the database, so that
+        # only the rows on screen are read into Python
+        return SQLTable(
+            f"{quote(schema.name)}.{quote(table.name)}",
+            [(field["name"], field["dtype"]) for field in self.list_fields(path)],
+            execute,
+            quote,
+            dialect,
+            # In-memory SQLite databases are not shared between threads
+            thread_safe=dialect != "sqlite",
         )
-        stmt = sqlalchemy_.sql.select(table).limit(1000)
-        # using conn.connect() is safer then using the conn directly and is also supported
-        # with older pandas versions such as 1.5
-        return pd_.read_sql(stmt, self.conn.connect())
 
     def disconnect(self):
         self.conn.dispose()
@@ -701,3 +714,7 @@ class SQLAlchemyConnection(Connection):
                 "Invalid path. Expected path to contain a schema and a table/view.",
                 f"But got schema.kind={schema.kind} and table.kind={table.kind}",
             )
+
+
+def _sqlite_quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
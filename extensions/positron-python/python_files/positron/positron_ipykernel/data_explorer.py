@@ -7,11 +7,38 @@
 # pyright: reportOptionalMemberAccess=false
 
 import abc
+import asyncio
+import atexit
+import functools
+import heapq
+import itertools
 import logging
 import math
 import operator
+import os
+import re
+import sys
+import tempfile
+import threading
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from datetime import datetime
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
 
 import comm
 
@@ -20,10 +47,13 @@ from .data_explorer_comm import (
     BackendState,
     ColumnDisplayType,
     ColumnFrequencyTable,
+    ColumnFrequencyTableItem,
     ColumnHistogram,
+    ColumnProfileRequest,
     ColumnProfileResult,
     ColumnProfileType,
     ColumnProfileTypeSupportStatus,
+    ColumnQuantileValue,
     ColumnSchema,
     ColumnSortKey,
     ColumnSummaryStats,
@@ -45,9 +75,12 @@ from .data_explorer_comm import (
     FormatOptions,
     GetColumnProfilesFeatures,
     GetColumnProfilesRequest,
+    GetDataValuesParams,
     GetDataValuesRequest,
+    GetMemoryUsageRequest,
     GetSchemaRequest,
     GetStateRequest,
+    MemoryUsage,
     RowFilter,
     RowFilterCondition,
     RowFilterType,
@@ -68,18 +101,19 @@ from .data_explorer_comm import (
     SupportedFeatures,
     SupportStatus,
     TableData,
+    TableDataEncoding,
     TableSchema,
     TableShape,
 )
-from .positron_comm import CommMessage, PositronComm
-from .third_party import np_, pd_, pl_
-from .utils import guid
+from .positron_comm import CommMessage, JsonRpcErrorCode, PositronComm
+from .third_party import np_, pa_, pd_, pl_
+from .utils import JsonRecord, guid
 
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
     import polars as pl
-
-    # import pyarrow as pa
+    import pyarrow as pa
 
 
 logger = logging.getLogger(__name__)
@@ -89,6 +123,106 @@ PathKey = Tuple[str, ...]
 StateUpdate = Tuple[bool, List[RowFilter], List[ColumnSortKey]]
 
 
+def _estimate_nbytes(values: List[Any]) -> int:
+    # Approximate memory use of a list of formatted values. Small ints
+    # and interned strings are shared, so this overestimates a little
+    return sys.getsizeof(values) + sum(map(sys.getsizeof, values))
+
+
+# Times of use of the entries of all the caches, so that the least
+# recently used entries of any of them can be evicted first
+_CACHE_TICKS = itertools.count()
+
+
+class _LRUCache:
+    """
+    Least recently used cache whose total size, as measured by the
+    sizeof function, is limited by a byte budget. Entries that are
+    larger than the whole budget are not cached. The cache can be
+    shared with the profile worker threads.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int]):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sizeof = sizeof
+        # Values with their sizes and the times they were last used
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries[key] = (entry[0], entry[1], next(_CACHE_TICKS))
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any):
+        nbytes = self._sizeof(value)
+
+        with self._lock:
+            if key in self._entries:
+                self.nbytes -= self._entries.pop(key)[1]
+
+            if nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (value, nbytes, next(_CACHE_TICKS))
+            self.nbytes += nbytes
+
+            while self.nbytes > self.max_bytes:
+                self._evict_oldest()
+
+    def oldest_tick(self) -> Optional[int]:
+        # When the least recently used entry was last used, or None if
+        # the cache is empty
+        with self._lock:
+            if not self._entries:
+                return None
+            return next(iter(self._entries.values()))[2]
+
+    def evict_oldest(self) -> int:
+        # Evict the least recently used entry, returning its size
+        with self._lock:
+            return self._evict_oldest() if self._entries else 0
+
+    def _evict_oldest(self) -> int:
+        _, (_, evicted_nbytes, _) = self._entries.popitem(last=False)
+        self.nbytes -= evicted_nbytes
+        self.evictions += 1
+        return evicted_nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+# Every state of the filtered and sorted rows of any table view gets a
+# new version number, so that cached values from a different view
+# state can never be returned
+_VIEW_VERSIONS = itertools.count()
+
+# Likewise, every column of a table wrapped by a table view gets a
+# new version number, for keying state derived from the column data.
+# A view of a table whose column has not changed gets the version of
+# the column in the view it replaces
+_COLUMN_VERSIONS = itertools.count()
+
+
 class DataExplorerTableView(abc.ABC):
     """
     Interface providing a consistent wrapper around different data
@@ -97,6 +231,44 @@ class DataExplorerTableView(abc.ABC):
     pyarrow.Table, and any others
     """
 
+    # Number of rows in each block of formatted values that is cached
+    # for serving get_data_values requests
+    VIEWPORT_BLOCK_SIZE = 128
+
+    # Memory budget for the cache of formatted values
+    VIEWPORT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+    # Memory budget for the column indices matching recent schema
+    # search terms
+    SEARCH_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+    # Histograms and frequency tables of at least this many rows are
+    # estimated from a random sample of PROFILE_SAMPLE_SIZE rows
+    APPROXIMATE_PROFILE_MIN_ROWS = 5_000_000
+    PROFILE_SAMPLE_SIZE = 1_000_000
+
+    HISTOGRAM_NUM_BINS = 20
+    FREQUENCY_TABLE_SIZE = 10
+
+    # Whether profiles are computed by the profile worker threads, or
+    # on the kernel thread for tables that cannot be used from other
+    # threads
+    PROFILES_IN_BACKGROUND = True
+
+    # Whether the profiles of all the columns in a get_column_profiles
+    # request are computed together by _get_column_profiles, rather
+    # than column by column
+    BATCH_COLUMN_PROFILES = False
+
+    # Whether the values around the viewport are formatted ahead of
+    # the next get_data_values request while the kernel is idle
+    PREFETCH_VIEWPORT = True
+
+    # Whether the table can be modified by user code without a
+    # variable update, so that the view is refreshed after each
+    # execution
+    REFRESH_AFTER_EXECUTION = False
+
     def __init__(
         self,
         display_name: str,
@@ -114,6 +286,41 @@ class DataExplorerTableView(abc.ABC):
 
         self._need_recompute = len(self.filters) > 0 or len(self.sort_keys) > 0
 
+        # Blocks of formatted values keyed by (view version, column
+        # index, block number, format options)
+        self._viewport_cache = _LRUCache(self.VIEWPORT_CACHE_MAX_BYTES, _estimate_nbytes)
+        self._view_indices = None
+        self._view_version = next(_VIEW_VERSIONS)
+
+        # Called, possibly from a background thread, when the schema
+        # returned to the frontend turns out to be wrong
+        self._schema_update_callback: Optional[Callable[[], None]] = None
+
+        # The column name index is built on the first schema search.
+        # The indices of the columns matching recent search terms are
+        # cached, so that scrolling through the search results and
+        # deleting characters from the search term are free, and
+        # typing more characters only tests the last matches
+        self._column_name_index: Optional[_ColumnNameIndex] = None
+        self._search_cache = _LRUCache(self.SEARCH_CACHE_MAX_BYTES, operator.attrgetter("nbytes"))
+        self._search_schema_last_term: Optional[str] = None
+
+    @property
+    def view_indices(self):
+        """
+        Array of selected AND reordered row indices (e.g. including
+        any filtering and sorting), or None if the rows are neither
+        filtered nor sorted.
+        """
+        return self._view_indices
+
+    @view_indices.setter
+    def view_indices(self, value):
+        # Any change to the visible rows invalidates the cached
+        # formatted values
+        self._view_indices = value
+        self._view_version = next(_VIEW_VERSIONS)
+
     def _set_sort_keys(self, sort_keys):
         self.sort_keys = sort_keys if sort_keys is not None else []
 
@@ -140,9 +347,101 @@ class DataExplorerTableView(abc.ABC):
 
         return TableSchema(columns=column_schemas).dict()
 
+    def _get_updated_state_by_name(
+        self, column_names: List, new_table, new_column_names: List, schema_updated: bool
+    ) -> StateUpdate:
+        # Carry the filters and sort keys over to the columns of the
+        # new table with the same names
+        new_indices = {name: i for i, name in enumerate(new_column_names)}
+
+        new_filters = []
+        for filt in self.filters:
+            filt = filt.copy(deep=True)
+            column_name = column_names[filt.column_schema.column_index]
+            new_index = new_indices.get(column_name)
+
+            if new_index is None:
+                filt.is_valid = False
+                filt.error_message = "Column was deleted"
+            else:
+                # Reset the validity in case the filter is valid for
+                # the new column type
+                filt.column_schema = self._get_column_schema(new_table, new_index)
+                filt.is_valid = self._is_supported_filter(filt)
+                if filt.is_valid:
+                    filt.error_message = None
+                else:
+                    filt.error_message = "Unsupported column type for filter"
+
+            new_filters.append(filt)
+
+        new_sort_keys = []
+        for key in self.sort_keys:
+            new_index = new_indices.get(column_names[key.column_index])
+            if new_index is None:
+                # Column deleted
+                continue
+            key = key.copy()
+            key.column_index = new_index
+            new_sort_keys.append(key)
+
+        return schema_updated, new_filters, new_sort_keys
+
+    @classmethod
+    def _get_column_schema(cls, table, column_index: int) -> ColumnSchema:
+        raise NotImplementedError
+
     def _get_single_column_schema(self, column_index: int) -> ColumnSchema:
         raise NotImplementedError
 
+    def _inherit_cached_state(self, old_view: "DataExplorerTableView"):
+        # Reuse state derived from the table of the view that this view
+        # replaces, where it is still valid
+        pass
+
+    # State derived from the values of the table that is shared with
+    # the other views of the table, if the view type has any
+    _table_state: Any = None
+
+    # Row indices selected by the filters, or None if the rows are not
+    # filtered or the view type does not compute them
+    filtered_indices: Any = None
+
+    def _get_caches(self) -> List[_LRUCache]:
+        # The caches of state derived from the table, some of which may
+        # be shared with other views
+        return [self._viewport_cache, self._search_cache]
+
+    def _get_row_indices_nbytes(self) -> int:
+        nbytes = _row_indices_nbytes(self.filtered_indices)
+        if self.view_indices is not self.filtered_indices:
+            nbytes += _row_indices_nbytes(self.view_indices)
+        return nbytes
+
+    def _refresh(self):
+        # Forget the state derived from the table, which is recomputed
+        # when it is next needed
+        pass
+
+    def _release_row_indices(self) -> bool:
+        """
+        Free the filtered and sorted row indices, which are recomputed
+        when they are next needed. Returns whether there were any.
+        """
+        if self.filtered_indices is None and self.view_indices is None:
+            return False
+        self.filtered_indices = None
+        self.view_indices = None
+        self._need_recompute = True
+        return True
+
+    def _get_updated_table_state(self, new_table, updated_states: Dict) -> Any:
+        # The shared state of new_table, given the states already
+        # computed for the same update in updated_states, keyed by the
+        # id of the state they update. This is the state of this view
+        # if the table values have not changed
+        return None
+
     def search_schema(self, request: SearchSchemaRequest):
         return self._search_schema(
             request.params.search_term,
@@ -152,12 +451,16 @@ class DataExplorerTableView(abc.ABC):
 
     def get_data_values(self, request: GetDataValuesRequest):
         self._recompute_if_needed()
-        return self._get_data_values(
+        result = self._get_data_values(
             request.params.row_start_index,
             request.params.num_rows,
             request.params.column_indices,
             request.params.format_options,
-        ).dict()
+        )
+        # The formatted values are already JSON-compatible, so we skip
+        # the pydantic conversion of every value, which for wide
+        # viewports costs more than formatting the values
+        return {"columns": result.columns, "row_labels": result.row_labels}
 
     def export_data_selection(self, request: ExportDataSelectionRequest):
         self._recompute_if_needed()
@@ -172,28 +475,45 @@ class DataExplorerTableView(abc.ABC):
     def set_sort_columns(self, request: SetSortColumnsRequest):
         return self._set_sort_columns(request.params.sort_keys)
 
-    def get_column_profiles(self, request: GetColumnProfilesRequest):
-        self._recompute_if_needed()
-        results = []
-
-        for req in request.params.profiles:
-            if req.profile_type == ColumnProfileType.NullCount:
-                count = self._prof_null_count(req.column_index)
-                result = ColumnProfileResult(null_count=int(count))
-            elif req.profile_type == ColumnProfileType.SummaryStats:
-                stats = self._prof_summary_stats(req.column_index, request.params.format_options)
-                result = ColumnProfileResult(summary_stats=stats)
-            elif req.profile_type == ColumnProfileType.FrequencyTable:
-                freq_table = self._prof_freq_table(req.column_index)
-                result = ColumnProfileResult(frequency_table=freq_table)
-            elif req.profile_type == ColumnProfileType.Histogram:
-                histogram = self._prof_histogram(req.column_index)
-                result = ColumnProfileResult(histogram=histogram)
-            else:
-                raise NotImplementedError(req.profile_type)
-            results.append(result.dict())
-
-        return results
+    def _get_column_profile(
+        self, req: ColumnProfileRequest, format_options: FormatOptions
+    ) -> ColumnProfileResult:
+        if req.profile_type == ColumnProfileType.NullCount:
+            count = self._prof_null_count(req.column_index)
+            return ColumnProfileResult(null_count=int(count))
+        elif req.profile_type == ColumnProfileType.SummaryStats:
+            stats = self._prof_summary_stats(req.column_index, format_options, req.quantiles)
+            return ColumnProfileResult(summary_stats=stats)
+        elif req.profile_type == ColumnProfileType.FrequencyTable:
+            freq_table = self._prof_freq_table(req.column_index, format_options)
+            return ColumnProfileResult(frequency_table=freq_table)
+        elif req.profile_type == ColumnProfileType.Histogram:
+            histogram = self._prof_histogram(req.column_index)
+            return ColumnProfileResult(histogram=histogram)
+        else:
+            raise NotImplementedError(req.profile_type)
+
+    def _get_column_profiles(
+        self, profiles: List[ColumnProfileRequest], format_options: FormatOptions
+    ) -> List[Optional[ColumnProfileResult]]:
+        # The results of several profile requests, with None for any
+        # profile that could not be computed
+        return [self._get_column_profile(req, format_options) for req in profiles]
+
+    def _group_column_profiles(
+        self, profiles: List[ColumnProfileRequest], indices: List[int]
+    ) -> List[List[int]]:
+        # The profiles at the indices, in groups that are computed
+        # together by _get_column_profiles. By default the profiles of
+        # each column are grouped, in the order the columns were
+        # requested
+        if self.BATCH_COLUMN_PROFILES:
+            return [indices] if len(indices) > 0 else []
+
+        by_column: Dict[int, List[int]] = {}
+        for i in indices:
+            by_column.setdefault(profiles[i].column_index, []).append(i)
+        return list(by_column.values())
 
     def get_state(self, _: GetStateRequest):
         self._recompute_if_needed()
@@ -208,6 +528,41 @@ class DataExplorerTableView(abc.ABC):
     def _search_schema(
         self, search_term: str, start_index: int, max_results: int
     ) -> SearchSchemaResult:
+        # Sanitize user input here for now, possibly remove this later
+        search_term = search_term.lower()
+
+        matches = self._search_schema_get_matches(search_term)
+
+        # Only the requested page of matches gets column schemas
+        matches_slice = matches[start_index : start_index + max_results]
+        return SearchSchemaResult(
+            matches=TableSchema(
+                columns=[self._get_single_column_schema(i) for i in matches_slice.tolist()]
+            ),
+            total_num_matches=len(matches),
+        )
+
+    def _search_schema_get_matches(self, search_term: str) -> "np.ndarray":
+        # The indices of the columns whose names contain the search term
+        matches = self._search_cache.get(search_term)
+        if matches is None:
+            if self._column_name_index is None:
+                self._column_name_index = _ColumnNameIndex(self._get_column_names())
+
+            # The columns matching a term are among the columns matching
+            # any part of it, such as the last term when typing
+            candidates = None
+            last_term = self._search_schema_last_term
+            if last_term is not None and last_term in search_term:
+                candidates = self._search_cache.get(last_term)
+
+            matches = self._column_name_index.search(search_term, candidates)
+            self._search_cache.put(search_term, matches)
+
+        self._search_schema_last_term = search_term
+        return matches
+
+    def _get_column_names(self) -> List:
         raise NotImplementedError
 
     def _get_data_values(
@@ -217,14 +572,221 @@ class DataExplorerTableView(abc.ABC):
         column_indices: Sequence[int],
         format_options: FormatOptions,
     ) -> TableData:
+        num_columns = self.table.shape[1]
+        row_start = max(row_start, 0)
+        row_end = min(row_start + num_rows, self._get_num_view_rows())
+        options_key = _format_options_key(format_options)
+
+        formatted_columns = []
+        for column_index in sorted(column_indices):
+            # The UI has requested data beyond the end of the table,
+            # so we stop here
+            if column_index >= num_columns:
+                break
+
+            formatted_columns.append(
+                self._get_cached_values(
+                    column_index,
+                    row_start,
+                    row_end,
+                    options_key,
+                    lambda start, end: self._format_column_range(
+                        column_index, start, end, format_options
+                    ),
+                )
+            )
+
+        if self.HAS_ROW_LABELS:
+            row_labels = [
+                self._get_cached_values(None, row_start, row_end, None, self._format_row_labels)
+            ]
+        else:
+            row_labels = None
+
+        return TableData.construct(columns=formatted_columns, row_labels=row_labels)
+
+    def _get_cached_values(
+        self,
+        column_key: Optional[int],
+        row_start: int,
+        row_end: int,
+        options_key: Optional[Tuple],
+        format_range: Callable[[int, int], List[ColumnValue]],
+    ) -> List[ColumnValue]:
+        # Serve the formatted values in the virtual row range
+        # [row_start, row_end) from cached blocks, formatting any
+        # missing blocks with a single call to format_range
+        if row_end <= row_start:
+            return []
+
+        block_size = self.VIEWPORT_BLOCK_SIZE
+        first_block = row_start // block_size
+        last_block = (row_end - 1) // block_size
+
+        def _key(block):
+            return (self._view_version, column_key, block, options_key)
+
+        blocks = {}
+        missing = []
+        for block in range(first_block, last_block + 1):
+            values = self._viewport_cache.get(_key(block))
+            if values is None:
+                missing.append(block)
+            else:
+                blocks[block] = values
+
+        # Format each run of consecutive missing blocks at once,
+        # skipping the cached blocks between runs
+        runs = []
+        for block in missing:
+            if runs and runs[-1][1] == block:
+                runs[-1][1] = block + 1
+            else:
+                runs.append([block, block + 1])
+
+        num_view_rows = self._get_num_view_rows()
+        for run_start, run_end in runs:
+            span_values = format_range(
+                run_start * block_size, min(run_end * block_size, num_view_rows)
+            )
+            for block in range(run_start, run_end):
+                offset = (block - run_start) * block_size
+                values = span_values[offset : offset + block_size]
+                blocks[block] = values
+                self._viewport_cache.put(_key(block), values)
+
+        result = []
+        for block in range(first_block, last_block + 1):
+            block_start = block * block_size
+            result.extend(blocks[block][max(row_start - block_start, 0) : row_end - block_start])
+        return result
+
+    # Whether the table has row labels to return with data values
+    HAS_ROW_LABELS = False
+
+    def _get_num_view_rows(self) -> int:
+        # The number of rows after filtering
+        if self.view_indices is not None:
+            return len(self.view_indices)
+        else:
+            return self.table.shape[0]
+
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        # Format the values of a column in the virtual (filtered and
+        # sorted) row range [start, end)
+        raise NotImplementedError
+
+    def _format_row_labels(self, start: int, end: int) -> List[ColumnValue]:
         raise NotImplementedError
 
     def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
+        sel = selection.selection
+        if selection.kind == DataSelectionKind.SingleCell:
+            assert isinstance(sel, DataSelectionSingleCell)
+            cell = self._export_cell(sel.row_index, sel.column_index)
+            return ExportedData(data=cell, format=fmt)
+        elif selection.kind == DataSelectionKind.CellRange:
+            assert isinstance(sel, DataSelectionCellRange)
+            return self._export_tabular(
+                slice(sel.first_row_index, sel.last_row_index + 1),
+                slice(sel.first_column_index, sel.last_column_index + 1),
+                fmt,
+            )
+        elif selection.kind == DataSelectionKind.RowRange:
+            assert isinstance(sel, DataSelectionRange)
+            return self._export_tabular(
+                slice(sel.first_index, sel.last_index + 1),
+                None,
+                fmt,
+            )
+        elif selection.kind == DataSelectionKind.ColumnRange:
+            assert isinstance(sel, DataSelectionRange)
+            return self._export_tabular(
+                None,
+                slice(sel.first_index, sel.last_index + 1),
+                fmt,
+            )
+        elif selection.kind == DataSelectionKind.RowIndices:
+            assert isinstance(sel, DataSelectionIndices)
+            return self._export_tabular(sel.indices, None, fmt)
+        elif selection.kind == DataSelectionKind.ColumnIndices:
+            assert isinstance(sel, DataSelectionIndices)
+            return self._export_tabular(None, sel.indices, fmt)
+        else:
+            raise NotImplementedError(f"Unknown data export: {selection.kind}")
+
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        # The value at a row index of the view, as a string
         raise NotImplementedError
 
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
+        # Export the rows of the view and the columns selected by a
+        # slice or list of indices, or all of them if None
+        raise NotImplementedError
+
+    @staticmethod
+    def _selected_columns(column_selector, num_columns: int) -> List[int]:
+        if column_selector is None:
+            return list(range(num_columns))
+        elif isinstance(column_selector, slice):
+            return list(range(num_columns)[column_selector])
+        return list(column_selector)
+
     def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
         raise NotImplementedError
 
+    def _set_filter_error(self, filt: RowFilter, e: Exception):
+        # Filter fails: we capture the error message and mark the
+        # filter as invalid
+        filt.is_valid = False
+        filt.error_message = str(e)
+        logger.warning(e, exc_info=True)
+
+    SUPPORTED_FILTERS: Set[RowFilterType] = set()
+
+    def _is_supported_filter(self, filt: RowFilter) -> bool:
+        if filt.filter_type not in self.SUPPORTED_FILTERS:
+            return False
+
+        display_type = filt.column_schema.type_display
+
+        if filt.filter_type in [
+            RowFilterType.IsEmpty,
+            RowFilterType.NotEmpty,
+            RowFilterType.Search,
+        ]:
+            # String-only filter types
+            return display_type == ColumnDisplayType.String
+        elif filt.filter_type == RowFilterType.Compare:
+            compare_op = filt.compare_params.op
+            if compare_op in [
+                CompareFilterParamsOp.Eq,
+                CompareFilterParamsOp.NotEq,
+            ]:
+                return True
+            else:
+                return display_type in _FILTER_RANGE_COMPARE_SUPPORTED
+        elif filt.filter_type in [
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ]:
+            return display_type in _FILTER_RANGE_COMPARE_SUPPORTED
+        elif filt.filter_type in [
+            RowFilterType.IsTrue,
+            RowFilterType.IsFalse,
+        ]:
+            return display_type == ColumnDisplayType.Boolean
+        else:
+            # Filters always supported
+            assert filt.filter_type in [
+                RowFilterType.IsNull,
+                RowFilterType.NotNull,
+                RowFilterType.SetMembership,
+            ]
+            return True
+
     def _set_sort_columns(self, sort_keys: List[ColumnSortKey]):
         raise NotImplementedError
 
@@ -234,17 +796,81 @@ class DataExplorerTableView(abc.ABC):
     def _prof_null_count(self, column_index: int) -> int:
         raise NotImplementedError
 
-    def _prof_summary_stats(self, column_index: int, options: FormatOptions) -> ColumnSummaryStats:
+    def _prof_summary_stats(
+        self,
+        column_index: int,
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ) -> ColumnSummaryStats:
         raise NotImplementedError
 
-    def _prof_freq_table(self, column_index: int) -> ColumnFrequencyTable:
+    def _prof_freq_table(self, column_index: int, options: FormatOptions) -> ColumnFrequencyTable:
         raise NotImplementedError
 
     def _prof_histogram(self, column_index: int) -> ColumnHistogram:
         raise NotImplementedError
 
+    @staticmethod
+    def _supported_features(supported_filters: Set[RowFilterType]) -> SupportedFeatures:
+        # The features of views that support filtering by
+        # supported_filters, sorting, profiles and exporting
+        return SupportedFeatures(
+            search_schema=SearchSchemaFeatures(support_status=SupportStatus.Supported),
+            set_row_filters=SetRowFiltersFeatures(
+                support_status=SupportStatus.Supported,
+                # Temporarily disabled for https://github.com/posit-dev/positron/issues/3489 on
+                # 6/11/2024. This will be enabled again when the UI has been reworked to support
+                # grouping.
+                supports_conditions=SupportStatus.Unsupported,
+                supported_types=[
+                    RowFilterTypeSupportStatus(
+                        row_filter_type=x, support_status=SupportStatus.Supported
+                    )
+                    for x in supported_filters
+                ],
+            ),
+            get_column_profiles=GetColumnProfilesFeatures(
+                support_status=SupportStatus.Supported,
+                supported_types=[
+                    ColumnProfileTypeSupportStatus(
+                        profile_type=ColumnProfileType.NullCount,
+                        support_status=SupportStatus.Supported,
+                    ),
+                    # Temporarily disabled for https://github.com/posit-dev/positron/issues/3490
+                    # on 6/11/2024. This will be enabled again when the UI has been reworked to
+                    # more fully support column profiles.
+                    ColumnProfileTypeSupportStatus(
+                        profile_type=ColumnProfileType.SummaryStats,
+                        support_status=SupportStatus.Experimental,
+                    ),
+                    ColumnProfileTypeSupportStatus(
+                        profile_type=ColumnProfileType.FrequencyTable,
+                        support_status=SupportStatus.Experimental,
+                    ),
+                    ColumnProfileTypeSupportStatus(
+                        profile_type=ColumnProfileType.Histogram,
+                        support_status=SupportStatus.Experimental,
+                    ),
+                ],
+            ),
+            set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
+            export_data_selection=ExportDataSelectionFeatures(
+                support_status=SupportStatus.Supported
+            ),
+        )
+
+    FEATURES: SupportedFeatures
+
     def _get_state(self) -> BackendState:
-        raise NotImplementedError
+        num_rows, num_columns = self.table.shape
+        return BackendState(
+            display_name=self.display_name,
+            table_shape=TableShape(num_rows=self._get_num_view_rows(), num_columns=num_columns),
+            table_unfiltered_shape=TableShape(num_rows=num_rows, num_columns=num_columns),
+            row_filters=self.filters,
+            sort_keys=self.sort_keys,
+            supported_features=self.FEATURES,
+        )
 
 
 class UnsupportedView(DataExplorerTableView):
@@ -261,6 +887,55 @@ _VALUE_NONE = 4
 _VALUE_INF = 10
 _VALUE_NEGINF = 11
 
+# Code of formatted values, as opposed to special values, in the
+# utf8 encoding of data values
+_VALUE_FORMATTED = 255
+
+
+def _encode_utf8_columns(columns: List[List[ColumnValue]]) -> List[memoryview]:
+    """
+    Pack the values of the columns, one column after another, into the
+    buffers of the utf8 table data encoding: the offsets of the values
+    in the UTF-8 data, the data, and the special value code of each
+    value, which is empty if there are no special values. The frontend
+    can read the buffers without parsing any JSON.
+    """
+    values = list(itertools.chain.from_iterable(columns))
+    num_values = len(values)
+
+    special_codes = np_.empty(0, dtype=np_.uint8)
+    try:
+        text = "\0".join(values)
+    except TypeError:
+        # Special values are codes, which take up no data
+        positions = [i for i, value in enumerate(values) if value.__class__ is not str]
+        special_codes = np_.full(num_values, _VALUE_FORMATTED, dtype=np_.uint8)
+        special_codes[positions] = [values[i] for i in positions]
+        for i in positions:
+            values[i] = ""
+        text = "\0".join(values)
+
+    # NUL separators are the only zero bytes in the UTF-8 text unless a
+    # value has NUL characters, so we can find where the values start
+    # without measuring each value, and the data is the text without
+    # the separators
+    joined = np_.frombuffer(text.encode("utf-8"), dtype=np_.uint8)
+    is_separator = joined == 0
+    separators = np_.flatnonzero(is_separator)
+    num_separators = max(num_values - 1, 0)
+
+    offsets = np_.zeros(num_values + 1, dtype="<u4")
+    if len(separators) == num_separators:
+        offsets[1:num_values] = separators - np_.arange(num_separators)
+        offsets[num_values] = len(joined) - num_separators
+        data = joined[~is_separator]
+    else:
+        encoded = [value.encode("utf-8") for value in values]
+        np_.cumsum([len(value) for value in encoded], out=offsets[1:])
+        data = b"".join(encoded)
+
+    return [memoryview(offsets), memoryview(data), memoryview(special_codes)]
+
 
 if np_ is not None:
 
@@ -333,6 +1008,87 @@ def _get_float_formatter(options: FormatOptions) -> Callable:
         return base_float_format
 
 
+def _format_options_key(options: FormatOptions) -> Tuple:
+    # FormatOptions is not hashable, so we use the tuple of its fields
+    # when caching anything that depends on the formatting options
+    return (
+        options.large_num_digits,
+        options.small_num_digits,
+        options.max_integral_digits,
+        options.thousands_sep,
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _get_float_array_formatter_cached(options_key: Tuple) -> Callable:
+    large_num_digits, small_num_digits, max_integral_digits, thousands_sep = options_key
+
+    # These must yield exactly the same strings as the scalar
+    # formatter returned by _get_float_formatter
+    sci_format = f"{{:.{large_num_digits}E}}".format
+    small_format = f"{{:.{small_num_digits}f}}".format
+    if thousands_sep is not None:
+        medium_format = f"{{:,.{large_num_digits}f}}".format
+    else:
+        medium_format = f"{{:.{large_num_digits}f}}".format
+
+    if thousands_sep is not None and thousands_sep != ",":
+
+        def _medium_format(x) -> str:
+            return medium_format(x).replace(",", thousands_sep)
+
+    else:
+        _medium_format = medium_format
+
+    upper_threshold = float("1" + "0" * max_integral_digits)
+    lower_threshold = float("0." + "0" * (small_num_digits - 1) + "1")
+
+    def float_array_format(values: "np.ndarray") -> "np.ndarray":
+        # Compare against the thresholds in double precision like the
+        # scalar formatter does with Python floats
+        values = values.astype(np_.float64, copy=False)
+        result = np_.empty(len(values), dtype=object)
+
+        isnan = np_.isnan(values)
+        isinf = np_.isinf(values)
+        result[isnan] = _VALUE_NAN
+        result[isinf & (values > 0)] = _VALUE_INF
+        result[isinf & (values < 0)] = _VALUE_NEGINF
+
+        finite = ~(isnan | isinf)
+        abs_values = np_.abs(values)
+
+        # Partition the finite values into the same three cases as
+        # the scalar formatter, then format each partition in bulk
+        is_medium = finite & (
+            ((abs_values >= 1) & (abs_values < upper_threshold)) | (abs_values == 0)
+        )
+        is_small = finite & (abs_values < 1) & (abs_values >= lower_threshold) & (abs_values != 0)
+        is_sci = finite & ~(is_medium | is_small)
+
+        for mask, formatter in (
+            (is_medium, _medium_format),
+            (is_small, small_format),
+            (is_sci, sci_format),
+        ):
+            if mask.any():
+                result[mask] = list(map(formatter, values[mask].tolist()))
+
+        return result
+
+    return float_array_format
+
+
+def _get_float_array_formatter(options: FormatOptions) -> Callable:
+    """
+    Return a function that formats a 1-D floating point NumPy array
+    in bulk into an object array, with the same output as the scalar
+    formatter returned by _get_float_formatter. The formatters are
+    cached per unique set of formatting options.
+    """
+    return _get_float_array_formatter_cached(_format_options_key(options))
+
+
 _FILTER_RANGE_COMPARE_SUPPORTED = {
     ColumnDisplayType.Number,
     ColumnDisplayType.Date,
@@ -346,24 +1102,1323 @@ def _pandas_datetimetz_mapper(type_name):
         return "datetime"
 
 
-class PandasView(DataExplorerTableView):
-    TYPE_NAME_MAPPING = {"boolean": "bool"}
+# Number of datetime64 ticks in one second for the units supported by
+# pandas
+_DATETIME64_TICKS_PER_SECOND = {
+    "s": 1,
+    "ms": 1_000,
+    "us": 1_000_000,
+    "ns": 1_000_000_000,
+}
 
-    def __init__(
-        self,
-        display_name: str,
-        table,
-        filters: Optional[List[RowFilter]],
-        sort_keys: Optional[List[ColumnSortKey]],
+
+def _to_object_array(items) -> "np.ndarray":
+    result = np_.empty(len(items), dtype=object)
+    result[:] = items
+    return result
+
+
+def _format_utc_offset(seconds: int) -> str:
+    # Same as the UTC offset suffix in datetime.isoformat
+    sign = "-" if seconds < 0 else "+"
+    hours, rest = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(rest, 60)
+    result = f"{sign}{hours:02d}:{minutes:02d}"
+    if seconds:
+        result += f":{seconds:02d}"
+    return result
+
+
+def _format_datetime64_array(values: "np.ndarray", utc_values=None) -> Optional["np.ndarray"]:
+    """
+    Format a datetime64 array in bulk like str(pandas.Timestamp), so
+    with nanoseconds or microseconds only when they are non-zero. If
+    utc_values is passed, values are the local wall times of a
+    time zone-aware array and the UTC offsets are appended.
+
+    Returns None for units that we do not know how to format.
+    """
+    unit, count = np_.datetime_data(values.dtype)
+    if unit not in _DATETIME64_TICKS_PER_SECOND or count != 1:
+        return None
+
+    ticks_per_second = _DATETIME64_TICKS_PER_SECOND[unit]
+    ticks = values.view("i8")
+
+    formatted = np_.char.replace(np_.datetime_as_string(values, unit="s"), "T", " ")
+
+    # The modulo of a positive divisor is non-negative, which is what
+    # we want for datetimes before the epoch
+    fraction_ns = (ticks % ticks_per_second) * (1_000_000_000 // ticks_per_second)
+    has_nanos = fraction_ns % 1000 != 0
+    has_micros = (fraction_ns != 0) & ~has_nanos
+
+    # Widen the string dtype so that the suffixes fit
+    formatted = formatted.astype("U40")
+    if has_micros.any():
+        formatted[has_micros] = np_.char.add(
+            formatted[has_micros], np_.char.mod(".%06d", fraction_ns[has_micros] // 1000)
+        )
+    if has_nanos.any():
+        formatted[has_nanos] = np_.char.add(
+            formatted[has_nanos], np_.char.mod(".%09d", fraction_ns[has_nanos])
+        )
+
+    if utc_values is not None:
+        offsets = (ticks - utc_values.view("i8")) // ticks_per_second
+        unique_offsets, inverse = np_.unique(offsets, return_inverse=True)
+        offset_strings = np_.array([_format_utc_offset(int(x)) for x in unique_offsets], dtype=str)
+        formatted = np_.char.add(formatted, offset_strings.take(inverse))
+
+    result = formatted.astype(object)
+    result[np_.isnat(values)] = _VALUE_NAT
+    return result
+
+
+def _pandas_format_object(values: "pd.Series", options: FormatOptions) -> "np.ndarray":
+    # Per-value fallback for object dtype and other columns that
+    # cannot be formatted in bulk
+    NaT = pd_.NaT
+    NA = pd_.NA
+    float_format = _get_float_formatter(options)
+
+    def _format_value(x):
+        if _is_float_scalar(x):
+            if _isnan(x):
+                return _VALUE_NAN
+            elif _isinf(x):
+                return _VALUE_INF if x > 0 else _VALUE_NEGINF
+            else:
+                return float_format(x)
+        elif x is None:
+            return _VALUE_NONE
+        elif x is NaT:
+            return _VALUE_NAT
+        elif x is NA:
+            return _VALUE_NA
+        else:
+            return str(x)
+
+    return _to_object_array([_format_value(x) for x in values])
+
+
+def _format_numpy_array(values: "np.ndarray", options: FormatOptions) -> Optional["np.ndarray"]:
+    kind = values.dtype.kind
+    if kind == "f":
+        return _get_float_array_formatter(options)(values)
+    elif kind in ("i", "u", "b", "c"):
+        # tolist() converts to Python scalars much faster than boxing
+        # each value, and is what iterating a Series yields too
+        return _to_object_array(list(map(str, values.tolist())))
+    elif kind == "M":
+        return _format_datetime64_array(values)
+    else:
+        return None
+
+
+def _pandas_format_categorical(values: "pd.Series", options: FormatOptions) -> "np.ndarray":
+    # Format each category once and then take the formatted
+    # categories by their codes
+    codes = values.cat.codes.to_numpy()
+    result = _pandas_format_column(pd_.Series(values.cat.categories), options).take(codes)
+
+    is_missing = codes == -1
+    if is_missing.any():
+        missing_value = _pandas_format_object(values[is_missing].iloc[:1], options)[0]
+        result[is_missing] = missing_value
+    return result
+
+
+def _pandas_format_column(values: "pd.Series", options: FormatOptions) -> "np.ndarray":
+    """
+    Format a pandas Series of values for the data grid as an object
+    array of strings or special value codes. The formatting method is
+    selected once for the whole column from its dtype so that the
+    NaN/inf/null handling and string conversion can be done in bulk,
+    leaving only object dtype and uncommon extension types to be
+    formatted value by value.
+    """
+    dtype = values.dtype
+    result = None
+
+    if isinstance(dtype, np_.dtype):
+        result = _format_numpy_array(values.to_numpy(), options)
+    elif isinstance(dtype, pd_.DatetimeTZDtype):
+        result = _format_datetime64_array(
+            values.dt.tz_localize(None).to_numpy(),
+            utc_values=values.dt.tz_convert(None).to_numpy(),
+        )
+    elif isinstance(dtype, pd_.CategoricalDtype):
+        result = _pandas_format_categorical(values, options)
+    elif isinstance(dtype, pd_.StringDtype):
+        result = values.to_numpy(dtype=object, na_value=_VALUE_NA)
+    elif getattr(dtype, "kind", None) in ("i", "u", "f", "b") and hasattr(dtype, "numpy_dtype"):
+        # Nullable masked or Arrow-backed numbers and booleans: we
+        # format the data with the NumPy formatters and then replace
+        # the nulls
+        is_na = values.isna().to_numpy()
+        result = _format_numpy_array(values.to_numpy(dtype=dtype.numpy_dtype, na_value=0), options)
+        if result is not None:
+            result[is_na] = _VALUE_NA
+
+    if result is None:
+        result = _pandas_format_object(values, options)
+
+    return result
+
+
+_BACKGROUND_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_background_executor() -> ThreadPoolExecutor:
+    # Worker thread for computations whose results are not needed to
+    # answer the current request
+    global _BACKGROUND_EXECUTOR
+    if _BACKGROUND_EXECUTOR is None:
+        _BACKGROUND_EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="positron-data-explorer"
+        )
+    return _BACKGROUND_EXECUTOR
+
+
+def _stable_order(rows: "np.ndarray", keys: "np.ndarray", na_rows: "np.ndarray") -> "np.ndarray":
+    return np_.concatenate([rows.take(np_.argsort(keys, kind="stable")), na_rows])
+
+
+class _LazySortOrder:
+    """
+    Stable sort order of table rows by integer sort keys, which is
+    materialized lazily: only a prefix of the order is sorted, using
+    np.argpartition and a small sort of the selected rows, until more
+    of it is needed. Rows with missing values follow in their original
+    order. The complete order can be computed in the background, by a
+    future whose result is transformed into the order if needed.
+
+    Stands in for a NumPy array of view indices, supporting len() and
+    indexing with integers, slices and arrays.
+    """
+
+    # Length of the first prefix that is sorted
+    MIN_PREFIX_LENGTH = 1024
+
+    def __init__(
+        self,
+        rows: "np.ndarray",
+        keys: "np.ndarray",
+        na_rows: "np.ndarray",
+        complete_order: Optional[Future] = None,
+        transform: Optional[Callable[["np.ndarray"], "np.ndarray"]] = None,
     ):
-        table = self._maybe_wrap(table)
+        self._rows = rows
+        self._keys = keys
+        self._na_rows = na_rows
+        self._num_keys = len(keys)
+        self._prefix = rows[:0]
+        self._order = None
+        self._future = complete_order
+        self._transform = transform
+
+    def __len__(self) -> int:
+        return self._num_keys + len(self._na_rows)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._get_range(start, max(start, stop))
+        elif isinstance(key, (int, np_.integer)):
+            index = operator.index(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(key)
+            return self._get_range(index, index + 1)[0]
+        return self.complete()[key]
+
+    def __array__(self, dtype=None):
+        order = self.complete()
+        return order if dtype is None else order.astype(dtype)
+
+    @property
+    def is_complete(self) -> bool:
+        return self._order is not None
+
+    def complete(self) -> "np.ndarray":
+        if self._order is None:
+            order = None
+            if self._future is not None and not self._future.cancelled():
+                try:
+                    order = self._future.result()
+                except Exception as e:
+                    logger.warning(e, exc_info=True)
+                else:
+                    if self._transform is not None:
+                        order = self._transform(order)
+            if order is None:
+                order = _stable_order(self._rows, self._keys, self._na_rows)
+            self._order = order
+
+            # The keys are no longer needed
+            self._rows = self._keys = self._prefix = self._future = self._transform = None
+        return self._order
+
+    def _get_range(self, start: int, stop: int) -> "np.ndarray":
+        if self._order is None and self._future is not None and self._future.done():
+            self.complete()
+
+        if self._order is not None:
+            return self._order[start:stop]
+
+        num_keys = self._num_keys
+        if stop > len(self._prefix) and start < num_keys:
+            self._sort_prefix(min(stop, num_keys))
+            if self._order is not None:
+                return self._order[start:stop]
+
+        if stop <= num_keys:
+            return self._prefix[start:stop]
+        else:
+            # The range extends into the rows with missing values
+            return np_.concatenate(
+                [
+                    self._prefix[start:num_keys],
+                    self._na_rows[max(start - num_keys, 0) : stop - num_keys],
+                ]
+            )
+
+    def _sort_prefix(self, length: int):
+        # Sort a prefix at least twice as long as the previous one so
+        # that scrolling deeper amortizes the cost of partitioning
+        length = max(length, 2 * len(self._prefix), self.MIN_PREFIX_LENGTH)
+        if 4 * length >= self._num_keys:
+            self.complete()
+            return
+
+        keys = self._keys
+
+        # The rows with keys less than the length-th smallest key come
+        # first, followed by the earliest rows having that key
+        kth = np_.partition(keys, length - 1)[length - 1]
+        selected = (keys < kth).nonzero()[0]
+        ties = (keys == kth).nonzero()[0][: length - len(selected)]
+        selected = np_.sort(np_.concatenate([selected, ties]))
+        selected = selected.take(np_.argsort(keys.take(selected), kind="stable"))
+        self._prefix = self._rows.take(selected)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self._rows, self._keys, self._na_rows, self._prefix, self._order]
+        return sum(array.nbytes for array in arrays if array is not None)
+
+
+def _row_index_dtype(num_rows: int) -> "np.dtype":
+    # The smallest integer type of the row indices of a table
+    if num_rows <= np_.iinfo(np_.int32).max:
+        return np_.dtype(np_.int32)
+    return np_.dtype(np_.int64)
+
+
+class _RowBitmap:
+    """
+    Increasing row indices of a table stored as a bit-packed mask of
+    all its rows, which is smaller than an array of the indices when
+    more than one in 32 rows are selected. The number of selected rows
+    before each block of rows is kept, so that ranges of the indices
+    are found by unpacking only the blocks that contain them.
+
+    Stands in for a NumPy array of row indices, as _LazySortOrder
+    does, supporting len() and indexing with integers, slices and
+    arrays.
+    """
+
+    # Number of rows in each block, which is a multiple of 8
+    BLOCK_SIZE = 65536
+
+    def __init__(self, mask: "np.ndarray"):
+        self.num_rows = len(mask)
+        self._dtype = _row_index_dtype(self.num_rows)
+        self._bits = np_.packbits(mask)
+
+        block_counts = np_.add.reduceat(
+            mask.view(np_.uint8), np_.arange(0, self.num_rows, self.BLOCK_SIZE), dtype=np_.int64
+        )
+        self._offsets = np_.concatenate([[0], np_.cumsum(block_counts)])
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            if step == 1:
+                return self._get_range(start, max(start, stop))
+        elif isinstance(key, (int, np_.integer)):
+            index = operator.index(key)
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError(key)
+            return self._get_range(index, index + 1)[0]
+        return self.to_indices()[key]
+
+    def __array__(self, dtype=None):
+        indices = self.to_indices()
+        return indices if dtype is None else indices.astype(dtype)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes + self._offsets.nbytes
+
+    def to_mask(self) -> "np.ndarray":
+        return _unpack_mask(self._bits, self.num_rows)
+
+    def to_indices(self) -> "np.ndarray":
+        return np_.flatnonzero(self.to_mask()).astype(self._dtype, copy=False)
+
+    def _get_range(self, start: int, stop: int) -> "np.ndarray":
+        if start >= stop:
+            return np_.empty(0, dtype=self._dtype)
+
+        # Unpack the blocks from the one containing the start-th
+        # selected row to the one containing the last selected row
+        first, last = np_.searchsorted(self._offsets, [start, stop - 1], side="right") - 1
+        row_start = int(first) * self.BLOCK_SIZE
+        row_stop = min((int(last) + 1) * self.BLOCK_SIZE, self.num_rows)
+        bits = np_.unpackbits(self._bits[row_start // 8 :], count=row_stop - row_start)
+        rows = np_.flatnonzero(bits).astype(self._dtype, copy=False) + row_start
+        skip = start - int(self._offsets[first])
+        return rows[skip : skip + stop - start]
+
+
+def _compact_row_indices(mask: "np.ndarray", bitmap_min_rows: int):
+    """
+    The indices of the rows selected by a boolean mask, as a
+    _RowBitmap if the table has at least bitmap_min_rows rows and the
+    bitmap is smaller than the indices, and otherwise as an array of
+    the smallest integer type that holds them.
+    """
+    num_rows = len(mask)
+    dtype = _row_index_dtype(num_rows)
+    if num_rows >= bitmap_min_rows and np_.count_nonzero(mask) * dtype.itemsize > num_rows // 8:
+        return _RowBitmap(mask)
+    return np_.flatnonzero(mask).astype(dtype, copy=False)
+
+
+def _row_indices_nbytes(indices) -> int:
+    # Memory used by the row indices of any view type: NumPy and
+    # pyarrow arrays, polars Series and the stand-ins for arrays
+    if indices is None:
+        return 0
+    if hasattr(indices, "estimated_size"):
+        return int(indices.estimated_size())
+    return int(getattr(indices, "nbytes", 0))
+
+
+def _has_numpy_stats(dtype) -> bool:
+    return isinstance(dtype, np_.dtype) and dtype.kind in "iuf"
+
+
+def _has_numpy_sort_keys(dtype) -> bool:
+    return isinstance(dtype, np_.dtype) and dtype.kind in "biufmM"
+
+
+def _pandas_sort_codes(column: "pd.Series") -> Tuple["np.ndarray", int]:
+    # Codes of the values in sorted order, with -1 for missing values,
+    # and the number of distinct values
+    codes, uniques = pd_.factorize(column, sort=True)
+    return codes, len(uniques)
+
+
+def _pandas_sort_keys(column: "pd.Series", ascending: bool, codes=None):
+    """
+    Compute int64 keys whose stable order is the order of the values
+    of the column, along with a mask of missing values (or None if
+    there are none), which are to be sorted last. For columns with
+    non-NumPy dtypes, the keys are the codes from _pandas_sort_codes,
+    which are computed if not passed.
+    """
+    dtype = column.dtype
+    na_mask = None
+    if _has_numpy_sort_keys(dtype):
+        values = column.to_numpy()
+        if dtype.kind == "f":
+            na_mask = np_.isnan(values)
+            # Reinterpret the IEEE 754 bits as integers that order the
+            # same way as the floats, after normalizing -0.0 to 0.0
+            bits = (values.astype(np_.float64) + 0.0).view(np_.int64)
+            keys = bits ^ ((bits >> 63) & np_.int64(0x7FFFFFFFFFFFFFFF))
+        elif dtype.kind in "mM":
+            keys = values.view(np_.int64)
+            na_mask = keys == np_.iinfo(np_.int64).min
+        elif dtype.kind == "u" and dtype.itemsize == 8:
+            keys = (values ^ np_.uint64(1 << 63)).view(np_.int64)
+        else:
+            keys = values.astype(np_.int64)
+    else:
+        if codes is None:
+            codes, _ = _pandas_sort_codes(column)
+        keys = codes.astype(np_.int64, copy=False)
+        na_mask = codes == -1
+
+    if not ascending:
+        # Reverses the order without overflowing
+        keys = ~keys
+
+    if na_mask is not None and not na_mask.any():
+        na_mask = None
+
+    return keys, na_mask
+
+
+def _pandas_multi_sort_keys(column_codes: List[Tuple["np.ndarray", int]], ascending: List[bool]):
+    """
+    Compute int64 keys whose stable order is the lexicographic order
+    of columns, given their codes from _pandas_sort_codes, with missing
+    values last for each column. Returns a list of keys for each column
+    (most significant first) if they cannot be combined into a single
+    64-bit key.
+    """
+    column_keys = []
+    radixes = []
+    for (codes, num_uniques), asc in zip(column_codes, ascending):
+        keys = codes.astype(np_.int64)
+        if not asc:
+            keys = (num_uniques - 1) - keys
+        keys[codes == -1] = num_uniques
+        column_keys.append(keys)
+        radixes.append(num_uniques + 1)
+
+    if math.prod(radixes) >= 2**62:
+        return column_keys
+
+    combined = column_keys[0]
+    for keys, radix in zip(column_keys[1:], radixes[1:]):
+        combined = combined * radix + keys
+    return combined
+
+
+def _filter_sort_order(order: "np.ndarray", mask: "np.ndarray") -> "np.ndarray":
+    # The sort order of a subset of rows is the order of all the rows
+    # with the unselected rows removed
+    return order[mask.take(order)]
+
+
+def _row_filter_key(filt: RowFilter) -> str:
+    # Canonical representation of the rows that a filter selects,
+    # leaving out its id, condition and validity so that equivalent
+    # filters share their evaluated masks
+    return filt.json(
+        include={
+            "filter_type": True,
+            "column_schema": {"column_index"},
+            "between_params": True,
+            "compare_params": True,
+            "search_params": True,
+            "set_membership_params": True,
+        },
+        sort_keys=True,
+    )
+
+
+def _row_filter_keys(filters: List[RowFilter]) -> List[Tuple[str, Optional[RowFilterCondition]]]:
+    # The condition of the first filter is not used when combining
+    # filters, so it is left out of the keys
+    return [
+        (_row_filter_key(filt), filt.condition if i > 0 else None) for i, filt in enumerate(filters)
+    ]
+
+
+def _packed_mask_nbytes(entry) -> int:
+    packed_values, packed_evaluated = entry
+    nbytes = packed_values.nbytes
+    if packed_evaluated is not None:
+        nbytes += packed_evaluated.nbytes
+    return nbytes
+
+
+def _sort_cache_nbytes(value) -> int:
+    if isinstance(value, tuple):
+        # Codes and number of unique values
+        return value[0].nbytes
+    return value.nbytes
+
+
+def _dictionary_nbytes(value) -> int:
+    # Codes and distinct values of a dictionary-encoded column
+    codes, uniques = value
+    return codes.nbytes + uniques.memory_usage(index=False)
+
+
+def _compact_codes(codes: "np.ndarray", num_uniques: int) -> "np.ndarray":
+    # Codes in the smallest signed integer type that can hold them
+    for dtype in (np_.int8, np_.int16, np_.int32):
+        if num_uniques <= np_.iinfo(dtype).max:
+            return codes.astype(dtype)
+    return codes
+
+
+def _is_arrow_dictionary(dtype) -> bool:
+    if not isinstance(dtype, pd_.ArrowDtype):
+        return False
+
+    import pyarrow as pa
+
+    return pa.types.is_dictionary(dtype.pyarrow_dtype)
+
+
+def _unpack_mask(packed: "np.ndarray", num_rows: int) -> "np.ndarray":
+    return np_.unpackbits(packed, count=num_rows).view(bool)
+
+
+def _sample_rows(filtered_indices: Optional["np.ndarray"], num_rows: int, sample_size: int):
+    # Random sample of sample_size of the filtered rows, in order. The
+    # seed is fixed so that the same rows give the same estimates
+    rng = np_.random.default_rng(0)
+    positions = np_.sort(rng.choice(num_rows, size=sample_size, replace=False))
+    if filtered_indices is None:
+        return positions
+    return filtered_indices[positions]
+
+
+# Values that are not NumPy arrays are charged this many bytes per
+# row against the hashing budget of fingerprints, as hashing them
+# with hash_pandas_object is hundreds of times slower per row than
+# hashing a row of a NumPy array
+_FINGERPRINT_OBJECT_ROW_BYTES = 512
+
+
+def _pandas_fingerprint(values, max_hash_bytes: int) -> Tuple[Hashable, int]:
+    """
+    Cheap fingerprint of the values of a Series or Index: its dtype,
+    its length, the memory of NumPy values and a hash of the values,
+    with the number of bytes hashed. Values modified in place keep
+    their memory, so only the hash shows that they have not changed.
+    Values that cost more than max_hash_bytes to hash are not hashed,
+    and their hash is unknown: it is not equal to any other hash, so
+    they are always taken to have changed.
+    """
+    if isinstance(values, pd_.RangeIndex):
+        return ("range", (values.start, values.stop, values.step)), 0
+
+    num_rows = len(values)
+    dtype = values.dtype
+    try:
+        if isinstance(dtype, np_.dtype) and dtype != object:
+            array = values.to_numpy()
+            memory = (array.__array_interface__["data"][0], array.strides)
+            cost = array.nbytes
+            if cost <= max_hash_bytes:
+                return (dtype, num_rows, memory, zlib.crc32(np_.ascontiguousarray(array))), cost
+        else:
+            memory = None
+            cost = num_rows * _FINGERPRINT_OBJECT_ROW_BYTES
+            if cost <= max_hash_bytes:
+                hashes = pd_.util.hash_pandas_object(values, index=False).to_numpy()
+                return (dtype, num_rows, memory, zlib.crc32(hashes)), cost
+    except Exception:
+        # Values that cannot be hashed never have the same fingerprint
+        return object(), 0
+    return (dtype, num_rows, memory, object()), 0
+
+
+def _same_fingerprinted_values(a: Hashable, b: Hashable) -> bool:
+    # Whether two fingerprints from _pandas_fingerprint are of the same
+    # values, wherever the values are in memory
+    if isinstance(a, tuple) and isinstance(b, tuple) and len(a) == len(b) == 4:
+        return a[:2] == b[:2] and a[3] == b[3]
+    return a == b
+
+
+def _merge_appended_rows(
+    order: "np.ndarray",
+    num_old_rows: int,
+    rows: "np.ndarray",
+    keys: "np.ndarray",
+    na_rows: "np.ndarray",
+) -> "np.ndarray":
+    """
+    The result of _stable_order(rows, keys, na_rows), computed from
+    the order of the first num_old_rows rows by sorting the rows after
+    them and merging them in. As for _stable_order, the rows and
+    na_rows are increasing.
+    """
+    num_old_keys = int(np_.searchsorted(rows, num_old_rows))
+    old_sorted = order[:num_old_keys]
+    new_sorted = _stable_order(rows[num_old_keys:], keys[num_old_keys:], na_rows[:0])
+    new_na_rows = na_rows[np_.searchsorted(na_rows, num_old_rows) :]
+
+    # The appended rows go after the old rows with equal keys
+    row_keys = np_.empty(len(rows) + len(na_rows), dtype=np_.int64)
+    row_keys[rows] = keys
+    positions = np_.searchsorted(row_keys.take(old_sorted), row_keys.take(new_sorted), "right")
+    return np_.concatenate(
+        [np_.insert(old_sorted, positions, new_sorted), order[num_old_keys:], new_na_rows]
+    )
+
+
+def _histogram(values: "np.ndarray", num_bins: int, scale: float = 1.0) -> ColumnHistogram:
+    """
+    Histogram of the finite values of an int, uint or float array. If
+    the values are a sample, the bin sizes are multiplied by scale to
+    estimate the histogram of all the values.
+    """
+    if values.dtype.kind == "f":
+        values = values[np_.isfinite(values)]
+
+    if len(values) == 0:
+        bin_sizes, bin_width = np_.array([], dtype=np_.int64), 0
+    else:
+        min_value, max_value = values.min(), values.max()
+        value_range = int(max_value) - int(min_value) if values.dtype.kind in "iu" else None
+        if value_range is not None and value_range < 2**62:
+            # Integers are counted in bins of a whole number of values
+            bin_width = -(-(value_range + 1) // num_bins)
+            bin_ids = (values.astype(np_.int64) - int(min_value)) // bin_width
+            bin_sizes = np_.bincount(bin_ids)
+        elif min_value == max_value:
+            bin_sizes, bin_width = np_.array([len(values)]), 0.0
+        else:
+            bin_sizes, _ = np_.histogram(values, bins=num_bins, range=(min_value, max_value))
+            bin_width = float(max_value - min_value) / num_bins
+
+    if scale != 1.0:
+        bin_sizes = np_.rint(bin_sizes * scale)
+
+    return ColumnHistogram(
+        bin_sizes=[int(x) for x in bin_sizes],
+        bin_width=bin_width,
+        exact=scale == 1.0,
+    )
 
-        super().__init__(display_name, table, filters, sort_keys)
+
+def _top_counts(counts: "np.ndarray", k: int) -> "np.ndarray":
+    # Positions of the k largest counts, largest first, breaking ties
+    # by position
+    if len(counts) > k:
+        kth_largest = np_.partition(counts, len(counts) - k)[len(counts) - k]
+        above = np_.flatnonzero(counts > kth_largest)
+        ties = np_.flatnonzero(counts == kth_largest)[: k - len(above)]
+        top = np_.concatenate([above, ties])
+    else:
+        top = np_.arange(len(counts))
+    return top[np_.lexsort((top, -counts[top]))]
+
+
+def _frequency_table(
+    values: List[str], counts: "np.ndarray", num_values: int, scale: float = 1.0
+) -> ColumnFrequencyTable:
+    """
+    Frequency table of the values with the given counts, out of
+    num_values non-null values. If the counts are from a sample, they
+    are multiplied by scale to estimate the counts of all the values.
+    """
+    other_count = num_values - counts.sum()
+    if scale != 1.0:
+        counts = np_.rint(counts * scale)
+        other_count = np_.rint(other_count * scale)
+
+    return ColumnFrequencyTable(
+        counts=[
+            ColumnFrequencyTableItem(value=value, count=int(count))
+            for value, count in zip(values, counts)
+        ],
+        other_count=int(other_count),
+        exact=scale == 1.0,
+    )
+
+
+# HyperLogLog distinct count estimates use 2**_HLL_PRECISION
+# registers, for a relative standard error of 1.04 / sqrt(2**p)
+_HLL_PRECISION = 14
+
+# Number of values that are hashed at a time for HyperLogLog
+_HLL_CHUNK_SIZE = 1 << 20
+
+
+def _hash_non_null(values: "pd.Series") -> "np.ndarray":
+    # 64-bit hashes of the non-null values
+    if values.dtype != object:
+        return pd_.util.hash_pandas_object(
+            values.dropna(), index=False, categorize=False
+        ).to_numpy()
+
+    # The builtin hash of str is salted per process, so the values are
+    # hashed with hash_array to make the estimates deterministic.
+    # Values of mixed types are factorized first, so that equal values
+    # of different types, like 1 and 1.0, have the same hash
+    objects = values.to_numpy()
+    objects = objects[~pd_.isna(objects)]
+    categorize = pd_.api.types.infer_dtype(objects, skipna=False) not in (
+        "string",
+        "bytes",
+        "empty",
+    )
+    return pd_.util.hash_array(objects, categorize=categorize)
+
+
+def _hll_num_unique(values: "pd.Series") -> Tuple[int, float]:
+    """
+    Estimate the number of distinct non-null values with HyperLogLog,
+    without building a hash table of the values. Returns the estimate
+    and its relative standard error.
+    """
+    num_registers = 1 << _HLL_PRECISION
+
+    # The rank of a hash is the position of the first 1 bit in the 32
+    # bits after the register bits, or 33 if they are all 0. Higher
+    # ranks are too unlikely to matter
+    seen = np_.zeros((num_registers, 34), dtype=bool)
+
+    for start in range(0, len(values), _HLL_CHUNK_SIZE):
+        hashes = _hash_non_null(values.iloc[start : start + _HLL_CHUNK_SIZE])
+        registers = (hashes >> np_.uint64(64 - _HLL_PRECISION)).astype(np_.intp)
+
+        # The exponent of 32 bits converted to float exactly is their
+        # bit length, or 0 if they are all 0
+        rank_bits = (hashes >> np_.uint64(32 - _HLL_PRECISION)).astype(np_.uint32)
+        _, bit_length = np_.frexp(rank_bits.astype(np_.float64))
+        seen[registers, 33 - bit_length] = True
+
+    # The highest rank seen by each register, or 0
+    max_rank = seen.shape[1] - 1 - np_.argmax(seen[:, ::-1], axis=1)
+    max_rank[~seen.any(axis=1)] = 0
+
+    alpha = 0.7213 / (1 + 1.079 / num_registers)
+    estimate = alpha * num_registers**2 / np_.sum(np_.exp2(-max_rank.astype(np_.float64)))
+
+    num_empty = np_.count_nonzero(max_rank == 0)
+    if estimate <= 2.5 * num_registers and num_empty > 0:
+        # Linear counting is more accurate for small cardinalities
+        estimate = num_registers * math.log(num_registers / num_empty)
+
+    return int(round(estimate)), 1.04 / math.sqrt(num_registers)
+
+
+# Number of rows of each column that are gathered and reduced at a
+# time when summarizing numeric columns
+_SUMMARY_CHUNK_SIZE = 65536
+
+
+class _QuantileSketch:
+    """
+    KLL quantile sketch (Karnin, Lang and Liberty) of float values. It
+    is a stack of compactors in which an item at level h stands for
+    2**h values and the capacities shrink geometrically towards level
+    0, so the memory use grows only with the log of the number of
+    values. The rank error of quantiles is about 1.7 / k. Sketches of
+    disjoint chunks of a column can be merged.
+    """
+
+    def __init__(self, k: int = 200):
+        self.k = k
+        self.count = 0
+        self._levels: List["np.ndarray"] = [np_.empty(0)]
+
+        # The extremes are kept exactly
+        self._min_value = np_.inf
+        self._max_value = -np_.inf
+
+        # Compactions alternately keep the even and the odd items,
+        # instead of choosing at random, so that the same values give
+        # the same estimates
+        self._num_compactions = 0
+
+    @property
+    def nbytes(self) -> int:
+        return sum(items.nbytes for items in self._levels)
+
+    def update(self, values: "np.ndarray"):
+        for start in range(0, len(values), _SUMMARY_CHUNK_SIZE):
+            chunk = values[start : start + _SUMMARY_CHUNK_SIZE].astype(np_.float64, copy=False)
+            chunk = chunk[~np_.isnan(chunk)]
+            if len(chunk) == 0:
+                continue
+            self.count += len(chunk)
+            self._min_value = min(self._min_value, chunk.min())
+            self._max_value = max(self._max_value, chunk.max())
+            self._levels[0] = np_.concatenate([self._levels[0], chunk])
+            self._compress()
+
+    def merge(self, other: "_QuantileSketch"):
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np_.empty(0))
+            self._levels[level] = np_.concatenate([self._levels[level], items])
+        self.count += other.count
+        self._min_value = min(self._min_value, other._min_value)
+        self._max_value = max(self._max_value, other._max_value)
+        self._compress()
+
+    def quantiles(self, qs: Sequence[float]) -> "np.ndarray":
+        """
+        Estimate the quantiles qs, as fractions between 0 and 1.
+        """
+        if self.count == 0:
+            return np_.full(len(qs), np_.nan)
+
+        items = np_.concatenate(self._levels)
+        weights = np_.concatenate(
+            [np_.full(len(level_items), 2**level) for level, level_items in enumerate(self._levels)]
+        )
+        order = np_.argsort(items, kind="stable")
+        cumulative_weights = np_.cumsum(weights.take(order))
+        ranks = np_.asarray(qs) * cumulative_weights[-1]
+        positions = np_.searchsorted(cumulative_weights, ranks, side="left")
+        estimates = items.take(order.take(np_.minimum(positions, len(items) - 1)))
+        estimates[ranks <= 0] = self._min_value
+        estimates[ranks >= cumulative_weights[-1]] = self._max_value
+        return estimates
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(int(self.k * (2 / 3) ** depth), 2)
+
+    def _compress(self):
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np_.empty(0))
+
+                # Half of the sorted items, every other one, move up
+                # a level with twice the weight
+                items = np_.sort(items)
+                num_compacted = len(items) - len(items) % 2
+                offset = self._num_compactions % 2
+                self._num_compactions += 1
+
+                promoted = items[offset:num_compacted:2]
+                self._levels[level + 1] = np_.concatenate([self._levels[level + 1], promoted])
+                self._levels[level] = items[num_compacted:]
+            level += 1
+
+
+class _NumericSummary:
+    """
+    Running count, null count, min, max, mean and sum of squared
+    deviations from the mean of a numeric column, plus either all its
+    values for exact quantiles or a sketch of them.
+    """
+
+    def __init__(self, sketch: bool = False):
+        self.count = 0
+        self.null_count = 0
+        self.min_value = None
+        self.max_value = None
+        self.mean = 0.0
+        self.m2 = 0.0
+        self._values: List["np.ndarray"] = []
+        self._sketch = _QuantileSketch() if sketch else None
+
+    @property
+    def nbytes(self) -> int:
+        if self._sketch is not None:
+            return self._sketch.nbytes
+        return sum(values.nbytes for values in self._values)
+
+    @property
+    def exact(self) -> bool:
+        return self._sketch is None
+
+    def update(self, values: "np.ndarray"):
+        if values.dtype.kind == "f":
+            num_values = len(values)
+            values = values[~np_.isnan(values)]
+            self.null_count += num_values - len(values)
+
+        if self._sketch is not None:
+            self._sketch.update(values)
+        else:
+            self._values.append(values)
+
+        count = len(values)
+        if count == 0:
+            return
+
+        min_value = values.min()
+        max_value = values.max()
+        if self.count == 0:
+            self.min_value, self.max_value = min_value, max_value
+        else:
+            self.min_value = min(self.min_value, min_value)
+            self.max_value = max(self.max_value, max_value)
+
+        # Combine the mean and squared deviations of the chunk with
+        # the running ones (Chan et al.), which is more accurate than
+        # accumulating the sum of squares
+        with np_.errstate(invalid="ignore", over="ignore"):
+            as_float = values.astype(np_.float64, copy=False)
+            mean = as_float.mean()
+            m2 = np_.square(as_float - mean).sum()
+            total = self.count + count
+            delta = mean - self.mean
+            self.mean += delta * count / total
+            self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def get_stdev(self) -> float:
+        if self.count < 2:
+            return np_.nan
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def get_quantiles(self, percentiles: Sequence[float]) -> "np.ndarray":
+        if self._sketch is not None:
+            return self._sketch.quantiles([q / 100 for q in percentiles])
+        if self.count == 0:
+            return np_.full(len(percentiles), np_.nan)
+        return np_.percentile(np_.concatenate(self._values), percentiles)
+
+    def get_median(self) -> float:
+        return float(self.get_quantiles([50])[0])
+
+
+def _summarize_numeric_arrays(
+    arrays: List["np.ndarray"],
+    indices: Optional["np.ndarray"] = None,
+    sketch: bool = False,
+) -> List[_NumericSummary]:
+    """
+    Summarize one or more int, uint or float arrays, restricted to
+    indices if passed, in one pass over the selected values. The
+    values are gathered a chunk at a time, so that the selected rows
+    are never copied as a whole, and each chunk of indices is used for
+    all the arrays.
+
+    Quantiles are exact unless sketch is True, in which case they are
+    estimated from a quantile sketch of bounded size.
+    """
+    num_rows = len(arrays[0]) if indices is None else len(indices)
+
+    summaries = [_NumericSummary(sketch=sketch) for _ in arrays]
+    for start in range(0, num_rows, _SUMMARY_CHUNK_SIZE):
+        end = min(start + _SUMMARY_CHUNK_SIZE, num_rows)
+        chunk_indices = None if indices is None else indices[start:end]
+
+        for values, summary in zip(arrays, summaries):
+            if chunk_indices is None:
+                summary.update(values[start:end])
+            else:
+                summary.update(values.take(chunk_indices))
+
+    return summaries
+
+
+class _ColumnNameIndex:
+    """
+    Index of the lowercase column names of a table for case-insensitive
+    substring search. The names are joined with NUL separators, so that
+    finding the few columns matching a selective term is a scan of one
+    string. Terms that match many columns test each name instead.
+    """
+
+    def __init__(self, names: Iterable):
+        self.names = _to_object_array([str(x).lower() for x in names])
+        self._joined = "\0".join(self.names.tolist())
+
+        # Offsets of the names in the joined string
+        lengths = np_.fromiter(map(len, self.names), dtype=np_.int64, count=len(self.names))
+        self._starts = np_.zeros(len(self.names), dtype=np_.int64)
+        np_.cumsum(lengths[:-1] + 1, out=self._starts[1:])
+
+    def search(self, term: str, candidates: Optional["np.ndarray"] = None) -> "np.ndarray":
+        """
+        Return the sorted indices of the names that contain term, out
+        of the candidates if passed.
+        """
+        all_indices = np_.arange(len(self.names))
+        if candidates is not None:
+            return self._test_names(term, candidates)
+        elif term == "":
+            return all_indices
+        elif "\0" in term:
+            return self._test_names(term, all_indices)
+
+        # Stop looking at the matches in the joined string when there
+        # are too many of them
+        max_matches = len(self.names) // 8
+        matches = re.finditer(re.escape(term), self._joined)
+        positions = [m.start() for m in itertools.islice(matches, max_matches + 1)]
+        if len(positions) > max_matches:
+            return self._test_names(term, all_indices)
+
+        indices = np_.searchsorted(self._starts, positions, side="right") - 1
+        return np_.unique(indices).astype(np_.int64)
+
+    def _test_names(self, term: str, indices: "np.ndarray") -> "np.ndarray":
+        names = self.names if len(indices) == len(self.names) else self.names.take(indices)
+        is_match = np_.fromiter(
+            map(operator.contains, names, itertools.repeat(term)), dtype=bool, count=len(names)
+        )
+        return indices[is_match]
+
+
+# Filters on strings that are evaluated for the distinct values of a
+# column and mapped back to the rows
+_DICTIONARY_FILTERS = {
+    RowFilterType.Compare,
+    RowFilterType.IsEmpty,
+    RowFilterType.NotEmpty,
+    RowFilterType.Search,
+    RowFilterType.SetMembership,
+}
+
+
+class _PandasTableState:
+    """
+    State derived from the values of a pandas table as they are when
+    the state is created, which is shared by all the views of the
+    table, such as the views of the explorers of the same variable:
+    the fingerprints and versions of the columns, their inferred
+    types, and the caches of filter masks, sort orders, factorized
+    columns and summaries. Each view only has its own filters, sort
+    keys and row indices.
+    """
+
+    def __init__(
+        self,
+        source,
+        config: Type["PandasView"],
+        fingerprints: Optional[List[Hashable]] = None,
+    ):
+        # The variable value, and the table that views display, in
+        # which a Series is wrapped. The cache sizes and fingerprint
+        # parameters are those of the view class config
+        self.source = source
+        self.table = PandasView._maybe_wrap(source)
+        self._config = config
+
+        # The column labels, and the fingerprints of the columns and
+        # the row labels, as they are when the state is created, since
+        # the table can be modified in place
+        self.columns = self.table.columns
+        self.num_rows = len(self.table)
+        if fingerprints is None:
+            fingerprints = self.get_fingerprints(self.table)
+        self.fingerprints = fingerprints
+        self.index_fingerprint = self.fingerprint(self.table.index)
+
+        # State derived from the values of a column is keyed by the
+        # version of the column, which is inherited by the state of an
+        # update of the table if the column does not change
+        self.column_versions = [next(_COLUMN_VERSIONS) for _ in range(len(self.columns))]
+
+        # If the table is the table of the state that this state
+        # updates with rows appended, the column versions of that state
+        # and its number of rows. The filters and sort keys of the old
+        # rows are then not evaluated again
+        self.appended_to: Optional[Tuple[List[int], int]] = None
 
         # Maintain a mapping of column index to inferred dtype for any
-        # object columns, to avoid recomputing. If the underlying
-        # object is changed, this needs to be reset
-        self._inferred_dtypes = {}
+        # object columns, to avoid recomputing
+        self.inferred_dtypes: Dict[int, str] = {}
+
+        # Bit-packed boolean masks of evaluated row filters, keyed by
+        # (column version, canonical filter spec). A filter may have
+        # been evaluated for only some of the rows, in which case its
+        # entry also has a bit-packed mask of the evaluated rows
+        self.filter_mask_cache = _LRUCache(
+            config.FILTER_MASK_CACHE_MAX_BYTES,
+            _packed_mask_nbytes,
+        )
+
+        # Stable sort orders of all the rows of the table, keyed by
+        # ("order", ((column version, ascending), ...)), so that
+        # changing the filters does not require sorting again, and
+        # factorized columns for sorting keyed by ("codes", column
+        # version). Sort orders that are being computed in the
+        # background are kept in sort_order_futures until they are done
+        self.sort_cache = _LRUCache(config.SORT_CACHE_MAX_BYTES, _sort_cache_nbytes)
+        self.sort_order_futures: Dict[Tuple, Future] = {}
+
+        # Summaries of numeric columns keyed by (column version,
+        # applied filter keys, whether quantiles are sketched), so
+        # that profiling a column again for the same filters is free
+        self.summary_cache = _LRUCache(
+            config.SUMMARY_CACHE_MAX_BYTES, operator.attrgetter("nbytes")
+        )
+
+        # Codes and distinct values of string and Arrow dictionary
+        # columns keyed by column version, for the filters in
+        # _DICTIONARY_FILTERS
+        self.dictionary_cache = _LRUCache(config.DICTIONARY_CACHE_MAX_BYTES, _dictionary_nbytes)
+
+    def fingerprint(self, values) -> Hashable:
+        return _pandas_fingerprint(values, self._config.FINGERPRINT_HASH_MAX_BYTES)[0]
+
+    def get_fingerprints(self, table) -> List[Hashable]:
+        # The columns share one hashing budget, so that fingerprinting
+        # a table after each execution does not scan all of its values
+        budget = self._config.FINGERPRINT_HASH_MAX_BYTES
+        fingerprints = []
+        for i in range(table.shape[1]):
+            fingerprint, num_bytes = _pandas_fingerprint(table.iloc[:, i], budget)
+            budget -= num_bytes
+            fingerprints.append(fingerprint)
+        return fingerprints
+
+    def get_dtype(self, column_index: int):
+        # The dtype of a column when the state was created
+        fingerprint = self.fingerprints[column_index]
+        return fingerprint[0] if isinstance(fingerprint, tuple) else None
+
+    def update(self, new_source) -> "_PandasTableState":
+        """
+        The state of a new value of the variable, or of the same value
+        after it was modified in place, which is this state if the
+        values of the table have not changed.
+        """
+        new_table = PandasView._maybe_wrap(new_source)
+        fingerprints = self.get_fingerprints(new_table)
+        if (
+            new_table.columns.equals(self.columns)
+            and self.fingerprint(new_table.index) == self.index_fingerprint
+            and fingerprints == self.fingerprints
+        ):
+            # Everything derived from the table is still valid
+            self.source, self.table = new_source, new_table
+            return self
+
+        new_state = _PandasTableState(new_source, self._config, fingerprints)
+        new_state._inherit(self)
+        return new_state
+
+    def _inherit(self, old_state: "_PandasTableState"):
+        # Columns that still have the same values keep their versions
+        # and inferred types, so that their cached filter masks, sort
+        # orders and summaries are reused. Columns modified in place
+        # keep their memory, so only equal fingerprints, which hash
+        # all the values, show that a column has not changed. Cached
+        # state of the other columns ages out of the caches
+        self.filter_mask_cache = old_state.filter_mask_cache
+        self.sort_cache = old_state.sort_cache
+        self.sort_order_futures = old_state.sort_order_futures
+        self.summary_cache = old_state.summary_cache
+        self.dictionary_cache = old_state.dictionary_cache
+
+        for new_index, column_name in enumerate(self.columns):
+            if column_name not in old_state.columns:
+                continue
+            old_index = old_state.columns.get_loc(column_name)
+            if (
+                not isinstance(old_index, int)
+                or old_state.fingerprints[old_index] != self.fingerprints[new_index]
+            ):
+                continue
+            self.column_versions[new_index] = old_state.column_versions[old_index]
+            inferred = old_state.inferred_dtypes.get(old_index)
+            if inferred is not None:
+                self.inferred_dtypes[new_index] = inferred
+
+        if self._appends_to(old_state):
+            self.appended_to = (old_state.column_versions, old_state.num_rows)
+
+    def _appends_to(self, old_state: "_PandasTableState") -> bool:
+        # Whether the table is the table of old_state, as it was when
+        # old_state was created, with rows appended
+        num_old_rows = old_state.num_rows
+        if self.num_rows <= num_old_rows or not self.columns.equals(old_state.columns):
+            return False
+
+        old_rows = self.table.iloc[:num_old_rows]
+        if not _same_fingerprinted_values(
+            self.fingerprint(old_rows.index), old_state.index_fingerprint
+        ):
+            return False
+        return all(
+            _same_fingerprinted_values(fingerprint, old_fingerprint)
+            for fingerprint, old_fingerprint in zip(
+                self.get_fingerprints(old_rows), old_state.fingerprints
+            )
+        )
+
+
+class PandasView(DataExplorerTableView):
+    TYPE_NAME_MAPPING = {"boolean": "bool"}
+
+    # Memory budget for the cache of evaluated row filter masks
+    FILTER_MASK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+    # The rows selected by the filters of tables with at least this
+    # many rows are kept as a bitmap, if it is smaller than their
+    # indices
+    BITMAP_INDICES_MIN_ROWS = 1_000_000
+
+    # Sorts of at least this many rows only sort as much of the
+    # order as has been requested, and complete it in the background
+    # if BACKGROUND_SORT is set
+    LAZY_SORT_MIN_ROWS = 1_000_000
+    BACKGROUND_SORT = True
+
+    # Memory budget for cached sort orders and factorized columns
+    SORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+    # The median and quantiles in the summary stats of columns with
+    # at least this many rows are estimated with a quantile sketch,
+    # unless EXACT_QUANTILES is set
+    QUANTILE_SKETCH_MIN_ROWS = 100_000
+    EXACT_QUANTILES = False
+
+    # Memory budget for the summaries of numeric columns, including
+    # their quantile sketches
+    SUMMARY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+    # Memory budget for the dictionary encodings of string columns,
+    # which let filters test each distinct value only once
+    DICTIONARY_CACHE_MAX_BYTES = 128 * 1024 * 1024
+
+    # The types of object columns with at least this many rows are
+    # inferred from a sample of INFER_DTYPE_SAMPLE_SIZE values at first
+    # and then verified with all the values in the background
+    INFER_DTYPE_SAMPLE_MIN_ROWS = 100_000
+    INFER_DTYPE_SAMPLE_SIZE = 10_000
+
+    # The number of distinct values in the summary stats of string,
+    # date and datetime columns with at least this many rows is a
+    # HyperLogLog estimate, unless EXACT_NUM_UNIQUE is set
+    APPROXIMATE_NUM_UNIQUE_MIN_ROWS = 5_000_000
+    EXACT_NUM_UNIQUE = False
+
+    # Columns are fingerprinted after each execution to detect the
+    # columns that have changed when the table is modified in place or
+    # replaced. At most FINGERPRINT_HASH_MAX_BYTES of the values of a
+    # table are hashed, and the columns beyond it are always taken to
+    # have changed
+    FINGERPRINT_HASH_MAX_BYTES = 64 * 1024 * 1024
+
+    def __init__(
+        self,
+        display_name: str,
+        table,
+        filters: Optional[List[RowFilter]],
+        sort_keys: Optional[List[ColumnSortKey]],
+        table_state: Optional[_PandasTableState] = None,
+    ):
+        # A Series is wrapped in a new DataFrame that shares its values
+        self._wraps_series = isinstance(table, pd_.Series)
+
+        # State derived from the table values, which may be shared with
+        # other views of the same table. The view keeps references to
+        # its parts
+        if table_state is None:
+            table_state = _PandasTableState(table, type(self))
+        self._table_state = table_state
+        self._columns = table_state.columns
+        self._num_rows = table_state.num_rows
+        self._column_versions = table_state.column_versions
+        self._filter_mask_cache = table_state.filter_mask_cache
+        self._sort_cache = table_state.sort_cache
+        self._sort_order_futures = table_state.sort_order_futures
+        self._summary_cache = table_state.summary_cache
+        self._dictionary_cache = table_state.dictionary_cache
+
+        # Types inferred from a sample of the values are kept in
+        # _sampled_dtypes until they have been verified in the
+        # background
+        self._inferred_dtypes = table_state.inferred_dtypes
+        self._sampled_dtypes: Dict[int, str] = {}
+
+        super().__init__(display_name, table_state.table, filters, sort_keys)
 
         # NumPy array of selected ("true") indices using filters. If
         # there are also sort keys, we first filter the unsorted data,
@@ -377,13 +2432,9 @@ class PandasView(DataExplorerTableView):
         # self.filtered_indices
         self.view_indices = None
 
-        # We store a tuple of (last_search_term, matches)
-        # here so that we can support scrolling through the search
-        # results without having to recompute the search. If the
-        # search term changes, we discard the last search result. We
-        # might add an LRU cache here or something if it helps
-        # performance.
-        self._search_schema_last_result: Optional[Tuple[str, List[ColumnSchema]]] = None
+        # Keys of the filters that were combined to produce
+        # self.filtered_indices
+        self._applied_filter_keys: List[Tuple[Tuple[int, str], Optional[RowFilterCondition]]] = []
 
         # Putting this here rather than in the class body before
         # Python < 3.10 has fussier rules about staticmethods
@@ -395,7 +2446,8 @@ class PandasView(DataExplorerTableView):
             ColumnDisplayType.Datetime: self._summarize_datetime,
         }
 
-    def _maybe_wrap(self, value):
+    @staticmethod
+    def _maybe_wrap(value):
         if isinstance(value, pd_.Series):
             if value.name is None:
                 return pd_.DataFrame({"unnamed": value})
@@ -413,37 +2465,35 @@ class PandasView(DataExplorerTableView):
             self._get_single_column_schema(key.column_index) for key in self.sort_keys
         ]
 
-    def get_updated_state(self, new_table) -> StateUpdate:
-        from pandas.api.types import infer_dtype
-
+    def get_updated_state(self, new_table, new_table_state=None) -> StateUpdate:
         filtered_columns = {
             filt.column_schema.column_index: filt.column_schema for filt in self.filters
         }
 
         # self.table may have been modified in place, so we cannot
-        # assume that new_table is different than self.table
-        if new_table is self.table:
-            # For in-place updates, we have to assume the worst case
-            # scenario of a schema change
-            schema_updated = True
-        else:
-            # The table object has changed -- now we look for
-            # suspected schema changes
-            schema_updated = False
+        # assume that new_table is different than self.table. The
+        # columns and fingerprints recorded when the state of this view
+        # was created tell us what the table was like before
+        if new_table_state is None:
+            new_table_state = self._table_state.update(new_table)
+        new_table = new_table_state.table
+        new_fingerprints = new_table_state.fingerprints
+        old_fingerprints = self._table_state.fingerprints
+        schema_updated = False
 
         # We go through the columns in the new table and see whether
         # there is a type change or whether a column name moved.
         #
         # TODO: duplicate column names are a can of worms here, and we
         # will need to return to make this logic robust to that
-        old_columns = self.table.columns
+        old_columns = self._columns
         shifted_columns: Dict[int, int] = {}
         schema_changes: Dict[int, ColumnSchema] = {}
 
         # First, we look for detectable deleted columns
         deleted_columns: Set[int] = set()
-        if not self.table.columns.equals(new_table.columns):
-            for old_index, column in enumerate(self.table.columns):
+        if not old_columns.equals(new_table.columns):
+            for old_index, column in enumerate(old_columns):
                 if column not in new_table.columns:
                     deleted_columns.add(old_index)
                     schema_updated = True
@@ -451,7 +2501,9 @@ class PandasView(DataExplorerTableView):
         def _get_column_schema(column, column_name, column_index):
             # We only use infer_dtype for columns that are involved in
             # a filter
-            type_name, type_display = self._get_type(column.dtype, lambda: infer_dtype(column))
+            type_name, type_display = self._get_type(
+                column.dtype, lambda: self._infer_dtype(column, sample=True)
+            )
 
             return ColumnSchema(
                 column_name=column_name,
@@ -478,31 +2530,20 @@ class PandasView(DataExplorerTableView):
             else:
                 old_index = new_index
 
-            new_column = new_table.iloc[:, new_index]
+            if new_fingerprints[new_index] == old_fingerprints[old_index]:
+                # The column has the same values
+                continue
 
             # For object dtype columns, we refuse to make any
             # assumptions about whether the data type has changed
             # and will let re-filtering fail later if there is a
             # problem
-            if new_column.dtype == object:
-                # The inferred type could be different
-                schema_updated = True
-            elif new_table is not self.table:
-                # While we must proceed under the conservative
-                # possibility that the table was modified in place, if
-                # the tables are indeed different we can check for
-                # schema changes more confidently
-                old_dtype = self.table.iloc[:, old_index].dtype
-                if new_column.dtype == old_dtype:
-                    # Type is the same and not object dtype
-                    continue
-            elif old_index in filtered_columns:
-                # If it was an in place modification, as a last ditch
-                # effort we check if we remember the data type because
-                # of a prior filter
-                if filtered_columns[old_index].type_name == str(new_column.dtype):
-                    # Type is the same and not object dtype
-                    continue
+            new_column = new_table.iloc[:, new_index]
+            if new_column.dtype != object and new_column.dtype == self._table_state.get_dtype(
+                old_index
+            ):
+                # Type is the same and not object dtype
+                continue
 
             # The type maybe changed
             schema_updated = True
@@ -603,48 +2644,113 @@ class PandasView(DataExplorerTableView):
         # sorting
         self._set_row_filters(self.filters)
 
-    def _search_schema(
-        self, search_term: str, start_index: int, max_results: int
-    ) -> SearchSchemaResult:
-        # Sanitize user input here for now, possibly remove this later
-        search_term = search_term.lower()
-
-        if self._search_schema_last_result is not None:
-            last_search_term, matches = self._search_schema_last_result
-            if last_search_term != search_term:
-                matches = self._search_schema_get_matches(search_term)
-                self._search_schema_last_result = (search_term, matches)
-        else:
-            matches = self._search_schema_get_matches(search_term)
-            self._search_schema_last_result = (search_term, matches)
-
-        matches_slice = matches[start_index : start_index + max_results]
-        return SearchSchemaResult(
-            matches=TableSchema(columns=matches_slice),
-            total_num_matches=len(matches),
-        )
+    def _get_column_names(self) -> List:
+        return self.table.columns.tolist()
 
-    def _search_schema_get_matches(self, search_term: str) -> List[ColumnSchema]:
-        matches = []
-        for column_index in range(len(self.table.columns)):
-            column_raw_name = self.table.columns[column_index]
-            column_name = str(column_raw_name)
+    def _get_inferred_dtype(self, column_index: int, exact: bool = False):
+        inferred = self._inferred_dtypes.get(column_index)
+        if inferred is not None:
+            return inferred
 
-            # Do a case-insensitive search
-            if search_term not in column_name.lower():
-                continue
+        column = self.table.iloc[:, column_index]
+        if exact or not self._should_sample_dtype(column):
+            inferred = self._infer_dtype(column)
+            self._inferred_dtypes[column_index] = inferred
+            return inferred
+
+        # Infer the type of a long object column from a sample of its
+        # values for now, and verify it with all the values later
+        sampled = self._sampled_dtypes.get(column_index)
+        if sampled is None:
+            sampled = self._infer_dtype(column, sample=True)
+            self._sampled_dtypes[column_index] = sampled
+            _get_background_executor().submit(self._verify_inferred_dtype, column_index, sampled)
+        return sampled
+
+    def _verify_inferred_dtype(self, column_index: int, sampled: str):
+        try:
+            inferred = self._get_inferred_dtype(column_index, exact=True)
+        except Exception as err:
+            logger.warning(f"Failed to infer the type of column {column_index}: {err}")
+            return
 
-            col_schema = self._get_single_column_schema(column_index)
-            matches.append(col_schema)
+        self._sampled_dtypes.pop(column_index, None)
+        if inferred != sampled and self._schema_update_callback is not None:
+            self._schema_update_callback()
 
-        return matches
+    def _should_sample_dtype(self, column: "pd.Series") -> bool:
+        return column.dtype == object and len(column) >= self.INFER_DTYPE_SAMPLE_MIN_ROWS
 
-    def _get_inferred_dtype(self, column_index: int):
+    def _infer_dtype(self, column: "pd.Series", sample: bool = False) -> str:
         from pandas.api.types import infer_dtype
 
-        if column_index not in self._inferred_dtypes:
-            self._inferred_dtypes[column_index] = infer_dtype(self.table.iloc[:, column_index])
-        return self._inferred_dtypes[column_index]
+        if sample and self._should_sample_dtype(column):
+            column = column.take(_sample_rows(None, len(column), self.INFER_DTYPE_SAMPLE_SIZE))
+        return infer_dtype(column)
+
+    def _get_updated_table_state(self, new_table, updated_states: Dict) -> _PandasTableState:
+        # The state of the table after an update. The views that share
+        # a state share the state of its update, which is only computed
+        # once for all of them
+        new_state = updated_states.get(id(self._table_state))
+        if new_state is None or new_state.source is not new_table:
+            new_state = self._table_state.update(new_table)
+            updated_states[id(self._table_state)] = new_state
+        return new_state
+
+    def _inherit_cached_state(self, old_view: DataExplorerTableView):
+        if self._table_state.appended_to is not None:
+            self._extend_filter_masks()
+
+    def _get_caches(self) -> List[_LRUCache]:
+        return super()._get_caches() + [
+            self._filter_mask_cache,
+            self._sort_cache,
+            self._summary_cache,
+            self._dictionary_cache,
+        ]
+
+    def _release_row_indices(self) -> bool:
+        # The filters are applied again from the start
+        self._applied_filter_keys = []
+        return super()._release_row_indices()
+
+    def _extend_filter_masks(self):
+        # Cache the masks of the filters for the old rows of a table
+        # with appended rows, so that the filters are only evaluated
+        # for the appended rows
+        old_versions, num_old_rows = self._table_state.appended_to
+        num_rows = len(self.table)
+        for filt in self.filters:
+            if filt.is_valid is False:
+                continue
+            column_index = filt.column_schema.column_index
+            filter_key = _row_filter_key(filt)
+            new_key = (self._column_versions[column_index], filter_key)
+            entry = self._filter_mask_cache.get((old_versions[column_index], filter_key))
+            if entry is None or new_key in self._filter_mask_cache:
+                # Another view of the table may have extended the mask
+                continue
+
+            packed_values, packed_evaluated = entry
+            mask = np_.zeros(num_rows, dtype=bool)
+            mask[:num_old_rows] = _unpack_mask(packed_values, num_old_rows)
+            evaluated = np_.zeros(num_rows, dtype=bool)
+            if packed_evaluated is None:
+                evaluated[:num_old_rows] = True
+            else:
+                evaluated[:num_old_rows] = _unpack_mask(packed_evaluated, num_old_rows)
+            self._filter_mask_cache.put(new_key, (np_.packbits(mask), np_.packbits(evaluated)))
+
+    def _get_appended_sort_order(self, sort_spec) -> Optional["np.ndarray"]:
+        # The cached sort order of the old rows of a table with
+        # appended rows, if any
+        if self._table_state.appended_to is None:
+            return None
+        old_versions, _ = self._table_state.appended_to
+        return self._get_cached_sort_order(
+            ("order", tuple((old_versions[i], ascending) for i, ascending in sort_spec))
+        )
 
     @classmethod
     def _get_type(cls, dtype, get_inferred_dtype):
@@ -732,111 +2838,49 @@ class PandasView(DataExplorerTableView):
             type_display=type_display,
         )
 
-    def _get_data_values(
-        self,
-        row_start: int,
-        num_rows: int,
-        column_indices: Sequence[int],
-        format_options: FormatOptions,
-    ) -> TableData:
-        formatted_columns = []
-
-        column_indices = sorted(column_indices)
-        columns = []
-        for i in column_indices:
-            # The UI has requested data beyond the end of the table,
-            # so we stop here
-            if i >= len(self.table.columns):
-                break
-            columns.append(self.table.iloc[:, i])
-
-        formatted_columns = []
+    HAS_ROW_LABELS = True
 
+    def _take_view_range(self, values, start: int, end: int):
+        # Select the virtual range of rows [start, end) from a Series
+        # or Index aligned with the table
         if self.view_indices is not None:
             # If the table is either filtered or sorted, use a slice
             # the view_indices to select the virtual range of values
             # for the grid
-            view_slice = self.view_indices[row_start : row_start + num_rows]
-            columns = [col.take(view_slice) for col in columns]
-            indices = self.table.index.take(view_slice)
-        else:
+            return values.take(self.view_indices[start:end])
+        elif isinstance(values, pd_.Series):
             # No filtering or sorting, just slice directly
-            indices = self.table.index[row_start : row_start + num_rows]
-            columns = [col.iloc[row_start : row_start + num_rows] for col in columns]
+            return values.iloc[start:end]
+        else:
+            return values[start:end]
 
-        formatted_columns = [self._format_values(col, format_options) for col in columns]
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        column = self._take_view_range(self.table.iloc[:, column_index], start, end)
+        return self._format_values(column, format_options)
+
+    def _format_row_labels(self, start: int, end: int) -> List[ColumnValue]:
+        indices = self._take_view_range(self.table.index, start, end)
 
         # Currently, we format MultiIndex in its flat tuple
         # representation. In the future we will return multiple lists
         # of row labels to be formatted more nicely in the UI
-        if isinstance(self.table.index, pd_.MultiIndex):
-            indices = indices.to_flat_index()
-        row_labels = [[str(x) for x in indices]]
-        return TableData(columns=formatted_columns, row_labels=row_labels)
+        if isinstance(indices, pd_.MultiIndex):
+            return [str(x) for x in indices.to_flat_index()]
+        elif indices.dtype.kind in ("i", "u"):
+            return list(map(str, indices.tolist()))
+        else:
+            return [str(x) for x in indices]
 
     @classmethod
     def _format_values(cls, values, options: FormatOptions) -> List[ColumnValue]:
-        NaT = pd_.NaT
-        NA = pd_.NA
-        float_format = _get_float_formatter(options)
-
-        def _format_value(x):
-            if _is_float_scalar(x):
-                if _isnan(x):
-                    return _VALUE_NAN
-                elif _isinf(x):
-                    return _VALUE_INF if x > 0 else _VALUE_NEGINF
-                else:
-                    return float_format(x)
-            elif x is None:
-                return _VALUE_NONE
-            elif x is NaT:
-                return _VALUE_NAT
-            elif x is NA:
-                return _VALUE_NA
-            else:
-                return str(x)
-
-        return [_format_value(x) for x in values]
+        return _pandas_format_column(values, options).tolist()
 
-    def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
-        sel = selection.selection
-        if selection.kind == DataSelectionKind.SingleCell:
-            assert isinstance(sel, DataSelectionSingleCell)
-            row_index = sel.row_index
-            if self.view_indices is not None:
-                row_index = self.view_indices[row_index]
-            cell = str(self.table.iat[row_index, sel.column_index])
-            return ExportedData(data=cell, format=fmt)
-        elif selection.kind == DataSelectionKind.CellRange:
-            assert isinstance(sel, DataSelectionCellRange)
-            return self._export_tabular(
-                slice(sel.first_row_index, sel.last_row_index + 1),
-                slice(sel.first_column_index, sel.last_column_index + 1),
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.RowRange:
-            assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                slice(sel.first_index, sel.last_index + 1),
-                None,
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.ColumnRange:
-            assert isinstance(sel, DataSelectionRange)
-            return self._export_tabular(
-                None,
-                slice(sel.first_index, sel.last_index + 1),
-                fmt,
-            )
-        elif selection.kind == DataSelectionKind.RowIndices:
-            assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(sel.indices, None, fmt)
-        elif selection.kind == DataSelectionKind.ColumnIndices:
-            assert isinstance(sel, DataSelectionIndices)
-            return self._export_tabular(None, sel.indices, fmt)
-        else:
-            raise NotImplementedError(f"Unknown data export: {selection.kind}")
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        if self.view_indices is not None:
+            row_index = self.view_indices[row_index]
+        return str(self.table.iat[row_index, column_index])
 
     def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
         from io import StringIO
@@ -892,20 +2936,54 @@ class PandasView(DataExplorerTableView):
         if len(filters) == 0:
             # Simply reset if empty filter set passed
             self.filtered_indices = None
+            self._applied_filter_keys = []
             self._update_view_indices()
             return FilterResult(selected_num_rows=len(self.table), had_errors=False)
 
+        # If filter is invalid, do not evaluate it. The filters are
+        # keyed with the versions of their columns
+        filters = [filt for filt in filters if filt.is_valid is not False]
+        filter_keys = [
+            ((self._column_versions[filt.column_schema.column_index], key), condition)
+            for filt, (key, condition) in zip(filters, _row_filter_keys(filters))
+        ]
+
+        # If the new filters start with the filters that produced the
+        # current filtered_indices (e.g. a filter has been added at
+        # the end), we pick up from there rather than starting over
+        num_applied = len(self._applied_filter_keys)
+        if (
+            self.filtered_indices is not None
+            and num_applied > 0
+            and filter_keys[:num_applied] == self._applied_filter_keys
+        ):
+            if num_applied == len(filters):
+                self._update_view_indices()
+                return FilterResult(selected_num_rows=len(self.filtered_indices), had_errors=False)
+
+            combined_mask = self._get_filtered_mask()
+            applied_keys = self._applied_filter_keys[:]
+            filters = filters[num_applied:]
+            filter_keys = filter_keys[num_applied:]
+        else:
+            combined_mask = None
+            applied_keys = []
+
         # Evaluate all the filters and combine them using the
         # indicated conditions
-        combined_mask = None
         had_errors = False
-        for filt in filters:
-            if filt.is_valid is False:
-                # If filter is invalid, do not evaluate it
-                continue
+        for filt, (filter_key, _) in zip(filters, filter_keys):
+            # When combining masks, only the rows that can still
+            # change need to be evaluated
+            if combined_mask is None:
+                rows_needed = None
+            elif filt.condition == RowFilterCondition.And:
+                rows_needed = combined_mask
+            else:
+                rows_needed = ~combined_mask
 
             try:
-                single_mask = self._eval_filter(filt)
+                single_mask = self._get_filter_mask(filt, filter_key, rows_needed)
             except Exception as e:
                 had_errors = True
 
@@ -921,69 +2999,135 @@ class PandasView(DataExplorerTableView):
 
             if combined_mask is None:
                 combined_mask = single_mask
+                applied_keys.append((filter_key, None))
+                continue
             elif filt.condition == RowFilterCondition.And:
                 combined_mask &= single_mask
             elif filt.condition == RowFilterCondition.Or:
                 combined_mask |= single_mask
+            applied_keys.append((filter_key, filt.condition))
 
+        self._applied_filter_keys = applied_keys
         if combined_mask is None:
             self.filtered_indices = None
             selected_num_rows = len(self.table)
         else:
-            self.filtered_indices = combined_mask.nonzero()[0]
+            self.filtered_indices = _compact_row_indices(
+                combined_mask, self.BITMAP_INDICES_MIN_ROWS
+            )
             selected_num_rows = len(self.filtered_indices)
 
         # Update the view indices, re-sorting if needed
         self._update_view_indices()
         return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
 
-    def _is_supported_filter(self, filt: RowFilter) -> bool:
-        if filt.filter_type not in self.SUPPORTED_FILTERS:
-            return False
+    def _get_filter_mask(self, filt: RowFilter, filter_key: Tuple[int, str], rows_needed=None):
+        """
+        Return the boolean mask of a filter, which is only guaranteed
+        to be correct for the rows selected by the rows_needed mask
+        (or all rows if it is None). Filters are evaluated only for
+        rows that have not been evaluated before.
+        """
+        num_rows = len(self.table)
+        cache_key = filter_key
+        entry = self._filter_mask_cache.get(cache_key)
+
+        if entry is None:
+            if rows_needed is None:
+                mask = self._eval_filter(filt)
+                self._filter_mask_cache.put(cache_key, (np_.packbits(mask), None))
+                return mask
+            mask = np_.zeros(num_rows, dtype=bool)
+            evaluated = np_.zeros(num_rows, dtype=bool)
+        else:
+            packed_values, packed_evaluated = entry
+            mask = _unpack_mask(packed_values, num_rows)
+            if packed_evaluated is None:
+                return mask
+            evaluated = _unpack_mask(packed_evaluated, num_rows)
+
+        if rows_needed is None:
+            missing = ~evaluated
+        else:
+            missing = rows_needed & ~evaluated
 
-        display_type = filt.column_schema.type_display
+        missing_rows = missing.nonzero()[0]
+        if len(missing_rows) == 0:
+            return mask
 
-        if filt.filter_type in [
-            RowFilterType.IsEmpty,
-            RowFilterType.NotEmpty,
-            RowFilterType.Search,
-        ]:
-            # String-only filter types
-            return display_type == ColumnDisplayType.String
-        elif filt.filter_type == RowFilterType.Compare:
-            compare_op = filt.compare_params.op
-            if compare_op in [
-                CompareFilterParamsOp.Eq,
-                CompareFilterParamsOp.NotEq,
-            ]:
-                return True
-            else:
-                return display_type in _FILTER_RANGE_COMPARE_SUPPORTED
-        elif filt.filter_type in [
-            RowFilterType.Between,
-            RowFilterType.NotBetween,
-        ]:
-            return display_type in _FILTER_RANGE_COMPARE_SUPPORTED
-        elif filt.filter_type in [
-            RowFilterType.IsTrue,
-            RowFilterType.IsFalse,
-        ]:
-            return display_type == ColumnDisplayType.Boolean
+        mask[missing_rows] = self._eval_filter(filt, missing_rows)
+        evaluated |= missing
+
+        if evaluated.all():
+            entry = (np_.packbits(mask), None)
         else:
-            # Filters always supported
-            assert filt.filter_type in [
-                RowFilterType.IsNull,
-                RowFilterType.NotNull,
-                RowFilterType.SetMembership,
-            ]
-            return True
+            entry = (np_.packbits(mask), np_.packbits(evaluated))
+        self._filter_mask_cache.put(cache_key, entry)
+        return mask
 
-    def _eval_filter(self, filt: RowFilter):
+    def _eval_filter(self, filt: RowFilter, indices=None):
+        # Evaluate a filter for all rows, or only the rows at the
+        # given positions
         column_index = filt.column_schema.column_index
         col = self.table.iloc[:, column_index]
+        if indices is not None:
+            col = col.take(indices)
+
+        # Filtering looks at all the values anyway
+        inferred_type = self._get_inferred_dtype(column_index, exact=True)
+
+        if filt.filter_type in _DICTIONARY_FILTERS:
+            # Only columns that are already encoded are factorized to
+            # evaluate a filter for some of the rows
+            dictionary = self._get_dictionary(column_index, inferred_type, indices is None)
+            if dictionary is not None:
+                codes, uniques = dictionary
+                if indices is not None:
+                    codes = codes.take(indices)
+
+                # Evaluate the filter for the distinct values, and
+                # for the null rows as they are, since they can be
+                # different kinds of nulls
+                mask = np_.append(self._eval_predicate(filt, uniques, inferred_type), False)[codes]
+                null_rows = (codes == -1).nonzero()[0]
+                if len(null_rows) > 0:
+                    mask[null_rows] = self._eval_predicate(filt, col.take(null_rows), inferred_type)
+                return mask
+
+        return self._eval_predicate(filt, col, inferred_type)
+
+    def _get_dictionary(
+        self, column_index: int, inferred_type: str, factorize: bool
+    ) -> Optional[Tuple["np.ndarray", "pd.Series"]]:
+        # The codes of the values of a column in all rows, with -1 for
+        # nulls, and its distinct values as a Series of the same type,
+        # or None if the column is not worth encoding
+        column = self.table.iloc[:, column_index]
+        dtype = column.dtype
+        if isinstance(dtype, pd_.CategoricalDtype):
+            categories = pd_.Categorical.from_codes(np_.arange(len(dtype.categories)), dtype=dtype)
+            return column.cat.codes.to_numpy(), pd_.Series(categories)
+
+        cache_key = self._column_versions[column_index]
+        result = self._dictionary_cache.get(cache_key)
+        if result is not None or not factorize:
+            return result
+
+        # Distinct Python objects that compare equal, like 1 and True,
+        # are encoded as one value, so this is limited to strings.
+        # Arrow dictionary columns only need their chunks combined
+        if inferred_type != "string" and not _is_arrow_dictionary(dtype):
+            return None
+
+        # Factorizing the array rather than the Series leaves the
+        # distinct values of Arrow dictionaries in their value type
+        codes, uniques = column.array.factorize()
+        result = (_compact_codes(codes, len(uniques)), pd_.Series(uniques))
+        self._dictionary_cache.put(cache_key, result)
+        return result
 
+    def _eval_predicate(self, filt: RowFilter, col: "pd.Series", inferred_type: str):
         dtype = col.dtype
-        inferred_type = self._get_inferred_dtype(column_index)
 
         mask = None
         if filt.filter_type in (
@@ -1061,61 +3205,154 @@ class PandasView(DataExplorerTableView):
         return mask.to_numpy()
 
     def _sort_data(self) -> None:
-        from pandas.core.sorting import lexsort_indexer, nargsort
-
-        if len(self.sort_keys) == 1:
-            key = self.sort_keys[0]
-            column = self.table.iloc[:, key.column_index]
-            if self.filtered_indices is not None:
-                # pandas's univariate null-friendly argsort (computes
-                # the sorting indices). Mergesort is needed to make it
-                # stable
-                sort_indexer = nargsort(
-                    column.take(self.filtered_indices),
-                    kind="mergesort",
-                    ascending=key.ascending,
-                )
-                # Reorder the filtered_indices to provide the
-                # filtered, sorted virtual view for future data
-                # requests
-                self.view_indices = self.filtered_indices.take(sort_indexer)
-            else:
-                # Data is not filtered
-                self.view_indices = nargsort(column, kind="mergesort", ascending=key.ascending)
-        elif len(self.sort_keys) > 1:
-            # Multiple sorting keys
-            cols_to_sort = []
-            directions = []
-            for key in self.sort_keys:
-                col = self._get_column(key.column_index)
-                cols_to_sort.append(col)
-                directions.append(key.ascending)
-
-            # lexsort_indexer uses np.lexsort and so is always stable
-            sort_indexer = lexsort_indexer(cols_to_sort, directions)
-            if self.filtered_indices is not None:
-                # Create the filtered, sorted virtual view indices
-                self.view_indices = self.filtered_indices.take(sort_indexer)
-            else:
-                self.view_indices = sort_indexer
-        else:
+        if len(self.sort_keys) == 0:
             # This will be None if the data is unfiltered
             self.view_indices = self.filtered_indices
+            return
+
+        sort_spec = tuple((key.column_index, key.ascending) for key in self.sort_keys)
+        cache_key = (
+            "order",
+            tuple((self._column_versions[i], ascending) for i, ascending in sort_spec),
+        )
+
+        order = self._get_cached_sort_order(cache_key)
+        if order is not None:
+            self.view_indices = self._filter_sort_order(order)
+            return
+
+        # Compute the keys for all rows of the table, so that the
+        # order can be reused for any filters
+        num_rows = len(self.table)
+        rows = np_.arange(num_rows, dtype=_row_index_dtype(num_rows))
+        if len(sort_spec) == 1:
+            column_index, ascending = sort_spec[0]
+            column = self.table.iloc[:, column_index]
+            codes = None
+            if not _has_numpy_sort_keys(column.dtype):
+                codes, _ = self._get_sort_codes(column_index)
+            keys, na_mask = _pandas_sort_keys(column, ascending, codes)
+            if na_mask is not None:
+                na_rows = rows[na_mask]
+                rows = rows[~na_mask]
+                keys = keys[~na_mask]
+            else:
+                na_rows = rows[:0]
+        else:
+            keys = _pandas_multi_sort_keys(
+                [self._get_sort_codes(column_index) for column_index, _ in sort_spec],
+                [ascending for _, ascending in sort_spec],
+            )
+            na_rows = rows[:0]
+            if isinstance(keys, list):
+                # The keys could not be combined, so we sort by all of
+                # them at once. np.lexsort is stable and its last key
+                # is the primary one
+                order = np_.lexsort(keys[::-1]).astype(rows.dtype, copy=False)
+                self._sort_cache.put(cache_key, order)
+                self.view_indices = self._filter_sort_order(order)
+                return
+
+        old_order = self._get_appended_sort_order(sort_spec)
+        if old_order is not None:
+            # Only the appended rows are sorted
+            _, num_old_rows = self._table_state.appended_to
+            order = _merge_appended_rows(old_order, num_old_rows, rows, keys, na_rows)
+            self._sort_cache.put(cache_key, order)
+            self.view_indices = self._filter_sort_order(order)
+            return
+
+        if num_rows < self.LAZY_SORT_MIN_ROWS:
+            order = _stable_order(rows, keys, na_rows)
+            self._sort_cache.put(cache_key, order)
+            self.view_indices = self._filter_sort_order(order)
+            return
+
+        # Sorting a large table: compute the order of all rows in the
+        # background, while only sorting the rows that are requested
+        future = None
+        if self.BACKGROUND_SORT:
+            # Orders for sort keys that are no longer used have not
+            # been requested
+            for key, pending in list(self._sort_order_futures.items()):
+                if key != cache_key and pending.cancel():
+                    del self._sort_order_futures[key]
+
+            future = self._sort_order_futures.get(cache_key)
+            if future is None:
+                future = _get_background_executor().submit(_stable_order, rows, keys, na_rows)
+                self._sort_order_futures[cache_key] = future
+
+        transform = None
+        if self.filtered_indices is not None:
+            mask = self._get_filtered_mask()
+            keys = keys[mask.take(rows)]
+            rows = rows[mask.take(rows)]
+            na_rows = na_rows[mask.take(na_rows)]
+            transform = functools.partial(_filter_sort_order, mask=mask)
+
+        if len(rows) + len(na_rows) < self.LAZY_SORT_MIN_ROWS:
+            self.view_indices = _stable_order(rows, keys, na_rows)
+        else:
+            self.view_indices = _LazySortOrder(rows, keys, na_rows, future, transform)
+
+    def _get_cached_sort_order(self, cache_key) -> Optional["np.ndarray"]:
+        order = self._sort_cache.get(cache_key)
+        if order is None:
+            future = self._sort_order_futures.get(cache_key)
+            if future is not None and future.done():
+                del self._sort_order_futures[cache_key]
+                if not future.cancelled() and future.exception() is None:
+                    order = future.result()
+                    self._sort_cache.put(cache_key, order)
+        return order
+
+    def _get_sort_codes(self, column_index: int) -> Tuple["np.ndarray", int]:
+        cache_key = ("codes", self._column_versions[column_index])
+        result = self._sort_cache.get(cache_key)
+        if result is None:
+            result = _pandas_sort_codes(self.table.iloc[:, column_index])
+            self._sort_cache.put(cache_key, result)
+        return result
+
+    def _get_filtered_mask(self) -> "np.ndarray":
+        if isinstance(self.filtered_indices, _RowBitmap):
+            return self.filtered_indices.to_mask()
+        mask = np_.zeros(len(self.table), dtype=bool)
+        mask[self.filtered_indices] = True
+        return mask
+
+    def _filter_sort_order(self, order: "np.ndarray") -> "np.ndarray":
+        if self.filtered_indices is None:
+            return order
+        return _filter_sort_order(order, self._get_filtered_mask())
 
     def _get_column(self, column_index: int) -> "pd.Series":
         column = self.table.iloc[:, column_index]
-        if self.filtered_indices is not None:
+        if isinstance(self.filtered_indices, _RowBitmap):
+            column = column.iloc[self.filtered_indices.to_mask()]
+        elif self.filtered_indices is not None:
             column = column.take(self.filtered_indices)
         return column
 
     def _prof_null_count(self, column_index: int):
         return self._get_column(column_index).isnull().sum()
 
-    def _prof_summary_stats(self, column_index: int, options: FormatOptions):
+    def _prof_summary_stats(
+        self,
+        column_index: int,
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ):
         col_schema = self._get_single_column_schema(column_index)
-        col = self._get_column(column_index)
-
         ui_type = col_schema.type_display
+
+        if ui_type == ColumnDisplayType.Number and _has_numpy_stats(
+            self.table.dtypes.iloc[column_index]
+        ):
+            return self._summarize_numbers([column_index], options, quantiles)[0]
+
+        col = self._get_column(column_index)
         handler = self._SUMMARIZERS.get(ui_type)
 
         if handler is None:
@@ -1124,6 +3361,124 @@ class PandasView(DataExplorerTableView):
         else:
             return handler(col, options)
 
+    def _use_quantile_sketch(self, num_rows: int) -> bool:
+        return not self.EXACT_QUANTILES and num_rows >= self.QUANTILE_SKETCH_MIN_ROWS
+
+    def _is_numeric_summary(self, req: ColumnProfileRequest) -> bool:
+        # Whether the profile is the summary stats of an int, uint or
+        # float column, which are computed by _summarize_numbers
+        return (
+            req.profile_type == ColumnProfileType.SummaryStats
+            and _has_numpy_stats(self.table.dtypes.iloc[req.column_index])
+            and self._get_single_column_schema(req.column_index).type_display
+            == ColumnDisplayType.Number
+        )
+
+    def _group_column_profiles(
+        self, profiles: List[ColumnProfileRequest], indices: List[int]
+    ) -> List[List[int]]:
+        # The summary stats of the numeric columns are computed in one
+        # pass over the filtered rows, before the other profiles
+        numeric = [i for i in indices if self._is_numeric_summary(profiles[i])]
+        numeric_set = set(numeric)
+        others = super()._group_column_profiles(
+            profiles, [i for i in indices if i not in numeric_set]
+        )
+        return ([numeric] if len(numeric) > 0 else []) + others
+
+    def _get_column_profiles(
+        self, profiles: List[ColumnProfileRequest], format_options: FormatOptions
+    ) -> List[Optional[ColumnProfileResult]]:
+        results: List[Optional[ColumnProfileResult]] = [None] * len(profiles)
+
+        # Numeric summary stats with the same quantiles are computed
+        # together
+        by_quantiles: Dict[Optional[Tuple[float, ...]], List[int]] = {}
+        for i, req in enumerate(profiles):
+            if self._is_numeric_summary(req):
+                key = None if req.quantiles is None else tuple(req.quantiles)
+                by_quantiles.setdefault(key, []).append(i)
+            else:
+                results[i] = self._get_column_profile(req, format_options)
+
+        for quantiles, group in by_quantiles.items():
+            stats = self._summarize_numbers(
+                [profiles[i].column_index for i in group],
+                format_options,
+                None if quantiles is None else list(quantiles),
+            )
+            for i, summary_stats in zip(group, stats):
+                results[i] = ColumnProfileResult(summary_stats=summary_stats)
+
+        return results
+
+    def _summarize_numbers(
+        self,
+        column_indices: List[int],
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ) -> List[ColumnSummaryStats]:
+        # Summarize int, uint and float columns together without
+        # taking the filtered rows of each column
+        indices = self.filtered_indices
+        filter_keys = tuple(self._applied_filter_keys)
+        sketch = self._use_quantile_sketch(self._get_num_view_rows())
+
+        keys = [(self._column_versions[i], filter_keys, sketch) for i in column_indices]
+        summaries = [self._summary_cache.get(key) for key in keys]
+        missing = [i for i, summary in enumerate(summaries) if summary is None]
+        if len(missing) > 0:
+            arrays = [self.table.iloc[:, column_indices[i]].to_numpy() for i in missing]
+            computed = _summarize_numeric_arrays(arrays, indices, sketch=sketch)
+
+            # This may run in a profile worker while the filters
+            # change, in which case the summaries are not cached
+            is_current = indices is self.filtered_indices and filter_keys == tuple(
+                self._applied_filter_keys
+            )
+            for i, summary in zip(missing, computed):
+                summaries[i] = summary
+                if is_current:
+                    self._summary_cache.put(keys[i], summary)
+
+        float_format = _get_float_formatter(options)
+        results = []
+        for summary in summaries:
+            if summary.count == 0:
+                min_val = max_val = np_.nan
+            else:
+                min_val, max_val = summary.min_value, summary.max_value
+
+            mean_val = median_val = std_val = None
+            if not _isinf(min_val) and not _isinf(max_val):
+                # These stats are not defined when there is an
+                # inf/-inf in the data
+                mean_val = float_format(summary.mean if summary.count > 0 else np_.nan)
+                median_val = float_format(summary.get_median())
+                std_val = float_format(summary.get_stdev())
+
+            quantile_vals = None
+            if quantiles is not None:
+                quantile_vals = [
+                    ColumnQuantileValue(q=q, value=float_format(value), exact=summary.exact)
+                    for q, value in zip(quantiles, summary.get_quantiles(quantiles))
+                ]
+
+            results.append(
+                ColumnSummaryStats(
+                    type_display=ColumnDisplayType.Number,
+                    number_stats=SummaryStatsNumber(
+                        min_value=float_format(min_val),
+                        max_value=float_format(max_val),
+                        mean=mean_val,
+                        median=median_val,
+                        stdev=std_val,
+                        quantiles=quantile_vals,
+                    ),
+                )
+            )
+        return results
+
     @classmethod
     def _summarize_number(cls, col: "pd.Series", options: FormatOptions):
         float_format = _get_float_formatter(options)
@@ -1163,14 +3518,24 @@ class PandasView(DataExplorerTableView):
             ),
         )
 
-    @staticmethod
-    def _summarize_string(col: "pd.Series", options: FormatOptions):
+    def _num_unique(self, col: "pd.Series") -> Tuple[int, Optional[float]]:
+        # The number of distinct values, estimated for long columns,
+        # and the relative standard error of the estimate
+        if self.EXACT_NUM_UNIQUE or len(col) < self.APPROXIMATE_NUM_UNIQUE_MIN_ROWS:
+            return col.nunique(), None
+        return _hll_num_unique(col)
+
+    def _summarize_string(self, col: "pd.Series", options: FormatOptions):
         num_empty = (col.str.len() == 0).sum()
-        num_unique = col.nunique()
+        num_unique, num_unique_error = self._num_unique(col)
 
         return ColumnSummaryStats(
             type_display=ColumnDisplayType.String,
-            string_stats=SummaryStatsString(num_empty=int(num_empty), num_unique=int(num_unique)),
+            string_stats=SummaryStatsString(
+                num_empty=int(num_empty),
+                num_unique=int(num_unique),
+                num_unique_error=num_unique_error,
+            ),
         )
 
     @staticmethod
@@ -1186,14 +3551,13 @@ class PandasView(DataExplorerTableView):
             ),
         )
 
-    @staticmethod
-    def _summarize_date(col: "pd.Series", options: FormatOptions):
+    def _summarize_date(self, col: "pd.Series", options: FormatOptions):
         col_dttm = pd_.to_datetime(col)
         min_date = col.min()
         mean_date = pd_.to_datetime(col_dttm.mean()).date()
-        median_date = _date_median(col_dttm)
+        median_date = _date_median(col_dttm, sketch=self._use_quantile_sketch(len(col)))
         max_date = col.max()
-        num_unique = col.nunique()
+        num_unique, num_unique_error = self._num_unique(col)
 
         def format_date(x):
             return x.strftime("%Y-%m-%d")
@@ -1202,6 +3566,7 @@ class PandasView(DataExplorerTableView):
             type_display=ColumnDisplayType.Date,
             date_stats=SummaryStatsDate(
                 num_unique=int(num_unique),
+                num_unique_error=num_unique_error,
                 min_date=format_date(min_date),
                 mean_date=format_date(mean_date),
                 median_date=format_date(median_date),
@@ -1209,18 +3574,19 @@ class PandasView(DataExplorerTableView):
             ),
         )
 
-    @staticmethod
-    def _summarize_datetime(col: "pd.Series", options: FormatOptions):
+    def _summarize_datetime(self, col: "pd.Series", options: FormatOptions):
         # when there are mixed timezones in a single column, it's possible that
         # any of the operations below can fail. specially if they mix timezone aware
         # datetimes with naive datetimes.
         # if an error happens we return `None` as the field value.
         min_date = _possibly(col.min)
         mean_date = _possibly(col.mean)
-        median_date = _possibly(lambda: _date_median(col))
+        median_date = _possibly(
+            lambda: _date_median(col, sketch=self._use_quantile_sketch(len(col)))
+        )
         max_date = _possibly(col.max)
 
-        num_unique = _possibly(col.nunique)
+        num_unique, num_unique_error = _possibly(lambda: self._num_unique(col), (None, None))
 
         def format_date(x):
             return str(x)
@@ -1238,6 +3604,7 @@ class PandasView(DataExplorerTableView):
             type_display=ColumnDisplayType.Datetime,
             datetime_stats=SummaryStatsDatetime(
                 num_unique=num_unique,
+                num_unique_error=num_unique_error,
                 min_date=format_date(min_date),
                 mean_date=format_date(mean_date),
                 median_date=format_date(median_date),
@@ -1246,11 +3613,39 @@ class PandasView(DataExplorerTableView):
             ),
         )
 
-    def _prof_freq_table(self, column_index: int):
-        raise NotImplementedError
+    def _get_profile_column(self, column_index: int) -> Tuple["pd.Series", float]:
+        # The filtered column, or a sample of it if it is large, and
+        # the factor to scale counts from the sample by
+        num_rows = self._get_num_view_rows()
+        if num_rows < self.APPROXIMATE_PROFILE_MIN_ROWS:
+            return self._get_column(column_index), 1.0
+
+        rows = _sample_rows(self.filtered_indices, num_rows, self.PROFILE_SAMPLE_SIZE)
+        return self.table.iloc[:, column_index].take(rows), num_rows / len(rows)
+
+    def _prof_freq_table(self, column_index: int, options: FormatOptions):
+        col, scale = self._get_profile_column(column_index)
+
+        codes, uniques = pd_.factorize(col)
+        # Shift the -1 codes of nulls to 0 to count them separately
+        counts = np_.bincount(codes + 1, minlength=len(uniques) + 1)
+        num_values = len(codes) - counts[0]
+        counts = counts[1:]
+
+        top = _top_counts(counts, self.FREQUENCY_TABLE_SIZE)
+        values = _pandas_format_column(pd_.Series(uniques.take(top)), options)
+        return _frequency_table([str(x) for x in values], counts.take(top), num_values, scale)
 
     def _prof_histogram(self, column_index: int):
-        raise NotImplementedError
+        col, scale = self._get_profile_column(column_index)
+        if _has_numpy_stats(col.dtype):
+            values = col.to_numpy()
+        elif col.dtype.kind in "iuf":
+            # Nullable integer and float extension types
+            values = col.dropna().to_numpy(dtype=col.dtype.numpy_dtype)
+        else:
+            raise TypeError(f"Histograms are not supported for {col.dtype}")
+        return _histogram(values, self.HISTOGRAM_NUM_BINS, scale)
 
     SUPPORTED_FILTERS = {
         RowFilterType.Between,
@@ -1266,63 +3661,7 @@ class PandasView(DataExplorerTableView):
         RowFilterType.SetMembership,
     }
 
-    FEATURES = SupportedFeatures(
-        search_schema=SearchSchemaFeatures(support_status=SupportStatus.Supported),
-        set_row_filters=SetRowFiltersFeatures(
-            support_status=SupportStatus.Supported,
-            # Temporarily disabled for https://github.com/posit-dev/positron/issues/3489 on
-            # 6/11/2024. This will be enabled again when the UI has been reworked to support
-            # grouping.
-            supports_conditions=SupportStatus.Unsupported,
-            supported_types=[
-                RowFilterTypeSupportStatus(
-                    row_filter_type=x, support_status=SupportStatus.Supported
-                )
-                for x in SUPPORTED_FILTERS
-            ],
-        ),
-        get_column_profiles=GetColumnProfilesFeatures(
-            support_status=SupportStatus.Supported,
-            supported_types=[
-                ColumnProfileTypeSupportStatus(
-                    profile_type=ColumnProfileType.NullCount,
-                    support_status=SupportStatus.Supported,
-                ),
-                # Temporarily disabled for https://github.com/posit-dev/positron/issues/3490
-                # on 6/11/2024. This will be enabled again when the UI has been reworked to
-                # more fully support column profiles.
-                ColumnProfileTypeSupportStatus(
-                    profile_type=ColumnProfileType.SummaryStats,
-                    support_status=SupportStatus.Experimental,
-                ),
-            ],
-        ),
-        set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Supported),
-        export_data_selection=ExportDataSelectionFeatures(support_status=SupportStatus.Supported),
-    )
-
-    def _get_state(self) -> BackendState:
-        table_unfiltered_shape = TableShape(
-            num_rows=self.table.shape[0], num_columns=self.table.shape[1]
-        )
-
-        if self.view_indices is not None:
-            # Account for filters
-            table_shape = TableShape(
-                num_rows=len(self.view_indices),
-                num_columns=self.table.shape[1],
-            )
-        else:
-            table_shape = table_unfiltered_shape
-
-        return BackendState(
-            display_name=self.display_name,
-            table_shape=table_shape,
-            table_unfiltered_shape=table_unfiltered_shape,
-            row_filters=self.filters,
-            sort_keys=self.sort_keys,
-            supported_features=self.FEATURES,
-        )
+    FEATURES = DataExplorerTableView._supported_features(SUPPORTED_FILTERS)
 
 
 COMPARE_OPS = {
@@ -1335,15 +3674,22 @@ COMPARE_OPS = {
 }
 
 
-def _date_median(x):
+def _date_median(x, sketch: bool = False):
     """
     Computes the median of a date or datetime series
 
     It converts to the integer representation of the datetime,
-    then computes the median, and then converts back to a datetime
+    then computes the median, and then converts back to a datetime.
+    If sketch is True, the median is estimated with a quantile sketch
     """
     # the np_.array calls are required to please pyright
-    median_date = np_.median(np_.array(pd_.to_numeric(x)))
+    values = np_.array(pd_.to_numeric(x))
+    if sketch:
+        quantile_sketch = _QuantileSketch()
+        quantile_sketch.update(values)
+        median_date = quantile_sketch.quantiles([0.5])[0]
+    else:
+        median_date = np_.median(values)
     out = pd_.to_datetime(np_.array(median_date), utc=True)
     return out.tz_convert(x[0].tz)
 
@@ -1413,6 +3759,13 @@ def _parse_iso8601_like(x, dtype):
 
 
 class PolarsView(DataExplorerTableView):
+    """
+    Filters and sort keys are translated to polars expressions and
+    executed as a single lazy query by the polars engine, which yields
+    the row indices of the view. Viewport fetches slice these indices
+    and gather only the requested rows.
+    """
+
     def __init__(
         self,
         display_name: str,
@@ -1420,19 +3773,53 @@ class PolarsView(DataExplorerTableView):
         filters: Optional[List[RowFilter]],
         sort_keys: Optional[List[ColumnSortKey]],
     ):
+        table = self._maybe_wrap(table)
+
         super().__init__(display_name, table, filters, sort_keys)
+
+        # polars Series of UInt32 row indices, as with PandasView
         self.filtered_indices = None
         self.view_indices = None
 
+        # Combination of the valid row filters, which the sort query
+        # applies again rather than gathering the filtered rows
+        self._row_filter: Optional["pl.Expr"] = None
+
+        # The columns and types of the table, which could be modified
+        # in place before get_updated_state is called
+        self._column_names: List[str] = list(table.columns)
+        self._column_dtypes: List["pl.DataType"] = list(table.dtypes)
+
+    def _maybe_wrap(self, value):
+        if isinstance(value, pl_.Series):
+            return value.to_frame()
+        return value
+
     def _recompute(self):
-        raise NotImplementedError
+        # Re-setting the row filters will trigger filtering AND
+        # sorting
+        self._set_row_filters(self.filters)
 
     def get_updated_state(self, new_table) -> StateUpdate:
-        raise NotImplementedError
+        new_table = self._maybe_wrap(new_table)
+
+        # polars columns have exact types, so the schema changed if and
+        # only if the names or types of the columns changed
+        new_dtypes = list(new_table.dtypes)
+        schema_updated = (
+            new_table.columns != self._column_names or new_dtypes != self._column_dtypes
+        )
+        return self._get_updated_state_by_name(
+            self._column_names, new_table, new_table.columns, schema_updated
+        )
 
     def _get_single_column_schema(self, column_index: int):
-        column: "pl.Series" = self.table[:, column_index]
-        type_display = self._get_type_display(column.dtype)
+        return self._get_column_schema(self.table, column_index)
+
+    @classmethod
+    def _get_column_schema(cls, table: "pl.DataFrame", column_index: int) -> ColumnSchema:
+        column: "pl.Series" = table[:, column_index]
+        type_display = cls._get_type_display(column.dtype)
 
         return ColumnSchema(
             column_name=column.name,
@@ -1474,39 +3861,19 @@ class PolarsView(DataExplorerTableView):
         key = str(dtype.base_type())
         return cls.TYPE_DISPLAY_MAPPING.get(key, "unknown")
 
-    def _search_schema(
-        self, search_term: str, start_index: int, max_results: int
-    ) -> SearchSchemaResult:
-        raise NotImplementedError
-
-    def _get_data_values(
-        self,
-        row_start: int,
-        num_rows: int,
-        column_indices: Sequence[int],
-        format_options: FormatOptions,
-    ) -> TableData:
-        formatted_columns = []
-        column_indices = sorted(column_indices)
-        columns = []
-        for i in column_indices:
-            # The UI has requested data beyond the end of the table,
-            # so we stop here
-            if i >= self.table.shape[1]:
-                break
-            columns.append(self.table[:, i])
-
-        formatted_columns = []
+    def _get_column_names(self) -> List:
+        return self.table.columns
 
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        column = self.table[:, column_index]
         if self.view_indices is not None:
-            raise NotImplementedError
+            column = column.gather(self.view_indices.slice(start, end - start))
         else:
             # No filtering or sorting, just slice
-            columns = [col[row_start : row_start + num_rows] for col in columns]
-
-        formatted_columns = [self._format_values(col, format_options) for col in columns]
-
-        return TableData(columns=formatted_columns)
+            column = column.slice(start, end - start)
+        return self._format_values(column, format_options)
 
     @classmethod
     def _format_values(cls, values, options: FormatOptions) -> List[ColumnValue]:
@@ -1535,96 +3902,2301 @@ class PolarsView(DataExplorerTableView):
                     else:
                         result.append(_VALUE_NULL)
             else:
-                for i, v in enumerate(s):
-                    if is_valid_mask[i]:
-                        result.append(_format_scalar(v))
-                    else:
-                        result.append(_VALUE_NULL)
-            return result
+                for i, v in enumerate(s):
+                    if is_valid_mask[i]:
+                        result.append(_format_scalar(v))
+                    else:
+                        result.append(_VALUE_NULL)
+            return result
+
+        return _format_series(values)
+
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        if self.view_indices is not None:
+            row_index = self.view_indices[row_index]
+        return str(self.table[row_index, column_index])
+
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
+        to_export = self.table
+        if column_selector is not None:
+            to_export = to_export[:, column_selector]
+
+        if self.view_indices is not None:
+            rows = self.view_indices
+            if row_selector is not None:
+                rows = rows[row_selector]
+            to_export = to_export[rows]
+        elif row_selector is not None:
+            to_export = to_export[row_selector]
+
+        # Nested values have no CSV representation in polars, so they
+        # are exported as they are formatted in the grid
+        nested = [
+            name
+            for name, dtype in zip(to_export.columns, to_export.dtypes)
+            if dtype.is_nested() or dtype == pl_.Object
+        ]
+        if nested:
+            to_export = to_export.with_columns(
+                pl_.Series(
+                    name,
+                    [None if value is None else str(value) for value in to_export[name].to_list()],
+                    dtype=pl_.String,
+                )
+                for name in nested
+            )
+
+        if fmt == ExportFormat.Csv:
+            data = to_export.write_csv()
+        elif fmt == ExportFormat.Tsv:
+            data = to_export.write_csv(separator="\t")
+        elif fmt == ExportFormat.Html:
+            data = _html_table(to_export.columns, to_export.iter_rows())
+        else:
+            raise NotImplementedError(f"Unsupported export format {fmt}")
+
+        return ExportedData(data=data, format=fmt)
+
+    def _numbered_rows(self) -> "pl.LazyFrame":
+        # Query of the table with the row index as an extra column
+        plan = self.table.lazy()
+        if hasattr(plan, "with_row_index"):
+            return plan.with_row_index(_POLARS_ROW_INDEX)
+        # Renamed in polars 0.20.4
+        return plan.with_row_count(_POLARS_ROW_INDEX)
+
+    def _collect_row_indices(self, plan: "pl.LazyFrame") -> "pl.Series":
+        return plan.select(_POLARS_ROW_INDEX).collect()[_POLARS_ROW_INDEX]
+
+    def _update_view_indices(self):
+        if len(self.sort_keys) == 0:
+            self.view_indices = self.filtered_indices
+        else:
+            # If we have just applied a new filter, we now resort to
+            # reflect the filtered_indices that have just been updated
+            self._sort_data()
+
+    def _set_sort_columns(self, sort_keys: List[ColumnSortKey]):
+        self._set_sort_keys(sort_keys)
+
+        if not self._recompute_if_needed():
+            # If a re-filter is pending, then it will automatically
+            # trigger a sort
+            self._sort_data()
+
+    def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
+        self.filters = filters
+
+        for filt in self.filters:
+            # If is_valid isn't set, set it based on what is currently
+            # supported
+            if filt.is_valid is None:
+                filt.is_valid = self._is_supported_filter(filt)
+
+        had_errors = False
+        exprs = []
+        for filt in filters:
+            # If filter is invalid, do not evaluate it
+            if filt.is_valid is False:
+                continue
+            try:
+                expr = self._get_filter_expr(filt)
+                # Type errors are raised when the query is planned,
+                # which does not look at any rows
+                self.table.clear().select(expr)
+            except Exception as e:
+                had_errors = True
+                self._set_filter_error(filt, e)
+                continue
+            exprs.append((filt, expr))
+
+        try:
+            self._row_filter = _combine_filter_exprs(exprs)
+            self._apply_row_filter()
+        except Exception:
+            # A filter failed for some of the values, so each filter is
+            # evaluated on its own to find out which
+            had_errors = True
+            valid_exprs = []
+            for filt, expr in exprs:
+                try:
+                    self.table.select(expr)
+                except Exception as e:
+                    self._set_filter_error(filt, e)
+                    continue
+                valid_exprs.append((filt, expr))
+            self._row_filter = _combine_filter_exprs(valid_exprs)
+            self._apply_row_filter()
+
+        if self.filtered_indices is None:
+            selected_num_rows = len(self.table)
+        else:
+            selected_num_rows = len(self.filtered_indices)
+
+        # Update the view indices, re-sorting if needed
+        self._update_view_indices()
+        return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
+
+    def _apply_row_filter(self):
+        if self._row_filter is None:
+            self.filtered_indices = None
+        else:
+            self.filtered_indices = self._collect_row_indices(
+                self._numbered_rows().filter(self._row_filter)
+            )
+
+    def _get_filter_expr(self, filt: RowFilter) -> "pl.Expr":
+        column_index = filt.column_schema.column_index
+        dtype = self.table.dtypes[column_index]
+        col = pl_.col(self.table.columns[column_index])
+
+        if dtype.base_type() is pl_.Datetime and dtype.time_zone is not None:  # type: ignore
+            # Values are compared with the local times of the column,
+            # as with pandas
+            col = col.dt.replace_time_zone(None)
+            dtype = pl_.Datetime(dtype.time_unit)  # type: ignore
+
+        if filt.filter_type in (
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ):
+            params = filt.between_params
+            assert params is not None
+            left_value = _polars_coerce_value(params.left_value, dtype)
+            right_value = _polars_coerce_value(params.right_value, dtype)
+            if filt.filter_type == RowFilterType.Between:
+                expr = (col >= left_value) & (col <= right_value)
+            else:
+                # NotBetween
+                expr = (col < left_value) | (col > right_value)
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.compare_params
+            assert params is not None
+
+            if params.op not in COMPARE_OPS:
+                raise ValueError(f"Unsupported filter type: {params.op}")
+            value = _polars_coerce_value(params.value, dtype)
+            if params.op == CompareFilterParamsOp.NotEq:
+                # Null values are not equal to anything, as with pandas
+                expr = col.ne_missing(value)
+            else:
+                expr = COMPARE_OPS[params.op](col, value)
+        elif filt.filter_type == RowFilterType.IsEmpty:
+            expr = _polars_as_string(col, dtype).str.len_bytes() == 0
+        elif filt.filter_type == RowFilterType.IsNull:
+            expr = col.is_null()
+        elif filt.filter_type == RowFilterType.NotEmpty:
+            expr = _polars_as_string(col, dtype).str.len_bytes() != 0
+        elif filt.filter_type == RowFilterType.NotNull:
+            expr = col.is_not_null()
+        elif filt.filter_type == RowFilterType.IsTrue:
+            expr = col
+        elif filt.filter_type == RowFilterType.IsFalse:
+            expr = col.not_()
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.set_membership_params
+            assert params is not None
+            values = [_polars_coerce_value(value, dtype) for value in params.values]
+            # IN
+            expr = col.is_in(pl_.Series(values, dtype=dtype))
+            if not params.inclusive:
+                # NOT-IN, which includes the null values
+                expr = expr.fill_null(False).not_()
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.search_params
+            assert params is not None
+
+            col = _polars_as_string(col, dtype)
+            term = params.term
+
+            if params.search_type == SearchFilterType.RegexMatch:
+                # Matches at the start of the values, as with pandas
+                flags = "" if params.case_sensitive else "(?i)"
+                expr = col.str.contains(f"{flags}^(?:{term})")
+            else:
+                if not params.case_sensitive:
+                    col = col.str.to_lowercase()
+                    term = term.lower()
+                if params.search_type == SearchFilterType.Contains:
+                    expr = col.str.contains(term, literal=True)
+                elif params.search_type == SearchFilterType.StartsWith:
+                    expr = col.str.starts_with(term)
+                elif params.search_type == SearchFilterType.EndsWith:
+                    expr = col.str.ends_with(term)
+                else:
+                    raise ValueError(f"Unsupported search type: {params.search_type}")
+        else:
+            raise ValueError(f"Unsupported filter type: {filt.filter_type}")
+
+        # Rows with null values are not selected
+        return expr.fill_null(False)
+
+    def _sort_data(self):
+        if len(self.sort_keys) == 0:
+            self.view_indices = self.filtered_indices
+            return
+
+        # Missing values are sorted last regardless of the sort order
+        # and ties keep the order of the rows, as with pandas. Each key
+        # is a pair of a null flag and the value, so that NaN and null
+        # values are sorted together
+        by = []
+        descending = []
+        for key in self.sort_keys:
+            col = pl_.col(self.table.columns[key.column_index])
+            if self.table.dtypes[key.column_index].is_float():
+                col = col.fill_nan(None)
+            by.extend([col.is_null(), col])
+            descending.extend([False, not key.ascending])
+
+        plan = self._numbered_rows()
+        if self._row_filter is not None:
+            plan = plan.filter(self._row_filter)
+        plan = plan.sort(by, descending=descending, maintain_order=True)
+        self.view_indices = self._collect_row_indices(plan)
+
+    # The profiles of a get_column_profiles request are computed with
+    # a single query of aggregate expressions for all the requested
+    # columns, which the polars engine evaluates in parallel
+    BATCH_COLUMN_PROFILES = True
+
+    def _get_column_profiles(
+        self, profiles: List[ColumnProfileRequest], format_options: FormatOptions
+    ) -> List[Optional[ColumnProfileResult]]:
+        # Histograms and frequency tables of long columns are computed
+        # from a sample of the rows, with the factor to scale counts
+        # from the sample by
+        num_rows = self._get_num_view_rows()
+        if num_rows < self.APPROXIMATE_PROFILE_MIN_ROWS:
+            sample_rows, scale = self.filtered_indices, 1.0
+        else:
+            sample_rows = _sample_rows(self.filtered_indices, num_rows, self.PROFILE_SAMPLE_SIZE)
+            scale = num_rows / len(sample_rows)
+
+        queries = []
+        for req in profiles:
+            try:
+                queries.append(self._get_profile_query(req, sample_rows, scale, format_options))
+            except Exception as err:
+                _log_profile_error(req, err)
+                queries.append(None)
+
+        exprs = [
+            expr.alias(f"{i}:{name}")
+            for i, query in enumerate(queries)
+            if query is not None
+            for name, expr in query[0].items()
+        ]
+        try:
+            aggregates = self.table.lazy().select(exprs).collect()
+        except Exception:
+            # Compute the profiles one at a time, so that the ones that
+            # fail do not fail the others
+            aggregates = None
+
+        results = []
+        for i, (req, query) in enumerate(zip(profiles, queries)):
+            if query is None:
+                results.append(None)
+                continue
+
+            exprs, finish = query
+            try:
+                if aggregates is None:
+                    values = self.table.lazy().select(**exprs).collect()
+                    values = {name: values[name][0] for name in exprs}
+                else:
+                    values = {name: aggregates[f"{i}:{name}"][0] for name in exprs}
+                results.append(finish(values))
+            except Exception as err:
+                _log_profile_error(req, err)
+                results.append(None)
+
+        return results
+
+    def _get_profile_query(
+        self,
+        req: ColumnProfileRequest,
+        sample_rows,
+        scale: float,
+        format_options: FormatOptions,
+    ) -> Tuple[Dict[str, "pl.Expr"], Callable[[Dict[str, Any]], ColumnProfileResult]]:
+        # The named aggregate expressions that a profile is computed
+        # from, and the function computing it from their values
+        dtype = self.table.dtypes[req.column_index]
+        col = pl_.col(self.table.columns[req.column_index])
+        column = col if self.filtered_indices is None else col.gather(self.filtered_indices)
+        sample = col if sample_rows is None else col.gather(sample_rows)
+
+        if req.profile_type == ColumnProfileType.NullCount:
+            return {"null_count": column.null_count()}, lambda values: ColumnProfileResult(
+                null_count=int(values["null_count"])
+            )
+        elif req.profile_type == ColumnProfileType.SummaryStats:
+            exprs, summarize = self._get_summary_stats_query(
+                column, dtype, format_options, req.quantiles
+            )
+            return exprs, lambda values: ColumnProfileResult(summary_stats=summarize(values))
+        elif req.profile_type == ColumnProfileType.FrequencyTable:
+            sample = sample.drop_nulls()
+
+            def _frequency_table_result(values):
+                # Value counts sorted by value, so that ties are broken
+                # by value as with pandas
+                counts = values["counts"].struct.unnest()
+                counts = counts.sort(counts.columns[0])
+                top = _top_counts(counts[:, 1].to_numpy(), self.FREQUENCY_TABLE_SIZE)
+                formatted = self._format_values(counts[:, 0].gather(top), format_options)
+                return ColumnProfileResult(
+                    frequency_table=_frequency_table(
+                        [str(x) for x in formatted],
+                        counts[:, 1].to_numpy().take(top),
+                        values["count"],
+                        scale,
+                    )
+                )
+
+            return {
+                "counts": sample.value_counts().implode(),
+                "count": sample.len(),
+            }, _frequency_table_result
+        elif req.profile_type == ColumnProfileType.Histogram:
+            if not (dtype.is_integer() or dtype.is_float()):
+                raise TypeError(f"Histograms are not supported for {dtype}")
+            return {"values": sample.drop_nulls().implode()}, lambda values: ColumnProfileResult(
+                histogram=_histogram(values["values"].to_numpy(), self.HISTOGRAM_NUM_BINS, scale)
+            )
+        else:
+            raise NotImplementedError(req.profile_type)
+
+    @classmethod
+    def _get_summary_stats_query(
+        cls,
+        column: "pl.Expr",
+        dtype: "pl.DataType",
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ) -> Tuple[Dict[str, "pl.Expr"], Callable[[Dict[str, Any]], ColumnSummaryStats]]:
+        ui_type = cls._get_type_display(dtype)
+        if ui_type == ColumnDisplayType.Number and (dtype.is_integer() or dtype.is_float()):
+            return cls._summarize_number(column, dtype, options, quantiles)
+        elif ui_type == ColumnDisplayType.String:
+            exprs = {
+                "num_empty": (_polars_as_string(column, dtype).str.len_bytes() == 0).sum(),
+                "num_unique": column.drop_nulls().n_unique(),
+            }
+            return exprs, lambda values: ColumnSummaryStats(
+                type_display=ColumnDisplayType.String,
+                string_stats=SummaryStatsString(
+                    num_empty=int(values["num_empty"]),
+                    num_unique=int(values["num_unique"]),
+                ),
+            )
+        elif ui_type == ColumnDisplayType.Boolean:
+            exprs = {
+                "true_count": column.sum(),
+                "null_count": column.null_count(),
+                "count": column.len(),
+            }
+            return exprs, lambda values: ColumnSummaryStats(
+                type_display=ColumnDisplayType.Boolean,
+                boolean_stats=SummaryStatsBoolean(
+                    true_count=int(values["true_count"]),
+                    false_count=int(values["count"] - values["true_count"] - values["null_count"]),
+                ),
+            )
+        elif ui_type in (ColumnDisplayType.Date, ColumnDisplayType.Datetime):
+            return cls._summarize_dates(column, dtype)
+        else:
+            # Return nothing for types we don't yet know how to summarize
+            return {}, lambda values: ColumnSummaryStats(type_display=ui_type)
+
+    @staticmethod
+    def _summarize_number(
+        column: "pl.Expr",
+        dtype: "pl.DataType",
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ):
+        if dtype.is_float():
+            # NaN values are missing, as with pandas
+            column = column.fill_nan(None)
+
+        exprs = {
+            "min": column.min(),
+            "max": column.max(),
+            "mean": column.mean(),
+            "median": column.median(),
+            "stdev": column.std(),
+        }
+        quantiles = quantiles or []
+        for i, q in enumerate(quantiles):
+            # The quantiles are requested as percentiles
+            exprs[f"quantile_{i}"] = column.quantile(q / 100, "linear")
+
+        def _summarize(values):
+            float_format = _get_float_formatter(options)
+            values = {name: np_.nan if value is None else value for name, value in values.items()}
+            min_val, max_val = values["min"], values["max"]
+
+            mean_val = median_val = std_val = None
+            if not _isinf(min_val) and not _isinf(max_val):
+                # These stats are not defined when there is an
+                # inf/-inf in the data
+                mean_val = float_format(values["mean"])
+                median_val = float_format(values["median"])
+                std_val = float_format(values["stdev"])
+
+            quantile_vals = None
+            if len(quantiles) > 0:
+                quantile_vals = [
+                    ColumnQuantileValue(
+                        q=q, value=float_format(values[f"quantile_{i}"]), exact=True
+                    )
+                    for i, q in enumerate(quantiles)
+                ]
+
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Number,
+                number_stats=SummaryStatsNumber(
+                    min_value=float_format(min_val),
+                    max_value=float_format(max_val),
+                    mean=mean_val,
+                    median=median_val,
+                    stdev=std_val,
+                    quantiles=quantile_vals,
+                ),
+            )
+
+        return exprs, _summarize
+
+    @staticmethod
+    def _summarize_dates(column: "pl.Expr", dtype: "pl.DataType"):
+        # The mean and median are computed on the integer
+        # representation of the dates and converted back
+        physical = pl_.Int32 if dtype == pl_.Date else pl_.Int64
+        exprs = {
+            "num_unique": column.drop_nulls().n_unique(),
+            "min": column.min(),
+            "mean": column.to_physical().mean().floor().cast(physical).cast(dtype),
+            "median": column.to_physical().median().floor().cast(physical).cast(dtype),
+            "max": column.max(),
+        }
+
+        def _summarize(values):
+            stats = {
+                "num_unique": int(values["num_unique"]),
+                "min_date": str(values["min"]),
+                "mean_date": str(values["mean"]),
+                "median_date": str(values["median"]),
+                "max_date": str(values["max"]),
+            }
+            if dtype == pl_.Date:
+                return ColumnSummaryStats(
+                    type_display=ColumnDisplayType.Date,
+                    date_stats=SummaryStatsDate(**stats),
+                )
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Datetime,
+                datetime_stats=SummaryStatsDatetime(
+                    timezone=str(dtype.time_zone),  # type: ignore
+                    **stats,
+                ),
+            )
+
+        return exprs, _summarize
+
+    SUPPORTED_FILTERS = {
+        RowFilterType.Between,
+        RowFilterType.Compare,
+        RowFilterType.IsEmpty,
+        RowFilterType.IsFalse,
+        RowFilterType.IsNull,
+        RowFilterType.IsTrue,
+        RowFilterType.NotBetween,
+        RowFilterType.NotEmpty,
+        RowFilterType.NotNull,
+        RowFilterType.Search,
+        RowFilterType.SetMembership,
+    }
+
+    FEATURES = DataExplorerTableView._supported_features(SUPPORTED_FILTERS)
+
+
+# Name of the row index column added to queries of polars tables
+_POLARS_ROW_INDEX = "__positron_row_index__"
+
+
+def _combine_filter_exprs(
+    exprs: List[Tuple[RowFilter, Any]], and_=operator.and_, or_=operator.or_
+) -> Optional[Any]:
+    # Combine filter expressions or masks using the indicated
+    # conditions
+    combined = None
+    for filt, expr in exprs:
+        if combined is None:
+            combined = expr
+        elif filt.condition == RowFilterCondition.And:
+            combined = and_(combined, expr)
+        elif filt.condition == RowFilterCondition.Or:
+            combined = or_(combined, expr)
+    return combined
+
+
+def _polars_coerce_value(value: str, dtype: "pl.DataType"):
+    if dtype.is_integer():
+        # For integer types, try to coerce to integer, but if this
+        # fails, allow a looser conversion to float
+        try:
+            return int(value)
+        except ValueError as e1:
+            try:
+                return float(value)
+            except ValueError:
+                raise e1
+    elif dtype.is_float():
+        return float(value)
+    elif dtype == pl_.Boolean:
+        lvalue = value.lower()
+        if lvalue == "true":
+            return True
+        elif lvalue == "false":
+            return False
+        else:
+            raise ValueError(f"Unable to convert {value} to boolean")
+    elif dtype.base_type() is pl_.Datetime:
+        return _parse_iso8601_like(value, None)
+    elif dtype == pl_.Date:
+        return _parse_iso8601_like(value, None).date()
+    else:
+        # As a fallback, let Series.cast do the coercion
+        return pl_.Series([value]).cast(dtype)[0]
+
+
+def _polars_as_string(col: "pl.Expr", dtype: "pl.DataType") -> "pl.Expr":
+    # Binary columns are displayed as strings
+    if dtype == pl_.String:
+        return col
+    return col.cast(pl_.String)
+
+
+def _html_table(column_names: List[str], rows: Iterable[Sequence]) -> str:
+    import html
+
+    def _row(tag: str, values) -> str:
+        cells = "".join(f"<{tag}>{html.escape(value)}</{tag}>" for value in values)
+        return f"    <tr>{cells}</tr>"
+
+    lines = ["<table>", "  <thead>", _row("th", column_names), "  </thead>", "  <tbody>"]
+    for row in rows:
+        lines.append(_row("td", ("" if value is None else str(value) for value in row)))
+    lines.extend(["  </tbody>", "</table>"])
+    return "\n".join(lines)
+
+
+def _export_rows(column_names: List[str], rows: Iterable[Sequence[str]], fmt: ExportFormat) -> str:
+    # Rows of values that are already converted to strings, as CSV,
+    # TSV or an HTML table
+    import csv
+    from io import StringIO
+
+    if fmt in (ExportFormat.Csv, ExportFormat.Tsv):
+        buf = StringIO()
+        writer = csv.writer(
+            buf, delimiter="," if fmt == ExportFormat.Csv else "\t", lineterminator="\n"
+        )
+        writer.writerow(column_names)
+        writer.writerows(rows)
+        return buf.getvalue()
+    elif fmt == ExportFormat.Html:
+        return _html_table(column_names, rows)
+    else:
+        raise NotImplementedError(f"Unsupported export format {fmt}")
+
+
+class PyArrowView(DataExplorerTableView):
+    """
+    Filters, sorting and profiles are computed with pyarrow.compute
+    kernels, which run on the chunks of the columns, so that tables
+    backed by memory-mapped Arrow files are never copied or converted
+    to pandas. The filtered and sorted row indices are Arrow arrays
+    that viewport fetches slice and take rows with.
+    """
+
+    def __init__(
+        self,
+        display_name: str,
+        table: "pa.Table",
+        filters: Optional[List[RowFilter]],
+        sort_keys: Optional[List[ColumnSortKey]],
+    ):
+        super().__init__(display_name, table, filters, sort_keys)
+
+        # Arrow arrays of row indices, as with PandasView
+        self.filtered_indices = None
+        self.view_indices = None
+
+    def _recompute(self):
+        # Re-setting the row filters will trigger filtering AND
+        # sorting
+        self._set_row_filters(self.filters)
+
+    def get_updated_state(self, new_table) -> StateUpdate:
+        # Arrow columns have exact types, so the schema changed if and
+        # only if the names or types of the columns changed
+        schema_updated = not new_table.schema.equals(self.table.schema)
+        return self._get_updated_state_by_name(
+            self.table.column_names, new_table, new_table.column_names, schema_updated
+        )
+
+    def _get_single_column_schema(self, column_index: int):
+        return self._get_column_schema(self.table, column_index)
+
+    @classmethod
+    def _get_column_schema(cls, table: "pa.Table", column_index: int) -> ColumnSchema:
+        field = table.schema.field(column_index)
+        return ColumnSchema(
+            column_name=field.name,
+            column_index=column_index,
+            type_name=str(field.type),
+            type_display=cls._get_type_display(field.type),
+        )
+
+    @classmethod
+    def _get_type_display(cls, arrow_type: "pa.DataType") -> ColumnDisplayType:
+        types = pa_.types
+        if types.is_dictionary(arrow_type):
+            # Dictionary-encoded columns are displayed as their values
+            arrow_type = arrow_type.value_type  # type: ignore
+
+        if types.is_boolean(arrow_type):
+            return ColumnDisplayType.Boolean
+        elif types.is_integer(arrow_type) or types.is_floating(arrow_type):
+            return ColumnDisplayType.Number
+        elif types.is_decimal(arrow_type):
+            return ColumnDisplayType.Number
+        elif _is_arrow_string_like(arrow_type):
+            return ColumnDisplayType.String
+        elif types.is_date(arrow_type):
+            return ColumnDisplayType.Date
+        elif types.is_timestamp(arrow_type):
+            return ColumnDisplayType.Datetime
+        elif types.is_time(arrow_type):
+            return ColumnDisplayType.Time
+        elif (
+            types.is_list(arrow_type)
+            or types.is_large_list(arrow_type)
+            or types.is_fixed_size_list(arrow_type)
+        ):
+            return ColumnDisplayType.Array
+        elif types.is_struct(arrow_type):
+            return ColumnDisplayType.Struct
+        else:
+            return ColumnDisplayType.Unknown
+
+    def _get_column_names(self) -> List:
+        return self.table.column_names
+
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        if self.view_indices is not None:
+            column = self._take_column(column_index, self.view_indices.slice(start, end - start))
+        else:
+            # No filtering or sorting, just slice
+            column = self.table.column(column_index).slice(start, end - start)
+        return self._format_values(column, format_options)
+
+    def _take_columns(self, column_indices: List[int], rows: Optional["pa.Array"]) -> "pa.Table":
+        # The given rows of the given columns, or all rows if rows is
+        # None
+        table = self.table.select(column_indices)
+        return table if rows is None else table.take(rows)
+
+    def _take_column(self, column_index: int, rows: "pa.Array") -> "pa.ChunkedArray":
+        return self._take_columns([column_index], rows).column(0)
+
+    @classmethod
+    def _format_values(cls, values, options: FormatOptions) -> List[ColumnValue]:
+        float_format = _get_float_formatter(options)
+        arrow_type = values.type
+        if pa_.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        is_float = pa_.types.is_floating(arrow_type)
+
+        result = []
+        for x in values.to_pylist():
+            if x is None:
+                result.append(_VALUE_NULL)
+            elif is_float:
+                if math.isnan(x):
+                    result.append(_VALUE_NAN)
+                elif math.isinf(x):
+                    result.append(_VALUE_INF if x > 0 else _VALUE_NEGINF)
+                else:
+                    result.append(float_format(x))
+            else:
+                result.append(str(x))
+        return result
+
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        if self.view_indices is not None:
+            row_index = self.view_indices[row_index].as_py()
+        value = self._take_column(column_index, pa_.array([row_index], pa_.int64()))[0]
+        return str(value.as_py())
+
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
+        column_indices = self._selected_columns(column_selector, self.table.num_columns)
+
+        rows = self.view_indices
+        if row_selector is not None:
+            if rows is None:
+                rows = pa_.array(range(self.table.num_rows)[row_selector], pa_.int64())
+            elif isinstance(row_selector, slice):
+                rows = rows[row_selector]
+            else:
+                rows = rows.take(pa_.array(row_selector, pa_.int64()))
+        to_export = self._take_columns(column_indices, rows)
+
+        column_names = to_export.column_names
+        values = zip(
+            *(
+                ["" if x is None else str(x) for x in column.to_pylist()]
+                for column in to_export.columns
+            )
+        )
+
+        return ExportedData(data=_export_rows(column_names, values, fmt), format=fmt)
+
+    def _update_view_indices(self):
+        if len(self.sort_keys) == 0:
+            self.view_indices = self.filtered_indices
+        else:
+            # If we have just applied a new filter, we now resort to
+            # reflect the filtered_indices that have just been updated
+            self._sort_data()
+
+    def _set_sort_columns(self, sort_keys: List[ColumnSortKey]):
+        self._set_sort_keys(sort_keys)
+
+        if not self._recompute_if_needed():
+            # If a re-filter is pending, then it will automatically
+            # trigger a sort
+            self._sort_data()
+
+    def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
+        import pyarrow.compute as pc
+
+        self.filters = filters
+
+        for filt in self.filters:
+            # If is_valid isn't set, set it based on what is currently
+            # supported
+            if filt.is_valid is None:
+                filt.is_valid = self._is_supported_filter(filt)
+
+        had_errors = False
+        masks = []
+        for filt in filters:
+            # If filter is invalid, do not evaluate it
+            if filt.is_valid is False:
+                continue
+            try:
+                mask = self._eval_filter(filt)
+            except Exception as e:
+                had_errors = True
+                self._set_filter_error(filt, e)
+                continue
+            masks.append((filt, mask))
+
+        combined = _combine_filter_exprs(masks, pc.and_, pc.or_)
+        if combined is None:
+            self.filtered_indices = None
+            selected_num_rows = self.table.num_rows
+        else:
+            self.filtered_indices = pc.indices_nonzero(combined)
+            selected_num_rows = len(self.filtered_indices)
+
+        # Update the view indices, re-sorting if needed
+        self._update_view_indices()
+        return FilterResult(selected_num_rows=selected_num_rows, had_errors=had_errors)
+
+    def _eval_filter(self, filt: RowFilter) -> "pa.ChunkedArray":
+        # Boolean mask of the rows selected by a filter
+        return self._eval_filter_values(filt, self.table.column(filt.column_schema.column_index))
+
+    @classmethod
+    def _eval_filter_values(cls, filt: RowFilter, column: "pa.ChunkedArray") -> "pa.ChunkedArray":
+        import pyarrow.compute as pc
+
+        if filt.filter_type == RowFilterType.IsNull:
+            return pc.is_null(column)
+        elif filt.filter_type == RowFilterType.NotNull:
+            return pc.is_valid(column)
+
+        if pa_.types.is_dictionary(column.type):
+            # The predicate is evaluated on the distinct values of each
+            # chunk, and mapped to the rows by the dictionary indices
+            value_type = column.type.value_type  # type: ignore
+            mask = pa_.chunked_array(
+                [
+                    pc.take(cls._eval_predicate(filt, chunk.dictionary, value_type), chunk.indices)
+                    for chunk in column.chunks
+                ],
+                pa_.bool_(),
+            )
+        else:
+            mask = cls._eval_predicate(filt, column, column.type)
+
+        # Rows with null values are not selected, except by the filters
+        # that select the rows NOT matching a value or values
+        selects_nulls = (
+            filt.filter_type == RowFilterType.Compare
+            and filt.compare_params.op == CompareFilterParamsOp.NotEq
+        ) or (
+            filt.filter_type == RowFilterType.SetMembership
+            and not filt.set_membership_params.inclusive
+        )
+        return mask.fill_null(selects_nulls)
+
+    @staticmethod
+    def _eval_predicate(filt: RowFilter, values, arrow_type: "pa.DataType"):
+        import pyarrow.compute as pc
+
+        if pa_.types.is_timestamp(arrow_type) and arrow_type.tz is not None:  # type: ignore
+            # Values are compared with the local times of the column,
+            # as with pandas
+            values = pc.local_timestamp(values)
+            arrow_type = pa_.timestamp(arrow_type.unit)  # type: ignore
+
+        if filt.filter_type in (
+            RowFilterType.Between,
+            RowFilterType.NotBetween,
+        ):
+            params = filt.between_params
+            assert params is not None
+            left_value = _arrow_coerce_value(params.left_value, arrow_type)
+            right_value = _arrow_coerce_value(params.right_value, arrow_type)
+            if filt.filter_type == RowFilterType.Between:
+                return pc.and_(
+                    pc.greater_equal(values, left_value), pc.less_equal(values, right_value)
+                )
+            else:
+                # NotBetween
+                return pc.or_(pc.less(values, left_value), pc.greater(values, right_value))
+        elif filt.filter_type == RowFilterType.Compare:
+            params = filt.compare_params
+            assert params is not None
+
+            if params.op not in _ARROW_COMPARE_FUNCTIONS:
+                raise ValueError(f"Unsupported filter type: {params.op}")
+            value = _arrow_coerce_value(params.value, arrow_type)
+            return pc.call_function(_ARROW_COMPARE_FUNCTIONS[params.op], [values, value])
+        elif filt.filter_type == RowFilterType.IsEmpty:
+            return pc.equal(pc.binary_length(values), 0)
+        elif filt.filter_type == RowFilterType.NotEmpty:
+            return pc.not_equal(pc.binary_length(values), 0)
+        elif filt.filter_type == RowFilterType.IsTrue:
+            return values
+        elif filt.filter_type == RowFilterType.IsFalse:
+            return pc.invert(values)
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.set_membership_params
+            assert params is not None
+            value_set = pa_.array(
+                [_arrow_coerce_value(value, arrow_type) for value in params.values], arrow_type
+            )
+            # IN
+            mask = pc.is_in(values, value_set=value_set)
+            if not params.inclusive:
+                # NOT-IN
+                mask = pc.invert(mask)
+            return mask
+        elif filt.filter_type == RowFilterType.Search:
+            params = filt.search_params
+            assert params is not None
+
+            ignore_case = not params.case_sensitive
+            if params.search_type == SearchFilterType.Contains:
+                return pc.match_substring(values, params.term, ignore_case=ignore_case)
+            elif params.search_type == SearchFilterType.StartsWith:
+                return pc.starts_with(values, params.term, ignore_case=ignore_case)
+            elif params.search_type == SearchFilterType.EndsWith:
+                return pc.ends_with(values, params.term, ignore_case=ignore_case)
+            elif params.search_type == SearchFilterType.RegexMatch:
+                # Matches at the start of the values, as with pandas
+                return pc.match_substring_regex(
+                    values, f"^(?:{params.term})", ignore_case=ignore_case
+                )
+            else:
+                raise ValueError(f"Unsupported search type: {params.search_type}")
+        else:
+            raise ValueError(f"Unsupported filter type: {filt.filter_type}")
+
+    def _sort_data(self):
+        import pyarrow.compute as pc
+
+        if len(self.sort_keys) == 0:
+            self.view_indices = self.filtered_indices
+            return
+
+        # The key columns are named by position, as the column names of
+        # the table need not be unique. Missing values are sorted last
+        # and ties keep the order of the rows
+        keys = pa_.Table.from_arrays(
+            [self.table.column(key.column_index) for key in self.sort_keys],
+            names=[str(i) for i in range(len(self.sort_keys))],
+        )
+        sort_keys = [
+            (str(i), "ascending" if key.ascending else "descending")
+            for i, key in enumerate(self.sort_keys)
+        ]
+
+        if self.filtered_indices is None:
+            self.view_indices = pc.sort_indices(keys, sort_keys=sort_keys, null_placement="at_end")
+        else:
+            # Only the filtered rows of the key columns are sorted
+            order = pc.sort_indices(
+                keys.take(self.filtered_indices), sort_keys=sort_keys, null_placement="at_end"
+            )
+            self.view_indices = self.filtered_indices.take(order)
+
+    def _get_column(self, column_index: int) -> "pa.ChunkedArray":
+        column = self.table.column(column_index)
+        if self.filtered_indices is not None:
+            column = column.take(self.filtered_indices)
+        return column
+
+    def _prof_null_count(self, column_index: int) -> int:
+        return self._get_column(column_index).null_count
+
+    def _prof_summary_stats(
+        self,
+        column_index: int,
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ) -> ColumnSummaryStats:
+        import pyarrow.compute as pc
+
+        col = self._get_column(column_index)
+        arrow_type = col.type
+        if pa_.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type  # type: ignore
+            col = col.cast(arrow_type)
+        ui_type = self._get_type_display(arrow_type)
+        types = pa_.types
+
+        if types.is_integer(arrow_type) or types.is_floating(arrow_type):
+            return self._summarize_number(col, options, quantiles)
+        elif ui_type == ColumnDisplayType.String:
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.String,
+                string_stats=SummaryStatsString(
+                    num_empty=_arrow_count(pc.equal(pc.binary_length(col), 0)),
+                    num_unique=pc.count_distinct(col, mode="only_valid").as_py(),
+                ),
+            )
+        elif ui_type == ColumnDisplayType.Boolean:
+            true_count = _arrow_count(col)
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Boolean,
+                boolean_stats=SummaryStatsBoolean(
+                    true_count=true_count,
+                    false_count=len(col) - true_count - col.null_count,
+                ),
+            )
+        elif ui_type in (ColumnDisplayType.Date, ColumnDisplayType.Datetime):
+            return self._summarize_dates(col, arrow_type)
+        else:
+            # Return nothing for types we don't yet know how to summarize
+            return ColumnSummaryStats(type_display=ui_type)
+
+    @staticmethod
+    def _summarize_number(
+        col: "pa.ChunkedArray", options: FormatOptions, quantiles: Optional[List[float]] = None
+    ) -> ColumnSummaryStats:
+        import pyarrow.compute as pc
+
+        float_format = _get_float_formatter(options)
+        if pa_.types.is_floating(col.type):
+            # NaN values are missing, as with pandas
+            col = pc.if_else(pc.is_nan(col), None, col)
+
+        def _value(scalar):
+            value = scalar.as_py()
+            return np_.nan if value is None else value
+
+        min_max = pc.min_max(col)
+        min_val, max_val = _value(min_max["min"]), _value(min_max["max"])
+
+        mean_val = median_val = std_val = None
+        if not _isinf(min_val) and not _isinf(max_val):
+            # These stats are not defined when there is an inf/-inf in
+            # the data
+            mean_val = float_format(_value(pc.mean(col)))
+            median_val = float_format(_value(pc.quantile(col, q=0.5)[0]))
+            std_val = float_format(_value(pc.stddev(col, ddof=1)))
+
+        quantile_vals = None
+        if quantiles:
+            # The quantiles are requested as percentiles
+            values = pc.quantile(col, q=[q / 100 for q in quantiles])
+            quantile_vals = [
+                ColumnQuantileValue(q=q, value=float_format(_value(value)), exact=True)
+                for q, value in zip(quantiles, values)
+            ]
+
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Number,
+            number_stats=SummaryStatsNumber(
+                min_value=float_format(min_val),
+                max_value=float_format(max_val),
+                mean=mean_val,
+                median=median_val,
+                stdev=std_val,
+                quantiles=quantile_vals,
+            ),
+        )
+
+    @staticmethod
+    def _summarize_dates(col: "pa.ChunkedArray", arrow_type: "pa.DataType") -> ColumnSummaryStats:
+        import pyarrow.compute as pc
+
+        # The mean and median are computed on the integer
+        # representation of the dates and converted back
+        physical = pa_.int32() if pa_.types.is_date32(arrow_type) else pa_.int64()
+        values = col.cast(physical)
+
+        def _to_date(scalar):
+            value = scalar.as_py()
+            if value is None:
+                return None
+            return pa_.scalar(math.floor(value), physical).cast(arrow_type).as_py()
+
+        min_max = pc.min_max(col)
+        stats = {
+            "num_unique": pc.count_distinct(col, mode="only_valid").as_py(),
+            "min_date": str(min_max["min"].as_py()),
+            "mean_date": str(_to_date(pc.mean(values))),
+            "median_date": str(_to_date(pc.quantile(values, q=0.5)[0])),
+            "max_date": str(min_max["max"].as_py()),
+        }
+        if pa_.types.is_date(arrow_type):
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Date,
+                date_stats=SummaryStatsDate(**stats),
+            )
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Datetime,
+            datetime_stats=SummaryStatsDatetime(
+                timezone=str(arrow_type.tz),  # type: ignore
+                **stats,
+            ),
+        )
+
+    def _get_profile_column(self, column_index: int) -> Tuple["pa.ChunkedArray", float]:
+        # The filtered column, or a sample of it if it is large, and
+        # the factor to scale counts from the sample by
+        num_rows = self._get_num_view_rows()
+        if num_rows < self.APPROXIMATE_PROFILE_MIN_ROWS:
+            return self._get_column(column_index), 1.0
+
+        rows = _sample_rows(None, num_rows, self.PROFILE_SAMPLE_SIZE)
+        if self.filtered_indices is not None:
+            rows = self.filtered_indices.take(rows)
+        return self._take_column(column_index, rows), num_rows / len(rows)
+
+    def _prof_freq_table(self, column_index: int, options: FormatOptions) -> ColumnFrequencyTable:
+        import pyarrow.compute as pc
+
+        col, scale = self._get_profile_column(column_index)
+        if pa_.types.is_dictionary(col.type):
+            col = col.cast(col.type.value_type)  # type: ignore
+
+        col = col.drop_null()
+        if pa_.types.is_floating(col.type):
+            # NaN values are missing, as with pandas
+            col = col.filter(pc.invert(pc.is_nan(col)))
+
+        # Value counts sorted by value, so that ties are broken by value
+        # as with pandas
+        value_counts = pc.value_counts(col)
+        order = pc.sort_indices(value_counts.field("values"))
+        uniques = value_counts.field("values").take(order)
+        counts = value_counts.field("counts").take(order).to_numpy()
+
+        top = _top_counts(counts, self.FREQUENCY_TABLE_SIZE)
+        values = [
+            x if isinstance(x, str) else str(value)
+            for x, value in zip(
+                self._format_values(uniques.take(top), options), uniques.take(top).to_pylist()
+            )
+        ]
+        return _frequency_table(values, counts.take(top), len(col), scale)
+
+    def _prof_histogram(self, column_index: int) -> ColumnHistogram:
+        col, scale = self._get_profile_column(column_index)
+        if not (pa_.types.is_integer(col.type) or pa_.types.is_floating(col.type)):
+            raise TypeError(f"Histograms are not supported for {col.type}")
+        return _histogram(col.drop_null().to_numpy(), self.HISTOGRAM_NUM_BINS, scale)
+
+    SUPPORTED_FILTERS = {
+        RowFilterType.Between,
+        RowFilterType.Compare,
+        RowFilterType.IsEmpty,
+        RowFilterType.IsFalse,
+        RowFilterType.IsNull,
+        RowFilterType.IsTrue,
+        RowFilterType.NotBetween,
+        RowFilterType.NotEmpty,
+        RowFilterType.NotNull,
+        RowFilterType.Search,
+        RowFilterType.SetMembership,
+    }
+
+    FEATURES = DataExplorerTableView._supported_features(SUPPORTED_FILTERS)
+
+
+# Names of the pyarrow.compute functions for comparison filters
+_ARROW_COMPARE_FUNCTIONS = {
+    CompareFilterParamsOp.Eq: "equal",
+    CompareFilterParamsOp.NotEq: "not_equal",
+    CompareFilterParamsOp.Lt: "less",
+    CompareFilterParamsOp.LtEq: "less_equal",
+    CompareFilterParamsOp.Gt: "greater",
+    CompareFilterParamsOp.GtEq: "greater_equal",
+}
+
+
+def _is_arrow_string_like(arrow_type: "pa.DataType") -> bool:
+    types = pa_.types
+    return (
+        types.is_string(arrow_type)
+        or types.is_large_string(arrow_type)
+        or types.is_binary(arrow_type)
+        or types.is_large_binary(arrow_type)
+    )
+
+
+def _arrow_count(mask: "pa.ChunkedArray") -> int:
+    # Number of true values of a boolean array
+    import pyarrow.compute as pc
+
+    return pc.sum(mask).as_py() or 0
+
+
+def _arrow_coerce_value(value: str, arrow_type: "pa.DataType"):
+    types = pa_.types
+    if types.is_integer(arrow_type):
+        # For integer types, try to coerce to integer, but if this
+        # fails, allow a looser conversion to float
+        try:
+            return int(value)
+        except ValueError as e1:
+            try:
+                return float(value)
+            except ValueError:
+                raise e1
+    elif types.is_floating(arrow_type):
+        return float(value)
+    elif types.is_boolean(arrow_type):
+        lvalue = value.lower()
+        if lvalue == "true":
+            return True
+        elif lvalue == "false":
+            return False
+        else:
+            raise ValueError(f"Unable to convert {value} to boolean")
+    elif types.is_timestamp(arrow_type):
+        return pa_.scalar(_parse_iso8601_like(value, None), arrow_type)
+    elif types.is_date(arrow_type):
+        return pa_.scalar(_parse_iso8601_like(value, None).date(), arrow_type)
+    else:
+        # As a fallback, let the Arrow cast do the coercion
+        return pa_.scalar(value).cast(arrow_type)
+
+
+class FileView(PyArrowView):
+    """
+    View of a Parquet, Arrow IPC (Feather) or CSV file that is read
+    from disk on demand rather than loaded into memory. Viewport
+    fetches read only the row groups or record batches holding the
+    requested rows, and only the requested columns. Filters skip the
+    row groups that the Parquet statistics show cannot match.
+    Sorting, filtering and profiling read only the columns involved.
+    """
+
+    def _get_caches(self) -> List[_LRUCache]:
+        # The column chunks that have been read are cached too
+        return super()._get_caches() + [self.table._cache]
+
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        if self.view_indices is not None:
+            rows = self.view_indices.slice(start, end - start)
+        else:
+            rows = np_.arange(start, end)
+        return self._format_values(self._take_column(column_index, rows), format_options)
+
+    def _take_columns(self, column_indices: List[int], rows) -> "pa.Table":
+        return self.table.take(column_indices, rows)
+
+    def _eval_filter(self, filt: RowFilter) -> "pa.ChunkedArray":
+        column_index = filt.column_schema.column_index
+        arrow_type = self.table.schema.field(column_index).type
+
+        masks = []
+        for chunk in range(self.table.num_chunks):
+            stats = self.table.statistics(chunk, column_index)
+            num_rows = self.table.chunk_num_rows(chunk)
+            if stats is not None and _stats_exclude_filter(filt, arrow_type, num_rows, *stats):
+                # No row of the chunk can match, so it is not read
+                masks.append(pa_.array(np_.zeros(num_rows, dtype=bool)))
+            else:
+                values = self.table.read_chunk(chunk, column_index)
+                masks.extend(self._eval_filter_values(filt, values).chunks)
+        return pa_.chunked_array(masks, pa_.bool_())
+
+    def _prof_null_count(self, column_index: int) -> int:
+        if self.filtered_indices is None:
+            # Use the null counts in the file metadata if there are any
+            null_counts = [
+                None if stats is None else stats[2]
+                for stats in (
+                    self.table.statistics(chunk, column_index)
+                    for chunk in range(self.table.num_chunks)
+                )
+            ]
+            if None not in null_counts:
+                return sum(null_counts)
+        return super()._prof_null_count(column_index)
+
+
+def _stats_exclude_filter(filt: RowFilter, arrow_type, num_rows, min_value, max_value, null_count):
+    # Whether the statistics of a chunk of a column show that the
+    # filter selects none of its rows. Filters that select nulls, and
+    # comparisons that are not exact with the statistics, never exclude
+    # a chunk
+    if filt.filter_type == RowFilterType.IsNull:
+        return null_count == 0
+    elif filt.filter_type == RowFilterType.NotNull:
+        return null_count == num_rows
+
+    if (
+        pa_.types.is_dictionary(arrow_type)
+        or (pa_.types.is_timestamp(arrow_type) and arrow_type.tz is not None)
+        or min_value is None
+        or max_value is None
+    ):
+        return False
+
+    def _coerce(value):
+        value = _arrow_coerce_value(value, arrow_type)
+        return value.as_py() if isinstance(value, pa_.Scalar) else value
+
+    try:
+        if filt.filter_type == RowFilterType.Compare:
+            params = filt.compare_params
+            assert params is not None
+            value = _coerce(params.value)
+            op = params.op
+            if op == CompareFilterParamsOp.Eq:
+                return value < min_value or value > max_value
+            elif op == CompareFilterParamsOp.Lt:
+                return min_value >= value
+            elif op == CompareFilterParamsOp.LtEq:
+                return min_value > value
+            elif op == CompareFilterParamsOp.Gt:
+                return max_value <= value
+            elif op == CompareFilterParamsOp.GtEq:
+                return max_value < value
+        elif filt.filter_type in (RowFilterType.Between, RowFilterType.NotBetween):
+            params = filt.between_params
+            assert params is not None
+            left_value = _coerce(params.left_value)
+            right_value = _coerce(params.right_value)
+            if filt.filter_type == RowFilterType.Between:
+                return max_value < left_value or min_value > right_value
+            else:
+                return min_value >= left_value and max_value <= right_value
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params = filt.set_membership_params
+            assert params is not None
+            if params.inclusive:
+                values = [_coerce(value) for value in params.values]
+                return all(value < min_value or value > max_value for value in values)
+    except (TypeError, ValueError):
+        # Leave errors to the evaluation of the filter
+        pass
+    return False
+
+
+class _ArrowFile:
+    """
+    Read-only table-like wrapper of a file, which is divided into
+    chunks (row groups or record batches) that are read one column at a
+    time, when needed. It has enough of the pyarrow.Table interface for
+    PyArrowView.
+    """
+
+    # Byte budget of the column chunks that are kept after they are
+    # read
+    CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, path: str, schema: "pa.Schema", chunk_num_rows: List[int]):
+        self.path = path
+        self.schema = schema
+        self._chunk_offsets = np_.cumsum([0] + chunk_num_rows)
+        self._cache = _LRUCache(self.CACHE_MAX_BYTES, operator.attrgetter("nbytes"))
+
+        # The readers of files are not safe to share with the profile
+        # worker threads
+        self._lock = threading.Lock()
+
+    @property
+    def num_rows(self) -> int:
+        return int(self._chunk_offsets[-1])
+
+    @property
+    def num_columns(self) -> int:
+        return len(self.schema)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.num_rows, self.num_columns)
+
+    @property
+    def column_names(self) -> List[str]:
+        return self.schema.names
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self._chunk_offsets) - 1
+
+    def chunk_num_rows(self, chunk: int) -> int:
+        return int(self._chunk_offsets[chunk + 1] - self._chunk_offsets[chunk])
+
+    def statistics(self, chunk: int, column_index: int) -> Optional[Tuple[Any, Any, Any]]:
+        # The minimum, maximum and null count of a chunk of a column,
+        # each of which may be None, or None if there are no statistics
+        return None
+
+    def read_chunk(self, chunk: int, column_index: int) -> "pa.ChunkedArray":
+        key = (chunk, column_index)
+        values = self._cache.get(key)
+        if values is None:
+            with self._lock:
+                values = self._read_chunk(chunk, column_index)
+            self._cache.put(key, values)
+        return values
+
+    def _read_chunk(self, chunk: int, column_index: int) -> "pa.ChunkedArray":
+        raise NotImplementedError
+
+    def close(self):
+        # Release the file, after which it is no longer read
+        pass
+
+    def column(self, column_index: int) -> "pa.ChunkedArray":
+        return self._read_chunks(range(self.num_chunks), column_index)
+
+    def _read_chunks(self, chunks, column_index: int) -> "pa.ChunkedArray":
+        return pa_.chunked_array(
+            [values for chunk in chunks for values in self.read_chunk(chunk, column_index).chunks],
+            self.schema.field(column_index).type,
+        )
+
+    def take(self, column_indices: List[int], rows=None) -> "pa.Table":
+        # The given rows of the given columns, reading only the chunks
+        # with any of the rows, or all rows if rows is None
+        fields = [self.schema.field(i) for i in column_indices]
+        if rows is None:
+            columns = [self.column(i) for i in column_indices]
+            return pa_.Table.from_arrays(columns, schema=pa_.schema(fields))
+
+        if isinstance(rows, (pa_.Array, pa_.ChunkedArray)):
+            rows = rows.to_numpy()
+        rows = np_.asarray(rows, dtype=np_.int64)
+
+        row_chunks = np_.searchsorted(self._chunk_offsets, rows, side="right") - 1
+        chunks = np_.unique(row_chunks)
+
+        # Positions of the rows in the chunks that are read
+        chunk_starts = np_.cumsum([0] + [self.chunk_num_rows(c) for c in chunks[:-1]])
+        positions = (
+            rows
+            - self._chunk_offsets[row_chunks]
+            + chunk_starts[np_.searchsorted(chunks, row_chunks)]
+        )
+
+        columns = [self._read_chunks(chunks, i).take(positions) for i in column_indices]
+        return pa_.Table.from_arrays(columns, schema=pa_.schema(fields))
+
+
+class _ParquetFile(_ArrowFile):
+    def __init__(self, path: str):
+        import pyarrow.parquet as pq
+
+        self._file = pq.ParquetFile(path, memory_map=True)
+        self._metadata = self._file.metadata
+        super().__init__(
+            path,
+            self._file.schema_arrow,
+            [self._metadata.row_group(i).num_rows for i in range(self._metadata.num_row_groups)],
+        )
+
+        # Statistics are only used for the columns that are not nested
+        parquet_schema = self._metadata.schema
+        leaf_columns = {parquet_schema.column(j).path: j for j in range(len(parquet_schema))}
+        self._stats_columns = [leaf_columns.get(name) for name in self.schema.names]
+
+    def statistics(self, chunk: int, column_index: int) -> Optional[Tuple[Any, Any, Any]]:
+        leaf_column = self._stats_columns[column_index]
+        if leaf_column is None:
+            return None
+        stats = self._metadata.row_group(chunk).column(leaf_column).statistics
+        if stats is None:
+            return None
+        return (
+            stats.min if stats.has_min_max else None,
+            stats.max if stats.has_min_max else None,
+            stats.null_count if stats.has_null_count else None,
+        )
+
+    def _read_chunk(self, chunk: int, column_index: int) -> "pa.ChunkedArray":
+        name = self.schema.field(column_index).name
+        return self._file.read_row_group(chunk, columns=[name]).column(0)
+
+
+class _ArrowIpcFile(_ArrowFile):
+    def __init__(self, path: str, chunk_num_rows: Optional[List[int]] = None):
+        # Memory-mapped, so that record batches are read without
+        # copying, unless they are compressed
+        self._source = pa_.memory_map(path)
+        self._reader = pa_.ipc.open_file(self._source)
+        if chunk_num_rows is None:
+            # The batches are read from the memory map without copying
+            # them, unless they are compressed
+            chunk_num_rows = [
+                self._reader.get_batch(i).num_rows for i in range(self._reader.num_record_batches)
+            ]
+        super().__init__(path, self._reader.schema, chunk_num_rows)
+
+    def close(self):
+        self._source.close()
+
+    def _read_chunk(self, chunk: int, column_index: int) -> "pa.ChunkedArray":
+        return pa_.chunked_array([self._reader.get_batch(chunk).column(column_index)])
+
+
+class _CsvConversions:
+    """
+    The temporary Arrow IPC files that CSV files are converted to, as
+    CSV files cannot be read at random. Opening a CSV file that has not
+    been modified since it was last converted shares its conversion.
+    Each file is removed when the last explorer using it is closed,
+    and any that remain are removed when the kernel exits.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        # The future of each conversion and the number of explorers
+        # using it, keyed by the CSV path, the delimiter and the
+        # modification time and size of the CSV file
+        self._conversions: Dict[Tuple, List] = {}
+        self._paths: Set[str] = set()
+        atexit.register(self._remove_all)
+
+    def acquire(
+        self, path: str, delimiter: str, executor: Optional[ThreadPoolExecutor]
+    ) -> Tuple[Tuple, Future]:
+        """
+        Start converting a CSV file, in the executor if given, unless
+        it has already been converted, returning the key to release it
+        with and the future of the converted file.
+        """
+        stat = os.stat(path)
+        key = (os.path.abspath(path), delimiter, stat.st_mtime_ns, stat.st_size)
+        convert = False
+        with self._lock:
+            conversion = self._conversions.get(key)
+            if conversion is None:
+                if executor is None:
+                    future = Future()
+                    convert = True
+                else:
+                    future = executor.submit(self._convert, path, delimiter)
+                conversion = self._conversions[key] = [future, 0]
+            conversion[1] += 1
+
+        future = conversion[0]
+        if convert:
+            # Converted outside of the lock, which the conversion takes
+            try:
+                future.set_result(self._convert(path, delimiter))
+            except Exception as err:
+                future.set_exception(err)
+        return key, future
+
+    def release(self, key: Tuple):
+        with self._lock:
+            conversion = self._conversions[key]
+            conversion[1] -= 1
+            if conversion[1] > 0:
+                return
+            del self._conversions[key]
+        conversion[0].add_done_callback(self._remove)
+
+    def _convert(self, path: str, delimiter: str) -> _ArrowIpcFile:
+        # Convert the CSV file batch by batch, recording the number of
+        # rows of each batch
+        import pyarrow.csv
+
+        reader = pyarrow.csv.open_csv(
+            path, parse_options=pyarrow.csv.ParseOptions(delimiter=delimiter)
+        )
+
+        fd, arrow_path = tempfile.mkstemp(suffix=".arrow", prefix="positron-")
+        os.close(fd)
+        with self._lock:
+            self._paths.add(arrow_path)
+
+        try:
+            chunk_num_rows = []
+            with pa_.OSFile(arrow_path, "wb") as sink:
+                with pa_.ipc.new_file(sink, reader.schema) as writer:
+                    for batch in reader:
+                        writer.write_batch(batch)
+                        chunk_num_rows.append(batch.num_rows)
+            return _ArrowIpcFile(arrow_path, chunk_num_rows)
+        except BaseException:
+            self._remove_path(arrow_path)
+            raise
+
+    def _remove(self, future: Future):
+        if future.cancelled() or future.exception() is not None:
+            return
+        file = future.result()
+        file.close()
+        self._remove_path(file.path)
+
+    def _remove_path(self, path: str):
+        with self._lock:
+            self._paths.discard(path)
+        _remove_file(path)
+
+    def _remove_all(self):
+        with self._lock:
+            paths = list(self._paths)
+            self._paths.clear()
+        for path in paths:
+            _remove_file(path)
+
+
+_CSV_CONVERSIONS = _CsvConversions()
+
+_CONVERSION_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def _get_conversion_executor() -> ThreadPoolExecutor:
+    # Worker thread for converting CSV files without blocking the
+    # kernel
+    global _CONVERSION_EXECUTOR
+    if _CONVERSION_EXECUTOR is None:
+        _CONVERSION_EXECUTOR = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="positron-data-explorer-files"
+        )
+    return _CONVERSION_EXECUTOR
+
+
+def _remove_file(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _csv_delimiter(path: str) -> Optional[str]:
+    # The delimiter of a CSV or TSV file, or None for other files
+    lpath = path.lower()
+    if lpath.endswith(".csv"):
+        return ","
+    elif lpath.endswith(".tsv"):
+        return "\t"
+    return None
+
+
+def _open_arrow_file(path: str) -> _ArrowFile:
+    lpath = path.lower()
+    if lpath.endswith((".parquet", ".pq", ".parq")):
+        return _ParquetFile(path)
+    elif lpath.endswith((".arrow", ".feather", ".ipc")):
+        return _ArrowIpcFile(path)
+    else:
+        raise ValueError(f"Unsupported file type: {path}")
+
+
+class SQLTable:
+    """
+    A table or view in a database, which SQLView browses by running SQL
+    queries with execute(sql, params). Parameter values are bound by
+    name (:name), which both sqlite3 and SQLAlchemy text() support, and
+    identifiers are quoted with quote. Connections that must not be
+    used from other threads are not thread_safe.
+    """
+
+    def __init__(
+        self,
+        from_clause: str,
+        columns: List[Tuple[str, str]],
+        execute: Callable[[str, Dict[str, Any]], List[Sequence]],
+        quote: Callable[[str], str],
+        dialect: str,
+        thread_safe: bool = True,
+    ):
+        self.from_clause = from_clause
+        # (name, declared type) of each column
+        self.columns = columns
+        self.execute = execute
+        self.quote = quote
+        self.dialect = dialect
+        self.thread_safe = thread_safe
+        self._num_rows: Optional[int] = None
+
+    def refresh(self):
+        # The table may have been modified, so it is counted again
+        self._num_rows = None
+
+    @property
+    def num_rows(self) -> int:
+        if self._num_rows is None:
+            self._num_rows = self.execute(f"SELECT COUNT(*) FROM {self.from_clause}", {})[0][0]
+        return self._num_rows
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return (self.num_rows, len(self.columns))
+
+
+class SQLView(DataExplorerTableView):
+    """
+    View of a database table that translates requests to SQL run
+    inside the database: viewport fetches page with LIMIT/OFFSET,
+    filters become a WHERE clause, sort keys an ORDER BY clause and
+    profiles aggregate queries. At most the rows of the requested
+    viewport are brought into Python.
+    """
+
+    # Queries cannot be interrupted when user code starts running, and
+    # each one may be a round trip to a database server
+    PREFETCH_VIEWPORT = False
+
+    # The database can be modified by any code the user runs
+    REFRESH_AFTER_EXECUTION = True
+
+    def __init__(
+        self,
+        display_name: str,
+        table: SQLTable,
+        filters: Optional[List[RowFilter]],
+        sort_keys: Optional[List[ColumnSortKey]],
+    ):
+        super().__init__(display_name, table, filters, sort_keys)
+
+        # WHERE and ORDER BY clauses of the view, and the values of
+        # the parameters of the WHERE clause
+        self._where = ""
+        self._where_params: Dict[str, Any] = {}
+        self._order_by = ""
+
+        # Number of rows selected by the filters, if any
+        self._num_view_rows: Optional[int] = None
+
+        # The last rows fetched, as all the columns of a viewport are
+        # fetched with one query
+        self._fetched_rows: Optional[Tuple[Tuple, List[Sequence]]] = None
+
+        self.PROFILES_IN_BACKGROUND = table.thread_safe
+
+    def _recompute(self):
+        # Re-setting the row filters will trigger filtering AND
+        # sorting
+        self._set_row_filters(self.filters)
+
+    def _refresh(self):
+        # The rows are counted and fetched again, under a new view
+        # version so that no cached formatted values are served
+        self.table.refresh()
+        self._fetched_rows = None
+        self._need_recompute = True
+
+    def _get_single_column_schema(self, column_index: int) -> ColumnSchema:
+        return self._get_column_schema(self.table, column_index)
+
+    @classmethod
+    def _get_column_schema(cls, table: SQLTable, column_index: int) -> ColumnSchema:
+        name, type_name = table.columns[column_index]
+        return ColumnSchema(
+            column_name=name,
+            column_index=column_index,
+            type_name=type_name,
+            type_display=_sql_type_display(type_name),
+        )
+
+    def _get_column_names(self) -> List:
+        return [name for name, _ in self.table.columns]
+
+    def _get_num_view_rows(self) -> int:
+        if self._num_view_rows is not None:
+            return self._num_view_rows
+        return self.table.num_rows
+
+    def _column(self, column_index: int) -> str:
+        return self.table.quote(self.table.columns[column_index][0])
+
+    def _where_and(self, condition: str) -> str:
+        # The WHERE clause of the view, narrowed by another condition
+        if self._where:
+            return f"{self._where} AND ({condition})"
+        return f" WHERE {condition}"
+
+    def _execute(self, sql: str, params: Optional[Dict[str, Any]] = None) -> List[Sequence]:
+        return self.table.execute(sql, {**self._where_params, **(params or {})})
+
+    def _fetch_rows(self, start: int, end: int, column_indices=None) -> List[Sequence]:
+        # Rows [start, end) of the view, with all columns unless
+        # column_indices are given
+        key = (self._view_version, start, end, column_indices)
+        if self._fetched_rows is not None and self._fetched_rows[0] == key:
+            return self._fetched_rows[1]
+
+        if column_indices is None:
+            column_indices = range(len(self.table.columns))
+        columns = ", ".join(self._column(i) for i in column_indices)
+        rows = self._execute(
+            f"SELECT {columns} FROM {self.table.from_clause}{self._where}{self._order_by} "
+            "LIMIT :limit OFFSET :offset",
+            {"limit": end - start, "offset": start},
+        )
+        self._fetched_rows = (key, rows)
+        return rows
+
+    def _format_column_range(
+        self, column_index: int, start: int, end: int, format_options: FormatOptions
+    ) -> List[ColumnValue]:
+        values = [row[column_index] for row in self._fetch_rows(start, end)]
+        if _sql_type_display(self.table.columns[column_index][1]) == ColumnDisplayType.Boolean:
+            # Databases like SQLite store booleans as integers
+            values = [x if x is None else bool(x) for x in values]
+        return _format_sql_values(values, format_options)
+
+    def _export_cell(self, row_index: int, column_index: int) -> str:
+        rows = self._fetch_rows(row_index, row_index + 1, (column_index,))
+        return str(rows[0][0])
+
+    def _export_tabular(self, row_selector, column_selector, fmt: ExportFormat) -> ExportedData:
+        column_indices = tuple(self._selected_columns(column_selector, len(self.table.columns)))
+
+        num_rows = self._get_num_view_rows()
+        if row_selector is None:
+            rows = self._fetch_rows(0, num_rows, column_indices)
+        elif isinstance(row_selector, slice):
+            start, stop, _ = row_selector.indices(num_rows)
+            rows = self._fetch_rows(start, stop, column_indices)
+        else:
+            # The span of the selected rows is fetched
+            start = min(row_selector)
+            span = self._fetch_rows(start, max(row_selector) + 1, column_indices)
+            rows = [span[i - start] for i in row_selector]
+
+        column_names = [self.table.columns[i][0] for i in column_indices]
+        values = (["" if x is None else str(x) for x in row] for row in rows)
+        return ExportedData(data=_export_rows(column_names, values, fmt), format=fmt)
+
+    def _set_sort_columns(self, sort_keys: List[ColumnSortKey]):
+        self._set_sort_keys(sort_keys)
+
+        if not self._recompute_if_needed():
+            # If a re-filter is pending, then it will automatically
+            # trigger a sort
+            self._sort_data()
+
+    def _sort_data(self):
+        # Missing values are sorted last, as with pandas
+        terms = []
+        for key in self.sort_keys:
+            column = self._column(key.column_index)
+            terms.append(f"CASE WHEN {column} IS NULL THEN 1 ELSE 0 END")
+            terms.append(f"{column} {'ASC' if key.ascending else 'DESC'}")
+        self._order_by = f" ORDER BY {', '.join(terms)}" if terms else ""
+        self._view_version = next(_VIEW_VERSIONS)
+
+    def _is_supported_filter(self, filt: RowFilter) -> bool:
+        if (
+            filt.filter_type == RowFilterType.Search
+            and filt.search_params.search_type == SearchFilterType.RegexMatch
+        ):
+            # There is no portable SQL for regular expressions
+            return False
+        return super()._is_supported_filter(filt)
+
+    def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
+        self.filters = filters
+
+        for filt in self.filters:
+            # If is_valid isn't set, set it based on what is currently
+            # supported
+            if filt.is_valid is None:
+                filt.is_valid = self._is_supported_filter(filt)
+
+        had_errors = False
+        while True:
+            params: Dict[str, Any] = {}
+            conditions = []
+            for filt in filters:
+                # If filter is invalid, do not evaluate it
+                if filt.is_valid is False:
+                    continue
+                try:
+                    conditions.append((filt, self._filter_condition(filt, params)))
+                except Exception as e:
+                    had_errors = True
+                    self._set_filter_error(filt, e)
+
+            combined = _combine_filter_exprs(
+                conditions,
+                lambda a, b: f"({a} AND {b})",
+                lambda a, b: f"({a} OR {b})",
+            )
+            where = "" if combined is None else f" WHERE {combined}"
+            try:
+                count = self.table.execute(
+                    f"SELECT COUNT(*) FROM {self.table.from_clause}{where}", params
+                )[0][0]
+                break
+            except Exception as count_error:
+                if combined is None:
+                    raise
+                # Find the filters that the database rejects and try
+                # again without them
+                had_errors = True
+                rejected = False
+                for filt, condition in conditions:
+                    try:
+                        self.table.execute(
+                            f"SELECT 1 FROM {self.table.from_clause} WHERE {condition} LIMIT 0",
+                            params,
+                        )
+                    except Exception as e:
+                        self._set_filter_error(filt, e)
+                        rejected = True
+
+                if not rejected:
+                    # Each filter is accepted on its own, so it is
+                    # not known which ones the count fails on
+                    for filt, _ in conditions:
+                        self._set_filter_error(filt, count_error)
+
+        self._where = where
+        self._where_params = params
+        self._num_view_rows = None if combined is None else count
+
+        # Update the view, re-sorting if needed
+        self._sort_data()
+        return FilterResult(selected_num_rows=count, had_errors=had_errors)
+
+    def _filter_condition(self, filt: RowFilter, params: Dict[str, Any]) -> str:
+        column = self._column(filt.column_schema.column_index)
+        display_type = filt.column_schema.type_display
+
+        def _bind(value: Any) -> str:
+            return _sql_bind(params, value)
+
+        if filt.filter_type == RowFilterType.IsNull:
+            return f"{column} IS NULL"
+        elif filt.filter_type == RowFilterType.NotNull:
+            return f"{column} IS NOT NULL"
+        elif filt.filter_type in (RowFilterType.Between, RowFilterType.NotBetween):
+            params_ = filt.between_params
+            assert params_ is not None
+            left_value = _bind(_sql_coerce_value(params_.left_value, display_type))
+            right_value = _bind(_sql_coerce_value(params_.right_value, display_type))
+            if filt.filter_type == RowFilterType.Between:
+                return f"{column} BETWEEN {left_value} AND {right_value}"
+            else:
+                return f"({column} < {left_value} OR {column} > {right_value})"
+        elif filt.filter_type == RowFilterType.Compare:
+            params_ = filt.compare_params
+            assert params_ is not None
+            if params_.op not in _SQL_COMPARE_OPS:
+                raise ValueError(f"Unsupported filter type: {params_.op}")
+            value = _bind(_sql_coerce_value(params_.value, display_type))
+            if params_.op == CompareFilterParamsOp.NotEq:
+                # Nulls are not equal to any value
+                return f"({column} <> {value} OR {column} IS NULL)"
+            return f"{column} {_SQL_COMPARE_OPS[params_.op]} {value}"
+        elif filt.filter_type == RowFilterType.IsEmpty:
+            return f"{column} = ''"
+        elif filt.filter_type == RowFilterType.NotEmpty:
+            return f"{column} <> ''"
+        elif filt.filter_type == RowFilterType.IsTrue:
+            return f"{column} = {_bind(True)}"
+        elif filt.filter_type == RowFilterType.IsFalse:
+            return f"{column} = {_bind(False)}"
+        elif filt.filter_type == RowFilterType.SetMembership:
+            params_ = filt.set_membership_params
+            assert params_ is not None
+            values = ", ".join(
+                _bind(_sql_coerce_value(value, display_type)) for value in params_.values
+            )
+            if params_.inclusive:
+                return f"{column} IN ({values})" if values else "1 = 0"
+            else:
+                # Nulls are not in any set
+                return f"({column} NOT IN ({values}) OR {column} IS NULL)" if values else "1 = 1"
+        elif filt.filter_type == RowFilterType.Search:
+            params_ = filt.search_params
+            assert params_ is not None
+            if params_.search_type == SearchFilterType.Contains:
+                prefix, suffix = True, True
+            elif params_.search_type == SearchFilterType.StartsWith:
+                prefix, suffix = False, True
+            elif params_.search_type == SearchFilterType.EndsWith:
+                prefix, suffix = True, False
+            else:
+                raise ValueError(f"Unsupported search type: {params_.search_type}")
+
+            if not params_.case_sensitive:
+                pattern = _sql_like_pattern(params_.term.lower(), prefix, suffix)
+                return f"LOWER({column}) LIKE {_bind(pattern)} ESCAPE '\\'"
+            elif self.table.dialect == "sqlite":
+                # LIKE ignores case in SQLite, but GLOB does not
+                return f"{column} GLOB {_bind(_sql_glob_pattern(params_.term, prefix, suffix))}"
+            else:
+                pattern = _sql_like_pattern(params_.term, prefix, suffix)
+                return f"{column} LIKE {_bind(pattern)} ESCAPE '\\'"
+        else:
+            raise ValueError(f"Unsupported filter type: {filt.filter_type}")
+
+    def _prof_null_count(self, column_index: int) -> int:
+        column = self._column(column_index)
+        return self._execute(
+            f"SELECT COUNT(*) - COUNT({column}) FROM {self.table.from_clause}{self._where}"
+        )[0][0]
+
+    def _prof_summary_stats(
+        self,
+        column_index: int,
+        options: FormatOptions,
+        quantiles: Optional[List[float]] = None,
+    ) -> ColumnSummaryStats:
+        column = self._column(column_index)
+        from_where = f"{self.table.from_clause}{self._where}"
+        ui_type = _sql_type_display(self.table.columns[column_index][1])
+
+        if ui_type == ColumnDisplayType.Number:
+            return self._summarize_number(column_index, options, quantiles)
+        elif ui_type == ColumnDisplayType.String:
+            num_empty, num_unique = self._execute(
+                f"SELECT SUM(CASE WHEN {column} = '' THEN 1 ELSE 0 END), "
+                f"COUNT(DISTINCT {column}) FROM {from_where}"
+            )[0]
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.String,
+                string_stats=SummaryStatsString(
+                    num_empty=int(num_empty or 0), num_unique=int(num_unique)
+                ),
+            )
+        elif ui_type == ColumnDisplayType.Boolean:
+            true_count, false_count = self._execute(
+                f"SELECT SUM(CASE WHEN {column} = :true THEN 1 ELSE 0 END), "
+                f"SUM(CASE WHEN {column} = :false THEN 1 ELSE 0 END) FROM {from_where}",
+                {"true": True, "false": False},
+            )[0]
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Boolean,
+                boolean_stats=SummaryStatsBoolean(
+                    true_count=int(true_count or 0), false_count=int(false_count or 0)
+                ),
+            )
+        else:
+            # Return nothing for types we don't yet know how to summarize
+            return ColumnSummaryStats(type_display=ui_type)
+
+    def _summarize_number(
+        self, column_index: int, options: FormatOptions, quantiles: Optional[List[float]] = None
+    ) -> ColumnSummaryStats:
+        float_format = _get_float_formatter(options)
+        column = self._column(column_index)
+        from_where = f"{self.table.from_clause}{self._where}"
+
+        min_val, max_val, mean_val, count = self._execute(
+            f"SELECT MIN({column}), MAX({column}), AVG({column}), COUNT({column}) "
+            f"FROM {from_where}"
+        )[0]
+        if count == 0:
+            return ColumnSummaryStats(
+                type_display=ColumnDisplayType.Number,
+                number_stats=SummaryStatsNumber(),
+            )
+
+        median_val = std_val = None
+        if not _isinf(min_val) and not _isinf(max_val):
+            # These stats are not defined when there is an inf/-inf in
+            # the data. The variance is computed about the mean for
+            # accuracy
+            (sum_squares,) = self._execute(
+                f"SELECT SUM(({column} - :mean) * ({column} - :mean)) FROM {from_where}",
+                {"mean": mean_val},
+            )[0]
+            std_val = float_format(math.sqrt(sum_squares / (count - 1))) if count > 1 else None
+            median_val = float_format(self._quantile(column_index, count, 50))
+            mean_val = float_format(mean_val)
+        else:
+            mean_val = None
+
+        quantile_vals = None
+        if quantiles:
+            quantile_vals = [
+                ColumnQuantileValue(
+                    q=q, value=float_format(self._quantile(column_index, count, q)), exact=True
+                )
+                for q in quantiles
+            ]
+
+        return ColumnSummaryStats(
+            type_display=ColumnDisplayType.Number,
+            number_stats=SummaryStatsNumber(
+                min_value=float_format(min_val),
+                max_value=float_format(max_val),
+                mean=mean_val,
+                median=median_val,
+                stdev=std_val,
+                quantiles=quantile_vals,
+            ),
+        )
+
+    def _quantile(self, column_index: int, count: int, q: float) -> float:
+        # Exact quantile of the count non-null values at the
+        # percentile q, interpolated linearly between the two nearest
+        # values, which are fetched by sorting in the database
+        column = self._column(column_index)
+        position = min(max(q / 100, 0), 1) * (count - 1)
+        lower = int(math.floor(position))
+        values = [
+            row[0]
+            for row in self._execute(
+                f"SELECT {column} FROM {self.table.from_clause}"
+                f"{self._where_and(f'{column} IS NOT NULL')} "
+                f"ORDER BY {column} LIMIT :limit OFFSET :offset",
+                {"limit": 2 if position > lower else 1, "offset": lower},
+            )
+        ]
+        if len(values) == 0:
+            # The table has changed since the values were counted
+            return math.nan
+        elif len(values) == 1:
+            return values[0]
+        return values[0] + (values[1] - values[0]) * (position - lower)
+
+    def _prof_freq_table(self, column_index: int, options: FormatOptions) -> ColumnFrequencyTable:
+        column = self._column(column_index)
+        where = self._where_and(f"{column} IS NOT NULL")
+
+        # Ties are broken by value, as with pandas
+        rows = self._execute(
+            f"SELECT {column}, COUNT(*) AS count FROM {self.table.from_clause}{where} "
+            f"GROUP BY {column} ORDER BY count DESC, {column} LIMIT :limit",
+            {"limit": self.FREQUENCY_TABLE_SIZE},
+        )
+        (num_values,) = self._execute(f"SELECT COUNT(*) FROM {self.table.from_clause}{where}")[0]
+
+        uniques = [row[0] for row in rows]
+        values = [
+            x if isinstance(x, str) else str(value)
+            for x, value in zip(_format_sql_values(uniques, options), uniques)
+        ]
+        counts = np_.array([row[1] for row in rows], dtype=np_.int64)
+        return _frequency_table(values, counts, num_values)
+
+    def _prof_histogram(self, column_index: int) -> ColumnHistogram:
+        if _sql_type_display(self.table.columns[column_index][1]) != ColumnDisplayType.Number:
+            raise TypeError("Histograms are only supported for numbers")
+
+        # Infinite values are left out, as with the other views
+        column = self._column(column_index)
+        where = self._where_and(f"{column} > :neginf AND {column} < :inf")
+        finite = {"neginf": -math.inf, "inf": math.inf}
+
+        min_value, max_value, count = self._execute(
+            f"SELECT MIN({column}), MAX({column}), COUNT({column}) "
+            f"FROM {self.table.from_clause}{where}",
+            finite,
+        )[0]
+        if count == 0:
+            return ColumnHistogram(bin_sizes=[], bin_width=0, exact=True)
+        elif min_value == max_value:
+            return ColumnHistogram(
+                bin_sizes=[count],
+                bin_width=0 if isinstance(min_value, int) else 0.0,
+                exact=True,
+            )
+
+        num_bins = self.HISTOGRAM_NUM_BINS
+        if isinstance(min_value, int) and isinstance(max_value, int):
+            # Integers are counted in bins of a whole number of values
+            bin_width = -(-(max_value - min_value + 1) // num_bins)
+            num_bins = (max_value - min_value) // bin_width + 1
+        else:
+            bin_width = float(max_value - min_value) / num_bins
+
+        # The bins are counted with one scan, with the last bin
+        # including the maximum
+        params: Dict[str, Any] = dict(finite)
+        counts = []
+        for i in range(num_bins):
+            lower = _sql_bind(params, min_value + i * bin_width)
+            if i == num_bins - 1:
+                condition = f"{column} >= {lower}"
+            else:
+                upper = _sql_bind(params, min_value + (i + 1) * bin_width)
+                condition = f"{column} >= {lower} AND {column} < {upper}"
+            counts.append(f"COUNT(CASE WHEN {condition} THEN 1 END)")
+        bin_sizes = self._execute(
+            f"SELECT {', '.join(counts)} FROM {self.table.from_clause}{where}", params
+        )[0]
+
+        return ColumnHistogram(
+            bin_sizes=[int(x) for x in bin_sizes],
+            bin_width=bin_width,
+            exact=True,
+        )
 
-        return _format_series(values)
+    SUPPORTED_FILTERS = {
+        RowFilterType.Between,
+        RowFilterType.Compare,
+        RowFilterType.IsEmpty,
+        RowFilterType.IsFalse,
+        RowFilterType.IsNull,
+        RowFilterType.IsTrue,
+        RowFilterType.NotBetween,
+        RowFilterType.NotEmpty,
+        RowFilterType.NotNull,
+        RowFilterType.Search,
+        RowFilterType.SetMembership,
+    }
 
-    def _export_data_selection(self, selection: DataSelection, fmt: ExportFormat) -> ExportedData:
-        raise NotImplementedError
+    FEATURES = DataExplorerTableView._supported_features(SUPPORTED_FILTERS)
 
-    def _set_row_filters(self, filters: List[RowFilter]) -> FilterResult:
-        raise NotImplementedError
 
-    def _set_sort_columns(self, sort_keys: List[ColumnSortKey]):
-        raise NotImplementedError
+_SQL_COMPARE_OPS = {
+    CompareFilterParamsOp.Eq: "=",
+    CompareFilterParamsOp.NotEq: "<>",
+    CompareFilterParamsOp.Lt: "<",
+    CompareFilterParamsOp.LtEq: "<=",
+    CompareFilterParamsOp.Gt: ">",
+    CompareFilterParamsOp.GtEq: ">=",
+}
 
-    def _sort_data(self):
-        raise NotImplementedError
 
-    def _prof_null_count(self, column_index: int) -> int:
-        return self._get_column(column_index).null_count()
+def _sql_type_display(type_name: str) -> ColumnDisplayType:
+    # Display type of a declared SQL column type, following the
+    # SQLite rules for column affinity where they apply
+    type_name = type_name.upper()
+    if "BOOL" in type_name:
+        return ColumnDisplayType.Boolean
+    elif "INT" in type_name:
+        return ColumnDisplayType.Number
+    elif any(x in type_name for x in ("CHAR", "CLOB", "TEXT", "STRING")):
+        return ColumnDisplayType.String
+    elif any(x in type_name for x in ("REAL", "FLOA", "DOUB", "NUMERIC", "DECIMAL")):
+        return ColumnDisplayType.Number
+    elif "TIMESTAMP" in type_name or "DATETIME" in type_name:
+        return ColumnDisplayType.Datetime
+    elif "DATE" in type_name:
+        return ColumnDisplayType.Date
+    elif "TIME" in type_name:
+        return ColumnDisplayType.Time
+    else:
+        return ColumnDisplayType.Unknown
 
-    def _get_column(self, column_index: int) -> "pl.Series":
-        column = self.table[:, column_index]
-        if self.filtered_indices is not None:
-            column = column.take(self.filtered_indices)
-        return column
 
-    def _prof_summary_stats(self, column_index: int, options: FormatOptions) -> ColumnSummaryStats:
-        raise NotImplementedError
+def _sql_bind(params: Dict[str, Any], value: Any) -> str:
+    # Add a query parameter with the given value, returning its
+    # placeholder
+    name = f"p{len(params)}"
+    params[name] = value
+    return f":{name}"
 
-    def _prof_freq_table(self, column_index: int) -> ColumnFrequencyTable:
-        raise NotImplementedError
 
-    def _prof_histogram(self, column_index: int) -> ColumnHistogram:
-        raise NotImplementedError
+def _sql_coerce_value(value: str, display_type: ColumnDisplayType):
+    if display_type == ColumnDisplayType.Number:
+        # Try to coerce to integer, but if this fails, allow a looser
+        # conversion to float
+        try:
+            return int(value)
+        except ValueError as e1:
+            try:
+                return float(value)
+            except ValueError:
+                raise e1
+    elif display_type == ColumnDisplayType.Boolean:
+        lvalue = value.lower()
+        if lvalue == "true":
+            return True
+        elif lvalue == "false":
+            return False
+        else:
+            raise ValueError(f"Unable to convert {value} to boolean")
+    elif display_type in (ColumnDisplayType.Date, ColumnDisplayType.Datetime):
+        # Dates are compared as ISO 8601 strings, which the databases
+        # convert to their date types
+        _parse_iso8601_like(value, None)
+        return value
+    else:
+        return value
 
-    SUPPORTED_FILTERS = set()
 
-    FEATURES = SupportedFeatures(
-        search_schema=SearchSchemaFeatures(support_status=SupportStatus.Unsupported),
-        set_row_filters=SetRowFiltersFeatures(
-            support_status=SupportStatus.Unsupported,
-            supports_conditions=SupportStatus.Unsupported,
-            supported_types=[
-                RowFilterTypeSupportStatus(
-                    row_filter_type=x, support_status=SupportStatus.Supported
-                )
-                for x in SUPPORTED_FILTERS
-            ],
-        ),
-        get_column_profiles=GetColumnProfilesFeatures(
-            support_status=SupportStatus.Supported,
-            supported_types=[
-                ColumnProfileTypeSupportStatus(
-                    profile_type=ColumnProfileType.NullCount,
-                    support_status=SupportStatus.Supported,
-                ),
-                # Temporarily disabled for https://github.com/posit-dev/positron/issues/3490
-                # on 6/11/2024. This will be enabled again when the UI has been reworked to
-                # more fully support column profiles.
-                ColumnProfileTypeSupportStatus(
-                    profile_type=ColumnProfileType.SummaryStats,
-                    support_status=SupportStatus.Unsupported,
-                ),
-            ],
-        ),
-        export_data_selection=ExportDataSelectionFeatures(support_status=SupportStatus.Unsupported),
-        set_sort_columns=SetSortColumnsFeatures(support_status=SupportStatus.Unsupported),
-    )
+def _sql_like_pattern(term: str, prefix: bool, suffix: bool) -> str:
+    # LIKE pattern matching the term, escaped with backslashes
+    term = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{'%' if prefix else ''}{term}{'%' if suffix else ''}"
 
-    def _get_state(self) -> BackendState:
-        table_unfiltered_shape = TableShape(
-            num_rows=self.table.shape[0], num_columns=self.table.shape[1]
-        )
 
-        return BackendState(
-            display_name=self.display_name,
-            table_shape=table_unfiltered_shape,
-            table_unfiltered_shape=table_unfiltered_shape,
-            row_filters=self.filters,
-            sort_keys=self.sort_keys,
-            supported_features=self.FEATURES,
-        )
+def _sql_glob_pattern(term: str, prefix: bool, suffix: bool) -> str:
+    # GLOB pattern matching the term, with the special characters in
+    # brackets
+    term = "".join(f"[{c}]" if c in "*?[" else c for c in term)
+    return f"{'*' if prefix else ''}{term}{'*' if suffix else ''}"
 
 
-class PyArrowView(DataExplorerTableView):
-    pass
+def _format_sql_values(values: List[Any], options: FormatOptions) -> List[ColumnValue]:
+    float_format = _get_float_formatter(options)
+
+    result = []
+    for x in values:
+        if x is None:
+            result.append(_VALUE_NULL)
+        elif isinstance(x, float):
+            if math.isnan(x):
+                result.append(_VALUE_NAN)
+            elif math.isinf(x):
+                result.append(_VALUE_INF if x > 0 else _VALUE_NEGINF)
+            else:
+                result.append(float_format(x))
+        else:
+            result.append(str(x))
+    return result
+
+
+def _log_profile_error(req: ColumnProfileRequest, err: Exception):
+    logger.warning(
+        f"Failed to compute {req.profile_type.value} profile for column "
+        f"{req.column_index}: {err}",
+        exc_info=True,
+    )
 
 
 def _is_pandas(table):
@@ -1635,13 +6207,21 @@ def _is_polars(table):
     return pl_ is not None and isinstance(table, (pl_.DataFrame, pl_.Series))
 
 
-def _get_table_view(table, filters=None, sort_keys=None, name=None):
+def _is_pyarrow(table):
+    return pa_ is not None and isinstance(table, pa_.Table)
+
+
+def _get_table_view(table, filters=None, sort_keys=None, name=None, table_state=None):
     name = name or guid()
 
     if _is_pandas(table):
-        return PandasView(name, table, filters, sort_keys)
+        return PandasView(name, table, filters, sort_keys, table_state)
     elif _is_polars(table):
         return PolarsView(name, table, filters, sort_keys)
+    elif _is_pyarrow(table):
+        return PyArrowView(name, table, filters, sort_keys)
+    elif isinstance(table, SQLTable):
+        return SQLView(name, table, filters, sort_keys)
     else:
         return UnsupportedView(name, table)
 
@@ -1651,10 +6231,338 @@ def _value_type_is_supported(value):
         return True
     if _is_polars(value):
         return True
+    if _is_pyarrow(value):
+        return True
+    if isinstance(value, SQLTable):
+        return True
     return False
 
 
+class _DataRequestQueue:
+    """
+    The get_data_values requests of a data explorer that have not been
+    answered yet. When requests arrive faster than they are answered,
+    as while scrolling quickly, they are answered together when the
+    kernel is next idle. The newest request is answered first, and the
+    values of the older requests for rows overlapping its rows are
+    computed with its values. The other requests are superseded, and
+    are answered with an error without computing their values.
+    """
+
+    def __init__(self):
+        self.pending: List[Tuple[GetDataValuesRequest, JsonRecord]] = []
+        self.flush_scheduled = False
+
+        # Numbers of requests whose values were computed, that were
+        # answered with values computed for a newer request, and that
+        # were dropped as superseded
+        self.computed = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+        # The last viewport, and the directions in which the rows and
+        # columns were last scrolled, for prefetching the values the
+        # next request is likely to need
+        self.last_params: Optional[GetDataValuesParams] = None
+        self.row_direction = 1
+        self.column_direction = 1
+        self.prefetch: Optional[_ViewportPrefetch] = None
+
+        # Number of ranges of values prefetched
+        self.prefetched = 0
+
+    def update_scroll_direction(self, params: GetDataValuesParams):
+        last = self.last_params
+        self.last_params = params
+        if last is None:
+            return
+
+        if params.row_start_index != last.row_start_index:
+            self.row_direction = 1 if params.row_start_index > last.row_start_index else -1
+
+        if params.column_indices and last.column_indices:
+            first = min(params.column_indices)
+            last_first = min(last.column_indices)
+            if first != last_first:
+                self.column_direction = 1 if first > last_first else -1
+
+    def cancel_prefetch(self):
+        if self.prefetch is not None:
+            self.prefetch.cancel()
+            self.prefetch = None
+
+
+class _ViewportPrefetch:
+    """
+    Ranges of values around the viewport of a data explorer that are
+    formatted into the viewport cache while the kernel is idle, so that
+    the next get_data_values request while scrolling is served from
+    the cache. The ranges are formatted one at a time on the kernel
+    thread, between other events, and the remaining ones are dropped
+    as soon as another request arrives or user code starts running.
+    """
+
+    def __init__(
+        self,
+        view: DataExplorerTableView,
+        steps: List[Tuple[int, int, List[int]]],
+        format_options: FormatOptions,
+        max_bytes: int,
+    ):
+        self.view = view
+        self.steps = deque(steps)
+        self.format_options = format_options
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.handle: Optional[asyncio.Handle] = None
+
+    def cancel(self):
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        self.steps.clear()
+
+
+def _prefetch_steps(
+    params: GetDataValuesParams,
+    row_direction: int,
+    column_direction: int,
+    num_rows: int,
+    num_columns: int,
+    block_size: int,
+    row_blocks: int,
+) -> List[Tuple[int, int, List[int]]]:
+    # The (row_start, num_rows, column_indices) ranges to prefetch
+    # around a viewport, nearest first: the row blocks ahead in the
+    # scrolling direction, the block behind, and then the viewport rows
+    # of the columns beside the viewport in the scrolling direction
+    columns = sorted({x for x in params.column_indices if x < num_columns})
+    start = max(params.row_start_index, 0)
+    end = min(start + params.num_rows, num_rows)
+    if not columns or end <= start:
+        return []
+
+    first_block = start // block_size
+    last_block = (end - 1) // block_size
+    if row_direction > 0:
+        blocks = [last_block + k for k in range(1, row_blocks + 1)] + [first_block - 1]
+    else:
+        blocks = [first_block - k for k in range(1, row_blocks + 1)] + [last_block + 1]
+    steps = [
+        (block * block_size, block_size, columns)
+        for block in blocks
+        if 0 <= block * block_size < num_rows
+    ]
+
+    width = len(columns)
+    if column_direction > 0:
+        beside = list(range(columns[-1] + 1, min(columns[-1] + 1 + width, num_columns)))
+    else:
+        beside = list(range(max(columns[0] - width, 0), columns[0]))
+    if beside:
+        steps.append((start, end - start, beside))
+    return steps
+
+
+def _same_data_columns(a: GetDataValuesParams, b: GetDataValuesParams) -> bool:
+    # Whether the values of two get_data_values requests for the same
+    # rows are the same
+    return (
+        a.column_indices == b.column_indices
+        and a.format_options == b.format_options
+        and a.encoding == b.encoding
+    )
+
+
+class _ColumnProfilesJob:
+    """
+    The profiles requested by one get_column_profiles request. The
+    profiles of each column are computed in the profile worker pool
+    and returned with a return_column_profiles event as soon as they
+    are finished.
+    """
+
+    def __init__(
+        self,
+        comm: PositronComm,
+        view: DataExplorerTableView,
+        request: GetColumnProfilesRequest,
+        loop: Optional[asyncio.AbstractEventLoop],
+    ):
+        self.comm = comm
+        self.view = view
+        self.callback_id = request.params.callback_id
+        self.profiles = request.params.profiles
+        self.format_options = request.params.format_options
+
+        # Events are sent from the kernel's event loop when there is
+        # one, so that they are not interleaved with the replies to
+        # other requests
+        self._loop = loop
+
+        self._lock = threading.Lock()
+        self._cancelled = False
+        self._paused = False
+        self._unsent = set(range(len(self.profiles)))
+        self._futures: List[Future] = []
+
+        # Incremented when the job is paused, so that the profiles
+        # being computed at the time are discarded
+        self._generation = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._data_requests_idle: Optional[threading.Event] = None
+
+    @property
+    def done(self) -> bool:
+        return self._cancelled or len(self._unsent) == 0
+
+    def start(self, executor: ThreadPoolExecutor, data_requests_idle: threading.Event):
+        self._executor = executor
+        self._data_requests_idle = data_requests_idle
+        with self._lock:
+            unsent = sorted(self._unsent)
+            generation = self._generation
+
+        for profile_indices in self.view._group_column_profiles(self.profiles, unsent):
+            if self.view.PROFILES_IN_BACKGROUND:
+                self._futures.append(
+                    executor.submit(
+                        self._compute_profiles, profile_indices, data_requests_idle, generation
+                    )
+                )
+            else:
+                self._compute_profiles(profile_indices, data_requests_idle, generation)
+
+    def pause(self):
+        """
+        Stop computing profiles while user code runs, as it may modify
+        the table being profiled. Profiles that are being computed are
+        discarded when they finish, and all the unsent profiles are
+        computed again when the job is resumed.
+        """
+        with self._lock:
+            if self._cancelled or self._paused:
+                return
+            self._paused = True
+            self._generation += 1
+
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def resume(self):
+        with self._lock:
+            if self._cancelled or not self._paused:
+                return
+            self._paused = False
+
+        assert self._executor is not None and self._data_requests_idle is not None
+        self.start(self._executor, self._data_requests_idle)
+
+    def wait(self, timeout: Optional[float] = None):
+        futures_wait(self._futures, timeout=timeout)
+
+    def cancel(self, notify: bool = True):
+        """
+        Cancel the profiles that have not been computed yet. If notify
+        is True, they are returned empty so the frontend is not left
+        waiting for them.
+        """
+        with self._lock:
+            if self._cancelled:
+                return
+            self._cancelled = True
+            unsent = sorted(self._unsent)
+            self._unsent.clear()
+
+        for future in self._futures:
+            future.cancel()
+
+        if notify and len(unsent) > 0:
+            self._send_event(unsent, [{} for _ in unsent])
+
+    def _compute_profiles(
+        self, profile_indices: List[int], data_requests_idle: threading.Event, generation: int
+    ):
+        # Requests for data that the user is looking at take priority
+        # over profiles, which are only shown in the summary panel
+        data_requests_idle.wait()
+        if self._cancelled or generation != self._generation:
+            return
+
+        try:
+            results = self.view._get_column_profiles(
+                [self.profiles[i] for i in profile_indices], self.format_options
+            )
+            results = [{} if result is None else result.dict() for result in results]
+        except Exception as err:
+            logger.warning(
+                f"Failed to compute profiles for column "
+                f"{self.profiles[profile_indices[0]].column_index}: {err}",
+                exc_info=True,
+            )
+            results = [{} for _ in profile_indices]
+
+        if self._loop is None:
+            self._deliver(profile_indices, results, generation)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, profile_indices, results, generation)
+
+    def _deliver(self, profile_indices: List[int], results: List[dict], generation: int):
+        with self._lock:
+            # Results that arrive after the job was cancelled have
+            # already been returned empty, and results computed while
+            # the job was paused may be of modified data
+            if self._cancelled or generation != self._generation:
+                return
+            self._unsent.difference_update(profile_indices)
+            self._send_event(profile_indices, results)
+
+    def _send_event(self, profile_indices: List[int], results: List[dict]):
+        self.comm.send_event(
+            DataExplorerFrontendEvent.ReturnColumnProfiles.value,
+            {
+                "callback_id": self.callback_id,
+                "profile_indices": profile_indices,
+                "profiles": results,
+            },
+        )
+
+
+def _distinct(items: Iterable) -> List:
+    # The items in order with repeated objects left out
+    seen = set()
+    result = []
+    for item in items:
+        if id(item) not in seen:
+            seen.add(id(item))
+            result.append(item)
+    return result
+
+
 class DataExplorerService:
+    # Number of threads computing column profiles in the background
+    PROFILE_WORKERS = 4
+
+    # Memory budget for the row indices and cached state of all the
+    # data explorers. When it is exceeded, the least recently used
+    # cached state is evicted first, and then the row indices of the
+    # least recently used explorers, which are recomputed when they
+    # are next needed
+    MEMORY_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+    # Seconds the kernel must be idle after answering get_data_values
+    # before the values around the viewport are prefetched
+    PREFETCH_DELAY = 0.05
+
+    # Number of row blocks prefetched in the scrolling direction
+    PREFETCH_ROW_BLOCKS = 2
+
+    # Size of the values prefetched around a viewport, which is at
+    # most a quarter of the viewport cache so that the values being
+    # viewed are never evicted to make room for them
+    PREFETCH_MAX_BYTES = 4 * 1024 * 1024
+
     def __init__(self, comm_target: str) -> None:
         self.comm_target = comm_target
 
@@ -1673,10 +6581,34 @@ class DataExplorerService:
         # Called when comm closure is initiated from the backend
         self._close_callback = None
 
+        # Unfinished get_column_profiles requests for each comm_id
+        self._profile_jobs: Dict[str, List[_ColumnProfilesJob]] = {}
+        self._profile_executor: Optional[ThreadPoolExecutor] = None
+
+        # Cleared while other requests are handled, so that profile
+        # workers do not compete with them
+        self._data_requests_idle = threading.Event()
+        self._data_requests_idle.set()
+
+        # When each comm_id last handled a request, for evicting the
+        # row indices of the least recently used explorers
+        self._last_used: Dict[str, int] = {}
+        self._request_ticks = itertools.count()
+
+        # Unanswered get_data_values requests for each comm_id
+        self._data_requests: Dict[str, _DataRequestQueue] = {}
+
+        # Releases the converted CSV file viewed by each comm_id
+        self._file_releases: Dict[str, Callable[[], None]] = {}
+
     def shutdown(self) -> None:
         for comm_id in list(self.comms.keys()):
             self._close_explorer(comm_id)
 
+        if self._profile_executor is not None:
+            self._profile_executor.shutdown(wait=False)
+            self._profile_executor = None
+
     def is_supported(self, value) -> bool:
         return value is not None and _value_type_is_supported(value)
 
@@ -1722,8 +6654,95 @@ class DataExplorerService:
         else:
             full_title = title
 
-        self.table_views[comm_id] = _get_table_view(table, name=full_title)
+        # Another explorer of the same variable shares the state derived
+        # from the table values
+        table_state = None
+        if variable_path is not None:
+            for other_id in self.path_to_comm_ids.get(tuple(variable_path), ()):
+                other_state = self.table_views[other_id]._table_state
+                if other_state is not None and other_state.source is table:
+                    table_state = other_state
+                    break
+
+        view = _get_table_view(table, name=full_title, table_state=table_state)
+        self._set_table_view(comm_id, view)
+        self._open_comm(comm_id, title, variable_path)
+        return comm_id
+
+    def register_file(self, path: str, title: Optional[str] = None, comm_id=None):
+        """
+        Set up a new comm and data explorer view of a Parquet, Arrow
+        IPC (Feather) or CSV file, which is read from disk as needed
+        rather than loaded into memory.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file
+        title : str, default None
+            Display name in UI, by default the file name
+        comm_id : str, default None
+            A specific comm identifier to use, otherwise generate a
+            random uuid.
+
+        Returns
+        -------
+        comm_id : str
+            The associated (generated or passed in) comm_id
+        """
+        if pa_ is None:
+            raise TypeError("pyarrow is required to view files")
+
+        if title is None:
+            title = os.path.basename(path)
+
+        if comm_id is None:
+            comm_id = guid()
+
+        delimiter = _csv_delimiter(path)
+        if delimiter is None:
+            self._open_file_view(comm_id, title, _open_arrow_file(path))
+            return comm_id
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        # With an event loop, CSV files are converted without blocking
+        # the kernel, and the explorer is opened when the conversion
+        # is done
+        key, future = _CSV_CONVERSIONS.acquire(
+            path, delimiter, None if loop is None else _get_conversion_executor()
+        )
+
+        def open_view(future: Future):
+            try:
+                table = future.result()
+            except BaseException:
+                _CSV_CONVERSIONS.release(key)
+                raise
+            self._file_releases[comm_id] = functools.partial(_CSV_CONVERSIONS.release, key)
+            self._open_file_view(comm_id, title, table)
+
+        def on_converted(future: Future):
+            try:
+                open_view(future)
+            except Exception:
+                logger.error(f"Failed to open {path} in the data explorer", exc_info=True)
+
+        if loop is None:
+            open_view(future)
+        else:
+            future.add_done_callback(lambda f: loop.call_soon_threadsafe(on_converted, f))
+        return comm_id
 
+    def _open_file_view(self, comm_id: str, title: str, table: _ArrowFile):
+        view = FileView(title, table, None, None)
+        self._set_table_view(comm_id, view)
+        self._open_comm(comm_id, title, None)
+
+    def _open_comm(self, comm_id: str, title: str, variable_path: Optional[List[str]]):
         base_comm = comm.create_comm(
             target_name=self.comm_target,
             comm_id=comm_id,
@@ -1754,7 +6773,28 @@ class DataExplorerService:
         wrapped_comm = PositronComm(base_comm)
         wrapped_comm.on_msg(self.handle_msg, DataExplorerBackendMessageContent)
         self.comms[comm_id] = wrapped_comm
-        return comm_id
+        self._data_requests[comm_id] = _DataRequestQueue()
+
+    def _set_table_view(self, comm_id: str, view: DataExplorerTableView):
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def send_schema_update():
+            # The view may have been replaced or closed in the meantime
+            if self.table_views.get(comm_id) is not view or comm_id not in self.comms:
+                return
+            self.comms[comm_id].send_event(DataExplorerFrontendEvent.SchemaUpdate.value, {})
+
+        def schema_update_callback():
+            if loop is None:
+                send_schema_update()
+            else:
+                loop.call_soon_threadsafe(send_schema_update)
+
+        view._schema_update_callback = schema_update_callback
+        self.table_views[comm_id] = view
 
     def _close_explorer(self, comm_id: str):
         try:
@@ -1766,8 +6806,17 @@ class DataExplorerService:
             logger.warning(err, exc_info=True)
             pass
 
+        self._cancel_column_profiles(comm_id, notify=False)
         del self.comms[comm_id]
         del self.table_views[comm_id]
+        self._last_used.pop(comm_id, None)
+        queue = self._data_requests.pop(comm_id, None)
+        if queue is not None:
+            queue.cancel_prefetch()
+
+        release = self._file_releases.pop(comm_id, None)
+        if release is not None:
+            release()
 
         if comm_id in self.comm_id_to_path:
             path = self.comm_id_to_path[comm_id]
@@ -1808,11 +6857,23 @@ class DataExplorerService:
 
     def handle_variable_updated(self, variable_name, new_variable):
         affected_paths = self.get_paths_for_variable(variable_name)
+
+        # The explorers of the same table share the state derived from
+        # its values, which is updated once for all of them
+        updated_states: Dict[int, Any] = {}
         for path in affected_paths:
             for comm_id in list(self.path_to_comm_ids[path]):
-                self._update_explorer_for_comm(comm_id, path, new_variable)
+                self._update_explorer_for_comm(comm_id, path, new_variable, updated_states)
 
-    def _update_explorer_for_comm(self, comm_id: str, path: PathKey, new_variable):
+        self._enforce_memory_budget()
+
+    def _update_explorer_for_comm(
+        self,
+        comm_id: str,
+        path: PathKey,
+        new_variable,
+        updated_states: Optional[Dict[int, Any]] = None,
+    ):
         """
         If a variable is updated, we have to handle the different scenarios:
 
@@ -1838,6 +6899,10 @@ class DataExplorerService:
         """
         from .variables import _resolve_value_from_path
 
+        # Requests made before the update are answered from the old
+        # table
+        self._flush_data_requests(comm_id)
+
         comm = self.comms[comm_id]
         table_view = self.table_views[comm_id]
 
@@ -1862,6 +6927,17 @@ class DataExplorerService:
             # looking at invalid.
             return self._close_explorer(comm_id)
 
+        new_table_state = None
+        if isinstance(new_table, type(table_view.table)):
+            new_table_state = table_view._get_updated_table_state(
+                new_table, {} if updated_states is None else updated_states
+            )
+            if new_table_state is not None and new_table_state is table_view._table_state:
+                # The table has not changed, so the explorer is up to
+                # date
+                table_view.table = new_table_state.table
+                return
+
         if not isinstance(new_table, type(table_view.table)):
             # Data structure type has changed. For now, we drop the
             # entire state: sorting keys, filters, etc. and start
@@ -1871,14 +6947,22 @@ class DataExplorerService:
             new_filters = []
             new_sort_keys = []
         else:
-            (schema_updated, new_filters, new_sort_keys) = table_view.get_updated_state(new_table)
+            (schema_updated, new_filters, new_sort_keys) = (
+                table_view.get_updated_state(new_table)
+                if new_table_state is None
+                else table_view.get_updated_state(new_table, new_table_state)
+            )
 
-        self.table_views[comm_id] = _get_table_view(
+        self._cancel_column_profiles(comm_id)
+        new_view = _get_table_view(
             new_table,
             filters=new_filters,
             sort_keys=new_sort_keys,
             name=full_title,
+            table_state=new_table_state,
         )
+        new_view._inherit_cached_state(table_view)
+        self._set_table_view(comm_id, new_view)
 
         if schema_updated:
             comm.send_event(DataExplorerFrontendEvent.SchemaUpdate.value, {})
@@ -1892,11 +6976,39 @@ class DataExplorerService:
         """
         comm_id = msg.content.comm_id
         request = msg.content.data
+        self._last_used[comm_id] = next(self._request_ticks)
+
+        # Requests are answered before values are prefetched
+        self._data_requests[comm_id].cancel_prefetch()
+
+        if isinstance(request, GetDataValuesRequest):
+            self._queue_data_request(comm_id, request, raw_msg)
+            return
+
+        # Other requests are answered after the get_data_values
+        # requests before them
+        self._flush_data_requests(comm_id)
 
         comm = self.comms[comm_id]
         table = self.table_views[comm_id]
 
-        result = getattr(table, request.method.value)(request)
+        if isinstance(request, GetColumnProfilesRequest):
+            return self._get_column_profiles(comm_id, request)
+
+        if isinstance(request, GetMemoryUsageRequest):
+            comm.send_result(self._get_memory_usage(comm_id).dict())
+            return
+
+        if isinstance(request, (SetRowFiltersRequest, SetSortColumnsRequest)):
+            # Profiles computed for the previous filters or sort
+            # order are no longer needed
+            self._cancel_column_profiles(comm_id)
+
+        self._data_requests_idle.clear()
+        try:
+            result = getattr(table, request.method.value)(request)
+        finally:
+            self._data_requests_idle.set()
 
         # To help remember to convert pydantic types to dicts
         if result is not None:
@@ -1907,3 +7019,338 @@ class DataExplorerService:
                 assert isinstance(result, dict)
 
         comm.send_result(result)
+        self._enforce_memory_budget(keep=comm_id)
+
+    def _queue_data_request(self, comm_id: str, request: GetDataValuesRequest, raw_msg):
+        queue = self._data_requests[comm_id]
+        queue.pending.append((request, raw_msg))
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is None:
+            # Without an event loop the requests are answered as they
+            # arrive
+            self._flush_data_requests(comm_id)
+        elif not queue.flush_scheduled:
+            # The requests that arrive before the kernel is idle again
+            # are answered together
+            queue.flush_scheduled = True
+            loop.call_soon(self._flush_data_requests, comm_id)
+
+    def _flush_data_requests(self, comm_id: str):
+        """
+        Answer the pending get_data_values requests of an explorer,
+        newest first. The older requests with the same columns and
+        formatting whose rows overlap the rows of the newest request
+        are answered with the values of the union of their rows, and
+        the other older requests are dropped.
+        """
+        queue = self._data_requests.get(comm_id)
+        if queue is None:
+            # The explorer was closed
+            return
+        queue.flush_scheduled = False
+        pending, queue.pending = queue.pending, []
+        if len(pending) == 0:
+            return
+
+        comm = self.comms[comm_id]
+        table = self.table_views[comm_id]
+
+        newest = pending[-1][0].params
+        start = newest.row_start_index
+        end = start + newest.num_rows
+        coalesced = [pending[-1]]
+        superseded = []
+        for request, raw_msg in reversed(pending[:-1]):
+            params = request.params
+            params_end = params.row_start_index + params.num_rows
+            if (
+                _same_data_columns(params, newest)
+                and params.row_start_index < newest.row_start_index + newest.num_rows
+                and params_end > newest.row_start_index
+            ):
+                coalesced.append((request, raw_msg))
+                start = min(start, params.row_start_index)
+                end = max(end, params_end)
+            else:
+                superseded.append(raw_msg)
+
+        request = pending[-1][0]
+        request = request.copy(
+            update={
+                "params": newest.copy(update={"row_start_index": start, "num_rows": end - start})
+            }
+        )
+        self._data_requests_idle.clear()
+        try:
+            result = table.get_data_values(request)
+        finally:
+            self._data_requests_idle.set()
+        queue.computed += 1
+        queue.coalesced += len(coalesced) - 1
+
+        for request, raw_msg in coalesced:
+            offset = request.params.row_start_index - start
+            rows = slice(offset, offset + request.params.num_rows)
+            self._send_data_values(
+                comm,
+                request,
+                {
+                    "columns": [values[rows] for values in result["columns"]],
+                    "row_labels": (
+                        None
+                        if result["row_labels"] is None
+                        else [labels[rows] for labels in result["row_labels"]]
+                    ),
+                },
+                raw_msg,
+            )
+
+        for raw_msg in superseded:
+            comm.send_error(
+                JsonRpcErrorCode.REQUEST_SUPERSEDED,
+                "Superseded by a newer get_data_values request",
+                parent=raw_msg,
+            )
+        queue.dropped += len(superseded)
+
+        self._enforce_memory_budget(keep=comm_id)
+
+        queue.update_scroll_direction(newest)
+        self._schedule_prefetch(comm_id)
+
+    def cancel_prefetch(self):
+        """
+        Stop prefetching values for all the data explorers, so that
+        user code that is about to run does not wait for it.
+        """
+        for queue in self._data_requests.values():
+            queue.cancel_prefetch()
+
+    def pause_background_work(self):
+        """
+        Called before user code runs. Prefetching is cancelled, and the
+        profile workers are paused since the user code may modify the
+        tables they are reading.
+        """
+        self.cancel_prefetch()
+        for jobs in self._profile_jobs.values():
+            for job in jobs:
+                job.pause()
+
+    def resume_background_work(self):
+        """
+        Called after user code has run and the explorers of modified
+        variables have been updated, which cancels their profiles.
+        Explorers of tables that user code can modify without a
+        variable update, such as database tables, are refreshed.
+        """
+        for comm_id, view in list(self.table_views.items()):
+            if view.REFRESH_AFTER_EXECUTION:
+                self._refresh_explorer(comm_id)
+
+        for jobs in self._profile_jobs.values():
+            for job in jobs:
+                job.resume()
+
+    def _refresh_explorer(self, comm_id: str):
+        # Requests made before the refresh are answered first
+        self._flush_data_requests(comm_id)
+        self._cancel_column_profiles(comm_id)
+        self.table_views[comm_id]._refresh()
+        self.comms[comm_id].send_event(DataExplorerFrontendEvent.DataUpdate.value, {})
+
+    def _schedule_prefetch(self, comm_id: str):
+        queue = self._data_requests[comm_id]
+        view = self.table_views[comm_id]
+        queue.cancel_prefetch()
+        if not view.PREFETCH_VIEWPORT or queue.last_params is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Without an event loop there is no idle time to use
+            return
+
+        steps = _prefetch_steps(
+            queue.last_params,
+            queue.row_direction,
+            queue.column_direction,
+            view._get_num_view_rows(),
+            view.table.shape[1],
+            view.VIEWPORT_BLOCK_SIZE,
+            self.PREFETCH_ROW_BLOCKS,
+        )
+        if not steps:
+            return
+
+        prefetch = _ViewportPrefetch(
+            view,
+            steps,
+            queue.last_params.format_options,
+            min(self.PREFETCH_MAX_BYTES, view._viewport_cache.max_bytes // 4),
+        )
+        prefetch.handle = loop.call_later(
+            self.PREFETCH_DELAY, self._prefetch_step, comm_id, prefetch
+        )
+        queue.prefetch = prefetch
+
+    def _prefetch_step(self, comm_id: str, prefetch: _ViewportPrefetch):
+        # Format the next range of a prefetch, and schedule the one
+        # after it, letting any waiting events be handled in between
+        prefetch.handle = None
+        queue = self._data_requests.get(comm_id)
+        if queue is None or queue.prefetch is not prefetch:
+            return
+
+        view = prefetch.view
+        caches, index_nbytes = self._get_memory_state()
+        total = sum(cache.nbytes for cache in caches) + sum(index_nbytes.values())
+        if (
+            not prefetch.steps
+            or self.table_views.get(comm_id) is not view
+            # Row indices released by the memory budget are not
+            # recomputed just to prefetch values
+            or view._need_recompute
+            or prefetch.nbytes >= prefetch.max_bytes
+            # Prefetched values never evict the state of other views
+            or total + prefetch.max_bytes - prefetch.nbytes > self.MEMORY_MAX_BYTES
+        ):
+            queue.prefetch = None
+            return
+
+        row_start, num_rows, column_indices = prefetch.steps.popleft()
+        try:
+            result = view._get_data_values(
+                row_start, num_rows, column_indices, prefetch.format_options
+            )
+        except Exception:
+            logger.warning("Error prefetching data values", exc_info=True)
+            queue.prefetch = None
+            return
+
+        queue.prefetched += 1
+        prefetch.nbytes += sum(_estimate_nbytes(values) for values in result.columns)
+        if result.row_labels is not None:
+            prefetch.nbytes += sum(_estimate_nbytes(labels) for labels in result.row_labels)
+        prefetch.handle = asyncio.get_running_loop().call_soon(
+            self._prefetch_step, comm_id, prefetch
+        )
+
+    def _send_data_values(
+        self, comm: PositronComm, request: GetDataValuesRequest, result: Dict, raw_msg
+    ):
+        buffers = None
+        if (
+            request.params.encoding == TableDataEncoding.Utf8
+            # Without NumPy the values are sent as JSON
+            and np_ is not None
+        ):
+            buffers = _encode_utf8_columns(result["columns"])
+            result = {**result, "columns": [], "encoding": TableDataEncoding.Utf8.value}
+        comm.send_result(result, buffers=buffers, parent=raw_msg)
+
+    def _get_memory_usage(self, comm_id: str) -> MemoryUsage:
+        table = self.table_views[comm_id]
+        caches, index_nbytes = self._get_memory_state()
+        return MemoryUsage(
+            index_bytes=index_nbytes[comm_id],
+            cache_bytes=sum(cache.nbytes for cache in _distinct(table._get_caches())),
+            total_bytes=sum(cache.nbytes for cache in caches) + sum(index_nbytes.values()),
+            max_bytes=self.MEMORY_MAX_BYTES,
+        )
+
+    def _get_memory_state(self) -> Tuple[List[_LRUCache], Dict[str, int]]:
+        # The caches of all the views, each listed once since views of
+        # the same table share caches, and the size of the row indices
+        # of each view
+        caches = _distinct(
+            cache for view in self.table_views.values() for cache in view._get_caches()
+        )
+        index_nbytes = {
+            comm_id: view._get_row_indices_nbytes() for comm_id, view in self.table_views.items()
+        }
+        return caches, index_nbytes
+
+    def _enforce_memory_budget(self, keep: Optional[str] = None):
+        """
+        Evict cached state, least recently used first, and then free
+        the row indices of the least recently used explorers other than
+        keep, until the memory used by all the explorers is within
+        MEMORY_MAX_BYTES.
+        """
+        caches, index_nbytes = self._get_memory_state()
+        total = sum(cache.nbytes for cache in caches) + sum(index_nbytes.values())
+        if total <= self.MEMORY_MAX_BYTES:
+            return
+
+        heap = []
+        for i, cache in enumerate(caches):
+            tick = cache.oldest_tick()
+            if tick is not None:
+                heap.append((tick, i))
+        heapq.heapify(heap)
+        while total > self.MEMORY_MAX_BYTES and heap:
+            _, i = heapq.heappop(heap)
+            total -= caches[i].evict_oldest()
+            tick = caches[i].oldest_tick()
+            if tick is not None:
+                heapq.heappush(heap, (tick, i))
+
+        # Views whose profiles are being computed keep their indices,
+        # which the profile workers are using
+        for comm_id in sorted(index_nbytes, key=lambda x: self._last_used.get(x, -1)):
+            if total <= self.MEMORY_MAX_BYTES:
+                break
+            if comm_id == keep or self._profile_jobs.get(comm_id):
+                continue
+            if self.table_views[comm_id]._release_row_indices():
+                total -= index_nbytes[comm_id]
+
+    def _get_column_profiles(self, comm_id: str, request: GetColumnProfilesRequest):
+        comm = self.comms[comm_id]
+        table = self.table_views[comm_id]
+
+        # Filters and sorts are brought up to date before handing the
+        # view to the profile workers
+        table._recompute_if_needed()
+
+        if request.params.callback_id is None:
+            # Clients without a callback_id wait for the profiles in
+            # the reply
+            results = table._get_column_profiles(
+                request.params.profiles, request.params.format_options
+            )
+            comm.send_result([{} if result is None else result.dict() for result in results])
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        job = _ColumnProfilesJob(comm, table, request, loop)
+        jobs = [x for x in self._profile_jobs.get(comm_id, []) if not x.done]
+        jobs.append(job)
+        self._profile_jobs[comm_id] = jobs
+
+        # The results are returned with return_column_profiles events
+        comm.send_result([])
+        job.start(self._get_profile_executor(), self._data_requests_idle)
+
+    def _get_profile_executor(self) -> ThreadPoolExecutor:
+        if self._profile_executor is None:
+            self._profile_executor = ThreadPoolExecutor(
+                max_workers=self.PROFILE_WORKERS,
+                thread_name_prefix="positron-data-explorer-profiles",
+            )
+        return self._profile_executor
+
+    def _cancel_column_profiles(self, comm_id: str, notify: bool = True):
+        for job in self._profile_jobs.pop(comm_id, []):
+            job.cancel(notify=notify)
@@ -166,6 +166,17 @@ class ExportFormat(str, enum.Enum):
     Html = "html"
 
 
+@enum.unique
+class TableDataEncoding(str, enum.Enum):
+    """
+    Possible values for TableDataEncoding
+    """
+
+    Json = "json"
+
+    Utf8 = "utf8"
+
+
 @enum.unique
 class SupportStatus(str, enum.Enum):
     """
@@ -253,6 +264,28 @@ class BackendState(BaseModel):
     )
 
 
+class MemoryUsage(BaseModel):
+    """
+    Memory used by the data explorer and by all data explorers
+    """
+
+    index_bytes: StrictInt = Field(
+        description="Bytes used by the filtered and sorted row indices",
+    )
+
+    cache_bytes: StrictInt = Field(
+        description="Bytes used by cached state derived from the table, including state shared with other data explorers of the same table",
+    )
+
+    total_bytes: StrictInt = Field(
+        description="Bytes used by the row indices and cached state of all data explorers",
+    )
+
+    max_bytes: StrictInt = Field(
+        description="Memory budget for the row indices and cached state of all data explorers",
+    )
+
+
 class ColumnSchema(BaseModel):
     """
     Schema for a column in a table
@@ -319,6 +352,11 @@ class TableData(BaseModel):
         description="Zero or more arrays of row labels",
     )
 
+    encoding: Optional[TableDataEncoding] = Field(
+        default=None,
+        description="Encoding of the column values. If utf8, columns is empty and the values of all the columns, one column after another, are in the buffers of the message: the uint32 little-endian offsets of the values in the data (one more than the number of values), the UTF-8 data, and a uint8 special value code for each value (255 for a formatted value), which is empty if there are no special values",
+    )
+
 
 class FormatOptions(BaseModel):
     """
@@ -506,6 +544,11 @@ class ColumnProfileRequest(BaseModel):
         description="The type of analytical column profile",
     )
 
+    quantiles: Optional[List[Union[StrictInt, StrictFloat]]] = Field(
+        default=None,
+        description="Quantiles to compute for the summary_stats profile of a numeric column, as percentiles, e.g. 50 for the median",
+    )
+
 
 class ColumnProfileTypeSupportStatus(BaseModel):
     """
@@ -613,6 +656,11 @@ class SummaryStatsNumber(BaseModel):
         description="Sample standard deviation as a string",
     )
 
+    quantiles: Optional[List[ColumnQuantileValue]] = Field(
+        default=None,
+        description="Requested quantiles, exact or estimated from a quantile sketch",
+    )
+
 
 class SummaryStatsBoolean(BaseModel):
     """
@@ -638,7 +686,12 @@ class SummaryStatsString(BaseModel):
     )
 
     num_unique: StrictInt = Field(
-        description="The exact number of distinct values",
+        description="The number of distinct values, which is an estimate if num_unique_error is set",
+    )
+
+    num_unique_error: Optional[Union[StrictInt, StrictFloat]] = Field(
+        default=None,
+        description="Relative standard error of num_unique if it is an estimate, if undefined then num_unique is exact",
     )
 
 
@@ -648,7 +701,12 @@ class SummaryStatsDate(BaseModel):
     """
 
     num_unique: StrictInt = Field(
-        description="The exact number of distinct values",
+        description="The number of distinct values, which is an estimate if num_unique_error is set",
+    )
+
+    num_unique_error: Optional[Union[StrictInt, StrictFloat]] = Field(
+        default=None,
+        description="Relative standard error of num_unique if it is an estimate, if undefined then num_unique is exact",
     )
 
     min_date: StrictStr = Field(
@@ -674,7 +732,12 @@ class SummaryStatsDatetime(BaseModel):
     """
 
     num_unique: StrictInt = Field(
-        description="The exact number of distinct values",
+        description="The number of distinct values, which is an estimate if num_unique_error is set",
+    )
+
+    num_unique_error: Optional[Union[StrictInt, StrictFloat]] = Field(
+        default=None,
+        description="Relative standard error of num_unique if it is an estimate, if undefined then num_unique is exact",
     )
 
     min_date: StrictStr = Field(
@@ -712,6 +775,11 @@ class ColumnHistogram(BaseModel):
         description="Absolute floating-point width of a histogram bin",
     )
 
+    exact: Optional[StrictBool] = Field(
+        default=None,
+        description="Whether the histogram was computed from all the values, or estimated from a sample of them, if undefined then true",
+    )
+
 
 class ColumnFrequencyTable(BaseModel):
     """
@@ -726,6 +794,11 @@ class ColumnFrequencyTable(BaseModel):
         description="Number of other values not accounted for in counts. May be 0",
     )
 
+    exact: Optional[StrictBool] = Field(
+        default=None,
+        description="Whether the counts were computed from all the values, or estimated from a sample of them, if undefined then true",
+    )
+
 
 class ColumnFrequencyTableItem(BaseModel):
     """
@@ -980,6 +1053,9 @@ class DataExplorerBackendRequest(str, enum.Enum):
     # Get the state
     GetState = "get_state"
 
+    # Get the memory usage
+    GetMemoryUsage = "get_memory_usage"
+
 
 class GetSchemaParams(BaseModel):
     """
@@ -1072,6 +1148,11 @@ class GetDataValuesParams(BaseModel):
         description="Formatting options for returning data values as strings",
     )
 
+    encoding: Optional[TableDataEncoding] = Field(
+        default=None,
+        description="Requested encoding of the data values. The values are returned as JSON if omitted or if the backend does not support the encoding",
+    )
+
 
 class GetDataValuesRequest(BaseModel):
     """
@@ -1189,7 +1270,10 @@ class SetSortColumnsRequest(BaseModel):
 
 class GetColumnProfilesParams(BaseModel):
     """
-    Requests a statistical summary or data profile for batch of columns
+    Requests a statistical summary or data profile for batch of columns.
+    If a callback_id is given, the profiles are computed asynchronously
+    and returned with return_column_profiles events as the profiles of
+    each column are finished
     """
 
     profiles: List[ColumnProfileRequest] = Field(
@@ -1200,10 +1284,18 @@ class GetColumnProfilesParams(BaseModel):
         description="Formatting options for returning data values as strings",
     )
 
+    callback_id: Optional[StrictStr] = Field(
+        default=None,
+        description="Async callback unique identifier. If omitted, the profiles are computed before replying and returned as the result",
+    )
+
 
 class GetColumnProfilesRequest(BaseModel):
     """
-    Requests a statistical summary or data profile for batch of columns
+    Requests a statistical summary or data profile for batch of columns.
+    If a callback_id is given, the profiles are computed asynchronously
+    and returned with return_column_profiles events as the profiles of
+    each column are finished
     """
 
     params: GetColumnProfilesParams = Field(
@@ -1236,6 +1328,22 @@ class GetStateRequest(BaseModel):
     )
 
 
+class GetMemoryUsageRequest(BaseModel):
+    """
+    Request the memory used by the row indices and cached state of the
+    data explorer
+    """
+
+    method: Literal[DataExplorerBackendRequest.GetMemoryUsage] = Field(
+        description="The JSON-RPC method name (get_memory_usage)",
+    )
+
+    jsonrpc: str = Field(
+        default="2.0",
+        description="The JSON-RPC version specifier",
+    )
+
+
 class DataExplorerBackendMessageContent(BaseModel):
     comm_id: str
     data: Union[
@@ -1247,6 +1355,7 @@ class DataExplorerBackendMessageContent(BaseModel):
         SetSortColumnsRequest,
         GetColumnProfilesRequest,
         GetStateRequest,
+        GetMemoryUsageRequest,
     ] = Field(..., discriminator="method")
 
 
@@ -1262,6 +1371,27 @@ class DataExplorerFrontendEvent(str, enum.Enum):
     # Clear cache and request fresh data
     DataUpdate = "data_update"
 
+    # Return async results of a get_column_profiles request
+    ReturnColumnProfiles = "return_column_profiles"
+
+
+class ReturnColumnProfilesParams(BaseModel):
+    """
+    Return async results of a get_column_profiles request
+    """
+
+    callback_id: StrictStr = Field(
+        description="Async callback unique identifier",
+    )
+
+    profile_indices: List[StrictInt] = Field(
+        description="Indices of the returned profiles in the array of requested profiles",
+    )
+
+    profiles: List[ColumnProfileResult] = Field(
+        description="Column profile results, in the order of profile_indices",
+    )
+
 
 SearchSchemaResult.update_forward_refs()
 
@@ -1372,3 +1502,7 @@ GetColumnProfilesParams.update_forward_refs()
 GetColumnProfilesRequest.update_forward_refs()
 
 GetStateRequest.update_forward_refs()
+
+GetMemoryUsageRequest.update_forward_refs()
+
+ReturnColumnProfilesParams.update_forward_refs()
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
     import numpy as np
     import pandas as pd
     import polars as pl
+    import pyarrow as pa
 
     try:  # temporary try/except for python 3.12
         import torch  # type: ignore [reportMissingImports]
@@ -84,6 +85,7 @@ SIMPLER_NAMES = {
     "polars.series.series.Series": "polars.Series",
     "polars.internals.series.series.Series": "polars.Series",
     "polars.internals.dataframe.frame.DataFrame": "polars.DataFrame",
+    "pyarrow.lib.Table": "pyarrow.Table",
 }
 
 
@@ -745,7 +747,7 @@ class MapInspector(_BaseMapInspector[Mapping]):
         return isinstance(self.value, MutableMapping)
 
 
-Column = TypeVar("Column", "pd.Series", "pl.Series", "pd.Index")
+Column = TypeVar("Column", "pd.Series", "pl.Series", "pd.Index", "pa.ChunkedArray")
 
 
 class BaseColumnInspector(_BaseMapInspector[Column], ABC):
@@ -874,7 +876,7 @@ class PolarsSeriesInspector(BaseColumnInspector["pl.Series"]):
         return self.value.to_frame().write_csv(file=None, separator="\t")
 
 
-Table = TypeVar("Table", "pd.DataFrame", "pl.DataFrame")
+Table = TypeVar("Table", "pd.DataFrame", "pl.DataFrame", "pa.Table")
 
 
 class BaseTableInspector(_BaseMapInspector[Table], Generic[Table, Column], ABC):
@@ -983,6 +985,38 @@ class PolarsDataFrameInspector(BaseTableInspector["pl.DataFrame", "pl.Series"]):
         return self.value.write_csv(file=None, separator="\t")
 
 
+class PyArrowTableInspector(BaseTableInspector["pa.Table", "pa.ChunkedArray"]):
+    CLASS_QNAME = "pyarrow.lib.Table"
+
+    def get_children(self):
+        return self.value.column_names
+
+    def is_mutable(self) -> bool:
+        # Arrow tables are immutable, so the variable is only updated
+        # when it is rebound to another table
+        return False
+
+    def equals(self, value: pa.Table) -> bool:
+        return self.value.equals(value)
+
+    def deepcopy(self) -> pa.Table:
+        # Immutable, so no copy is needed
+        return self.value
+
+    def to_html(self) -> str:
+        # TODO: Support HTML
+        return self.to_plaintext()
+
+    def to_plaintext(self) -> str:
+        import pyarrow.csv
+
+        buf = pyarrow.BufferOutputStream()
+        pyarrow.csv.write_csv(
+            self.value, buf, write_options=pyarrow.csv.WriteOptions(delimiter="\t")
+        )
+        return buf.getvalue().to_pybytes().decode("utf-8")
+
+
 class BaseConnectionInspector(ObjectInspector):
     def has_viewer(self) -> bool:
         return self._is_active(self.value)
@@ -1035,6 +1069,7 @@ INSPECTOR_CLASSES: Dict[str, Type[PositronInspector]] = {
     TorchTensorInspector.CLASS_QNAME: TorchTensorInspector,
     **dict.fromkeys(PolarsDataFrameInspector.CLASS_QNAME, PolarsDataFrameInspector),
     **dict.fromkeys(PolarsSeriesInspector.CLASS_QNAME, PolarsSeriesInspector),
+    PyArrowTableInspector.CLASS_QNAME: PyArrowTableInspector,
     DatetimeInspector.CLASS_QNAME: DatetimeInspector,
     **dict.fromkeys(SQLiteConnectionInspector.CLASS_QNAME, SQLiteConnectionInspector),
     **dict.fromkeys(SQLAlchemyEngineInspector.CLASS_QNAME, SQLAlchemyEngineInspector),
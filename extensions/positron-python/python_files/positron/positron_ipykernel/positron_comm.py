@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import enum
 import logging
-from typing import Callable, Generic, Optional, Type, TypeVar
+from typing import Callable, Generic, List, Optional, Type, TypeVar
 
 import comm
 
@@ -48,6 +48,12 @@ class JsonRpcErrorCode(enum.IntEnum):
     # Internal JSON-RPC error.
     INTERNAL_ERROR = -32603
 
+    # The codes from -32000 to -32099 are reserved for
+    # implementation-defined server errors.
+
+    # The request was superseded by a newer request and not processed.
+    REQUEST_SUPERSEDED = -32001
+
 
 T_content = TypeVar(
     "T_content",
@@ -188,7 +194,13 @@ class PositronComm:
 
         self.comm.on_msg(handle_msg)
 
-    def send_result(self, data: JsonData = None, metadata: Optional[JsonRecord] = None) -> None:
+    def send_result(
+        self,
+        data: JsonData = None,
+        metadata: Optional[JsonRecord] = None,
+        buffers: Optional[List[memoryview]] = None,
+        parent: Optional[JsonRecord] = None,
+    ) -> None:
         """
         Send a JSON-RPC result to the frontend-side version of this comm.
 
@@ -198,16 +210,16 @@ class PositronComm:
             The result data to send.
         metadata
             The metadata to send with the result.
+        buffers
+            Binary buffers to send with the result, outside of the JSON data.
+        parent
+            The raw message of the request, if it is not the message being handled.
         """
         result = dict(
             jsonrpc="2.0",
             result=data,
         )
-        self.comm.send(
-            data=result,
-            metadata=metadata,
-            buffers=None,
-        )
+        self._send(result, metadata, buffers, parent)
 
     def send_event(self, name: str, payload: JsonRecord) -> None:
         """
@@ -227,7 +239,12 @@ class PositronComm:
         )
         self.comm.send(data=event)
 
-    def send_error(self, code: JsonRpcErrorCode, message: Optional[str] = None) -> None:
+    def send_error(
+        self,
+        code: JsonRpcErrorCode,
+        message: Optional[str] = None,
+        parent: Optional[JsonRecord] = None,
+    ) -> None:
         """
         Send a JSON-RPC result to the frontend-side version of this comm.
 
@@ -237,6 +254,8 @@ class PositronComm:
             The error code to send.
         message
             The error message to send.
+        parent
+            The raw message of the request, if it is not the message being handled.
         """
         error = dict(
             jsonrpc="2.0",
@@ -245,10 +264,35 @@ class PositronComm:
                 message=message,
             ),
         )
-        self.comm.send(
-            data=error,
-            metadata=None,
-            buffers=None,
+        self._send(error, None, None, parent)
+
+    def _send(
+        self,
+        data: JsonRecord,
+        metadata: Optional[JsonRecord],
+        buffers: Optional[List[memoryview]],
+        parent: Optional[JsonRecord],
+    ) -> None:
+        # The frontend matches replies to requests by their parent
+        # message, which the kernel comm takes to be the message being
+        # handled. A reply to another request is published directly
+        kernel = getattr(self.comm, "kernel", None)
+        if parent is None or kernel is None:
+            self.comm.send(
+                data=data,
+                metadata=metadata,
+                buffers=buffers,
+            )
+            return
+
+        kernel.session.send(
+            kernel.iopub_socket,
+            "comm_msg",
+            dict(data=data, comm_id=self.comm_id),
+            metadata={} if metadata is None else metadata,
+            parent=parent,
+            ident=self.comm.topic,
+            buffers=buffers,
         )
 
     def close(self) -> None:
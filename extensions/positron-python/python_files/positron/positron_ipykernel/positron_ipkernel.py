@@ -282,6 +282,13 @@ class PositronShell(ZMQInteractiveShell):
         except Exception:
             logger.warning("Failed to snapshot user namespace", exc_info=True)
 
+        # Data explorers stop prefetching values and computing profiles of
+        # tables that the user's code may modify
+        try:
+            self.kernel.data_explorer_service.pause_background_work()
+        except Exception:
+            logger.warning("Failed to pause data explorer background work", exc_info=True)
+
     def _handle_post_run_cell(self, info: ExecutionInfo) -> None:
         """
         After execution, sends an update message to the client to summarize
@@ -299,6 +306,11 @@ class PositronShell(ZMQInteractiveShell):
         except Exception:
             logger.exception("Error polling variables")
 
+        try:
+            self.kernel.data_explorer_service.resume_background_work()
+        except Exception:
+            logger.exception("Error resuming data explorer background work")
+
     async def _stop(self):
         # Initiate the kernel shutdown sequence.
         await self.kernel.do_shutdown(restart=False)
@@ -0,0 +1,469 @@
+#
+# Copyright (C) 2024 Posit Software, PBC. All rights reserved.
+# Licensed under the Elastic License 2.0. See LICENSE.txt for license information.
+#
+
+"""
+Micro-benchmarks for the data explorer backend. These are not run as
+part of the test suite. Run them with:
+
+    python -m positron_ipykernel.tests.bench_data_explorer
+"""
+
+import argparse
+import json
+import timeit
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from .. import data_explorer
+from ..data_explorer import PandasView, PolarsView, _encode_utf8_columns, _hll_num_unique
+from ..data_explorer_comm import (
+    ColumnProfileRequest,
+    ColumnSortKey,
+    FormatOptions,
+    GetDataValuesParams,
+    GetDataValuesRequest,
+    RowFilter,
+)
+from ..utils import guid
+
+FORMAT_OPTIONS = FormatOptions(
+    large_num_digits=2,
+    small_num_digits=4,
+    max_integral_digits=7,
+    thousands_sep=",",
+)
+
+
+def _wide_frames(num_rows: int, num_columns: int):
+    rng = np.random.default_rng(12345)
+    floats = rng.standard_normal((num_rows, num_columns)) * 1000
+    floats[::7, ::3] = np.nan
+    ints = rng.integers(-(10**9), 10**9, (num_rows, num_columns))
+    return {
+        "float64": pd.DataFrame(floats),
+        "int64": pd.DataFrame(ints),
+    }
+
+
+def _data_values_request(row_start: int, num_rows: int, num_columns: int):
+    return GetDataValuesRequest(
+        params=GetDataValuesParams(
+            row_start_index=row_start,
+            num_rows=num_rows,
+            column_indices=list(range(num_columns)),
+            format_options=FORMAT_OPTIONS,
+        ),
+        method="get_data_values",  # type: ignore
+    )
+
+
+def _time_get_data_values(table, num_rows: int, repeat: int, cached: bool = False) -> float:
+    view = PandasView("bench", table, None, None)
+    request = _data_values_request(0, num_rows, table.shape[1])
+
+    def run():
+        if not cached:
+            view._viewport_cache.clear()
+        view.get_data_values(request)
+
+    run()
+    return min(timeit.repeat(run, number=1, repeat=repeat))
+
+
+def bench_get_data_values(num_rows: int, num_columns: int, repeat: int):
+    """
+    Compare get_data_values on wide numeric frames against the same
+    data with object dtype, which is formatted one value at a time.
+    """
+    print(f"get_data_values: {num_rows} rows x {num_columns} columns (best of {repeat})")
+    for name, table in _wide_frames(num_rows, num_columns).items():
+        per_value = _time_get_data_values(table.astype(object), num_rows, repeat)
+        by_column = _time_get_data_values(table, num_rows, repeat)
+        print(
+            f"  {name:>8}: per-value {per_value * 1000:8.1f} ms, "
+            f"by column {by_column * 1000:8.1f} ms, "
+            f"speedup {per_value / by_column:5.1f}x"
+        )
+
+
+def bench_viewport_cache(num_rows: int, num_columns: int, repeat: int):
+    """
+    Compare get_data_values for a viewport that has already been
+    formatted against formatting it from scratch.
+    """
+    print(f"viewport cache: {num_rows} rows x {num_columns} columns (best of {repeat})")
+    for name, table in _wide_frames(num_rows, num_columns).items():
+        uncached = _time_get_data_values(table, num_rows, repeat)
+        cached = _time_get_data_values(table, num_rows, repeat, cached=True)
+        print(
+            f"  {name:>8}: uncached {uncached * 1000:8.1f} ms, "
+            f"cached {cached * 1000:8.1f} ms, "
+            f"speedup {uncached / cached:5.1f}x"
+        )
+
+
+def _compare_filter(table, column_index: int, op: str, value) -> RowFilter:
+    view = PandasView("bench", table, None, None)
+    return RowFilter.parse_obj(
+        {
+            "filter_id": guid(),
+            "filter_type": "compare",
+            "column_schema": view._get_single_column_schema(column_index).dict(),
+            "condition": "and",
+            "compare_params": {"op": op, "value": str(value)},
+        }
+    )
+
+
+def bench_incremental_filters(num_rows: int, repeat: int):
+    """
+    Compare adding a filter to an existing filter set against
+    evaluating every filter for all rows and combining the masks.
+    """
+    print(f"add filter: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    table = pd.DataFrame(
+        {
+            "a": rng.integers(0, 100, num_rows),
+            "b": rng.choice(["foo", "bar", "baz", "qux"], num_rows),
+        }
+    )
+    f1 = _compare_filter(table, 0, "<", 10)
+    f2 = _compare_filter(table, 1, "=", "foo")
+
+    def time_filters(full_evaluation: bool):
+        view = PandasView("bench", table, None, None)
+        # The column schemas have been computed before the UI can
+        # create any filters
+        for i in range(table.shape[1]):
+            view._get_single_column_schema(i)
+        view._set_row_filters([f1])
+        start = timeit.default_timer()
+        if full_evaluation:
+            (view._eval_filter(f1) & view._eval_filter(f2)).nonzero()
+        else:
+            view._set_row_filters([f1, f2])
+        return timeit.default_timer() - start
+
+    full = min(time_filters(True) for _ in range(repeat))
+    incremental = min(time_filters(False) for _ in range(repeat))
+    print(
+        f"  full evaluation {full * 1000:8.1f} ms, "
+        f"incremental {incremental * 1000:8.1f} ms, "
+        f"speedup {full / incremental:5.1f}x"
+    )
+
+
+def bench_dictionary_filters(num_rows: int, repeat: int):
+    """
+    Compare evaluating a search filter on a string column with few
+    distinct values row by row against evaluating it for the distinct
+    values, including and excluding the factorization of the column.
+    """
+    print(f"search filter: {num_rows} rows, 1000 distinct values (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    categories = np.array([f"category_{i}" for i in range(1000)], dtype=object)
+    table = pd.DataFrame({"a": categories[rng.integers(0, len(categories), num_rows)]})
+    view = PandasView("bench", table, None, None)
+    filt = RowFilter.parse_obj(
+        {
+            "filter_id": guid(),
+            "filter_type": "search",
+            "column_schema": view._get_single_column_schema(0).dict(),
+            "condition": "and",
+            "search_params": {"search_type": "contains", "term": "_99", "case_sensitive": False},
+        }
+    )
+
+    def time_filter(encoded: bool, cached: bool):
+        view = PandasView("bench", table, None, None)
+        view._get_single_column_schema(0)
+        dictionary_filters = data_explorer._DICTIONARY_FILTERS
+        if not encoded:
+            data_explorer._DICTIONARY_FILTERS = set()
+        try:
+            if cached:
+                view._eval_filter(filt)
+            start = timeit.default_timer()
+            view._eval_filter(filt)
+            return timeit.default_timer() - start
+        finally:
+            data_explorer._DICTIONARY_FILTERS = dictionary_filters
+
+    rows = min(time_filter(False, False) for _ in range(repeat))
+    encoding = min(time_filter(True, False) for _ in range(repeat))
+    encoded = min(time_filter(True, True) for _ in range(repeat))
+    print(
+        f"  row by row {rows * 1000:8.1f} ms, "
+        f"encoding {encoding * 1000:8.1f} ms, "
+        f"encoded {encoded * 1000:8.1f} ms, "
+        f"speedup {rows / encoded:5.1f}x"
+    )
+
+
+def bench_lazy_sort(num_rows: int, repeat: int):
+    """
+    Compare the time to the first screen of a sorted table for a full
+    sort and a lazy sort.
+    """
+    print(f"sort, first screen: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    table = pd.DataFrame({"a": rng.standard_normal(num_rows)})
+    request = _data_values_request(0, 100, 1)
+    sort_keys = [ColumnSortKey(column_index=0, ascending=True)]
+
+    def time_first_screen(lazy: bool):
+        view = PandasView("bench", table, None, None)
+        view.BACKGROUND_SORT = False
+        if not lazy:
+            view.LAZY_SORT_MIN_ROWS = num_rows + 1
+        start = timeit.default_timer()
+        view._set_sort_columns(sort_keys)
+        view.get_data_values(request)
+        return timeit.default_timer() - start
+
+    full = min(time_first_screen(False) for _ in range(repeat))
+    lazy = min(time_first_screen(True) for _ in range(repeat))
+    print(
+        f"  full sort {full * 1000:8.1f} ms, "
+        f"lazy sort {lazy * 1000:8.1f} ms, "
+        f"speedup {full / lazy:5.1f}x"
+    )
+
+
+def bench_sort_after_filter(num_rows: int, repeat: int):
+    """
+    Compare changing the filters of a sorted table with and without
+    the cached sort order of the table.
+    """
+    print(f"filter sorted table: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    table = pd.DataFrame(
+        {
+            "a": rng.standard_normal(num_rows),
+            "b": rng.integers(0, 100, num_rows),
+        }
+    )
+    filters = [_compare_filter(table, 1, "<", 50)]
+    sort_keys = [ColumnSortKey(column_index=0, ascending=True)]
+
+    def time_filter(cached: bool):
+        view = PandasView("bench", table, None, None)
+        view.LAZY_SORT_MIN_ROWS = num_rows + 1
+        view._set_sort_columns(sort_keys)
+        if not cached:
+            view._sort_cache.clear()
+        start = timeit.default_timer()
+        view._set_row_filters(filters)
+        return timeit.default_timer() - start
+
+    uncached = min(time_filter(False) for _ in range(repeat))
+    cached = min(time_filter(True) for _ in range(repeat))
+    print(
+        f"  sort again {uncached * 1000:8.1f} ms, "
+        f"cached order {cached * 1000:8.1f} ms, "
+        f"speedup {uncached / cached:5.1f}x"
+    )
+
+
+def bench_summary_stats(num_rows: int, repeat: int):
+    """
+    Compare the summary stats of a filtered numeric column computed
+    with separate pandas reductions and with the fused reduction.
+    """
+    print(f"numeric summary stats: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    floats = rng.standard_normal(num_rows)
+    floats[::10] = np.nan
+    table = pd.DataFrame({"a": floats, "b": rng.integers(0, 100, num_rows)})
+
+    view = PandasView("bench", table, None, None)
+    view._set_row_filters([_compare_filter(table, 1, "<", 50)])
+
+    def separate():
+        view._summarize_number(view._get_column(0), FORMAT_OPTIONS)
+
+    def fused():
+        view._summary_cache.clear()
+        view._summarize_numbers([0], FORMAT_OPTIONS)
+
+    separate_time = min(timeit.repeat(separate, number=1, repeat=repeat))
+    fused_time = min(timeit.repeat(fused, number=1, repeat=repeat))
+    print(
+        f"  separate {separate_time * 1000:8.1f} ms, "
+        f"fused {fused_time * 1000:8.1f} ms, "
+        f"speedup {separate_time / fused_time:5.1f}x"
+    )
+
+
+def bench_num_unique(num_rows: int, repeat: int):
+    """
+    Compare the exact number of distinct values of a high-cardinality
+    string column with the HyperLogLog estimate.
+    """
+    print(f"string num_unique: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    col = pd.Series(rng.integers(0, num_rows, num_rows).astype(str).astype(object))
+
+    exact_time = min(timeit.repeat(col.nunique, number=1, repeat=repeat))
+    hll_time = min(timeit.repeat(lambda: _hll_num_unique(col), number=1, repeat=repeat))
+    print(
+        f"  exact {exact_time * 1000:8.1f} ms, "
+        f"HyperLogLog {hll_time * 1000:8.1f} ms, "
+        f"speedup {exact_time / hll_time:5.1f}x"
+    )
+
+
+def bench_quantiles(num_rows: int, repeat: int):
+    """
+    Compare the summary stats of a numeric column with exact quantiles
+    and with quantiles estimated from a sketch, and the summary stats
+    of the column when they have been cached.
+    """
+    print(f"numeric quantiles: {num_rows} rows (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    table = pd.DataFrame({"a": rng.standard_normal(num_rows)})
+    quantiles = [1, 5, 25, 50, 75, 95, 99]
+
+    def time_summary(exact: bool, cached: bool = False):
+        view = PandasView("bench", table, None, None)
+        view.EXACT_QUANTILES = exact
+        if not cached:
+            view.SUMMARY_CACHE_MAX_BYTES = 0
+        view._summarize_numbers([0], FORMAT_OPTIONS, quantiles)
+        if not cached:
+            view._summary_cache.clear()
+        start = timeit.default_timer()
+        view._summarize_numbers([0], FORMAT_OPTIONS, quantiles)
+        return timeit.default_timer() - start
+
+    exact = min(time_summary(True) for _ in range(repeat))
+    sketch = min(time_summary(False) for _ in range(repeat))
+    cached = min(time_summary(False, cached=True) for _ in range(repeat))
+    print(
+        f"  exact {exact * 1000:8.1f} ms, "
+        f"sketch {sketch * 1000:8.1f} ms, "
+        f"cached {cached * 1000:8.1f} ms"
+    )
+
+
+def bench_utf8_encoding(num_rows: int, num_columns: int, repeat: int):
+    """
+    Compare encoding the formatted values of a viewport as JSON, like
+    the Jupyter session does, against packing them into the buffers of
+    the utf8 encoding.
+    """
+    print(f"data values encoding: {num_rows} rows x {num_columns} columns (best of {repeat})")
+    for name, table in _wide_frames(num_rows, num_columns).items():
+        view = PandasView("bench", table, None, None)
+        columns = view.get_data_values(_data_values_request(0, num_rows, num_columns))["columns"]
+
+        def to_json():
+            json.dumps({"columns": columns}).encode("utf-8")
+
+        def to_buffers():
+            _encode_utf8_columns(columns)
+
+        json_time = min(timeit.repeat(to_json, number=1, repeat=repeat))
+        utf8_time = min(timeit.repeat(to_buffers, number=1, repeat=repeat))
+        print(
+            f"  {name:>8}: JSON {json_time * 1000:8.1f} ms, "
+            f"utf8 {utf8_time * 1000:8.1f} ms, "
+            f"speedup {json_time / utf8_time:5.1f}x"
+        )
+
+
+def bench_polars_profiles(num_rows: int, num_columns: int, repeat: int):
+    """
+    Compare the null counts and summary stats of the columns of a
+    polars table computed with one query per profile and with a single
+    query for all of them.
+    """
+    print(f"polars profiles: {num_rows} rows, {num_columns} columns (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    table = pl.DataFrame(
+        {f"x{i}": rng.standard_normal(num_rows) for i in range(num_columns)}
+    ).with_columns(pl.col("x0").fill_nan(None))
+
+    view = PolarsView("bench", table, None, None)
+    profiles = [
+        ColumnProfileRequest(column_index=i, profile_type=profile_type)
+        for i in range(num_columns)
+        for profile_type in ["null_count", "summary_stats"]
+    ]
+
+    def each_profile():
+        for req in profiles:
+            view._get_column_profiles([req], FORMAT_OPTIONS)
+
+    def one_query():
+        view._get_column_profiles(profiles, FORMAT_OPTIONS)
+
+    each_profile_time = min(timeit.repeat(each_profile, number=1, repeat=repeat))
+    one_query_time = min(timeit.repeat(one_query, number=1, repeat=repeat))
+    print(
+        f"  each profile {each_profile_time * 1000:8.1f} ms, "
+        f"one query {one_query_time * 1000:8.1f} ms, "
+        f"speedup {each_profile_time / one_query_time:5.1f}x"
+    )
+
+
+def bench_search_schema(num_columns: int, repeat: int):
+    """
+    Compare typing a schema search term one character at a time in a
+    wide table against testing every column name for each keystroke.
+    """
+    print(f"search schema: {num_columns} columns (best of {repeat})")
+    rng = np.random.default_rng(12345)
+    columns = [f"Gene_{i}_ENSG{x:08d}" for i, x in enumerate(rng.integers(10**8, size=num_columns))]
+    table = pd.DataFrame(np.zeros((1, num_columns)), columns=pd.Index(columns))
+    term = "gene_123"
+
+    def each_column():
+        for end in range(1, len(term) + 1):
+            [i for i, name in enumerate(table.columns) if term[:end] in str(name).lower()]
+
+    def indexed():
+        view = PandasView("bench", table, None, None)
+        for end in range(1, len(term) + 1):
+            view._search_schema(term[:end], 0, 100)
+
+    each_column_time = min(timeit.repeat(each_column, number=1, repeat=repeat))
+    indexed_time = min(timeit.repeat(indexed, number=1, repeat=repeat))
+    print(
+        f"  each column {each_column_time * 1000:8.1f} ms, "
+        f"indexed {indexed_time * 1000:8.1f} ms, "
+        f"speedup {each_column_time / indexed_time:5.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--columns", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter-rows", type=int, default=1_000_000)
+    parser.add_argument("--sort-rows", type=int, default=10_000_000)
+    parser.add_argument("--search-columns", type=int, default=300_000)
+    args = parser.parse_args()
+
+    bench_get_data_values(args.rows, args.columns, args.repeat)
+    bench_viewport_cache(args.rows, args.columns, args.repeat)
+    bench_utf8_encoding(args.rows, args.columns, args.repeat)
+    bench_incremental_filters(args.filter_rows, args.repeat)
+    bench_dictionary_filters(args.filter_rows, args.repeat)
+    bench_lazy_sort(args.sort_rows, args.repeat)
+    bench_sort_after_filter(args.filter_rows, args.repeat)
+    bench_summary_stats(args.sort_rows, args.repeat)
+    bench_num_unique(args.sort_rows, args.repeat)
+    bench_quantiles(args.sort_rows, args.repeat)
+    bench_polars_profiles(args.filter_rows, args.columns // 5, args.repeat)
+    bench_search_schema(args.search_columns, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ import pytest
 import sqlalchemy
 from positron_ipykernel.access_keys import encode_access_key
 from positron_ipykernel.connections import ConnectionsService
+from positron_ipykernel.data_explorer import SQLView
 
 from .conftest import DummyComm, PositronShell
 from .utils import json_rpc_request, json_rpc_response
@@ -26,7 +27,8 @@ def add_default_data(execute):
 
 def get_sqlalchemy_sqlite_connection():
     con = sqlalchemy.create_engine("sqlite://")
-    add_default_data(lambda sql: con.connect().execute(sqlalchemy.text(sql)))
+    with con.begin() as conn:
+        add_default_data(lambda sql: conn.execute(sqlalchemy.text(sql)))
     return con
 
 
@@ -143,6 +145,13 @@ class TestSQLiteConnectionsService:
             comm_id=comm.comm_id,
         )
         comm.handle_msg(msg)
+
+        # The table is browsed with queries run in the database
+        (view,) = service._kernel.data_explorer_service.table_views.values()
+        assert isinstance(view, SQLView)
+        assert view.table.shape == (3, 3)
+        assert view._fetch_rows(1, 2) == [("The Godfather", 1972, 9.2)]
+
         # cleanup the data_explorer state, so we don't break its own tests
         service._kernel.data_explorer_service.shutdown()
         result = comm.messages[0]["data"]["result"]
@@ -5,8 +5,11 @@
 
 # ruff: noqa: E712
 
+import asyncio
 import math
-from datetime import datetime
+import os
+import sqlite3
+from datetime import date, datetime
 from decimal import Decimal
 from io import StringIO
 from typing import Any, Dict, List, Optional, Type, cast
@@ -14,10 +17,15 @@ from typing import Any, Dict, List, Optional, Type, cast
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 
+from .. import data_explorer
 from .._vendor.pydantic import BaseModel
 from ..access_keys import encode_access_key
+from ..connections import SQLite3Connection
+from ..connections_comm import ObjectSchema
 from ..data_explorer import (
     _VALUE_INF,
     _VALUE_NA,
@@ -29,7 +37,12 @@ from ..data_explorer import (
     COMPARE_OPS,
     DataExplorerService,
     PandasView,
+    _ColumnNameIndex,
     _get_float_formatter,
+    _QuantileSketch,
+    _RowBitmap,
+    _hll_num_unique,
+    _summarize_numeric_arrays,
 )
 from ..data_explorer_comm import (
     ColumnDisplayType,
@@ -43,6 +56,7 @@ from ..data_explorer_comm import (
     RowFilterTypeSupportStatus,
     SupportStatus,
 )
+from ..positron_comm import JsonRpcErrorCode
 from ..utils import guid
 from .conftest import DummyComm, PositronShell
 from .test_variables import BIG_ARRAY_LENGTH
@@ -290,6 +304,7 @@ class DataExplorerFixture:
         self.shell = shell
         self.de_service = de_service
         self.variables_comm = variables_comm
+        self._file_comm_ids = {}
         self.register_table("simple", SIMPLE_PANDAS_DF)
         self._table_views = {}
 
@@ -318,26 +333,43 @@ class DataExplorerFixture:
             variable_path=[encode_access_key(table_name)],
         )
 
+    def register_file(self, table_name: str, path):
+        comm_id = guid()
+        self.de_service.register_file(str(path), table_name, comm_id=comm_id)
+        self._file_comm_ids[table_name] = comm_id
+
     def get_schema_for(self, df):
         comm_id = guid()
         self.register_table(comm_id, df)
         return self.get_schema(comm_id)
 
-    def do_json_rpc(self, table_name, method, **params):
+    def get_comm_id(self, table_name):
+        if table_name in self._file_comm_ids:
+            return self._file_comm_ids[table_name]
+
         paths = self.de_service.get_paths_for_variable(table_name)
         assert len(paths) == 1
 
-        comm_id = list(self.de_service.path_to_comm_ids[paths[0]])[0]
+        return list(self.de_service.path_to_comm_ids[paths[0]])[0]
+
+    def get_table_view(self, table_name):
+        return self.de_service.table_views[self.get_comm_id(table_name)]
+
+    def do_json_rpc(self, table_name, method, **params):
+        comm_id = self.get_comm_id(table_name)
 
         request = json_rpc_request(
             method,
             params=params,
             comm_id=comm_id,
         )
-        self.de_service.comms[comm_id].comm.handle_msg(request)
-        response = get_last_message(self.de_service, comm_id)
-        data = response["data"]
-        return data["result"]
+        comm = cast(DummyComm, self.de_service.comms[comm_id].comm)
+        message_count = len(comm.messages)
+        comm.handle_msg(request)
+
+        # Events from background work may be sent after the reply
+        replies = [x for x in comm.messages[message_count:] if "result" in x["data"]]
+        return replies[0]["data"]["result"]
 
     def get_schema(self, table_name, start_index=None, num_columns=None):
         if start_index is None:
@@ -366,6 +398,9 @@ class DataExplorerFixture:
     def get_state(self, table_name):
         return self.do_json_rpc(table_name, "get_state")
 
+    def get_memory_usage(self, table_name):
+        return self.do_json_rpc(table_name, "get_memory_usage")
+
     def get_data_values(self, table_name, format_options=DEFAULT_FORMAT, **params):
         return self.do_json_rpc(
             table_name,
@@ -389,12 +424,38 @@ class DataExplorerFixture:
         return self.do_json_rpc(table_name, "set_sort_columns", sort_keys=sort_keys)
 
     def get_column_profiles(self, table_name, profiles, format_options=DEFAULT_FORMAT):
-        return self.do_json_rpc(
+        callback_id = guid()
+        result = self.do_json_rpc(
             table_name,
             "get_column_profiles",
+            callback_id=callback_id,
             profiles=profiles,
             format_options=format_options,
         )
+        assert result == []
+        return self.get_returned_column_profiles(table_name, callback_id, len(profiles))
+
+    def get_returned_column_profiles(self, table_name, callback_id, num_profiles):
+        # Wait for the profile workers, then collect the profiles from
+        # the return_column_profiles events
+        comm_id = self.get_comm_id(table_name)
+        for job in self.de_service._profile_jobs.get(comm_id, []):
+            job.wait()
+
+        comm = cast(DummyComm, self.de_service.comms[comm_id].comm)
+        results = [None] * num_profiles
+        for msg in comm.messages:
+            data = msg["data"]
+            if data.get("method") != "return_column_profiles":
+                continue
+            params = data["params"]
+            if params["callback_id"] != callback_id:
+                continue
+            for i, profile in zip(params["profile_indices"], params["profiles"]):
+                assert results[i] is None
+                results[i] = profile
+        assert all(x is not None for x in results)
+        return results
 
     def check_filter_case(self, table, filter_set, expected_table):
         table_id = guid()
@@ -545,6 +606,12 @@ def test_pandas_supported_features(dxf: DataExplorerFixture):
         ColumnProfileTypeSupportStatus(
             profile_type="summary_stats", support_status=SupportStatus.Experimental
         ),
+        ColumnProfileTypeSupportStatus(
+            profile_type="frequency_table", support_status=SupportStatus.Experimental
+        ),
+        ColumnProfileTypeSupportStatus(
+            profile_type="histogram", support_status=SupportStatus.Experimental
+        ),
     ]
     for tp in profile_types:
         assert tp in column_profiles["supported_types"]
@@ -740,6 +807,75 @@ def test_pandas_search_schema(dxf: DataExplorerFixture):
         assert matches == ex_matches
 
 
+def test_column_name_index():
+    rng = np.random.default_rng(12345)
+    names = [f"Gene_{i}_{rng.integers(10**6)}" for i in range(2000)]
+    names += [1234, ("a", "B"), "", "x\0y", "GENE_GENE"]
+    index = _ColumnNameIndex(names)
+    lower = [str(x).lower() for x in names]
+
+    def _expected(term):
+        return [i for i, name in enumerate(lower) if term in name]
+
+    # Selective terms, terms matching most names, and the empty term
+    for term in ["gene_12", "_99", "1234", "('a', 'b')", "gene", "_", "1", "", "x\0y", "zzz"]:
+        assert index.search(term).tolist() == _expected(term)
+
+    # The search can be restricted to some names
+    candidates = index.search("gene_1")
+    assert index.search("gene_12", candidates).tolist() == _expected("gene_12")
+    assert index.search("zzz", candidates).tolist() == []
+
+
+def test_pandas_search_schema_incremental(dxf: DataExplorerFixture, monkeypatch):
+    column_names = [f"col_{i}" for i in range(5000)]
+    df = pd.DataFrame(np.zeros((2, len(column_names))), columns=pd.Index(column_names))
+    dxf.register_table("df", df)
+
+    view = dxf.get_table_view("df")
+    searched_columns = []
+    search = _ColumnNameIndex.search
+    get_column_schema = view._get_single_column_schema
+    column_schemas = []
+
+    def _get_column_schema(column_index):
+        column_schemas.append(column_index)
+        return get_column_schema(column_index)
+
+    monkeypatch.setattr(view, "_get_single_column_schema", _get_column_schema)
+
+    def _search(self, term, candidates=None):
+        result = search(self, term, candidates)
+        searched_columns.append(len(self.names) if candidates is None else len(candidates))
+        return result
+
+    monkeypatch.setattr(_ColumnNameIndex, "search", _search)
+
+    def _check(search_term, num_searched):
+        searched_columns.clear()
+        result = dxf.search_schema("df", search_term, 0, 10)
+        expected = [i for i, name in enumerate(column_names) if search_term.lower() in name]
+        assert result["total_num_matches"] == len(expected)
+        assert [x["column_index"] for x in result["matches"]["columns"]] == expected[:10]
+        assert searched_columns == num_searched
+
+    # Typing only searches the columns matching the last term
+    _check("col_4", [5000])
+    _check("col_49", [1111])
+    _check("COL_499", [111])
+
+    # Deleting characters and searching again uses previous results
+    _check("col_49", [])
+    _check("col_4", [])
+
+    # Unrelated terms search all the columns
+    _check("_12", [5000])
+
+    # Only the requested page of results gets column schemas
+    assert len(view._search_cache) == 4
+    assert len(column_schemas) == 60
+
+
 def test_pandas_get_data_values(dxf: DataExplorerFixture):
     result = dxf.get_data_values(
         "simple",
@@ -784,6 +920,153 @@ def test_pandas_get_data_values(dxf: DataExplorerFixture):
     assert response["columns"] == expected_columns[2:]
 
 
+def _decode_utf8_columns(result, buffers, num_columns):
+    offsets = np.frombuffer(buffers[0], dtype="<u4")
+    data = bytes(buffers[1])
+    special_codes = np.frombuffer(buffers[2], dtype=np.uint8)
+
+    values = [data[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
+    for i, code in enumerate(special_codes):
+        if code != 255:
+            values[i] = int(code)
+
+    num_rows = len(values) // num_columns if num_columns else 0
+    return [values[i * num_rows : (i + 1) * num_rows] for i in range(num_columns)]
+
+
+@pytest.mark.parametrize("table_name", ["simple", "df"])
+def test_pandas_get_data_values_utf8(dxf: DataExplorerFixture, table_name):
+    # Values with NUL characters take the slow path
+    dxf.register_table("df", pd.DataFrame({"a": ["α", "", "日\0本語"], "b": [1.5, 2.5, 3.5]}))
+    comm = cast(DummyComm, dxf.de_service.comms[dxf.get_comm_id(table_name)].comm)
+
+    def _get(num_rows, column_indices, encoding=None):
+        params = {}
+        if encoding is not None:
+            params["encoding"] = encoding
+        result = dxf.get_data_values(
+            table_name,
+            row_start_index=0,
+            num_rows=num_rows,
+            column_indices=column_indices,
+            **params,
+        )
+        return result, comm.messages[-1]["buffers"]
+
+    for num_rows, column_indices in [(20, list(range(8))), (2, [1]), (0, [0, 1])]:
+        expected, buffers = _get(num_rows, column_indices)
+        assert buffers is None
+        assert "encoding" not in expected
+
+        # The values are in the buffers, the row labels are not
+        result, buffers = _get(num_rows, column_indices, encoding="utf8")
+        assert result["encoding"] == "utf8"
+        assert result["columns"] == []
+        assert result["row_labels"] == expected["row_labels"]
+        assert len(buffers) == 3
+        columns = _decode_utf8_columns(result, buffers, len(expected["columns"]))
+        assert columns == expected["columns"]
+
+    # The values of a column without special values have no codes
+    _get(3, [1], encoding="utf8")
+    if table_name == "df":
+        assert len(comm.messages[-1]["buffers"][2]) == 0
+
+    # JSON is the default and the fallback
+    result, buffers = _get(3, [0], encoding="json")
+    assert buffers is None
+    assert "encoding" not in result
+
+
+def test_pandas_get_data_values_cache(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 7, "c": np.arange(1000) * 2})
+    dxf.register_table("df", df)
+
+    view = dxf.get_table_view("df")
+    cache = view._viewport_cache
+    block_size = view.VIEWPORT_BLOCK_SIZE
+
+    def _check_values(table, row_start, num_rows, column_indices=(0, 1)):
+        result = dxf.get_data_values(
+            "df",
+            row_start_index=row_start,
+            num_rows=num_rows,
+            column_indices=list(column_indices),
+        )
+        expected = table.iloc[row_start : row_start + num_rows, list(column_indices)]
+        assert result["columns"] == [[str(x) for x in expected[c]] for c in expected.columns]
+        assert result["row_labels"] == [[str(x) for x in expected.index]]
+
+    _check_values(df, 0, 100)
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # Scrolling back to rows that were already seen hits the cache
+    _check_values(df, 10, 50)
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    # A partial overlap is assembled from the cached blocks and only
+    # the missing blocks are formatted
+    _check_values(df, block_size - 10, 50)
+    assert (cache.hits, cache.misses) == (6, 6)
+
+    # Cached blocks between missing blocks are not formatted again
+    formatted = []
+    format_column_range = view._format_column_range
+
+    def _format_column_range(column_index, start, end, *args):
+        formatted.append((column_index, start, end))
+        return format_column_range(column_index, start, end, *args)
+
+    view._format_column_range = _format_column_range
+    _check_values(df, 3 * block_size, 10, [0])
+    del formatted[:]
+    _check_values(df, 0, 5 * block_size, [0])
+    assert formatted == [(0, 2 * block_size, 3 * block_size), (0, 4 * block_size, 5 * block_size)]
+    del view._format_column_range
+
+    # Beyond the end of the table
+    _check_values(df, 990, 100)
+    _check_values(df, 1000, 100)
+
+    # Filtering and sorting change the view and so invalidate the
+    # cached values
+    dxf.set_sort_columns("df", [{"column_index": 1, "ascending": True}])
+    _check_values(df.sort_values("b", kind="mergesort"), 0, 100)
+
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", [_compare_filter(schema[1], ">", "3")])
+    _check_values(df[df["b"] > 3].sort_values("b", kind="mergesort"), 0, 200)
+
+    dxf.set_row_filters("df", [])
+    dxf.set_sort_columns("df", [])
+    _check_values(df, 0, 100)
+
+    # Formatting options are part of the cache key
+    result = dxf.get_data_values(
+        "df",
+        row_start_index=0,
+        num_rows=10,
+        column_indices=[0],
+        format_options=FormatOptions(
+            large_num_digits=2,
+            small_num_digits=4,
+            max_integral_digits=7,
+            thousands_sep="_",
+        ),
+    )
+    assert result["columns"] == [[str(x) for x in range(10)]]
+
+    # The cache evicts least recently used blocks to stay within its
+    # memory budget
+    block_nbytes = cache.nbytes // len(cache)
+    cache.max_bytes = 4 * block_nbytes
+    cache.clear()
+    _check_values(df, 0, 1000, column_indices=[0, 1, 2])
+    assert cache.nbytes <= cache.max_bytes
+    assert cache.evictions > 0
+    _check_values(df, 0, 1000, column_indices=[0, 1, 2])
+
+
 def test_pandas_float_formatting(dxf: DataExplorerFixture):
     df = pd.DataFrame(
         {
@@ -920,6 +1203,79 @@ def test_pandas_extension_dtypes(dxf: DataExplorerFixture):
     assert schema == _wrap_json(ColumnSchema, ex_schema)
 
 
+def test_pandas_format_values_by_dtype(dxf: DataExplorerFixture):
+    # Columns are formatted in bulk based on their dtype, which must
+    # give the same result as formatting the values one by one, which
+    # is what happens for object dtype
+    floats = np.array([0, -0.0, 1.5, 0.0001, 0.00001, 1234567.891, 1e7, np.nan, np.inf, -np.inf])
+    datetimes = pd.to_datetime(
+        [
+            "2024-01-04 18:49:27.126",
+            "2000-01-01 12:34:45",
+            "1969-12-31 23:59:59.999999999",
+            None,
+            "1969-12-31 23:59:59.000001",
+            "1700-06-01 00:00:00.5",
+            "2000-01-01",
+            "2000-01-01",
+            "2000-01-01",
+            "2000-01-01",
+        ],
+        format="ISO8601",
+    )
+    df = pd.DataFrame(
+        {
+            "float64": floats,
+            "float32": floats.astype("float32"),
+            "int64": np.arange(-5, 5) * 10**12,
+            "uint8": np.arange(10, dtype="uint8"),
+            "bool": np.arange(10) % 3 == 0,
+            "complex64": (floats + 1j).astype("complex64"),
+            "Int64": pd.array([1, None] * 5, dtype="Int64"),
+            "Float64": pd.array([1.5, None] * 5, dtype="Float64"),
+            "boolean": pd.array([True, None] * 5, dtype="boolean"),
+            "string": pd.array(["foo", None] * 5, dtype="string"),
+            "categorical": pd.Categorical(["a", None, "b", "a", "c"] * 2),
+            "datetime_ns": datetimes,
+            "datetime_ms": datetimes.astype("datetime64[ms]"),
+            "datetime_s": datetimes.astype("datetime64[s]"),
+            "datetime_tz": pd.date_range("1880-01-01", periods=10, freq="20YE", tz="US/Eastern"),
+            "timedelta": pd.to_timedelta([1, None] * 5, unit="s"),
+        }
+    )
+
+    dxf.register_table("df", df)
+    dxf.register_table("df_object", df.astype(object))
+
+    format_options = [
+        DEFAULT_FORMAT,
+        FormatOptions(
+            large_num_digits=3,
+            small_num_digits=2,
+            max_integral_digits=3,
+            thousands_sep="_",
+        ),
+        FormatOptions(large_num_digits=1, small_num_digits=6, max_integral_digits=10),
+    ]
+
+    for options in format_options:
+        result = dxf.get_data_values(
+            "df",
+            row_start_index=0,
+            num_rows=10,
+            column_indices=list(range(df.shape[1])),
+            format_options=options,
+        )
+        ex_result = dxf.get_data_values(
+            "df_object",
+            row_start_index=0,
+            num_rows=10,
+            column_indices=list(range(df.shape[1])),
+            format_options=options,
+        )
+        assert result == ex_result
+
+
 def test_pandas_leading_whitespace(dxf: DataExplorerFixture):
     # See GH#3138
     df = pd.DataFrame(
@@ -1075,6 +1431,65 @@ def test_pandas_filter_conditions(dxf: DataExplorerFixture):
     dxf.check_filter_case(df, filters, df[df["a"] >= 3])
 
 
+def test_pandas_filter_incremental(dxf: DataExplorerFixture):
+    # Changes to the filter set reuse the masks of filters that were
+    # already evaluated, and new filters are only evaluated for rows
+    # that can still change
+    df = pd.DataFrame({"a": np.arange(1000), "b": np.arange(1000) % 7, "c": np.arange(1000) % 5})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    view = dxf.get_table_view("df")
+
+    num_evaluated = []
+    eval_filter = view._eval_filter
+
+    def _eval_filter(filt, indices=None):
+        num_evaluated.append(len(df) if indices is None else len(indices))
+        return eval_filter(filt, indices)
+
+    view._eval_filter = _eval_filter
+
+    f1 = _compare_filter(schema[0], "<", 300)
+    f2 = _compare_filter(schema[1], "=", 3)
+    f3 = _compare_filter(schema[2], "=", 0, condition="or")
+
+    def _check(filters, expected_mask, expected_evaluated):
+        num_evaluated.clear()
+        result = dxf.set_row_filters("df", filters=filters)
+        assert result == FilterResult(selected_num_rows=int(expected_mask.sum()), had_errors=False)
+        if len(filters) > 0:
+            assert (view.filtered_indices == expected_mask.to_numpy().nonzero()[0]).all()
+        else:
+            assert view.filtered_indices is None
+        assert num_evaluated == expected_evaluated
+
+    m1 = df["a"] < 300
+    m2 = df["b"] == 3
+    m3 = df["c"] == 0
+
+    _check([f1], m1, [1000])
+
+    # Adding an AND filter only evaluates it for the selected rows
+    _check([f1, f2], m1 & m2, [300])
+
+    # An OR filter only evaluates the rows that are not selected
+    _check([f1, f2, f3], (m1 & m2) | m3, [1000 - 43])
+
+    # Removing a filter recombines the cached masks, evaluating the
+    # rows that were skipped before
+    _check([f1, f3], m1 | m3, [])
+    _check([f2], m2, [700])
+    _check([f2, f1], m2 & m1, [])
+
+    # Equivalent filters share cached masks
+    _check([_compare_filter(schema[0], "<", 300)], m1, [])
+
+    # The masks are stored bit-packed
+    assert view._filter_mask_cache.nbytes < 6 * 1000 // 8 + 10
+
+    _check([], pd.Series(True, index=df.index), [])
+
+
 def test_pandas_filter_compare(dxf: DataExplorerFixture):
     # Just use the 'a' column to smoke test comparison filters on
     # integers
@@ -1334,16 +1749,75 @@ def test_pandas_filter_search(dxf: DataExplorerFixture):
         )
 
 
+def test_pandas_filter_dictionary_encoded(dxf: DataExplorerFixture, monkeypatch):
+    import pyarrow as pa
+
+    values = ["foo1", "FOO2", None, "", "bar1", np.nan, "foo1", "baz"] * 5
+    df = pd.DataFrame(
+        {
+            "object": values,
+            "string": pd.Series(values, dtype="string"),
+            "category": pd.Series(values, dtype="category"),
+            "arrow": pd.Series(values, dtype=pd.ArrowDtype(pa.string())),
+        }
+    )
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+
+    def _filter_cases(column_schema):
+        return [
+            _search_filter(column_schema, "foo"),
+            _search_filter(column_schema, "foo", case_sensitive=True),
+            _search_filter(column_schema, "1", search_type="ends_with"),
+            _search_filter(column_schema, "f[o]+", search_type="regex_match"),
+            _search_filter(column_schema, "none"),
+            _compare_filter(column_schema, "=", "foo1"),
+            _compare_filter(column_schema, "!=", "foo1"),
+            _set_member_filter(column_schema, ["foo1", "baz"]),
+            _set_member_filter(column_schema, ["foo1", "baz"], inclusive=False),
+            _filter("is_empty", column_schema),
+            _filter("not_empty", column_schema),
+        ]
+
+    def _filtered_rows():
+        results = []
+        for column_schema in schema:
+            for filt in _filter_cases(column_schema):
+                result = dxf.set_row_filters("df", filters=[filt])
+                view = dxf.de_service.table_views[dxf.get_comm_id("df")]
+                results.append((result, view.filtered_indices))
+        return results
+
+    view = dxf.de_service.table_views[dxf.get_comm_id("df")]
+    results = _filtered_rows()
+
+    # Columns are factorized once, and categoricals not at all
+    assert len(view._dictionary_cache) == 3
+
+    # Same results as evaluating the filters for every row
+    dxf.register_table("df", df)
+    monkeypatch.setattr(data_explorer, "_DICTIONARY_FILTERS", set())
+    expected = _filtered_rows()
+    assert len(results) == len(expected)
+    for (result, indices), (ex_result, ex_indices) in zip(results, expected):
+        assert result == ex_result
+        np.testing.assert_array_equal(indices, ex_indices)
+
+
 def test_pandas_variable_updates(
     shell: PositronShell,
     de_service: DataExplorerService,
     variables_comm: DummyComm,
     dxf: DataExplorerFixture,
+    monkeypatch,
 ):
     x = pd.DataFrame({"a": [1, 0, 3, 4]})
     big_array = np.arange(BIG_ARRAY_LENGTH)
     big_x = pd.DataFrame({"a": big_array})
 
+    # big_x is hashed, so that it is known not to have changed
+    monkeypatch.setattr(PandasView, "FINGERPRINT_HASH_MAX_BYTES", big_array.nbytes)
+
     _assign_variables(
         shell,
         variables_comm,
@@ -1383,14 +1857,22 @@ def test_pandas_variable_updates(
     assert new_state["table_shape"]["num_columns"] == 1
     assert new_state["sort_keys"] == [ColumnSortKey(**k) for k in x_sort_keys]
 
-    # Execute code that triggers an update event for big_x because it's large
+    # Execute code that triggers an update event for big_x because
+    # it's large, but the table has not changed so no event is sent
+    (big_x_comm_id,) = de_service.path_to_comm_ids[(encode_access_key("big_x"),)]
+    big_x_messages = cast(DummyComm, de_service.comms[big_x_comm_id].comm).messages
+    num_messages = len(big_x_messages)
     shell.run_cell("None")
-    _check_update_variable(de_service, "big_x", update_type="schema")
+    assert len(big_x_messages) == num_messages
+
+    # Values modified in place with the same dtype are a data update
+    shell.run_cell("big_x.iloc[0, 0] = -1")
+    _check_update_variable(de_service, "big_x", update_type="data")
 
     # Update nested values in y and check for schema updates
     shell.run_cell(
-        """y = {'key1': y['key1'].iloc[:1]],
-    'key2': y['key2'].copy()}
+        """y = {'key1': y['key1'].iloc[:1],
+    'key2': y['key2'].iloc[::-1]}
     """
     )
     _check_update_variable(de_service, "y", update_type="schema")
@@ -1403,6 +1885,48 @@ def test_pandas_variable_updates(
     _check_update_variable(de_service, "y", update_type="schema")
 
 
+def test_pandas_variable_modified_in_place(
+    shell: PositronShell,
+    de_service: DataExplorerService,
+    variables_comm: DummyComm,
+    dxf: DataExplorerFixture,
+    monkeypatch,
+):
+    monkeypatch.setattr(PandasView, "FINGERPRINT_HASH_MAX_BYTES", 10_000)
+    df = pd.DataFrame({"a": np.arange(1000, dtype=float)})
+    strs = pd.DataFrame({"a": np.arange(1000).astype(str).astype(object)})
+    wide = pd.DataFrame({"a": np.arange(1000, dtype=float), "b": np.arange(1000, dtype=float)})
+    _assign_variables(shell, variables_comm, df=df, strs=strs, wide=wide)
+    for name in ["df", "strs", "wide"]:
+        _open_viewer(variables_comm, [name])
+
+    def _row_5(name):
+        result = dxf.get_data_values(name, row_start_index=5, num_rows=1, column_indices=[0])
+        return result["columns"][0][0]
+
+    assert _row_5("df") == "5.00"
+    assert _row_5("strs") == "5"
+
+    # A value of a NumPy column that a sample of the values would miss
+    shell.run_cell("df.iloc[5, 0] = -123.0")
+    _check_update_variable(de_service, "df", update_type="data")
+    assert _row_5("df") == "-123.00"
+
+    # Long object columns are not hashed, so they are taken to have
+    # changed even though they are in the same memory
+    shell.run_cell("strs.iloc[5, 0] = 'x'")
+    _check_update_variable(de_service, "strs", update_type="schema")
+    assert _row_5("strs") == "x"
+
+    # The columns of a table share the hashing budget, and the NumPy
+    # columns beyond it are taken to have changed, keeping their type
+    fingerprints = dxf.get_table_view("wide")._table_state.fingerprints
+    assert isinstance(fingerprints[0][3], int)
+    assert not isinstance(fingerprints[1][3], int)
+    shell.run_cell("wide.iloc[0, 0] = 1.0")
+    _check_update_variable(de_service, "wide", update_type="data")
+
+
 def test_pandas_schema_change_state_updates(dxf: DataExplorerFixture):
     df = pd.DataFrame(
         {
@@ -1620,6 +2144,194 @@ def test_pandas_set_sort_columns(dxf: DataExplorerFixture):
             dxf.check_sort_case(df, wrapped_keys, expected_filtered, filters=filters)
 
 
+def _sort_test_frame(num_rows):
+    rng = np.random.default_rng(12345)
+    floats = rng.integers(-5, 5, num_rows).astype(float)
+    floats[rng.integers(0, num_rows, num_rows // 10)] = np.nan
+    floats[rng.integers(0, num_rows, num_rows // 10)] = -0.0
+    dates = pd.Series(pd.date_range("2000-01-01", periods=7)).take(rng.integers(0, 7, num_rows))
+    dates.iloc[::11] = pd.NaT
+    strings = rng.choice(np.array(["foo", "bar", "baz", None], dtype=object), num_rows)
+    return pd.DataFrame(
+        {
+            "float": floats,
+            "int": rng.integers(-3, 3, num_rows),
+            "uint": rng.choice(np.array([0, 1, 2**63, 2**64 - 1], dtype=np.uint64), num_rows),
+            "bool": rng.integers(0, 2, num_rows).astype(bool),
+            "date": dates.to_numpy(),
+            "str": strings,
+            "category": pd.Categorical(strings, categories=["foo", "baz", "bar"]),
+            "Int64": pd.Series(rng.integers(0, 4, num_rows), dtype="Int64").where(floats > -4),
+        }
+    )
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_pandas_sort_matches_full_sort(dxf: DataExplorerFixture, lazy: bool):
+    # The sort order must match pandas's stable full sort exactly, for
+    # lazy sorts as well
+    from pandas.core.sorting import lexsort_indexer, nargsort
+
+    df = _sort_test_frame(5000)
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    view = dxf.get_table_view("df")
+
+    if lazy:
+        view.LAZY_SORT_MIN_ROWS = 0
+        view.BACKGROUND_SORT = False
+
+    cases = [[(i, ascending)] for i in range(df.shape[1]) for ascending in (True, False)]
+    cases += [
+        [(0, True), (1, False)],
+        [(5, False), (3, True), (0, False)],
+        [(6, True), (7, False), (4, True)],
+    ]
+
+    for filters in [[], [_compare_filter(schema[1], ">=", 0)]]:
+        dxf.set_row_filters("df", filters)
+        if filters:
+            rows = (df["int"] >= 0).to_numpy().nonzero()[0]
+        else:
+            rows = np.arange(len(df))
+        subset = df.take(rows)
+
+        for keys in cases:
+            dxf.set_sort_columns(
+                "df", [{"column_index": i, "ascending": ascending} for i, ascending in keys]
+            )
+            if len(keys) == 1:
+                i, ascending = keys[0]
+                indexer = nargsort(subset.iloc[:, i], kind="mergesort", ascending=ascending)
+            else:
+                indexer = lexsort_indexer(
+                    [subset.iloc[:, i] for i, _ in keys], [ascending for _, ascending in keys]
+                )
+            expected = rows.take(indexer)
+
+            order = view.view_indices
+            assert len(order) == len(expected)
+
+            # Scroll through part of the order before materializing
+            # all of it
+            for start, stop in [(0, 50), (40, 100), (1000, 1200), (len(expected) - 30, None)]:
+                assert (order[start:stop] == expected[start:stop]).all()
+            assert order[-1] == expected[-1]
+            assert (np.asarray(order) == expected).all()
+
+
+def test_pandas_lazy_sort(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": np.arange(100_000) % 1000, "b": np.arange(100_000)})
+    dxf.register_table("df", df)
+    view = dxf.get_table_view("df")
+    view.LAZY_SORT_MIN_ROWS = 0
+    view.BACKGROUND_SORT = False
+
+    dxf.set_sort_columns("df", [{"column_index": 0, "ascending": False}])
+    expected = df.sort_values("a", ascending=False, kind="mergesort")
+
+    # Only the prefix of the order that is requested gets sorted
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=20, column_indices=[1])
+    assert result["columns"] == [[str(x) for x in expected["b"][:20]]]
+    assert not view.view_indices.is_complete
+    assert len(view.view_indices._prefix) == view.view_indices.MIN_PREFIX_LENGTH
+
+    # Scrolling deeper sorts more, until the whole order is sorted
+    result = dxf.get_data_values("df", row_start_index=5000, num_rows=20, column_indices=[1])
+    assert result["columns"] == [[str(x) for x in expected["b"][5000:5020]]]
+    assert not view.view_indices.is_complete
+
+    result = dxf.get_data_values("df", row_start_index=50_000, num_rows=20, column_indices=[1])
+    assert result["columns"] == [[str(x) for x in expected["b"][50_000:50_020]]]
+    assert view.view_indices.is_complete
+
+    # The complete order is computed in the background
+    view.BACKGROUND_SORT = True
+    dxf.set_sort_columns("df", [{"column_index": 0, "ascending": True}])
+    order = view.view_indices
+    order._future.result()
+    assert (order[:10] == np.arange(0, 1000 * 10, 1000)).all()
+    assert order.is_complete
+
+
+def test_pandas_sort_order_cache(dxf: DataExplorerFixture):
+    # The sort order of all rows is cached and reused when the filters
+    # change, and factorized columns are reused by multi-key sorts
+    df = _sort_test_frame(2000)
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    view = dxf.get_table_view("df")
+    cache = view._sort_cache
+
+    def _cached_keys(kind):
+        # The cached keys of the current column versions, by column
+        # index
+        indices = {version: i for i, version in enumerate(view._column_versions)}
+        if kind == "codes":
+            return sorted(indices[key[1]] for key in cache._entries if key[0] == kind)
+        return sorted(
+            tuple((indices[version], ascending) for version, ascending in key[1])
+            for key in cache._entries
+            if key[0] == kind
+        )
+
+    def _check(sort_keys, filters, expected_df):
+        dxf.set_row_filters("df", filters)
+        dxf.set_sort_columns(
+            "df", [{"column_index": i, "ascending": ascending} for i, ascending in sort_keys]
+        )
+        expected = df.index.get_indexer(expected_df.index)
+        assert (np.asarray(view.view_indices) == expected).all()
+
+    int_filter = _compare_filter(schema[1], ">=", 0)
+    float_filter = _compare_filter(schema[0], "<", 2)
+    by_str = {"by": "str", "kind": "mergesort"}
+
+    _check([(5, True)], [], df.sort_values(**by_str))
+    assert _cached_keys("order") == [((5, True),)]
+    assert _cached_keys("codes") == [5]
+
+    hits = cache.hits
+    _check([(5, True)], [int_filter], df[df["int"] >= 0].sort_values(**by_str))
+    _check([(5, True)], [float_filter], df[df["float"] < 2].sort_values(**by_str))
+    # Both setting the filters and the sort keys look up the order
+    assert cache.hits == hits + 4
+    assert _cached_keys("order") == [((5, True),)]
+
+    by_multi = {"by": ["str", "float"], "ascending": [False, True], "kind": "mergesort"}
+    _check([(5, False), (0, True)], [int_filter], df[df["int"] >= 0].sort_values(**by_multi))
+    assert _cached_keys("codes") == [0, 5]
+    assert _cached_keys("order") == [((5, False), (0, True)), ((5, True),)]
+
+    # New column versions do not use the cached state
+    view._column_versions = [-1 - i for i in range(len(view._column_versions))]
+    _check([(5, True)], [], df.sort_values(**by_str))
+    assert ("order", ((-6, True),)) in cache
+    assert ("codes", -6) in cache
+
+
+def test_pandas_background_sort_order(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": np.arange(10_000) % 100, "b": np.arange(10_000) % 7})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    view = dxf.get_table_view("df")
+    view.LAZY_SORT_MIN_ROWS = 0
+
+    dxf.set_sort_columns("df", [{"column_index": 0, "ascending": False}])
+    cache_key = ("order", ((view._column_versions[0], False),))
+    view._sort_order_futures[cache_key].result()
+
+    # Once the order has been computed in the background, filtering
+    # uses it without sorting again
+    dxf.set_row_filters("df", [_compare_filter(schema[1], "=", 3)])
+    assert cache_key in view._sort_cache
+    assert cache_key not in view._sort_order_futures
+    assert view.view_indices.dtype.kind in "iu"
+
+    expected = df[df["b"] == 3].sort_values("a", ascending=False, kind="mergesort")
+    assert (view.view_indices == expected.index.to_numpy()).all()
+
+
 def test_pandas_change_schema_after_sort(
     shell: PositronShell,
     de_service: DataExplorerService,
@@ -1683,12 +2395,439 @@ def test_pandas_updated_with_sort_keys(dxf: DataExplorerFixture):
 
     schema_updated, new_filt, new_sort_keys = view.get_updated_state(df)
 
-    # Object dtype makes schema_updated always true
-    assert schema_updated
+    # The table has not changed
+    assert not schema_updated
     assert new_filt == view.filters
     assert new_sort_keys == view.sort_keys
 
 
+def test_pandas_update_reuses_unchanged_columns(
+    dxf: DataExplorerFixture, shell: PositronShell, monkeypatch
+):
+    df = pd.DataFrame({"a": np.arange(10), "b": np.arange(10)[::-1] * 0.5, "c": np.zeros(10)})
+    dxf.assign_and_open_viewer("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], "<", 5)])
+    dxf.set_sort_columns("df", [{"column_index": 1, "ascending": True}])
+    old_view = dxf.get_table_view("df")
+
+    # Modify one column in place
+    shell.run_cell("df.loc[0, 'c'] = 1")
+    _check_update_variable(dxf.de_service, "df", update_type="data")
+    view = dxf.get_table_view("df")
+    assert view is not old_view
+    assert view._column_versions[:2] == old_view._column_versions[:2]
+    assert view._column_versions[2] != old_view._column_versions[2]
+
+    # The filter and the sort order of the unchanged columns are not
+    # computed again
+    def _fail(*args, **kwargs):
+        raise AssertionError("Recomputed")
+
+    monkeypatch.setattr(view, "_eval_filter", _fail)
+    monkeypatch.setattr(data_explorer, "_stable_order", _fail)
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == 5
+    assert list(view.view_indices) == [4, 3, 2, 1, 0]
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=1, column_indices=[2])
+    assert result["columns"] == [["0.00"]]
+
+
+def test_pandas_explorers_share_table_state(
+    dxf: DataExplorerFixture, shell: PositronShell, monkeypatch
+):
+    df = pd.DataFrame({"a": np.arange(20) % 3, "b": np.arange(20) * 0.5})
+    dxf.assign_and_open_viewer("df", df)
+    dxf.de_service.register_table(df, "df", variable_path=[encode_access_key("df")])
+
+    def _views():
+        comm_ids = sorted(dxf.de_service.path_to_comm_ids[(encode_access_key("df"),)])
+        return [dxf.de_service.table_views[comm_id] for comm_id in comm_ids]
+
+    views = _views()
+    assert len(views) == 2
+    assert views[0]._table_state is views[1]._table_state
+
+    # A sort order computed for one explorer is reused by the other
+    sort_keys = [ColumnSortKey(column_index=1, ascending=False)]
+    views[0]._set_sort_columns(sort_keys)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("Recomputed")
+
+    with monkeypatch.context() as m:
+        m.setattr(data_explorer, "_stable_order", _fail)
+        views[1]._set_sort_columns(sort_keys)
+    assert list(views[1].view_indices) == list(range(19, -1, -1))
+
+    # Both explorers share the state of the updated table, which keeps
+    # the version of the unchanged column
+    shell.run_cell("df.loc[0, 'a'] = 5")
+    updated = _views()
+    assert all(new is not old for new, old in zip(updated, views))
+    assert updated[0]._table_state is updated[1]._table_state
+    assert updated[0]._column_versions[1] == views[0]._column_versions[1]
+    assert updated[0]._column_versions[0] != views[0]._column_versions[0]
+
+
+def test_pandas_append_updates_incrementally(
+    dxf: DataExplorerFixture, shell: PositronShell, monkeypatch
+):
+    df = pd.DataFrame(
+        {
+            "a": np.arange(100) % 7,
+            "b": np.where(np.arange(100) % 9 == 0, np.nan, np.arange(100) % 5),
+        }
+    )
+    dxf.assign_and_open_viewer("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], ">", 2)])
+    dxf.set_sort_columns("df", [{"column_index": 1, "ascending": False}])
+
+    # Rows are appended in a loop
+    shell.run_cell(
+        "import numpy as np\nimport pandas as pd\n"
+        "df = pd.concat([df, pd.DataFrame({'a': [6, 1, 3], 'b': [np.nan, 4.0, 0.0]})], "
+        "ignore_index=True)"
+    )
+    _check_update_variable(dxf.de_service, "df", update_type="data")
+    view = dxf.get_table_view("df")
+    assert view._table_state.appended_to is not None
+
+    evaluated = []
+    eval_filter = view._eval_filter
+
+    def _eval_filter(filt, indices=None):
+        evaluated.append(indices)
+        return eval_filter(filt, indices)
+
+    sorted_rows = []
+    stable_order = data_explorer._stable_order
+
+    def _stable_order(rows, keys, na_rows):
+        sorted_rows.append(len(rows) + len(na_rows))
+        return stable_order(rows, keys, na_rows)
+
+    monkeypatch.setattr(view, "_eval_filter", _eval_filter)
+    monkeypatch.setattr(data_explorer, "_stable_order", _stable_order)
+
+    new_df = shell.user_ns["df"]
+    expected = new_df[new_df["a"] > 2].sort_values(
+        "b", ascending=False, kind="mergesort", na_position="last"
+    )
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == len(expected)
+    assert list(view.view_indices) == expected.index.tolist()
+
+    # Only the appended rows were filtered and sorted
+    assert [list(x) for x in evaluated] == [[100, 101, 102]]
+    assert sorted_rows == [2]
+
+
+def test_row_bitmap(monkeypatch):
+    monkeypatch.setattr(_RowBitmap, "BLOCK_SIZE", 16)
+    rng = np.random.default_rng(0)
+    for num_rows, density in [(0, 0.5), (100, 0.0), (100, 1.0), (1000, 0.05), (1000, 0.9)]:
+        mask = rng.random(num_rows) < density
+        expected = mask.nonzero()[0]
+        bitmap = _RowBitmap(mask)
+        assert len(bitmap) == len(expected)
+        assert (bitmap.to_mask() == mask).all()
+        assert (np.asarray(bitmap) == expected).all()
+        for start, stop in [(0, 1), (3, 40), (0, len(expected)), (17, 1000), (5, 5)]:
+            assert (bitmap[start:stop] == expected[start:stop]).all()
+        for i in [0, 1, len(expected) // 2, -1]:
+            if len(expected) > 0:
+                assert bitmap[i] == expected[i]
+        positions = np.array([0, len(expected) // 3, len(expected) - 1])
+        if len(expected) > 0:
+            assert (bitmap[positions] == expected[positions]).all()
+
+
+def test_pandas_compact_row_indices(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": np.arange(1000) % 10, "b": np.arange(1000)[::-1]})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    view = dxf.get_table_view("df")
+
+    # Sparse filters and sort orders have int32 indices
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], "=", 3)])
+    assert view.filtered_indices.dtype == np.int32
+    dxf.set_sort_columns("df", [{"column_index": 1, "ascending": True}])
+    assert view.view_indices.dtype == np.int32
+
+    # Dense filters of long tables keep a bitmap of the selected rows
+    view.BITMAP_INDICES_MIN_ROWS = 0
+    dxf.set_sort_columns("df", [])
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], "<", 8)])
+    assert isinstance(view.filtered_indices, _RowBitmap)
+    expected = df[df["a"] < 8]
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == len(expected)
+    result = dxf.get_data_values("df", row_start_index=395, num_rows=10, column_indices=[1])
+    assert result["columns"] == [[str(x) for x in expected["b"][395:405]]]
+
+    # Sorting, adding filters and profiling use the bitmap
+    dxf.set_sort_columns("df", [{"column_index": 1, "ascending": True}])
+    result = dxf.get_data_values("df", row_start_index=0, num_rows=3, column_indices=[1])
+    assert result["columns"] == [[str(x) for x in expected["b"].sort_values()[:3]]]
+    dxf.set_row_filters(
+        "df",
+        filters=[
+            _compare_filter(schema[0], "<", 8),
+            _compare_filter(schema[1], ">=", 500),
+        ],
+    )
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == (expected["b"] >= 500).sum()
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[0], "<", 8)])
+    result = dxf.get_column_profiles("df", [_get_null_count(0), _get_summary_stats(1)])
+    assert result[0]["null_count"] == 0
+    assert result[1]["summary_stats"]["number_stats"]["max_value"] == f"{expected['b'].max():.2f}"
+
+
+def test_pandas_memory_governor(dxf: DataExplorerFixture, monkeypatch):
+    df = pd.DataFrame({"a": np.arange(10_000) % 10, "b": np.arange(10_000)[::-1]})
+    dxf.register_table("df", df)
+    dxf.register_table("df2", df.copy())
+    schema = dxf.get_schema("df")
+    for name in ["df", "df2"]:
+        dxf.set_row_filters(name, filters=[_compare_filter(schema[0], "<", 5)])
+        dxf.set_sort_columns(name, [{"column_index": 1, "ascending": True}])
+        dxf.get_data_values(name, row_start_index=0, num_rows=10, column_indices=[0, 1])
+
+    usage = dxf.get_memory_usage("df")
+    assert usage["index_bytes"] == 5000 * 4 * 2
+    assert usage["cache_bytes"] > 0
+    assert usage["total_bytes"] >= 2 * (usage["index_bytes"] + usage["cache_bytes"])
+    assert usage["max_bytes"] == DataExplorerService.MEMORY_MAX_BYTES
+
+    # Over budget, the cached state is evicted first, and then the row
+    # indices of the explorers that were not just used
+    monkeypatch.setattr(dxf.de_service, "MEMORY_MAX_BYTES", usage["total_bytes"] - 1)
+    dxf.get_state("df")
+    usage = dxf.get_memory_usage("df")
+    assert usage["total_bytes"] <= dxf.de_service.MEMORY_MAX_BYTES
+    assert dxf.get_table_view("df2").view_indices is not None
+
+    monkeypatch.setattr(dxf.de_service, "MEMORY_MAX_BYTES", 1)
+    dxf.get_state("df")
+    assert dxf.get_memory_usage("df")["index_bytes"] > 0
+    view = dxf.get_table_view("df2")
+    assert view.view_indices is None
+    assert all(len(cache) == 0 for cache in view._get_caches())
+
+    # Freed indices are recomputed when they are needed
+    result = dxf.get_data_values("df2", row_start_index=0, num_rows=2, column_indices=[1])
+    assert result["columns"] == [["5", "6"]]
+    assert dxf.get_state("df2")["table_shape"]["num_rows"] == 5000
+
+
+def test_data_values_requests_coalesced(dxf: DataExplorerFixture, monkeypatch):
+    df = pd.DataFrame({"a": np.arange(1000)})
+    dxf.register_table("df", df)
+    comm_id = dxf.get_comm_id("df")
+    comm = cast(DummyComm, dxf.de_service.comms[comm_id].comm)
+    view = dxf.get_table_view("df")
+
+    computed = []
+    get_data_values = view._get_data_values
+
+    def _get_data_values(row_start, num_rows, *args):
+        computed.append((row_start, num_rows))
+        return get_data_values(row_start, num_rows, *args)
+
+    monkeypatch.setattr(view, "_get_data_values", _get_data_values)
+
+    def _request(row_start_index, num_rows, column_indices=[0]):
+        params = {
+            "row_start_index": row_start_index,
+            "num_rows": num_rows,
+            "column_indices": column_indices,
+            "format_options": DEFAULT_FORMAT,
+        }
+        return json_rpc_request("get_data_values", params=params, comm_id=comm_id)
+
+    async def _burst(requests):
+        # The requests arrive before the kernel is idle
+        for request in requests:
+            comm.handle_msg(request)
+        await asyncio.sleep(0)
+
+    # The newest request is answered first, along with an older
+    # overlapping request, and the other requests are dropped
+    message_count = len(comm.messages)
+    asyncio.run(
+        _burst(
+            [_request(0, 10), _request(300, 10), _request(202, 10, [0, 0]), _request(205, 10)]
+            + [_request(200, 10)]
+        )
+    )
+    assert computed == [(200, 15)]
+    replies = [x["data"] for x in comm.messages[message_count:]]
+    assert [x["result"]["columns"] for x in replies[:2]] == [
+        [[str(x) for x in range(200, 210)]],
+        [[str(x) for x in range(205, 215)]],
+    ]
+    assert [x["error"]["code"] for x in replies[2:]] == [JsonRpcErrorCode.REQUEST_SUPERSEDED] * 3
+    queue = dxf.de_service._data_requests[comm_id]
+    assert (queue.computed, queue.coalesced, queue.dropped) == (1, 1, 3)
+
+    # Other requests are answered after the requests before them
+    message_count = len(comm.messages)
+    get_state = json_rpc_request("get_state", comm_id=comm_id)
+    asyncio.run(_burst([_request(500, 2), get_state]))
+    replies = [x["data"]["result"] for x in comm.messages[message_count:]]
+    assert replies[0]["columns"] == [["500", "501"]]
+    assert replies[1]["table_shape"]["num_rows"] == 1000
+
+
+def test_data_values_prefetch(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(dxf.de_service, "PREFETCH_DELAY", 0)
+    df = pd.DataFrame({f"c{i}": np.arange(1000) for i in range(6)})
+    dxf.register_table("df", df)
+    comm_id = dxf.get_comm_id("df")
+    comm = cast(DummyComm, dxf.de_service.comms[comm_id].comm)
+    view = dxf.get_table_view("df")
+    queue = dxf.de_service._data_requests[comm_id]
+
+    computed = []
+    get_data_values = view._get_data_values
+
+    def _get_data_values(row_start, num_rows, column_indices, *args):
+        computed.append((row_start, num_rows, list(column_indices)))
+        return get_data_values(row_start, num_rows, column_indices, *args)
+
+    monkeypatch.setattr(view, "_get_data_values", _get_data_values)
+
+    def _request(row_start_index, num_rows, column_indices):
+        params = {
+            "row_start_index": row_start_index,
+            "num_rows": num_rows,
+            "column_indices": column_indices,
+            "format_options": DEFAULT_FORMAT,
+        }
+        return json_rpc_request("get_data_values", params=params, comm_id=comm_id)
+
+    async def _scroll(request, cancel=False):
+        comm.handle_msg(request)
+        await asyncio.sleep(0)
+        if cancel:
+            dxf.de_service.cancel_prefetch()
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+    # Scrolling down prefetches the next two row blocks, the block
+    # above, and the columns to the right
+    asyncio.run(_scroll(_request(200, 10, [0, 1])))
+    assert computed == [
+        (200, 10, [0, 1]),
+        (256, 128, [0, 1]),
+        (384, 128, [0, 1]),
+        (0, 128, [0, 1]),
+        (200, 10, [2, 3]),
+    ]
+    assert queue.prefetched == 4
+    assert queue.prefetch is None
+
+    # Which are then served from the cache
+    misses = view._viewport_cache.misses
+    result = dxf.get_data_values("df", row_start_index=400, num_rows=10, column_indices=[0, 1])
+    assert result["columns"][0] == [str(x) for x in range(400, 410)]
+    result = dxf.get_data_values("df", row_start_index=200, num_rows=10, column_indices=[2, 3])
+    assert result["columns"][0] == [str(x) for x in range(200, 210)]
+    assert view._viewport_cache.misses == misses
+
+    # Scrolling up and left prefetches in the other directions
+    del computed[:]
+    asyncio.run(_scroll(_request(100, 10, [1, 2])))
+    assert computed == [(100, 10, [1, 2]), (128, 128, [1, 2]), (100, 10, [0])]
+
+    # Prefetching stops when user code starts running
+    del computed[:]
+    asyncio.run(_scroll(_request(600, 10, [1, 2]), cancel=True))
+    assert computed == [(600, 10, [1, 2])]
+    assert queue.prefetch is None
+
+    # and does not exceed the memory budget
+    del computed[:]
+    monkeypatch.setattr(dxf.de_service, "MEMORY_MAX_BYTES", 0)
+    asyncio.run(_scroll(_request(800, 10, [1, 2])))
+    assert computed == [(800, 10, [1, 2])]
+
+
+def _flush_background_executor():
+    data_explorer._get_background_executor().submit(lambda: None).result()
+
+
+def test_pandas_infer_dtype_sampled(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(PandasView, "INFER_DTYPE_SAMPLE_MIN_ROWS", 100)
+    monkeypatch.setattr(PandasView, "INFER_DTYPE_SAMPLE_SIZE", 10)
+
+    # A string column with a single integer that the sample misses
+    values = ["foo"] * 1000
+    values[999] = 1
+    df = pd.DataFrame({"a": ["bar"] * 1000, "b": values, "c": np.arange(1000)})
+    dxf.register_table("df", df)
+
+    comm_id = dxf.get_comm_id("df")
+    dummy_comm = cast(DummyComm, dxf.de_service.comms[comm_id].comm)
+    dummy_comm.messages.clear()
+
+    schema = dxf.get_schema("df")
+    assert [c["type_display"] for c in schema] == ["string", "string", "number"]
+
+    # The full check disagrees for the second column only
+    _flush_background_executor()
+    notifications = [m for m in dummy_comm.messages if "method" in m["data"]]
+    assert notifications == [json_rpc_notification("schema_update", {})]
+    view = dxf.de_service.table_views[comm_id]
+    assert view._sampled_dtypes == {}
+    assert view._inferred_dtypes == {0: "string", 1: "mixed-integer"}
+
+    schema = dxf.get_schema("df")
+    assert [c["type_display"] for c in schema] == ["string", "number", "number"]
+
+
+def test_pandas_infer_dtype_inherited(dxf: DataExplorerFixture, shell: PositronShell):
+    df = pd.DataFrame({"a": ["foo", "bar"], "b": [1, 2]})
+    comm_id = dxf.assign_and_open_viewer("df", df)
+    dxf.get_schema("df")
+
+    # A new table that shares the values of the object column
+    shell.run_cell("df = df.copy(deep=False)\ndf['b'] = [3, 4]")
+    _check_update_variable(dxf.de_service, "df", update_type="data")
+    view = dxf.de_service.table_views[comm_id]
+    assert view._inferred_dtypes == {0: "string"}
+
+    # Modifying the table in place could change the inferred types
+    shell.run_cell("df.iloc[0, 0] = 5")
+    _check_update_variable(dxf.de_service, "df", update_type="schema")
+    view = dxf.de_service.table_views[comm_id]
+    assert view._inferred_dtypes == {}
+    assert dxf.get_schema("df")[0]["type_display"] == "number"
+
+
+def test_pandas_infer_dtype_long_column_modified_in_place(
+    dxf: DataExplorerFixture, shell: PositronShell, monkeypatch
+):
+    monkeypatch.setattr(PandasView, "INFER_DTYPE_SAMPLE_MIN_ROWS", 100)
+    monkeypatch.setattr(PandasView, "INFER_DTYPE_SAMPLE_SIZE", 10)
+    monkeypatch.setattr(PandasView, "FINGERPRINT_HASH_MAX_BYTES", 10_000)
+    df = pd.DataFrame({"a": ["foo"] * 1000})
+    comm_id = dxf.assign_and_open_viewer("df", df)
+    dxf.get_schema("df")
+    _flush_background_executor()
+    assert dxf.de_service.table_views[comm_id]._inferred_dtypes == {0: "string"}
+
+    # The values of the long column are not hashed, so a change that
+    # keeps its memory is not taken to keep its inferred type
+    shell.run_cell("df.iloc[999, 0] = 5")
+    _check_update_variable(dxf.de_service, "df", update_type="schema")
+    view = dxf.de_service.table_views[comm_id]
+    assert view._inferred_dtypes == {}
+
+    dxf.get_schema("df")
+    _flush_background_executor()
+    assert view._inferred_dtypes == {0: "mixed-integer"}
+
+
 def _select_single_cell(row_index: int, col_index: int):
     return {
         "kind": "single_cell",
@@ -1823,6 +2962,14 @@ def _get_summary_stats(column_index):
     return _profile_request(column_index, "summary_stats")
 
 
+def _get_histogram(column_index):
+    return _profile_request(column_index, "histogram")
+
+
+def _get_frequency_table(column_index):
+    return _profile_request(column_index, "frequency_table")
+
+
 def test_pandas_profile_null_counts(dxf: DataExplorerFixture):
     df1 = pd.DataFrame(
         {
@@ -1896,18 +3043,131 @@ def test_pandas_profile_null_counts(dxf: DataExplorerFixture):
         assert results == ex_results
 
 
-EPSILON = 1e-7
-
+def _get_profile_events(dxf: DataExplorerFixture, table_name: str, callback_id: str):
+    comm = cast(DummyComm, dxf.de_service.comms[dxf.get_comm_id(table_name)].comm)
+    return [
+        msg["data"]["params"]
+        for msg in comm.messages
+        if msg["data"].get("method") == "return_column_profiles"
+        and msg["data"]["params"]["callback_id"] == callback_id
+    ]
 
-def _assert_close(expected, actual):
-    if isinstance(expected, float) and math.isinf(expected):
-        assert math.isinf(actual)
-        if expected > 0:
-            assert actual > 0
-        else:
-            assert actual < 0
-    else:
-        assert np.abs(actual - expected) < EPSILON
+
+def test_pandas_profiles_returned_by_column(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": [0, np.nan, 2], "b": [None, "one", None], "c": [1, 2, 3]})
+    dxf.register_table("df", df)
+
+    profiles = [
+        _get_null_count(1),
+        _get_null_count(0),
+        _get_summary_stats(1),
+        _get_null_count(2),
+    ]
+    callback_id = guid()
+    result = dxf.do_json_rpc(
+        "df",
+        "get_column_profiles",
+        callback_id=callback_id,
+        profiles=profiles,
+        format_options=DEFAULT_FORMAT,
+    )
+    assert result == []
+
+    results = dxf.get_returned_column_profiles("df", callback_id, len(profiles))
+    assert [x["null_count"] for x in results if x["null_count"] is not None] == [2, 1, 0]
+
+    # One event for each column, as soon as its profiles are ready
+    events = _get_profile_events(dxf, "df", callback_id)
+    assert sorted(x["profile_indices"] for x in events) == [[0, 2], [1], [3]]
+
+
+def test_pandas_profiles_cancelled(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": [0, np.nan, 2], "b": [None, "one", None]})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema_for(df)
+
+    # Hold the profile workers as if a data request were in progress
+    dxf.de_service._data_requests_idle.clear()
+
+    profiles = [_get_null_count(0), _get_null_count(1)]
+    callback_id = guid()
+    dxf.do_json_rpc(
+        "df",
+        "get_column_profiles",
+        callback_id=callback_id,
+        profiles=profiles,
+        format_options=DEFAULT_FORMAT,
+    )
+    assert _get_profile_events(dxf, "df", callback_id) == []
+
+    # Changing the filters returns the unfinished profiles empty
+    dxf.set_row_filters("df", [_filter("not_null", schema[0])])
+    assert dxf.de_service._data_requests_idle.is_set()
+
+    results = dxf.get_returned_column_profiles("df", callback_id, len(profiles))
+    assert results == [{}, {}]
+    assert len(_get_profile_events(dxf, "df", callback_id)) == 1
+
+    # New requests are computed for the filtered rows
+    assert dxf.get_column_profiles("df", profiles) == [
+        ColumnProfileResult(null_count=0),
+        ColumnProfileResult(null_count=2),
+    ]
+
+
+def test_pandas_profiles_paused_while_code_runs(dxf: DataExplorerFixture):
+    df = pd.DataFrame({"a": [0, np.nan, 2], "b": [None, "one", None]})
+    dxf.register_table("df", df)
+
+    # Hold the profile workers until the job is paused
+    dxf.de_service._data_requests_idle.clear()
+    profiles = [_get_null_count(0), _get_null_count(1)]
+    callback_id = guid()
+    dxf.do_json_rpc(
+        "df",
+        "get_column_profiles",
+        callback_id=callback_id,
+        profiles=profiles,
+        format_options=DEFAULT_FORMAT,
+    )
+    dxf.de_service.pause_background_work()
+    dxf.de_service._data_requests_idle.set()
+    comm_id = dxf.get_comm_id("df")
+    for job in dxf.de_service._profile_jobs[comm_id]:
+        job.wait()
+    assert _get_profile_events(dxf, "df", callback_id) == []
+
+    # The profiles are computed once the code has run
+    dxf.de_service.resume_background_work()
+    results = dxf.get_returned_column_profiles("df", callback_id, len(profiles))
+    assert results == [ColumnProfileResult(null_count=1), ColumnProfileResult(null_count=2)]
+
+
+def test_column_profiles_without_callback_id(dxf: DataExplorerFixture):
+    # Clients that predate asynchronous profiles get them in the reply
+    df = pd.DataFrame({"a": [0, np.nan, 2], "b": [None, "one", None]})
+    dxf.register_table("df", df)
+    result = dxf.do_json_rpc(
+        "df",
+        "get_column_profiles",
+        profiles=[_get_null_count(0), _get_null_count(1)],
+        format_options=DEFAULT_FORMAT,
+    )
+    assert result == [ColumnProfileResult(null_count=1), ColumnProfileResult(null_count=2)]
+
+
+EPSILON = 1e-7
+
+
+def _assert_close(expected, actual):
+    if isinstance(expected, float) and math.isinf(expected):
+        assert math.isinf(actual)
+        if expected > 0:
+            assert actual > 0
+        else:
+            assert actual < 0
+    else:
+        assert np.abs(actual - expected) < EPSILON
 
 
 def _assert_numeric_stats_equal(expected, actual):
@@ -2157,6 +3417,356 @@ def test_pandas_profile_summary_stats(dxf: DataExplorerFixture):
             _assert_datetime_stats_equal(ex_result, stats["datetime_stats"])
 
 
+def test_summarize_numeric_arrays(monkeypatch):
+    # Use several chunks
+    monkeypatch.setattr(data_explorer, "_SUMMARY_CHUNK_SIZE", 64)
+
+    rng = np.random.default_rng(12345)
+    floats = rng.standard_normal(1000) * 100
+    floats[::7] = np.nan
+    arrays = [
+        floats,
+        floats.astype(np.float32),
+        rng.integers(-1000, 1000, 1000),
+        rng.integers(0, 1000, 1000).astype(np.uint16),
+    ]
+    indices = np.sort(rng.choice(1000, 500, replace=False))
+
+    summaries = _summarize_numeric_arrays(arrays, indices)
+    for values, summary in zip(arrays, summaries):
+        expected = pd.Series(values).take(indices)
+        assert summary.count == expected.count()
+        assert summary.null_count == expected.isnull().sum()
+        assert summary.min_value == expected.min()
+        assert summary.max_value == expected.max()
+        # pandas reduces float32 values in float32
+        np.testing.assert_allclose(summary.mean, expected.mean(), rtol=1e-6)
+        np.testing.assert_allclose(summary.get_stdev(), expected.std(), rtol=1e-6)
+        np.testing.assert_allclose(summary.get_median(), expected.median(), rtol=1e-6)
+
+    # The sketched median is close to the exact median
+    values = rng.standard_normal(100_000)
+    (summary,) = _summarize_numeric_arrays([values], sketch=True)
+    assert not summary.exact
+    assert abs(summary.get_median() - np.median(values)) < 0.05
+    assert summary.count == len(values)
+
+    # No rows
+    (summary,) = _summarize_numeric_arrays([floats], np.array([], dtype=np.int64))
+    assert summary.count == 0
+    assert np.isnan(summary.get_median())
+    assert np.isnan(summary.get_stdev())
+
+
+def _rank_error(values, q, estimate):
+    # The distance between the fraction of values below estimate and q
+    values = np.sort(values)
+    low = np.searchsorted(values, estimate, side="left") / len(values)
+    high = np.searchsorted(values, estimate, side="right") / len(values)
+    return max(low - q, q - high, 0)
+
+
+def test_quantile_sketch(monkeypatch):
+    monkeypatch.setattr(data_explorer, "_SUMMARY_CHUNK_SIZE", 1000)
+
+    rng = np.random.default_rng(12345)
+    values = np.concatenate([rng.standard_normal(100_000), rng.exponential(size=100_000)])
+    rng.shuffle(values)
+    qs = [0, 0.01, 0.25, 0.5, 0.75, 0.99, 1]
+
+    sketch = _QuantileSketch()
+    sketch.update(values)
+    assert sketch.count == len(values)
+    # The memory use does not grow with the number of values
+    assert sketch.nbytes < 10_000
+    for q, estimate in zip(qs, sketch.quantiles(qs)):
+        assert _rank_error(values, q, estimate) < 0.01
+
+    # Same values, same estimates
+    again = _QuantileSketch()
+    again.update(values)
+    np.testing.assert_array_equal(again.quantiles(qs), sketch.quantiles(qs))
+
+    # Sketches of parts of the values merge into a sketch of them all
+    merged = _QuantileSketch()
+    for part in np.array_split(values, 7):
+        part_sketch = _QuantileSketch()
+        part_sketch.update(part)
+        merged.merge(part_sketch)
+    assert merged.count == len(values)
+    for q, estimate in zip(qs, merged.quantiles(qs)):
+        assert _rank_error(values, q, estimate) < 0.01
+
+    # NaN is ignored and an empty sketch has no quantiles
+    sketch = _QuantileSketch()
+    sketch.update(np.array([np.nan, 1.0, np.nan]))
+    assert sketch.count == 1
+    assert list(sketch.quantiles([0.5])) == [1.0]
+    assert np.isnan(_QuantileSketch().quantiles([0.5])).all()
+
+
+def _number_stats(result):
+    return result["summary_stats"]["number_stats"]
+
+
+def _parse_number(value: str):
+    return float(value.replace(",", ""))
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_pandas_profile_summary_stats_quantiles(dxf: DataExplorerFixture, monkeypatch, exact):
+    monkeypatch.setattr(PandasView, "QUANTILE_SKETCH_MIN_ROWS", 1000)
+    monkeypatch.setattr(PandasView, "EXACT_QUANTILES", exact)
+
+    values = np.arange(10_001, dtype=np.float64)
+    df = pd.DataFrame(
+        {
+            "a": values,
+            "b": pd.date_range("2000-01-01", periods=10_001, freq="s"),
+        }
+    )
+    dxf.register_table("df", df)
+
+    qs = [1, 25, 50, 99.5]
+    profile = _get_summary_stats(0)
+    profile["quantiles"] = qs
+    (result, date_result) = dxf.get_column_profiles("df", [profile, _get_summary_stats(1)])
+
+    stats = _number_stats(result)
+    assert [x["q"] for x in stats["quantiles"]] == qs
+    assert all(x["exact"] == exact for x in stats["quantiles"])
+    estimates = [_parse_number(x["value"]) for x in stats["quantiles"]]
+    median = _parse_number(stats["median"])
+    datetime_median = pd.Timestamp(date_result["summary_stats"]["datetime_stats"]["median_date"])
+    if exact:
+        assert estimates == list(np.percentile(values, qs))
+        assert median == 5000
+        assert datetime_median == pd.Timestamp("2000-01-01 01:23:20")
+    else:
+        for q, estimate in zip(qs, estimates):
+            assert _rank_error(values, q / 100, estimate) < 0.01
+        assert abs(median - 5000) <= 100
+        assert abs(datetime_median - pd.Timestamp("2000-01-01 01:23:20")) <= pd.Timedelta(
+            seconds=100
+        )
+
+    # Quantiles are only included when requested
+    (result,) = dxf.get_column_profiles("df", [_get_summary_stats(0)])
+    assert _number_stats(result).get("quantiles") is None
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars", "pyarrow", "sql"])
+def test_profile_summary_stats_quantiles(dxf: DataExplorerFixture, backend):
+    # The quantiles are requested as percentiles
+    values = np.arange(101, dtype=np.float64)
+    table = {
+        "pandas": lambda: pd.DataFrame({"a": values}),
+        "polars": lambda: pl.DataFrame({"a": values}),
+        "pyarrow": lambda: pa.table({"a": values}),
+        "sql": lambda: _sql_table(pa.table({"a": values})),
+    }[backend]()
+    dxf.register_table("table", table)
+
+    qs = [1, 25, 50, 99.5]
+    profile = _get_summary_stats(0)
+    profile["quantiles"] = qs
+    (result,) = dxf.get_column_profiles("table", [profile])
+
+    stats = _number_stats(result)
+    assert [x["q"] for x in stats["quantiles"]] == qs
+    assert [_parse_number(x["value"]) for x in stats["quantiles"]] == qs
+    assert _parse_number(stats["median"]) == 50
+
+
+def test_pandas_profile_summary_stats_cache(dxf: DataExplorerFixture, monkeypatch):
+    calls = []
+
+    def summarize(arrays, *args, **kwargs):
+        calls.append(len(arrays))
+        return _summarize_numeric_arrays(arrays, *args, **kwargs)
+
+    monkeypatch.setattr(data_explorer, "_summarize_numeric_arrays", summarize)
+
+    df = pd.DataFrame({"a": np.arange(100), "b": np.arange(100) * 0.5})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+
+    profiles = [_get_summary_stats(0), _get_summary_stats(1)]
+    first = dxf.get_column_profiles("df", profiles)
+    assert dxf.get_column_profiles("df", profiles) == first
+
+    # The numeric columns are summarized together, in one pass
+    assert calls == [2]
+
+    # Filtered rows are summarized again, once
+    filters = [_compare_filter(schema[0], "<", 10)]
+    dxf.set_row_filters("df", filters=filters)
+    filtered = dxf.get_column_profiles("df", profiles)
+    assert _number_stats(filtered[0])["max_value"] == "9.00"
+    assert calls == [2, 2]
+
+    # Removing and reapplying the same filters reuses the summaries
+    dxf.set_row_filters("df", filters=[])
+    assert dxf.get_column_profiles("df", profiles) == first
+    dxf.set_row_filters("df", filters=filters)
+    assert dxf.get_column_profiles("df", profiles) == filtered
+    assert calls == [2, 2]
+
+    # New column versions do not use them
+    dxf.get_table_view("df")._column_versions = [-1, -2]
+    assert dxf.get_column_profiles("df", profiles) == filtered
+    assert calls == [2, 2, 2]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.Series([None, np.nan], dtype=object),
+        pd.Series(["a", None, "b", "a", ""]),
+        pd.Series(np.arange(50_000).astype(str)),
+        pd.Series([1, 1.0, True, 2.5, None], dtype=object),
+        pd.Series(pd.date_range("2000-01-01", periods=100_000, freq="min")),
+        pd.Series(pd.date_range("2000-01-01", periods=1000, tz="US/Eastern").repeat(3)),
+    ],
+)
+def test_hll_num_unique(values):
+    estimate, error = _hll_num_unique(values)
+    expected = values.nunique()
+    assert error < 0.01
+    assert abs(estimate - expected) <= 3 * error * expected
+
+
+def test_hash_non_null_deterministic():
+    # The hashes of strings do not depend on the per-process salt of
+    # the builtin hash, and -1 and -2 do not collide
+    values = pd.Series(["a", None, "b"])
+    expected = pd.util.hash_array(np.array(["a", "b"], dtype=object), categorize=False)
+    assert (data_explorer._hash_non_null(values) == expected).all()
+    hashes = data_explorer._hash_non_null(pd.Series([-1, -2], dtype=object))
+    assert hashes[0] != hashes[1]
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_pandas_profile_num_unique_approximate(dxf: DataExplorerFixture, monkeypatch, exact):
+    monkeypatch.setattr(PandasView, "APPROXIMATE_NUM_UNIQUE_MIN_ROWS", 1000)
+    monkeypatch.setattr(PandasView, "EXACT_NUM_UNIQUE", exact)
+
+    df = pd.DataFrame(
+        {
+            "strings": np.arange(20_000).astype(str),
+            "dates": getattr(pd.date_range("2000-01-01", periods=20_000, freq="D"), "date"),
+            "datetimes": pd.date_range("2000-01-01", periods=20_000, freq="h"),
+        }
+    )
+    dxf.register_table("df", df)
+
+    results = dxf.get_column_profiles("df", [_get_summary_stats(i) for i in range(3)])
+    stats = [
+        results[0]["summary_stats"]["string_stats"],
+        results[1]["summary_stats"]["date_stats"],
+        results[2]["summary_stats"]["datetime_stats"],
+    ]
+    for x in stats:
+        if exact:
+            assert x["num_unique"] == 20_000
+            assert x["num_unique_error"] is None
+        else:
+            assert abs(x["num_unique"] - 20_000) <= 3 * x["num_unique_error"] * 20_000
+            assert 0 < x["num_unique_error"] < 0.01
+
+
+def _histogram_case(bin_sizes, bin_width, exact=True):
+    return {"bin_sizes": bin_sizes, "bin_width": bin_width, "exact": exact}
+
+
+def _frequency_table_case(counts, other_count, exact=True):
+    return {
+        "counts": [{"value": value, "count": count} for value, count in counts],
+        "other_count": other_count,
+        "exact": exact,
+    }
+
+
+def test_pandas_profile_histogram(dxf: DataExplorerFixture):
+    df = pd.DataFrame(
+        {
+            "ints": [0, 1, 1, 2, 5, 9, 9, 9, 100, 3],
+            "floats": [0.0, 0.5, np.nan, 1.0, np.inf, 2.0, 2.0, 2.0, 1.5, 0.25],
+            "constant": [1.5] * 10,
+            "nullable": pd.array([1, None, 2, 2, None, 3, 3, 3, 3, 4], dtype="Int64"),
+            "strings": list("abcdefghij"),
+        }
+    )
+    dxf.register_table("df", df)
+    dxf.de_service.table_views[dxf.get_comm_id("df")].HISTOGRAM_NUM_BINS = 4
+
+    results = dxf.get_column_profiles("df", [_get_histogram(i) for i in range(5)])
+    assert [x["histogram"] for x in results[:4]] == [
+        # Bins of 26 whole numbers
+        _histogram_case([9, 0, 0, 1], 26),
+        _histogram_case([2, 1, 1, 4], 0.5),
+        _histogram_case([10], 0.0),
+        # A bin for each value
+        _histogram_case([1, 2, 4, 1], 1),
+    ]
+    # Not supported
+    assert results[4] == {}
+
+
+def test_pandas_profile_frequency_table(dxf: DataExplorerFixture):
+    df = pd.DataFrame(
+        {
+            "strings": ["b", "a", None, "b", "c", "a", "b", "d", "e", None],
+            "floats": [1.5, 2.0, np.nan, 1.5, 1.5, 2.0, 3.25, 4.0, 5.0, 6.0],
+        }
+    )
+    dxf.register_table("df", df)
+    dxf.de_service.table_views[dxf.get_comm_id("df")].FREQUENCY_TABLE_SIZE = 3
+
+    results = dxf.get_column_profiles("df", [_get_frequency_table(0), _get_frequency_table(1)])
+    assert [x["frequency_table"] for x in results] == [
+        _frequency_table_case([("b", 3), ("a", 2), ("c", 1)], 2),
+        _frequency_table_case([("1.50", 3), ("2.00", 2), ("3.25", 1)], 3),
+    ]
+
+    # Filtered rows
+    schema = dxf.get_schema_for(df)
+    dxf.set_row_filters("df", [_filter("not_null", schema[0])])
+    (result,) = dxf.get_column_profiles("df", [_get_frequency_table(1)])
+    assert result["frequency_table"] == _frequency_table_case(
+        [("1.50", 3), ("2.00", 2), ("3.25", 1)], 2
+    )
+
+
+def test_pandas_profile_approximate(dxf: DataExplorerFixture, monkeypatch):
+    monkeypatch.setattr(PandasView, "APPROXIMATE_PROFILE_MIN_ROWS", 1000)
+    monkeypatch.setattr(PandasView, "PROFILE_SAMPLE_SIZE", 100)
+    monkeypatch.setattr(PandasView, "HISTOGRAM_NUM_BINS", 4)
+    monkeypatch.setattr(PandasView, "FREQUENCY_TABLE_SIZE", 2)
+
+    df = pd.DataFrame({"a": np.tile([0, 1, 1, 2, 2, 2, 3, 3, 3, 3], 100)})
+    dxf.register_table("df", df)
+
+    results = dxf.get_column_profiles("df", [_get_histogram(0), _get_frequency_table(0)])
+    histogram = results[0]["histogram"]
+    assert not histogram["exact"]
+    assert histogram["bin_width"] == 1
+    assert sum(histogram["bin_sizes"]) == 1000
+    for estimate, count in zip(histogram["bin_sizes"], [100, 200, 300, 400]):
+        assert abs(estimate - count) < 100
+
+    freq_table = results[1]["frequency_table"]
+    assert not freq_table["exact"]
+    assert [x["value"] for x in freq_table["counts"]] == ["3", "2"]
+    assert sum(x["count"] for x in freq_table["counts"]) + freq_table["other_count"] == 1000
+
+    # Below the threshold after filtering
+    schema = dxf.get_schema_for(df)
+    dxf.set_row_filters("df", [_compare_filter(schema[0], "<", 3)])
+    (result,) = dxf.get_column_profiles("df", [_get_histogram(0)])
+    assert result["histogram"] == _histogram_case([100, 200, 300], 1)
+
+
 # ----------------------------------------------------------------------
 # polars backend functionality tests
 
@@ -2290,15 +3900,23 @@ def test_polars_get_state(dxf: DataExplorerFixture):
     assert state["row_filters"] == []
 
     features = state["supported_features"]
-    assert features["search_schema"]["support_status"] == SupportStatus.Unsupported
-    assert features["set_row_filters"]["support_status"] == SupportStatus.Unsupported
+    assert features["search_schema"]["support_status"] == SupportStatus.Supported
+    assert features["set_row_filters"]["support_status"] == SupportStatus.Supported
+    assert features["set_sort_columns"]["support_status"] == SupportStatus.Supported
+    assert features["export_data_selection"]["support_status"] == SupportStatus.Supported
     assert features["get_column_profiles"]["support_status"] == SupportStatus.Supported
     assert features["get_column_profiles"]["supported_types"] == [
         ColumnProfileTypeSupportStatus(
             profile_type="null_count", support_status=SupportStatus.Supported
         ),
         ColumnProfileTypeSupportStatus(
-            profile_type="summary_stats", support_status=SupportStatus.Unsupported
+            profile_type="summary_stats", support_status=SupportStatus.Experimental
+        ),
+        ColumnProfileTypeSupportStatus(
+            profile_type="frequency_table", support_status=SupportStatus.Experimental
+        ),
+        ColumnProfileTypeSupportStatus(
+            profile_type="histogram", support_status=SupportStatus.Experimental
         ),
     ]
 
@@ -2411,3 +4029,1214 @@ def test_polars_profile_null_counts(dxf: DataExplorerFixture):
         ex_results = [ColumnProfileResult(null_count=count) for count in ex_results]
 
         assert results == ex_results
+
+
+def test_polars_profile_histogram_and_frequency_table(dxf: DataExplorerFixture):
+    df = pl.DataFrame(
+        {
+            "ints": [0, 1, 1, 2, None, 3, 3, 3, 3, 4],
+            "floats": [0.0, 0.5, None, 1.0, float("inf"), 2.0, 2.0, 2.0, 1.5, 0.25],
+            "strings": ["b", "a", None, "b", "c", "a", "b", "d", "e", None],
+        }
+    )
+    name = guid()
+    dxf.register_table(name, df)
+    view = dxf.de_service.table_views[dxf.get_comm_id(name)]
+    view.HISTOGRAM_NUM_BINS = 4
+    view.FREQUENCY_TABLE_SIZE = 3
+
+    results = dxf.get_column_profiles(
+        name,
+        [_get_histogram(0), _get_histogram(1), _get_histogram(2)],
+    )
+    assert [x["histogram"] for x in results[:2]] == [
+        _histogram_case([3, 5, 1], 2),
+        _histogram_case([2, 1, 1, 4], 0.5),
+    ]
+    assert results[2] == {}
+
+    results = dxf.get_column_profiles(name, [_get_frequency_table(0), _get_frequency_table(2)])
+    assert [x["frequency_table"] for x in results] == [
+        _frequency_table_case([("3", 4), ("1", 2), ("0", 1)], 2),
+        _frequency_table_case([("b", 3), ("a", 2), ("c", 1)], 2),
+    ]
+
+
+def test_polars_profile_summary_stats(dxf: DataExplorerFixture):
+    arr = np.random.standard_normal(100)
+    arr_with_nulls = arr.copy()
+    arr_with_nulls[::10] = np.nan
+
+    df = pl.DataFrame(
+        {
+            "f0": arr,
+            "f1": arr_with_nulls,
+            "f2": [False, False, False, True, None] * 20,
+            "f3": ["foo", "", "baz", "qux", "foo", None, "bar", "", "bar", "zzz"] * 10,
+            "f4": pl.date_range(date(2000, 1, 1), date(2000, 4, 9), eager=True),
+            "f5": pl.datetime_range(
+                datetime(2000, 1, 1), datetime(2000, 1, 9, 6), "2h", eager=True
+            ),
+            "f6": pl.datetime_range(
+                datetime(2000, 1, 1),
+                datetime(2000, 1, 9, 6),
+                "2h",
+                time_zone="US/Eastern",
+                eager=True,
+            ),
+            "f7": [np.nan, np.inf, -np.inf, 0, np.nan] * 20,
+            "f8": [[1, 2]] * 100,
+        }
+    )
+    dxf.register_table("df", df)
+
+    format_options = FormatOptions(
+        large_num_digits=4,
+        small_num_digits=6,
+        max_integral_digits=7,
+        thousands_sep="_",
+    )
+    _format_float = _get_float_formatter(format_options)
+    f1 = pd.Series(arr_with_nulls)
+
+    cases = [
+        (
+            0,
+            {
+                "min_value": _format_float(arr.min()),
+                "max_value": _format_float(arr.max()),
+                "mean": _format_float(arr.mean()),
+                "stdev": _format_float(arr.std(ddof=1)),
+                "median": _format_float(np.median(arr)),
+            },
+        ),
+        # NaN values are missing, as with pandas
+        (
+            1,
+            {
+                "min_value": _format_float(f1.min()),
+                "max_value": _format_float(f1.max()),
+                "mean": _format_float(f1.mean()),
+                "stdev": _format_float(f1.std()),
+                "median": _format_float(f1.median()),
+            },
+        ),
+        (2, {"true_count": 20, "false_count": 60}),
+        (3, {"num_empty": 20, "num_unique": 6}),
+        (
+            4,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01",
+                "mean_date": "2000-02-19",
+                "median_date": "2000-02-19",
+                "max_date": "2000-04-09",
+            },
+        ),
+        (
+            5,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01 00:00:00",
+                "mean_date": "2000-01-05 03:00:00",
+                "median_date": "2000-01-05 03:00:00",
+                "max_date": "2000-01-09 06:00:00",
+                "timezone": "None",
+            },
+        ),
+        (
+            6,
+            {
+                "num_unique": 100,
+                "min_date": "2000-01-01 00:00:00-05:00",
+                "mean_date": "2000-01-05 03:00:00-05:00",
+                "median_date": "2000-01-05 03:00:00-05:00",
+                "max_date": "2000-01-09 06:00:00-05:00",
+                "timezone": "US/Eastern",
+            },
+        ),
+        (7, {"min_value": "-INF", "max_value": "INF"}),
+    ]
+
+    # All the profiles are computed with one request
+    results = dxf.get_column_profiles(
+        "df",
+        [_get_summary_stats(i) for i, _ in cases] + [_get_summary_stats(8)],
+        format_options=format_options,
+    )
+    for (_, ex_result), result in zip(cases, results):
+        stats = result["summary_stats"]
+        ui_type = stats["type_display"]
+
+        if ui_type == ColumnDisplayType.Number:
+            _assert_numeric_stats_equal(ex_result, stats["number_stats"])
+        elif ui_type == ColumnDisplayType.String:
+            _assert_string_stats_equal(ex_result, stats["string_stats"])
+        elif ui_type == ColumnDisplayType.Boolean:
+            _assert_boolean_stats_equal(ex_result, stats["boolean_stats"])
+        elif ui_type == ColumnDisplayType.Date:
+            _assert_date_stats_equal(ex_result, stats["date_stats"])
+        else:
+            assert ui_type == ColumnDisplayType.Datetime
+            _assert_datetime_stats_equal(ex_result, stats["datetime_stats"])
+
+    # Types that are not summarized
+    assert results[-1]["summary_stats"]["type_display"] == "array"
+
+
+def test_polars_profiles_one_query(dxf: DataExplorerFixture, monkeypatch):
+    df = pl.DataFrame(
+        {
+            "a": [0, None, 2, 3, 4, 5, 6, 3, 3, 1],
+            "b": ["foo", None, "bar", "", "foo", "baz", None, "", "foo", "qux"],
+            "c": [0.5, float("nan"), None, 1.5, 2.5, 0.5, 1.0, 4.0, 0.5, 2.0],
+        }
+    )
+    name = guid()
+    dxf.register_table(name, df)
+    schema = dxf.get_schema(name)
+    dxf.set_row_filters(name, filters=[_compare_filter(schema[0], "!=", 4)])
+    view = dxf.de_service.table_views[dxf.get_comm_id(name)]
+    view.FREQUENCY_TABLE_SIZE = 2
+
+    num_queries = 0
+    select = pl.LazyFrame.select
+
+    def counting_select(self, *args, **kwargs):
+        nonlocal num_queries
+        num_queries += 1
+        return select(self, *args, **kwargs)
+
+    monkeypatch.setattr(pl.LazyFrame, "select", counting_select)
+
+    profiles = [
+        _get_null_count(0),
+        _get_null_count(1),
+        _get_summary_stats(1),
+        # Histograms of strings fail without failing the other profiles
+        _get_histogram(1),
+        _get_summary_stats(2),
+        _get_frequency_table(1),
+        _get_histogram(0),
+    ]
+    results = dxf.get_column_profiles(name, profiles)
+    assert num_queries == 1
+
+    filtered = df.filter(pl.col("a").ne_missing(4)).to_pandas()
+    _format_float = _get_float_formatter(DEFAULT_FORMAT)
+    assert results[0]["null_count"] == 1
+    assert results[1]["null_count"] == 2
+    assert results[2]["summary_stats"]["string_stats"] == {
+        "num_empty": 2,
+        "num_unique": 5,
+        "num_unique_error": None,
+    }
+    assert results[3] == {}
+    _assert_numeric_stats_equal(
+        {
+            "min_value": _format_float(filtered["c"].min()),
+            "max_value": _format_float(filtered["c"].max()),
+            "mean": _format_float(filtered["c"].mean()),
+            "stdev": _format_float(filtered["c"].std()),
+            "median": _format_float(filtered["c"].median()),
+        },
+        results[4]["summary_stats"]["number_stats"],
+    )
+    assert results[5]["frequency_table"]["counts"] == [
+        {"value": "", "count": 2},
+        {"value": "foo", "count": 2},
+    ]
+    assert results[5]["frequency_table"]["other_count"] == 3
+    assert sum(results[6]["histogram"]["bin_sizes"]) == 8
+
+
+def test_polars_filter(dxf: DataExplorerFixture):
+    df = pl.DataFrame(
+        {
+            "a": [1, 2, None, 4, 5, 3],
+            "b": ["foo", "bar", None, "", "Foo", "baz"],
+            "c": [True, False, None, True, False, True],
+            "d": [1.5, float("nan"), None, 0.5, 2.5, -1.0],
+            "e": [b"ab", b"", None, b"b", b"abc", b"a"],
+        }
+    )
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+
+    a, b, c, d, e = (pl.col(name) for name in df.columns)
+    cases = [
+        ([_compare_filter(schema[0], ">", 2)], a > 2),
+        ([_compare_filter(schema[0], "<=", "2.5")], a <= 2.5),
+        # Nulls are not equal to any value
+        ([_compare_filter(schema[0], "!=", 2)], a.ne_missing(2)),
+        ([_compare_filter(schema[1], "=", "bar")], b == "bar"),
+        ([_compare_filter(schema[3], ">", 1)], d > 1),
+        ([_between_filter(schema[0], 2, 4)], a.is_between(2, 4)),
+        ([_not_between_filter(schema[0], 2, 4)], (a < 2) | (a > 4)),
+        ([_filter("is_null", schema[1])], b.is_null()),
+        ([_filter("not_null", schema[1])], b.is_not_null()),
+        ([_filter("is_empty", schema[1])], b == ""),
+        ([_filter("not_empty", schema[1])], b != ""),
+        ([_filter("is_empty", schema[4])], e == b""),
+        ([_filter("is_true", schema[2])], c),
+        ([_filter("is_false", schema[2])], c.not_()),
+        ([_set_member_filter(schema[1], ["foo", "bar"])], b.is_in(["foo", "bar"])),
+        # Nulls are not in any set
+        (
+            [_set_member_filter(schema[0], [1, 4], inclusive=False)],
+            ~a.is_in([1, 4]).fill_null(False),
+        ),
+        ([_search_filter(schema[1], "FO")], b.str.to_lowercase().str.contains("fo")),
+        ([_search_filter(schema[1], "Fo", case_sensitive=True)], b.str.contains("Fo")),
+        ([_search_filter(schema[1], "a", search_type="starts_with")], b.str.starts_with("a")),
+        ([_search_filter(schema[1], "R", search_type="ends_with")], b.str.ends_with("r")),
+        ([_search_filter(schema[1], "b.", search_type="regex_match")], b.str.contains("^b.")),
+        ([_search_filter(schema[4], "b")], e.cast(pl.String).str.contains("b")),
+        (
+            [_compare_filter(schema[0], ">", 1), _filter("is_true", schema[2])],
+            (a > 1) & c,
+        ),
+    ]
+
+    for filters, expr in cases:
+        dxf.check_filter_case(df, filters, df.filter(expr))
+
+
+def test_polars_filter_datetime(dxf: DataExplorerFixture):
+    df = pl.DataFrame(
+        {
+            "date": pl.date_range(date(2024, 1, 1), date(2024, 1, 10), eager=True),
+            "datetime": pl.datetime_range(
+                datetime(2024, 1, 1), datetime(2024, 1, 10), "1d", eager=True
+            ),
+        }
+    ).with_columns(datetimetz=pl.col("datetime").dt.replace_time_zone("America/New_York"))
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+
+    for column_schema in schema:
+        expected = df.slice(4, 6)
+        dxf.check_filter_case(df, [_compare_filter(column_schema, ">=", "2024-01-05")], expected)
+
+        expected = df.slice(2, 3)
+        filters = [_between_filter(column_schema, "2024-01-03", "2024-01-05")]
+        dxf.check_filter_case(df, filters, expected)
+
+
+def test_polars_filter_errors(dxf: DataExplorerFixture):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["foo", "bar", "baz"]})
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+
+    filters = [
+        _compare_filter(schema[0], ">", "foo"),
+        _search_filter(schema[1], "(", search_type="regex_match"),
+        _compare_filter(schema[0], ">", 1),
+        _search_filter(schema[0], "foo"),
+    ]
+    result = dxf.set_row_filters("df", filters=filters)
+    assert result == FilterResult(selected_num_rows=2, had_errors=True)
+
+    state = dxf.get_state("df")
+    assert [f["is_valid"] for f in state["row_filters"]] == [False, False, True, False]
+    assert state["row_filters"][3]["error_message"] is None
+    assert state["table_shape"]["num_rows"] == 2
+
+
+def test_polars_sort_and_filter(dxf: DataExplorerFixture):
+    rng = np.random.default_rng(12345)
+    num_rows = 1000
+    floats = rng.integers(0, 10, num_rows).astype(float)
+    floats[rng.random(num_rows) < 0.1] = np.nan
+    df = pl.DataFrame(
+        {
+            "a": rng.integers(0, 5, num_rows),
+            "b": pl.Series(floats).scatter(np.flatnonzero(rng.random(num_rows) < 0.1), None),
+            "c": rng.choice(["foo", "bar", "baz", None], num_rows).tolist(),
+        }
+    )
+    pandas_df = df.to_pandas()
+
+    sort_cases = [
+        [{"column_index": 0, "ascending": True}],
+        [{"column_index": 1, "ascending": False}],
+        [{"column_index": 2, "ascending": True}, {"column_index": 1, "ascending": True}],
+        [{"column_index": 1, "ascending": False}, {"column_index": 0, "ascending": False}],
+    ]
+    for sort_keys in sort_cases:
+        # Missing values are sorted last and the sort is stable, as
+        # with pandas
+        order = pandas_df.sort_values(
+            [df.columns[key["column_index"]] for key in sort_keys],
+            ascending=[key["ascending"] for key in sort_keys],
+            kind="stable",
+            na_position="last",
+        ).index.to_numpy()
+        dxf.check_sort_case(df, sort_keys, df[order])
+
+        schema = dxf.get_schema_for(df)
+        filters = [_compare_filter(schema[0], ">", 2)]
+        mask = (pandas_df["a"] > 2).to_numpy()
+        dxf.check_sort_case(df, sort_keys, df[order[mask[order]]], filters=filters)
+
+    # Changing the filters of a sorted table keeps the sort order
+    dxf.register_table("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_sort_columns("df", sort_keys=sort_cases[1])
+    dxf.set_row_filters("df", filters=[_filter("not_null", schema[1])])
+    values = dxf.get_data_values("df", row_start_index=0, num_rows=5, column_indices=[1])
+    assert values["columns"] == [["9.00", "9.00", "9.00", "9.00", "9.00"]]
+    # NaN is a value rather than a null in polars
+    assert dxf.get_state("df")["table_shape"]["num_rows"] == df["b"].count()
+
+
+def test_polars_search_schema(dxf: DataExplorerFixture):
+    column_names = [f"{prefix}_{i}" for prefix in ["aaa", "bbb"] for i in range(100)]
+    df = pl.DataFrame({name: [0, 1] for name in column_names})
+    dxf.register_table("df", df)
+    full_schema = dxf.get_schema("df", 0, len(column_names))
+
+    result = dxf.search_schema("df", "BBB_1", 0, 5)
+    assert result["total_num_matches"] == 11
+    assert result["matches"]["columns"] == [full_schema[i] for i in [101, 110, 111, 112, 113]]
+
+
+def test_polars_export_data_selection(dxf: DataExplorerFixture):
+    df = pl.DataFrame(
+        {
+            "a": [3, 1, 2, 5, 4],
+            "b": ["foo", "b,ar", None, "<qux>", "baz"],
+            "c": [[1], [2, 3], [], None, [4]],
+        }
+    )
+    dxf.register_table("df", df)
+    dxf.set_sort_columns("df", sort_keys=[{"column_index": 0, "ascending": True}])
+
+    result = dxf.export_data_selection("df", _select_single_cell(0, 1))
+    assert result["data"] == "b,ar"
+
+    result = dxf.export_data_selection("df", _select_cell_range(1, 2, 0, 1), "csv")
+    assert result["data"] == "a,b\n2,\n3,foo\n"
+
+    result = dxf.export_data_selection("df", _select_row_indices([4, 0]), "tsv")
+    assert result["data"] == "a\tb\tc\n5\t<qux>\t\n1\tb,ar\t[2, 3]\n"
+
+    result = dxf.export_data_selection("df", _select_column_range(1, 1), "html")
+    assert result["data"].splitlines()[2:5] == [
+        "    <tr><th>b</th></tr>",
+        "  </thead>",
+        "  <tbody>",
+    ]
+    assert "<td>&lt;qux&gt;</td>" in result["data"]
+
+
+def test_polars_variable_updates(dxf: DataExplorerFixture, shell: PositronShell):
+    df = pl.DataFrame({"a": [1, 2, 3], "b": ["foo", "bar", "baz"], "c": [1.0, 2.0, 3.0]})
+    dxf.assign_and_open_viewer("df", df)
+    schema = dxf.get_schema("df")
+    dxf.set_row_filters("df", filters=[_compare_filter(schema[1], "!=", "bar")])
+    dxf.set_sort_columns("df", sort_keys=[{"column_index": 2, "ascending": False}])
+
+    # Same schema
+    shell.run_cell("import polars as pl\ndf = df.with_columns(c=pl.col('c') * 2)")
+    _check_update_variable(dxf.de_service, "df", update_type="data")
+    state = dxf.get_state("df")
+    assert state["table_shape"]["num_rows"] == 2
+    assert state["sort_keys"] == [{"column_index": 2, "ascending": False}]
+
+    # Columns moved and deleted
+    shell.run_cell("df = df.select('c', 'b')")
+    _check_update_variable(dxf.de_service, "df", update_type="schema")
+    state = dxf.get_state("df")
+    assert state["row_filters"][0]["column_schema"]["column_index"] == 1
+    assert state["row_filters"][0]["is_valid"]
+    assert state["sort_keys"] == [{"column_index": 0, "ascending": False}]
+    values = dxf.get_data_values("df", row_start_index=0, num_rows=5, column_indices=[0, 1])
+    assert values["columns"] == [["6.00", "2.00"], ["baz", "foo"]]
+
+    shell.run_cell("df = df.select('c')")
+    _check_update_variable(dxf.de_service, "df", update_type="schema")
+    state = dxf.get_state("df")
+    assert not state["row_filters"][0]["is_valid"]
+    assert state["row_filters"][0]["error_message"] == "Column was deleted"
+    assert state["table_shape"]["num_rows"] == 3
+
+
+# ----------------------------------------------------------------------
+# pyarrow tests
+
+
+def example_pyarrow_table():
+    # Tables of several record batches, so that the columns have
+    # several chunks
+    batches = [
+        pa.RecordBatch.from_pydict(
+            {
+                "a": [1, 2, None, 4],
+                "b": ["foo", "bar", None, ""],
+                "c": [1.5, float("nan"), None, float("inf")],
+                "d": pa.array(["x", "y", "x", None]).dictionary_encode(),
+                "e": [True, False, None, True],
+                "f": pa.array(
+                    [datetime(2024, 1, 1), datetime(2024, 1, 3), None, datetime(2024, 1, 2)],
+                    pa.timestamp("us", tz="UTC"),
+                ),
+            }
+        ),
+        pa.RecordBatch.from_pydict(
+            {
+                "a": [5, 3],
+                "b": ["Foo", "baz"],
+                "c": [0.0, -1.0],
+                "d": pa.array(["y", "z"]).dictionary_encode(),
+                "e": [False, True],
+                "f": pa.array(
+                    [datetime(2024, 1, 5), datetime(2024, 1, 4)], pa.timestamp("us", tz="UTC")
+                ),
+            }
+        ),
+    ]
+    return pa.Table.from_batches(batches)
+
+
+def test_pyarrow_get_schema(dxf: DataExplorerFixture):
+    table = example_pyarrow_table()
+    dxf.register_table("table", table)
+
+    assert dxf.get_schema("table") == _wrap_json(
+        ColumnSchema,
+        [
+            {"column_name": "a", "column_index": 0, "type_name": "int64", "type_display": "number"},
+            {
+                "column_name": "b",
+                "column_index": 1,
+                "type_name": "string",
+                "type_display": "string",
+            },
+            {
+                "column_name": "c",
+                "column_index": 2,
+                "type_name": "double",
+                "type_display": "number",
+            },
+            {
+                "column_name": "d",
+                "column_index": 3,
+                "type_name": "dictionary<values=string, indices=int32, ordered=0>",
+                "type_display": "string",
+            },
+            {"column_name": "e", "column_index": 4, "type_name": "bool", "type_display": "boolean"},
+            {
+                "column_name": "f",
+                "column_index": 5,
+                "type_name": "timestamp[us, tz=UTC]",
+                "type_display": "datetime",
+            },
+        ],
+    )
+
+
+def test_pyarrow_get_data_values(dxf: DataExplorerFixture):
+    table = example_pyarrow_table()
+    dxf.register_table("table", table)
+
+    result = dxf.get_data_values(
+        "table", row_start_index=0, num_rows=10, column_indices=list(range(6))
+    )
+    assert result["columns"] == [
+        ["1", "2", _VALUE_NULL, "4", "5", "3"],
+        ["foo", "bar", _VALUE_NULL, "", "Foo", "baz"],
+        ["1.50", _VALUE_NAN, _VALUE_NULL, _VALUE_INF, "0.00", "-1.00"],
+        ["x", "y", "x", _VALUE_NULL, "y", "z"],
+        ["True", "False", _VALUE_NULL, "True", "False", "True"],
+        [
+            "2024-01-01 00:00:00+00:00",
+            "2024-01-03 00:00:00+00:00",
+            _VALUE_NULL,
+            "2024-01-02 00:00:00+00:00",
+            "2024-01-05 00:00:00+00:00",
+            "2024-01-04 00:00:00+00:00",
+        ],
+    ]
+    assert result["row_labels"] is None
+
+    # Ranges across chunks
+    result = dxf.get_data_values("table", row_start_index=3, num_rows=2, column_indices=[0, 3])
+    assert result["columns"] == [["4", "5"], [_VALUE_NULL, "y"]]
+
+
+def test_pyarrow_filter(dxf: DataExplorerFixture):
+    table = example_pyarrow_table()
+    dxf.register_table("table", table)
+    schema = dxf.get_schema("table")
+
+    a, b, c, d, e, f = table.columns
+    cases = [
+        ([_compare_filter(schema[0], ">", 2)], pc.greater(a, 2)),
+        ([_compare_filter(schema[0], "<=", "2.5")], pc.less_equal(a, 2.5)),
+        # Nulls are not equal to any value
+        ([_compare_filter(schema[0], "!=", 2)], pc.not_equal(a, 2).fill_null(True)),
+        ([_compare_filter(schema[1], "=", "bar")], pc.equal(b, "bar")),
+        ([_compare_filter(schema[2], ">", 1)], pc.greater(c, 1)),
+        ([_compare_filter(schema[3], "=", "x")], pc.equal(d.cast(pa.string()), "x")),
+        ([_between_filter(schema[0], 2, 4)], pc.and_(pc.greater_equal(a, 2), pc.less_equal(a, 4))),
+        ([_not_between_filter(schema[0], 2, 4)], pc.or_(pc.less(a, 2), pc.greater(a, 4))),
+        ([_filter("is_null", schema[1])], pc.is_null(b)),
+        ([_filter("not_null", schema[3])], pc.is_valid(d)),
+        ([_filter("is_empty", schema[1])], pc.equal(b, "")),
+        ([_filter("not_empty", schema[1])], pc.not_equal(b, "")),
+        ([_filter("is_true", schema[4])], e),
+        ([_filter("is_false", schema[4])], pc.invert(e)),
+        ([_set_member_filter(schema[1], ["foo", "bar"])], pc.is_in(b, pa.array(["foo", "bar"]))),
+        (
+            [_set_member_filter(schema[3], ["x", "z"], inclusive=False)],
+            pc.invert(pc.is_in(d.cast(pa.string()), pa.array(["x", "z"]))).fill_null(True),
+        ),
+        ([_search_filter(schema[1], "FO")], pc.match_substring(b, "fo", ignore_case=True)),
+        ([_search_filter(schema[1], "Fo", case_sensitive=True)], pc.match_substring(b, "Fo")),
+        ([_search_filter(schema[1], "b", search_type="starts_with")], pc.starts_with(b, "b")),
+        ([_search_filter(schema[1], "R", search_type="ends_with")], pc.ends_with(b, "r")),
+        (
+            [_search_filter(schema[1], "b.", search_type="regex_match")],
+            pc.match_substring_regex(b, "^b."),
+        ),
+        ([_compare_filter(schema[5], ">=", "2024-01-03")], pc.greater_equal(pc.day(f), 3)),
+        (
+            [_compare_filter(schema[0], ">", 1), _filter("is_true", schema[4])],
+            pc.and_(pc.greater(a, 1), e),
+        ),
+    ]
+
+    for filters, mask in cases:
+        dxf.check_filter_case(table, filters, table.filter(mask.fill_null(False)))
+
+
+def test_pyarrow_filter_errors(dxf: DataExplorerFixture):
+    table = pa.table({"a": [1, 2, 3], "b": ["foo", "bar", "baz"]})
+    dxf.register_table("table", table)
+    schema = dxf.get_schema("table")
+
+    filters = [
+        _compare_filter(schema[0], ">", "foo"),
+        _search_filter(schema[1], "(", search_type="regex_match"),
+        _compare_filter(schema[0], ">", 1),
+    ]
+    result = dxf.set_row_filters("table", filters=filters)
+    assert result == FilterResult(selected_num_rows=2, had_errors=True)
+
+    state = dxf.get_state("table")
+    assert [f["is_valid"] for f in state["row_filters"]] == [False, False, True]
+    assert state["table_shape"]["num_rows"] == 2
+
+
+def test_pyarrow_sort_and_filter(dxf: DataExplorerFixture):
+    rng = np.random.default_rng(12345)
+    num_rows = 1000
+    floats = rng.integers(0, 10, num_rows).astype(float)
+    floats[rng.random(num_rows) < 0.1] = np.nan
+    pandas_df = pd.DataFrame(
+        {
+            "a": rng.integers(0, 5, num_rows),
+            "b": floats,
+            "c": rng.choice(["foo", "bar", "baz", None], num_rows),
+        }
+    )
+    table = pa.Table.from_pandas(pandas_df[:500], preserve_index=False)
+    table = pa.concat_tables([table, pa.Table.from_pandas(pandas_df[500:], preserve_index=False)])
+
+    sort_cases = [
+        [{"column_index": 0, "ascending": True}],
+        [{"column_index": 2, "ascending": False}],
+        [{"column_index": 2, "ascending": True}, {"column_index": 0, "ascending": False}],
+    ]
+    for sort_keys in sort_cases:
+        order = pandas_df.sort_values(
+            [pandas_df.columns[key["column_index"]] for key in sort_keys],
+            ascending=[key["ascending"] for key in sort_keys],
+            kind="stable",
+            na_position="last",
+        ).index.to_numpy()
+        dxf.check_sort_case(table, sort_keys, table.take(order))
+
+        schema = dxf.get_schema_for(table)
+        filters = [_compare_filter(schema[0], ">", 2)]
+        mask = (pandas_df["a"] > 2).to_numpy()
+        dxf.check_sort_case(table, sort_keys, table.take(order[mask[order]]), filters=filters)
+
+
+def test_pyarrow_profiles(dxf: DataExplorerFixture):
+    table = pa.concat_tables(
+        [
+            pa.table(
+                {
+                    "ints": [0, 1, 1, 2, None],
+                    "floats": [0.0, 0.5, None, 1.0, float("inf")],
+                    "strings": pa.array(["b", "a", None, "b", ""]).dictionary_encode(),
+                }
+            ),
+            pa.table(
+                {
+                    "ints": [3, 3, 3, 3, 4],
+                    "floats": [2.0, 2.0, 2.0, 1.5, float("nan")],
+                    "strings": pa.array(["a", "b", "d", "e", None]).dictionary_encode(),
+                }
+            ),
+        ]
+    )
+    dxf.register_table("table", table)
+    view = dxf.get_table_view("table")
+    view.HISTOGRAM_NUM_BINS = 4
+    view.FREQUENCY_TABLE_SIZE = 3
+
+    results = dxf.get_column_profiles(
+        "table", [_get_null_count(0), _get_null_count(1), _get_null_count(2)]
+    )
+    assert [x["null_count"] for x in results] == [1, 1, 2]
+
+    results = dxf.get_column_profiles(
+        "table", [_get_histogram(0), _get_histogram(1), _get_histogram(2)]
+    )
+    assert [x["histogram"] for x in results[:2]] == [
+        _histogram_case([3, 5, 1], 2),
+        _histogram_case([1, 1, 1, 4], 0.5),
+    ]
+    assert results[2] == {}
+
+    results = dxf.get_column_profiles("table", [_get_frequency_table(0), _get_frequency_table(2)])
+    assert [x["frequency_table"] for x in results] == [
+        _frequency_table_case([("3", 4), ("1", 2), ("0", 1)], 2),
+        _frequency_table_case([("b", 3), ("a", 2), ("", 1)], 2),
+    ]
+
+    results = dxf.get_column_profiles("table", [_get_summary_stats(0), _get_summary_stats(2)])
+    assert results[0]["summary_stats"]["number_stats"] == {
+        "min_value": "0.00",
+        "max_value": "4.00",
+        "mean": "2.22",
+        "median": "3.00",
+        "stdev": "1.30",
+        "quantiles": None,
+    }
+    assert results[1]["summary_stats"]["string_stats"] == {
+        "num_empty": 1,
+        "num_unique": 5,
+        "num_unique_error": None,
+    }
+
+    # Profiles of the filtered rows
+    schema = dxf.get_schema("table")
+    dxf.set_row_filters("table", filters=[_compare_filter(schema[0], "<", 3)])
+    results = dxf.get_column_profiles("table", [_get_null_count(1), _get_frequency_table(0)])
+    assert results[0]["null_count"] == 1
+    assert results[1]["frequency_table"] == _frequency_table_case([("1", 2), ("0", 1), ("2", 1)], 0)
+
+
+def test_pyarrow_export_data_selection(dxf: DataExplorerFixture):
+    table = pa.table(
+        {
+            "a": [3, 1, 2, 5, 4],
+            "b": ["foo", "b,ar", None, "<qux>", "baz"],
+            "c": [[1], [2, 3], [], None, [4]],
+        }
+    )
+    dxf.register_table("table", table)
+    dxf.set_sort_columns("table", sort_keys=[{"column_index": 0, "ascending": True}])
+
+    result = dxf.export_data_selection("table", _select_single_cell(0, 1))
+    assert result["data"] == "b,ar"
+
+    result = dxf.export_data_selection("table", _select_cell_range(1, 2, 0, 1), "csv")
+    assert result["data"] == "a,b\n2,\n3,foo\n"
+
+    result = dxf.export_data_selection("table", _select_row_indices([4, 0]), "tsv")
+    assert result["data"] == "a\tb\tc\n5\t<qux>\t\n1\tb,ar\t[2, 3]\n"
+
+    result = dxf.export_data_selection("table", _select_column_range(1, 1), "html")
+    assert "<td>&lt;qux&gt;</td>" in result["data"]
+
+
+def test_pyarrow_variable_updates(dxf: DataExplorerFixture, shell: PositronShell):
+    table = pa.table({"a": [1, 2, 3], "b": ["foo", "bar", "baz"], "c": [1.0, 2.0, 3.0]})
+    dxf.assign_and_open_viewer("table", table)
+    schema = dxf.get_schema("table")
+    dxf.set_row_filters("table", filters=[_compare_filter(schema[1], "!=", "bar")])
+    dxf.set_sort_columns("table", sort_keys=[{"column_index": 2, "ascending": False}])
+
+    # Same schema
+    shell.run_cell(
+        "import pyarrow.compute as pc\n"
+        "table = table.set_column(2, 'c', pc.multiply(table['c'], 2))"
+    )
+    _check_update_variable(dxf.de_service, "table", update_type="data")
+    state = dxf.get_state("table")
+    assert state["table_shape"]["num_rows"] == 2
+    assert state["sort_keys"] == [{"column_index": 2, "ascending": False}]
+
+    # Columns moved and deleted
+    shell.run_cell("table = table.select(['c', 'b'])")
+    _check_update_variable(dxf.de_service, "table", update_type="schema")
+    state = dxf.get_state("table")
+    assert state["row_filters"][0]["column_schema"]["column_index"] == 1
+    assert state["sort_keys"] == [{"column_index": 0, "ascending": False}]
+    values = dxf.get_data_values("table", row_start_index=0, num_rows=5, column_indices=[0, 1])
+    assert values["columns"] == [["6.00", "2.00"], ["baz", "foo"]]
+
+
+# ----------------------------------------------------------------------
+# File tests
+
+
+def _write_example_files(table: pa.Table, tmp_path):
+    import pyarrow.csv
+    import pyarrow.feather
+    import pyarrow.parquet
+
+    paths = {
+        "parquet": tmp_path / "table.parquet",
+        "feather": tmp_path / "table.feather",
+        "csv": tmp_path / "table.csv",
+    }
+    pyarrow.parquet.write_table(table, paths["parquet"], row_group_size=10)
+    pyarrow.feather.write_feather(table, paths["feather"], chunksize=10)
+    pyarrow.csv.write_csv(table, paths["csv"])
+    return paths
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "feather", "csv"])
+def test_register_file(dxf: DataExplorerFixture, tmp_path, file_format):
+    table = pa.table(
+        {
+            "a": np.arange(100),
+            "b": [f"s{i % 7}" for i in range(100)],
+            "c": [None if i % 10 == 0 else i * 0.5 for i in range(100)],
+        }
+    )
+    path = _write_example_files(table, tmp_path)[file_format]
+    dxf.register_file("file", path)
+    dxf.register_table("table", table)
+
+    assert dxf.get_schema("file") == dxf.get_schema("table")
+    state = dxf.get_state("file")
+    assert state["display_name"] == "file"
+    assert state["table_shape"] == {"num_rows": 100, "num_columns": 3}
+
+    dxf.compare_tables("file", "table", table.shape)
+
+    schema = dxf.get_schema("file")
+    filters = [_between_filter(schema[0], 42, 55), _search_filter(schema[1], "S1")]
+    sort_keys = [{"column_index": 2, "ascending": False}]
+    for name in ["file", "table"]:
+        assert dxf.set_row_filters(name, filters=filters) == FilterResult(
+            selected_num_rows=2, had_errors=False
+        )
+        dxf.set_sort_columns(name, sort_keys=sort_keys)
+    dxf.compare_tables("file", "table", table.shape)
+
+    profiles = [_get_null_count(2), _get_summary_stats(0), _get_frequency_table(1)]
+    assert dxf.get_column_profiles("file", profiles) == dxf.get_column_profiles("table", profiles)
+
+    selection = _select_row_range(0, 1)
+    assert dxf.export_data_selection("file", selection, "csv") == dxf.export_data_selection(
+        "table", selection, "csv"
+    )
+
+
+def test_register_file_reads_only_needed_row_groups(dxf: DataExplorerFixture, tmp_path):
+    table = pa.table({"a": np.arange(100), "b": np.arange(100) * 2.0})
+    path = _write_example_files(table, tmp_path)["parquet"]
+    dxf.register_file("file", path)
+    view = dxf.get_table_view("file")
+    view.VIEWPORT_BLOCK_SIZE = 10
+    file = view.table
+
+    reads = []
+    read_chunk = file._read_chunk
+
+    def _read_chunk(chunk, column_index):
+        reads.append((chunk, column_index))
+        return read_chunk(chunk, column_index)
+
+    file._read_chunk = _read_chunk
+
+    # The shape and null counts are in the file metadata
+    assert dxf.get_state("file")["table_shape"] == {"num_rows": 100, "num_columns": 2}
+    assert dxf.get_column_profiles("file", [_get_null_count(0)])[0]["null_count"] == 0
+    assert reads == []
+
+    result = dxf.get_data_values("file", row_start_index=25, num_rows=10, column_indices=[1])
+    assert result["columns"] == [[f"{x:.2f}" for x in range(50, 70, 2)]]
+    assert reads == [(2, 1), (3, 1)]
+
+    # Row groups whose statistics exclude the filter are not read
+    reads.clear()
+    schema = dxf.get_schema("file")
+    result = dxf.set_row_filters("file", filters=[_compare_filter(schema[0], ">=", 85)])
+    assert result == FilterResult(selected_num_rows=15, had_errors=False)
+    assert reads == [(8, 0), (9, 0)]
+
+
+def test_register_file_unsupported(dxf: DataExplorerFixture, tmp_path):
+    path = tmp_path / "table.txt"
+    path.write_text("a,b\n1,2\n")
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        dxf.de_service.register_file(str(path))
+
+
+def test_register_file_csv_conversions(dxf: DataExplorerFixture, tmp_path):
+    table = pa.table({"a": np.arange(100), "b": np.arange(100) * 2.0})
+    path = _write_example_files(table, tmp_path)["csv"]
+
+    # An unmodified CSV file is converted once for all its explorers
+    dxf.register_file("file1", path)
+    dxf.register_file("file2", path)
+    file = dxf.get_table_view("file1").table
+    assert dxf.get_table_view("file2").table is file
+    assert os.path.exists(file.path)
+
+    dxf.de_service._close_explorer(dxf.get_comm_id("file1"))
+    assert os.path.exists(file.path)
+    dxf.de_service._close_explorer(dxf.get_comm_id("file2"))
+    assert not os.path.exists(file.path)
+
+    # A modified CSV file is converted again
+    dxf.register_file("file3", path)
+    file3 = dxf.get_table_view("file3").table
+    os.utime(path, ns=(0, 0))
+    dxf.register_file("file4", path)
+    file4 = dxf.get_table_view("file4").table
+    assert file4 is not file3
+    assert file4.path != file3.path
+    assert dxf.get_state("file4")["table_shape"] == {"num_rows": 100, "num_columns": 2}
+
+    for name in ["file3", "file4"]:
+        dxf.de_service._close_explorer(dxf.get_comm_id(name))
+    assert not os.path.exists(file3.path)
+    assert not os.path.exists(file4.path)
+
+
+def test_register_file_csv_converted_in_background(dxf: DataExplorerFixture, tmp_path):
+    table = pa.table({"a": np.arange(100)})
+    path = _write_example_files(table, tmp_path)["csv"]
+    service = dxf.de_service
+
+    async def _register():
+        comm_id = service.register_file(str(path), "file")
+
+        # The explorer is opened once the file has been converted
+        # without blocking the kernel
+        assert comm_id not in service.comms
+        for _ in range(1000):
+            if comm_id in service.comms:
+                break
+            await asyncio.sleep(0.01)
+        return comm_id
+
+    comm_id = asyncio.run(_register())
+    dxf._file_comm_ids["file"] = comm_id
+    assert dxf.get_state("file")["table_shape"] == {"num_rows": 100, "num_columns": 1}
+    service._close_explorer(comm_id)
+
+
+def test_register_file_compressed_feather(dxf: DataExplorerFixture, tmp_path):
+    import pyarrow.feather
+
+    table = pa.table({"a": np.arange(1000), "b": [f"s{i}" for i in range(1000)]})
+    path = tmp_path / "table.feather"
+    pyarrow.feather.write_feather(table, path, compression="zstd", chunksize=300)
+
+    dxf.register_file("file", path)
+    assert np.diff(dxf.get_table_view("file").table._chunk_offsets).tolist() == [300, 300, 300, 100]
+    dxf.register_table("table", table)
+    assert dxf.get_state("file")["table_shape"] == {"num_rows": 1000, "num_columns": 2}
+    dxf.compare_tables("file", "table", table.shape)
+
+
+# ----------------------------------------------------------------------
+# SQL tests
+
+
+def _sql_table(table: pa.Table):
+    # The table in an in-memory SQLite database, as previewed from the
+    # connections pane
+    types = {
+        pa.int64(): "INTEGER",
+        pa.float64(): "REAL",
+        pa.string(): "TEXT",
+        pa.bool_(): "BOOLEAN",
+    }
+    columns = ", ".join(f"{field.name} {types[field.type]}" for field in table.schema)
+    placeholders = ", ".join("?" for _ in table.column_names)
+
+    con = sqlite3.connect(":memory:")
+    con.execute(f"CREATE TABLE example({columns})")
+    con.executemany(
+        f"INSERT INTO example VALUES({placeholders})",
+        [tuple(row.values()) for row in table.to_pylist()],
+    )
+    return SQLite3Connection(con).preview_object(
+        [ObjectSchema(kind="schema", name="main"), ObjectSchema(kind="table", name="example")]
+    )
+
+
+def example_sql_tables():
+    table = pa.table(
+        {
+            "a": [1, 2, None, 4, 5, 3],
+            "b": ["foo", "bar", None, "", "Foo", "b_z"],
+            "c": [1.5, 2.5, None, float("inf"), 0.0, -1.0],
+            "e": [True, False, None, True, False, True],
+        }
+    )
+    return _sql_table(table), table
+
+
+def test_sql_get_schema_and_data_values(dxf: DataExplorerFixture):
+    sql_table, table = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    dxf.register_table("table", table)
+
+    assert [
+        (c["column_name"], c["type_name"], c["type_display"]) for c in dxf.get_schema("sql")
+    ] == [
+        ("a", "INTEGER", "number"),
+        ("b", "TEXT", "string"),
+        ("c", "REAL", "number"),
+        ("e", "BOOLEAN", "boolean"),
+    ]
+    state = dxf.get_state("sql")
+    assert state["table_shape"] == {"num_rows": 6, "num_columns": 4}
+
+    dxf.compare_tables("sql", "table", table.shape)
+    result = dxf.get_data_values("sql", row_start_index=4, num_rows=10, column_indices=[1, 2])
+    assert result["columns"] == [["Foo", "b_z"], ["0.00", "-1.00"]]
+
+
+def test_sql_filter(dxf: DataExplorerFixture):
+    sql_table, table = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    schema = dxf.get_schema("sql")
+
+    a, b, c, e = table.columns
+    cases = [
+        ([_compare_filter(schema[0], ">", 2)], pc.greater(a, 2)),
+        ([_compare_filter(schema[0], "<=", "2.5")], pc.less_equal(a, 2.5)),
+        # Nulls are not equal to any value
+        ([_compare_filter(schema[0], "!=", 2)], pc.not_equal(a, 2).fill_null(True)),
+        ([_compare_filter(schema[1], "=", "bar")], pc.equal(b, "bar")),
+        ([_compare_filter(schema[2], ">", 1)], pc.greater(c, 1)),
+        ([_between_filter(schema[0], 2, 4)], pc.and_(pc.greater_equal(a, 2), pc.less_equal(a, 4))),
+        ([_not_between_filter(schema[0], 2, 4)], pc.or_(pc.less(a, 2), pc.greater(a, 4))),
+        ([_filter("is_null", schema[1])], pc.is_null(b)),
+        ([_filter("not_null", schema[1])], pc.is_valid(b)),
+        ([_filter("is_empty", schema[1])], pc.equal(b, "")),
+        ([_filter("not_empty", schema[1])], pc.not_equal(b, "")),
+        ([_filter("is_true", schema[3])], e),
+        ([_filter("is_false", schema[3])], pc.invert(e)),
+        ([_set_member_filter(schema[1], ["foo", "bar"])], pc.is_in(b, pa.array(["foo", "bar"]))),
+        (
+            [_set_member_filter(schema[1], ["foo", ""], inclusive=False)],
+            pc.invert(pc.is_in(b, pa.array(["foo", ""]))).fill_null(True),
+        ),
+        ([_search_filter(schema[1], "FO")], pc.match_substring(b, "fo", ignore_case=True)),
+        ([_search_filter(schema[1], "Fo", case_sensitive=True)], pc.match_substring(b, "Fo")),
+        # Wildcards in search terms are matched literally
+        ([_search_filter(schema[1], "_")], pc.match_substring(b, "_")),
+        ([_search_filter(schema[1], "b", search_type="starts_with")], pc.starts_with(b, "b")),
+        ([_search_filter(schema[1], "R", search_type="ends_with")], pc.ends_with(b, "r")),
+        (
+            [_compare_filter(schema[0], ">", 1), _filter("is_true", schema[3])],
+            pc.and_(pc.greater(a, 1), e),
+        ),
+    ]
+
+    for filters, mask in cases:
+        expected = table.filter(mask.fill_null(False))
+        dxf.register_table("expected", expected)
+        result = dxf.set_row_filters("sql", filters=filters)
+        assert result == FilterResult(selected_num_rows=len(expected), had_errors=False)
+        assert dxf.get_state("sql")["table_unfiltered_shape"]["num_rows"] == len(table)
+        dxf.compare_tables("sql", "expected", table.shape)
+
+
+def test_sql_filter_errors(dxf: DataExplorerFixture):
+    sql_table, _ = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    schema = dxf.get_schema("sql")
+
+    filters = [
+        _compare_filter(schema[0], ">", "foo"),
+        _search_filter(schema[1], "b.", search_type="regex_match"),
+        _compare_filter(schema[0], ">", 1),
+    ]
+    result = dxf.set_row_filters("sql", filters=filters)
+    assert result == FilterResult(selected_num_rows=4, had_errors=True)
+
+    state = dxf.get_state("sql")
+    assert [f["is_valid"] for f in state["row_filters"]] == [False, False, True]
+    assert state["table_shape"]["num_rows"] == 4
+
+
+def test_sql_filter_count_error(dxf: DataExplorerFixture):
+    sql_table, _ = example_sql_tables()
+    execute = sql_table.execute
+
+    def _execute(sql, params):
+        # Each filter is accepted on its own, but the count fails
+        if sql.startswith("SELECT COUNT(*)") and " WHERE " in sql:
+            raise sqlite3.OperationalError("count failed")
+        return execute(sql, params)
+
+    sql_table.execute = _execute
+    dxf.register_table("sql", sql_table)
+    schema = dxf.get_schema("sql")
+
+    filters = [_compare_filter(schema[0], ">", 1), _compare_filter(schema[2], "<", 2)]
+    result = dxf.set_row_filters("sql", filters=filters)
+    assert result == FilterResult(selected_num_rows=6, had_errors=True)
+
+    state = dxf.get_state("sql")
+    assert [f["is_valid"] for f in state["row_filters"]] == [False, False]
+    assert [f["error_message"] for f in state["row_filters"]] == ["count failed"] * 2
+
+
+def test_sql_sort_and_filter(dxf: DataExplorerFixture):
+    sql_table, table = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    schema = dxf.get_schema("sql")
+    pandas_df = table.to_pandas()
+
+    sort_cases = [
+        [{"column_index": 0, "ascending": True}],
+        [{"column_index": 2, "ascending": False}],
+        [{"column_index": 3, "ascending": True}, {"column_index": 1, "ascending": False}],
+    ]
+    for sort_keys in sort_cases:
+        order = pandas_df.sort_values(
+            [pandas_df.columns[key["column_index"]] for key in sort_keys],
+            ascending=[key["ascending"] for key in sort_keys],
+            na_position="last",
+        ).index.to_numpy()
+
+        dxf.set_row_filters("sql", filters=[])
+        dxf.set_sort_columns("sql", sort_keys=sort_keys)
+        dxf.register_table("expected", table.take(order))
+        dxf.compare_tables("sql", "expected", table.shape)
+
+        # Filtering keeps the sort order
+        dxf.set_row_filters("sql", filters=[_filter("not_null", schema[1])])
+        mask = pandas_df["b"].notna().to_numpy()
+        dxf.register_table("expected", table.take(order[mask[order]]))
+        dxf.compare_tables("sql", "expected", table.shape)
+
+
+def test_sql_profiles(dxf: DataExplorerFixture):
+    table = pa.table(
+        {
+            "ints": [0, 1, 1, 2, None, 3, 3, 3, 3, 4],
+            "floats": [0.0, 0.5, None, 1.0, float("inf"), 2.0, 2.0, 2.0, 1.5, 1.5],
+            "strings": ["b", "a", None, "b", "", "a", "b", "d", "e", None],
+            "bools": [True, False, None, True, True, False, True, None, True, False],
+        }
+    )
+    dxf.register_table("sql", _sql_table(table))
+    dxf.register_table("table", table)
+    for name in ["sql", "table"]:
+        view = dxf.get_table_view(name)
+        view.HISTOGRAM_NUM_BINS = 4
+        view.FREQUENCY_TABLE_SIZE = 3
+
+    profiles = [
+        _get_null_count(0),
+        _get_null_count(2),
+        _get_summary_stats(0),
+        _get_summary_stats(1),
+        _get_summary_stats(2),
+        _get_summary_stats(3),
+        _get_histogram(0),
+        _get_histogram(1),
+    ]
+    assert dxf.get_column_profiles("sql", profiles) == dxf.get_column_profiles("table", profiles)
+
+    results = dxf.get_column_profiles("sql", [_get_frequency_table(0), _get_frequency_table(2)])
+    assert [x["frequency_table"] for x in results] == [
+        _frequency_table_case([("3", 4), ("1", 2), ("0", 1)], 2),
+        _frequency_table_case([("b", 3), ("a", 2), ("", 1)], 2),
+    ]
+
+    # Profiles of the filtered rows
+    schema = dxf.get_schema("sql")
+    for name in ["sql", "table"]:
+        dxf.set_row_filters(name, filters=[_compare_filter(schema[0], "<", 3)])
+    assert dxf.get_column_profiles("sql", profiles) == dxf.get_column_profiles("table", profiles)
+
+
+def test_sql_export_data_selection(dxf: DataExplorerFixture):
+    sql_table, _ = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    dxf.set_sort_columns("sql", sort_keys=[{"column_index": 0, "ascending": True}])
+
+    result = dxf.export_data_selection("sql", _select_single_cell(0, 1))
+    assert result["data"] == "foo"
+
+    result = dxf.export_data_selection("sql", _select_cell_range(1, 2, 0, 1), "csv")
+    assert result["data"] == "a,b\n2,bar\n3,b_z\n"
+
+    result = dxf.export_data_selection("sql", _select_row_indices([5, 0]), "tsv")
+    assert result["data"] == "a\tb\tc\te\n\t\t\t\n1\tfoo\t1.5\t1\n"
+
+
+def test_sql_fetches_only_viewport_rows(dxf: DataExplorerFixture):
+    table = pa.table({"a": np.arange(10_000), "b": np.arange(10_000) * 0.5})
+    sql_table = _sql_table(table)
+    queries = []
+    execute = sql_table.execute
+
+    def _execute(sql, params):
+        result = execute(sql, params)
+        queries.append((sql, len(result)))
+        return result
+
+    sql_table.execute = _execute
+    dxf.register_table("sql", sql_table)
+    dxf.get_table_view("sql").VIEWPORT_BLOCK_SIZE = 10
+
+    result = dxf.get_data_values("sql", row_start_index=5000, num_rows=5, column_indices=[1])
+    assert result["columns"] == [[f"{x:,.2f}" for x in np.arange(5000, 5005) * 0.5]]
+    assert max(num_rows for _, num_rows in queries) == 10
+
+    queries.clear()
+    schema = dxf.get_schema("sql")
+    dxf.set_row_filters("sql", filters=[_compare_filter(schema[0], ">=", 9990)])
+    dxf.set_sort_columns("sql", sort_keys=[{"column_index": 1, "ascending": False}])
+    dxf.get_column_profiles("sql", [_get_summary_stats(0), _get_histogram(1)])
+    result = dxf.get_data_values("sql", row_start_index=0, num_rows=3, column_indices=[0])
+    assert result["columns"] == [["9999", "9998", "9997"]]
+    assert max(num_rows for _, num_rows in queries) <= 10
+
+
+def test_sql_refreshed_after_execution(dxf: DataExplorerFixture):
+    sql_table, _ = example_sql_tables()
+    dxf.register_table("sql", sql_table)
+    assert dxf.get_state("sql")["table_shape"]["num_rows"] == 6
+    result = dxf.get_data_values("sql", row_start_index=0, num_rows=10, column_indices=[0])
+    assert result["columns"] == [["1", "2", _VALUE_NULL, "4", "5", "3"]]
+
+    # The database is modified by user code, so the explorer is
+    # refreshed once the code has run
+    sql_table.execute("INSERT INTO example(a) VALUES (7)", {})
+    dxf.de_service.pause_background_work()
+    dxf.de_service.resume_background_work()
+
+    comm = cast(DummyComm, dxf.de_service.comms[dxf.get_comm_id("sql")].comm)
+    assert comm.messages[-1] == json_rpc_notification("data_update", {})
+    assert dxf.get_state("sql")["table_shape"]["num_rows"] == 7
+    result = dxf.get_data_values("sql", row_start_index=0, num_rows=10, column_indices=[0])
+    assert result["columns"] == [["1", "2", _VALUE_NULL, "4", "5", "3", "7"]]
+
+    # Filtered views are counted again too
+    schema = dxf.get_schema("sql")
+    dxf.set_row_filters("sql", filters=[_compare_filter(schema[0], ">", 3)])
+    assert dxf.get_state("sql")["table_shape"]["num_rows"] == 3
+    sql_table.execute("DELETE FROM example WHERE a = 7", {})
+    dxf.de_service.resume_background_work()
+    assert dxf.get_state("sql")["table_shape"]["num_rows"] == 2
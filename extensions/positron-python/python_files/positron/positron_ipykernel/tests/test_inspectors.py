@@ -14,6 +14,7 @@ from typing import Any, Callable, Iterable, Optional, Tuple
 import numpy as np
 import pandas as pd
 import polars as pl
+import pyarrow as pa
 import pytest
 from fastcore.foundation import L
 
@@ -774,6 +775,23 @@ def test_inspect_polars_dataframe() -> None:
     )
 
 
+def test_inspect_pyarrow_table() -> None:
+    value = pa.table({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    rows, cols = value.shape
+    verify_inspector(
+        value=value,
+        display_value=f"[{rows} rows x {cols} columns] pyarrow.Table",
+        kind=VariableKind.Table,
+        display_type=f"Table [{rows}x{cols}]",
+        type_info=get_type_as_str(value),
+        has_children=True,
+        has_viewer=True,
+        is_truncated=True,
+        length=cols,
+    )
+    assert get_inspector(value).to_plaintext() == '"a"\t"b"\n1\t"x"\n2\t"y"\n3\t"z"\n'
+
+
 def test_inspect_polars_series() -> None:
     value = pl.Series([0, 1])
     (rows,) = value.shape
@@ -802,6 +820,7 @@ def test_inspect_polars_series() -> None:
         (pl.Series([0, 1]), range(2)),
         (pd.DataFrame({"a": [1, 2], "b": ["3", "4"]}), range(2)),
         (pl.DataFrame({"a": [1, 2], "b": ["3", "4"]}), ["a", "b"]),
+        (pa.table({"a": [1, 2], "b": ["3", "4"]}), ["a", "b"]),
         (pd.Index([0, 1]), range(0, 2)),
         (
             pd.Index([datetime.datetime(2021, 1, 1), datetime.datetime(2021, 1, 2)]),
@@ -5,8 +5,10 @@
 
 import { Emitter } from 'vs/base/common/event';
 import { Disposable } from 'vs/base/common/lifecycle';
+import { generateUuid } from 'vs/base/common/uuid';
 import { IRuntimeClientInstance } from 'vs/workbench/services/languageRuntime/common/languageRuntimeClientInstance';
-import { BackendState, ColumnProfileRequest, ColumnProfileResult, ColumnSchema, ColumnSortKey, DataSelection, ExportedData, ExportFormat, FilterResult, FormatOptions, PositronDataExplorerComm, RowFilter, SchemaUpdateEvent, SupportedFeatures, SupportStatus, TableData, TableSchema } from 'vs/workbench/services/languageRuntime/common/positronDataExplorerComm';
+import { JsonRpcErrorCode } from 'vs/workbench/services/languageRuntime/common/positronBaseComm';
+import { BackendState, ColumnProfileRequest, ColumnProfileResult, ColumnSchema, ColumnSortKey, DataSelection, ExportedData, ExportFormat, FilterResult, FormatOptions, PositronDataExplorerComm, ReturnColumnProfilesEvent, RowFilter, SchemaUpdateEvent, SupportedFeatures, SupportStatus, TableData, TableSchema } from 'vs/workbench/services/languageRuntime/common/positronDataExplorerComm';
 
 /**
  * TableSchemaSearchResult interface. This is here temporarily until searching the tabe schema
@@ -90,6 +92,15 @@ export class DataExplorerClientInstance extends Disposable {
 	 */
 	private _numPendingTasks: number = 0;
 
+	/**
+	 * Handlers for the results of pending column profile requests, which are returned
+	 * asynchronously, keyed by callback ID.
+	 */
+	private readonly _pendingColumnProfiles = new Map<string, {
+		onResults: (e: ReturnColumnProfilesEvent) => void;
+		cancel: () => void;
+	}>();
+
 	/**
 	 * Data formatting options for backend requests
 	 */
@@ -133,6 +144,7 @@ export class DataExplorerClientInstance extends Disposable {
 		// Register the onDidClose event handler.
 		this._register(this._positronDataExplorerComm.onDidClose(() => {
 			this.setStatus(DataExplorerClientStatus.Disconnected);
+			this._pendingColumnProfiles.forEach(pending => pending.cancel());
 			this._onDidCloseEmitter.fire();
 		}));
 
@@ -146,6 +158,13 @@ export class DataExplorerClientInstance extends Disposable {
 		this._register(this._positronDataExplorerComm.onDidDataUpdate(() => {
 			this._onDidDataUpdateEmitter.fire();
 		}));
+
+		// Register the onDidReturnColumnProfiles event handler.
+		this._register(this._positronDataExplorerComm.onDidReturnColumnProfiles(
+			(e: ReturnColumnProfilesEvent) => {
+				this._pendingColumnProfiles.get(e.callback_id)?.onResults(e);
+			}
+		));
 	}
 
 	override dispose(): void {
@@ -292,7 +311,8 @@ export class DataExplorerClientInstance extends Disposable {
 	 * @param rowStartIndex The first row to fetch (inclusive).
 	 * @param numRows The number of rows to fetch from start index. May extend beyond end of table.
 	 * @param columnIndices Indices to select, which can be a sequential, sparse, or random selection.
-	 * @returns A Promise<TableData> that resolves when the operation is complete.
+	 * @returns A Promise<TableData> that resolves when the operation is complete, with no columns
+	 * if the request was superseded by a newer request.
 	 */
 	async getDataValues(
 		rowStartIndex: number,
@@ -300,9 +320,19 @@ export class DataExplorerClientInstance extends Disposable {
 		columnIndices: Array<number>
 	): Promise<TableData> {
 		return this.runBackendTask(
-			() => this._positronDataExplorerComm.getDataValues(rowStartIndex, numRows, columnIndices,
-				this._dataFormatOptions
-			),
+			async () => {
+				try {
+					return await this._positronDataExplorerComm.getDataValues(rowStartIndex, numRows,
+						columnIndices, this._dataFormatOptions
+					);
+				} catch (err) {
+					// The backend drops requests superseded by newer ones while scrolling.
+					if (err?.code === JsonRpcErrorCode.RequestSuperseded) {
+						return { columns: [] };
+					}
+					throw err;
+				}
+			},
 			() => {
 				return { columns: [[]] };
 			}
@@ -318,7 +348,45 @@ export class DataExplorerClientInstance extends Disposable {
 		profiles: Array<ColumnProfileRequest>
 	): Promise<Array<ColumnProfileResult>> {
 		return this.runBackendTask(
-			() => this._positronDataExplorerComm.getColumnProfiles(profiles, this._profileFormatOptions),
+			async () => {
+				const callbackId = generateUuid();
+				const results = new Array<ColumnProfileResult | undefined>(profiles.length);
+
+				// The results are returned in events as the profiles of each column are finished
+				const returned = new Promise<void>(resolve => {
+					let numReturned = 0;
+					this._pendingColumnProfiles.set(callbackId, {
+						onResults: (e: ReturnColumnProfilesEvent) => {
+							e.profile_indices.forEach((profileIndex, i) => {
+								results[profileIndex] = e.profiles[i];
+							});
+							numReturned += e.profile_indices.length;
+							if (numReturned >= profiles.length) {
+								resolve();
+							}
+						},
+						cancel: () => resolve()
+					});
+				});
+
+				try {
+					const syncResults = await this._positronDataExplorerComm.getColumnProfiles(
+						profiles,
+						this._profileFormatOptions,
+						callbackId
+					);
+
+					// Backends that compute the profiles synchronously return them directly.
+					if (syncResults.length === profiles.length) {
+						return syncResults;
+					}
+
+					await returned;
+					return Array.from(results, result => result ?? {});
+				} finally {
+					this._pendingColumnProfiles.delete(callbackId);
+				}
+			},
 			() => []
 		);
 	}
@@ -18,6 +18,7 @@ export enum JsonRpcErrorCode {
 	InvalidParams = -32602,
 	InternalError = -32603,
 	ServerErrorStart = -32000,
+	RequestSuperseded = -32001,
 	ServerErrorEnd = -32099
 }
 
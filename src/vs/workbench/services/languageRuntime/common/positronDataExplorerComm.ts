@@ -95,6 +95,34 @@ export interface BackendState {
 
 }
 
+/**
+ * Memory used by the data explorer and by all data explorers
+ */
+export interface MemoryUsage {
+	/**
+	 * Bytes used by the filtered and sorted row indices
+	 */
+	index_bytes: number;
+
+	/**
+	 * Bytes used by cached state derived from the table, including state
+	 * shared with other data explorers of the same table
+	 */
+	cache_bytes: number;
+
+	/**
+	 * Bytes used by the row indices and cached state of all data explorers
+	 */
+	total_bytes: number;
+
+	/**
+	 * Memory budget for the row indices and cached state of all data
+	 * explorers
+	 */
+	max_bytes: number;
+
+}
+
 /**
  * Schema for a column in a table
  */
@@ -165,6 +193,16 @@ export interface TableData {
 	 */
 	row_labels?: Array<Array<string>>;
 
+	/**
+	 * Encoding of the column values. If utf8, columns is empty and the
+	 * values of all the columns, one column after another, are in the
+	 * buffers of the message: the uint32 little-endian offsets of the values
+	 * in the data (one more than the number of values), the UTF-8 data, and
+	 * a uint8 special value code for each value (255 for a formatted value),
+	 * which is empty if there are no special values
+	 */
+	encoding?: TableDataEncoding;
+
 }
 
 /**
@@ -379,6 +417,12 @@ export interface ColumnProfileRequest {
 	 */
 	profile_type: ColumnProfileType;
 
+	/**
+	 * Quantiles to compute for the summary_stats profile of a numeric
+	 * column, as percentiles, e.g. 50 for the median
+	 */
+	quantiles?: Array<number>;
+
 }
 
 /**
@@ -489,6 +533,11 @@ export interface SummaryStatsNumber {
 	 */
 	stdev?: string;
 
+	/**
+	 * Requested quantiles, exact or estimated from a quantile sketch
+	 */
+	quantiles?: Array<ColumnQuantileValue>;
+
 }
 
 /**
@@ -517,10 +566,17 @@ export interface SummaryStatsString {
 	num_empty: number;
 
 	/**
-	 * The exact number of distinct values
+	 * The number of distinct values, which is an estimate if
+	 * num_unique_error is set
 	 */
 	num_unique: number;
 
+	/**
+	 * Relative standard error of num_unique if it is an estimate, if
+	 * undefined then num_unique is exact
+	 */
+	num_unique_error?: number;
+
 }
 
 /**
@@ -528,10 +584,17 @@ export interface SummaryStatsString {
  */
 export interface SummaryStatsDate {
 	/**
-	 * The exact number of distinct values
+	 * The number of distinct values, which is an estimate if
+	 * num_unique_error is set
 	 */
 	num_unique: number;
 
+	/**
+	 * Relative standard error of num_unique if it is an estimate, if
+	 * undefined then num_unique is exact
+	 */
+	num_unique_error?: number;
+
 	/**
 	 * Minimum date value as string
 	 */
@@ -559,10 +622,17 @@ export interface SummaryStatsDate {
  */
 export interface SummaryStatsDatetime {
 	/**
-	 * The exact number of distinct values
+	 * The number of distinct values, which is an estimate if
+	 * num_unique_error is set
 	 */
 	num_unique: number;
 
+	/**
+	 * Relative standard error of num_unique if it is an estimate, if
+	 * undefined then num_unique is exact
+	 */
+	num_unique_error?: number;
+
 	/**
 	 * Minimum date value as string
 	 */
@@ -604,6 +674,12 @@ export interface ColumnHistogram {
 	 */
 	bin_width: number;
 
+	/**
+	 * Whether the histogram was computed from all the values, or estimated
+	 * from a sample of them, if undefined then true
+	 */
+	exact?: boolean;
+
 }
 
 /**
@@ -620,6 +696,12 @@ export interface ColumnFrequencyTable {
 	 */
 	other_count: number;
 
+	/**
+	 * Whether the counts were computed from all the values, or estimated
+	 * from a sample of them, if undefined then true
+	 */
+	exact?: boolean;
+
 }
 
 /**
@@ -963,6 +1045,14 @@ export enum ExportFormat {
 	Html = 'html'
 }
 
+/**
+ * Possible values for TableDataEncoding
+ */
+export enum TableDataEncoding {
+	Json = 'json',
+	Utf8 = 'utf8'
+}
+
 /**
  * Possible values for SupportStatus
  */
@@ -984,9 +1074,31 @@ export interface SchemaUpdateEvent {
 export interface DataUpdateEvent {
 }
 
+/**
+ * Event: Return async results of a get_column_profiles request
+ */
+export interface ReturnColumnProfilesEvent {
+	/**
+	 * Async callback unique identifier
+	 */
+	callback_id: string;
+
+	/**
+	 * Indices of the returned profiles in the array of requested profiles
+	 */
+	profile_indices: Array<number>;
+
+	/**
+	 * Column profile results, in the order of profile_indices
+	 */
+	profiles: Array<ColumnProfileResult>;
+
+}
+
 export enum DataExplorerFrontendEvent {
 	SchemaUpdate = 'schema_update',
-	DataUpdate = 'data_update'
+	DataUpdate = 'data_update',
+	ReturnColumnProfiles = 'return_column_profiles'
 }
 
 export enum DataExplorerBackendRequest {
@@ -997,7 +1109,8 @@ export enum DataExplorerBackendRequest {
 	SetRowFilters = 'set_row_filters',
 	SetSortColumns = 'set_sort_columns',
 	GetColumnProfiles = 'get_column_profiles',
-	GetState = 'get_state'
+	GetState = 'get_state',
+	GetMemoryUsage = 'get_memory_usage'
 }
 
 export class PositronDataExplorerComm extends PositronBaseComm {
@@ -1008,6 +1121,7 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		super(instance, options);
 		this.onDidSchemaUpdate = super.createEventEmitter('schema_update', []);
 		this.onDidDataUpdate = super.createEventEmitter('data_update', []);
+		this.onDidReturnColumnProfiles = super.createEventEmitter('return_column_profiles', ['callback_id', 'profile_indices', 'profiles']);
 	}
 
 	/**
@@ -1053,11 +1167,14 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	 * sparse, or random selection
 	 * @param formatOptions Formatting options for returning data values as
 	 * strings
+	 * @param encoding Requested encoding of the data values. The values are
+	 * returned as JSON if omitted or if the backend does not support the
+	 * encoding
 	 *
 	 * @returns Table values formatted as strings
 	 */
-	getDataValues(rowStartIndex: number, numRows: number, columnIndices: Array<number>, formatOptions: FormatOptions): Promise<TableData> {
-		return super.performRpc('get_data_values', ['row_start_index', 'num_rows', 'column_indices', 'format_options'], [rowStartIndex, numRows, columnIndices, formatOptions]);
+	getDataValues(rowStartIndex: number, numRows: number, columnIndices: Array<number>, formatOptions: FormatOptions, encoding?: TableDataEncoding): Promise<TableData> {
+		return super.performRpc('get_data_values', ['row_start_index', 'num_rows', 'column_indices', 'format_options', 'encoding'], [rowStartIndex, numRows, columnIndices, formatOptions, encoding]);
 	}
 
 	/**
@@ -1105,16 +1222,21 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	/**
 	 * Request a batch of column profiles
 	 *
-	 * Requests a statistical summary or data profile for batch of columns
+	 * Requests a statistical summary or data profile for batch of columns.
+	 * If a callback_id is given, the profiles are computed asynchronously
+	 * and returned with return_column_profiles events as the profiles of
+	 * each column are finished
 	 *
 	 * @param profiles Array of requested profiles
 	 * @param formatOptions Formatting options for returning data values as
 	 * strings
+	 * @param callbackId Async callback unique identifier. If omitted, the
+	 * profiles are computed before replying and returned as the result
 	 *
 	 * @returns undefined
 	 */
-	getColumnProfiles(profiles: Array<ColumnProfileRequest>, formatOptions: FormatOptions): Promise<Array<ColumnProfileResult>> {
-		return super.performRpc('get_column_profiles', ['profiles', 'format_options'], [profiles, formatOptions]);
+	getColumnProfiles(profiles: Array<ColumnProfileRequest>, formatOptions: FormatOptions, callbackId?: string): Promise<Array<ColumnProfileResult>> {
+		return super.performRpc('get_column_profiles', ['profiles', 'format_options', 'callback_id'], [profiles, formatOptions, callbackId]);
 	}
 
 	/**
@@ -1130,6 +1252,19 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 		return super.performRpc('get_state', [], []);
 	}
 
+	/**
+	 * Get the memory usage
+	 *
+	 * Request the memory used by the row indices and cached state of the
+	 * data explorer
+	 *
+	 *
+	 * @returns Memory used by the data explorer and by all data explorers
+	 */
+	getMemoryUsage(): Promise<MemoryUsage> {
+		return super.performRpc('get_memory_usage', [], []);
+	}
+
 
 	/**
 	 * Request to sync after a schema change
@@ -1144,5 +1279,13 @@ export class PositronDataExplorerComm extends PositronBaseComm {
 	 * and triggering a refresh/redraw.
 	 */
 	onDidDataUpdate: Event<DataUpdateEvent>;
+	/**
+	 * Return async results of a get_column_profiles request
+	 *
+	 * Return the profiles of one or more columns requested with
+	 * get_column_profiles. Profiles that could not be computed, or whose
+	 * computation was cancelled, are returned empty.
+	 */
+	onDidReturnColumnProfiles: Event<ReturnColumnProfilesEvent>;
 }
 
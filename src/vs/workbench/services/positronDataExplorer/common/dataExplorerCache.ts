@@ -320,160 +320,165 @@ export class DataExplorerCache extends Disposable {
 		// Set the updating cache flag.
 		this._updatingCache = true;
 
-		// Destructure the cache update descriptor.
-		const {
-			firstColumnIndex,
-			visibleColumns,
-			firstRowIndex,
-			visibleRows
-		} = cacheUpdateDescriptor;
-
-		// Get the size of the data.
-		const tableState = await this._dataExplorerClientInstance.getBackendState();
-		this._columns = tableState.table_shape.num_columns;
-		this._rows = tableState.table_shape.num_rows;
-
-		// Set the start column index and the end column index of the columns to cache.
-		const startColumnIndex = Math.max(
-			firstColumnIndex - (visibleColumns * OVERSCAN_FACTOR),
-			0
-		);
-		const endColumnIndex = Math.min(
-			startColumnIndex + visibleColumns + (visibleColumns * OVERSCAN_FACTOR * 2),
-			this._columns - 1
-		);
-
-		// Build an array of the column indices to cache.
-		const columnIndices = arrayFromIndexRange(startColumnIndex, endColumnIndex);
-
-		// Build an array of the column schema indices that need to be cached.
-		const columnSchemaIndices = columnIndices.filter(columnIndex =>
-			!this._columnSchemaCache.has(columnIndex)
-		);
+		try {
+			// Destructure the cache update descriptor.
+			const {
+				firstColumnIndex,
+				visibleColumns,
+				firstRowIndex,
+				visibleRows
+			} = cacheUpdateDescriptor;
+
+			// Get the size of the data.
+			const tableState = await this._dataExplorerClientInstance.getBackendState();
+			this._columns = tableState.table_shape.num_columns;
+			this._rows = tableState.table_shape.num_rows;
+
+			// Set the start column index and the end column index of the columns to cache.
+			const startColumnIndex = Math.max(
+				firstColumnIndex - (visibleColumns * OVERSCAN_FACTOR),
+				0
+			);
+			const endColumnIndex = Math.min(
+				startColumnIndex + visibleColumns + (visibleColumns * OVERSCAN_FACTOR * 2),
+				this._columns - 1
+			);
 
-		// Initialize the cache updated flag.
-		let cacheUpdated = false;
+			// Build an array of the column indices to cache.
+			const columnIndices = arrayFromIndexRange(startColumnIndex, endColumnIndex);
 
-		// If there are column schema indices that need to be cached, cache them.
-		if (columnSchemaIndices.length) {
-			// Get the schema.
-			const tableSchema = await this._dataExplorerClientInstance.getSchema(
-				columnSchemaIndices[0],
-				columnSchemaIndices[columnSchemaIndices.length - 1] - columnSchemaIndices[0] + 1
+			// Build an array of the column schema indices that need to be cached.
+			const columnSchemaIndices = columnIndices.filter(columnIndex =>
+				!this._columnSchemaCache.has(columnIndex)
 			);
 
-			// Update the column schema cache, overwriting any entries we already have cached.
-			for (let i = 0; i < tableSchema.columns.length; i++) {
-				this._columnSchemaCache.set(columnSchemaIndices[0] + i, tableSchema.columns[i]);
-			}
-
-			// Update the cache updated flag.
-			cacheUpdated = true;
-		}
+			// Initialize the cache updated flag.
+			let cacheUpdated = false;
 
-		// Build an array of the column schema indices that need to be cached.
-		const columnNullCountIndices = columnIndices.filter(columnIndex =>
-			!this._columnNullCountCache.has(columnIndex)
-		);
+			// If there are column schema indices that need to be cached, cache them.
+			if (columnSchemaIndices.length) {
+				// Get the schema.
+				const tableSchema = await this._dataExplorerClientInstance.getSchema(
+					columnSchemaIndices[0],
+					columnSchemaIndices[columnSchemaIndices.length - 1] - columnSchemaIndices[0] + 1
+				);
 
-		// If there are null counts that need to be cached, cache them.
-		if (columnNullCountIndices.length) {
-			// Request the profiles
-			const results = await this._dataExplorerClientInstance.getColumnProfiles(
-				columnNullCountIndices.map(column_index => {
-					return {
-						column_index,
-						profile_type: ColumnProfileType.NullCount
-					};
-				})
-			);
+				// Update the column schema cache, overwriting any entries we already have cached.
+				for (let i = 0; i < tableSchema.columns.length; i++) {
+					this._columnSchemaCache.set(columnSchemaIndices[0] + i, tableSchema.columns[i]);
+				}
 
-			// Update the column schema cache, overwriting any entries we already have cached.
-			for (let i = 0; i < results.length; i++) {
-				this._columnNullCountCache.set(columnNullCountIndices[i], results[i].null_count!);
+				// Update the cache updated flag.
+				cacheUpdated = true;
 			}
 
-			// Update the cache updated flag.
-			cacheUpdated = true;
-		}
-
-		// If data is also being cached, update the data cache.
-		if (firstRowIndex !== undefined && visibleRows !== undefined) {
-			// Set the start row index and the end row index of the rows to cache.
-			const startRowIndex = Math.max(
-				firstRowIndex - (visibleRows * OVERSCAN_FACTOR),
-				0
-			);
-			const endRowIndex = Math.min(
-				startRowIndex + visibleRows + (visibleRows * OVERSCAN_FACTOR * 2),
-				this._rows - 1
+			// Build an array of the column schema indices that need to be cached.
+			const columnNullCountIndices = columnIndices.filter(columnIndex =>
+				!this._columnNullCountCache.has(columnIndex)
 			);
 
-			// Build an array of the row indices that need to be cached.
-			const rowIndices: number[] = [];
-			for (let rowIndex = startRowIndex; rowIndex <= endRowIndex; rowIndex++) {
-				for (let columnIndex = startColumnIndex; columnIndex <= endColumnIndex; columnIndex++) {
-					if (!this._dataCellCache.has(`${columnIndex},${rowIndex}`)) {
-						rowIndices.push(rowIndex);
-						break;
-					}
+			// If there are null counts that need to be cached, cache them.
+			if (columnNullCountIndices.length) {
+				// Request the profiles
+				const results = await this._dataExplorerClientInstance.getColumnProfiles(
+					columnNullCountIndices.map(column_index => {
+						return {
+							column_index,
+							profile_type: ColumnProfileType.NullCount
+						};
+					})
+				);
+
+				// Update the column schema cache, overwriting any entries we already have cached.
+				for (let i = 0; i < results.length; i++) {
+					this._columnNullCountCache.set(columnNullCountIndices[i], results[i].null_count!);
 				}
-			}
 
-			// If there are row indices that need to be cached, cache them.
-			if (rowIndices.length) {
-				// Calculate the rows count.
-				const rows = rowIndices[rowIndices.length - 1] - rowIndices[0] + 1;
+				// Update the cache updated flag.
+				cacheUpdated = true;
+			}
 
-				// Get the data values.
-				const tableData: TableData = await this._dataExplorerClientInstance.getDataValues(
-					rowIndices[0],
-					rows,
-					columnIndices
+			// If data is also being cached, update the data cache.
+			if (firstRowIndex !== undefined && visibleRows !== undefined) {
+				// Set the start row index and the end row index of the rows to cache.
+				const startRowIndex = Math.max(
+					firstRowIndex - (visibleRows * OVERSCAN_FACTOR),
+					0
+				);
+				const endRowIndex = Math.min(
+					startRowIndex + visibleRows + (visibleRows * OVERSCAN_FACTOR * 2),
+					this._rows - 1
 				);
 
-				// Update the data cell cache, overwriting any entries we already have cached.
-				for (let row = 0; row < rows; row++) {
-					// Get the row index.
-					const rowIndex = rowIndices[row];
-
-					// If row labels were returned, cache the row label for the row.
-					if (tableData.row_labels) {
-						const rowLabel = tableData.row_labels[0][row];
-						this._rowLabelCache.set(rowIndex, rowLabel);
+				// Build an array of the row indices that need to be cached.
+				const rowIndices: number[] = [];
+				for (let rowIndex = startRowIndex; rowIndex <= endRowIndex; rowIndex++) {
+					for (let columnIndex = startColumnIndex; columnIndex <= endColumnIndex; columnIndex++) {
+						if (!this._dataCellCache.has(`${columnIndex},${rowIndex}`)) {
+							rowIndices.push(rowIndex);
+							break;
+						}
 					}
+				}
 
-					// Cache the data cells.
-					for (let column = 0; column < columnIndices.length; column++) {
-						const value = tableData.columns[column][row];
-						const columnIndex = columnIndices[column];
-						const rowIndex = rowIndices[row];
-						if (typeof value === 'number') {
-							this._dataCellCache.set(`${columnIndex},${rowIndex}`,
-								decodeSpecialValue(value)
-							);
-						} else {
-							this._dataCellCache.set(`${columnIndex},${rowIndex}`, {
-								formatted: value,
-								kind: DataCellKind.NON_NULL
-							});
+				// If there are row indices that need to be cached, cache them.
+				if (rowIndices.length) {
+					// Calculate the rows count.
+					const rows = rowIndices[rowIndices.length - 1] - rowIndices[0] + 1;
+
+					// Get the data values.
+					const tableData: TableData = await this._dataExplorerClientInstance.getDataValues(
+						rowIndices[0],
+						rows,
+						columnIndices
+					);
+
+					// A request superseded by a newer one returns no values to cache.
+					if (tableData.columns.length === columnIndices.length) {
+						// Update the data cell cache, overwriting any entries we already have cached.
+						for (let row = 0; row < rows; row++) {
+							// Get the row index.
+							const rowIndex = rowIndices[row];
+
+							// If row labels were returned, cache the row label for the row.
+							if (tableData.row_labels) {
+								const rowLabel = tableData.row_labels[0][row];
+								this._rowLabelCache.set(rowIndex, rowLabel);
+							}
+
+							// Cache the data cells.
+							for (let column = 0; column < columnIndices.length; column++) {
+								const value = tableData.columns[column][row];
+								const columnIndex = columnIndices[column];
+								const rowIndex = rowIndices[row];
+								if (typeof value === 'number') {
+									this._dataCellCache.set(`${columnIndex},${rowIndex}`,
+										decodeSpecialValue(value)
+									);
+								} else {
+									this._dataCellCache.set(`${columnIndex},${rowIndex}`, {
+										formatted: value,
+										kind: DataCellKind.NON_NULL
+									});
+								}
+							}
 						}
+
+						// Update the cache updated flag.
+						cacheUpdated = true;
 					}
 				}
-
-				// Update the cache updated flag.
-				cacheUpdated = true;
 			}
-		}
 
-		// If the cache was updated, fire the onDidUpdateCache event.
-		if (cacheUpdated) {
-			this._onDidUpdateCacheEmitter.fire();
+			// If the cache was updated, fire the onDidUpdateCache event.
+			if (cacheUpdated) {
+				this._onDidUpdateCacheEmitter.fire();
+			}
+		} finally {
+			// Clear the updating cache flag, even if the update failed.
+			this._updatingCache = false;
 		}
 
-		// Clear the updating cache flag.
-		this._updatingCache = false;
-
 		// If there is a cache update descriptor, update the cache for it.
 		if (this._cacheUpdateDescriptor) {
 			// Get the pending cache update descriptor and clear it.